@@ -0,0 +1,151 @@
+"""
+Benchmark CLI.
+
+    python -m benchmarks run [--matrix axes|full] [--filter SUBSTR] [--quick]
+                             [--out PATH] [--compare [BASELINE]] [--threshold 0.10]
+    python -m benchmarks compare BASELINE CURRENT [--threshold 0.10] [--metric p50_us]
+    python -m benchmarks footprint [--count N]
+
+`run --compare` and `compare` exit with status 1 when any case
+regressed past the threshold. `--compare` without a path gates
+against the committed reference baseline (REFERENCE_BASELINE).
+
+The reference holds absolute timings from one machine (recorded in
+the file), so gate on the machine that recorded it. To refresh it
+after an intended performance change, or for a new CI machine, run
+the default matrix at full iterations and commit the result:
+
+    python -m benchmarks run --out benchmarks/baselines/reference.json
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+from benchmarks.baseline import compare_results, load_results, save_results
+from benchmarks.footprint import footprints
+from benchmarks.harness import BenchmarkCase, run_case
+from benchmarks.micro_cases import micro_cases, offline_cases
+from benchmarks.runtime_cases import REPO_ROOT, runtime_cases
+
+
+BASELINE_DIR = REPO_ROOT / "benchmarks" / "baselines"
+REFERENCE_BASELINE = BASELINE_DIR / "reference.json"
+
+# --quick: enough samples for a smoke run, not for gating
+_QUICK_ITERATIONS = 10
+_QUICK_WARMUP = 2
+
+
+def _collect(matrix: str) -> List[BenchmarkCase]:
+    return runtime_cases(matrix=matrix) + micro_cases() + offline_cases()
+
+
+def _run(args: argparse.Namespace) -> int:
+    cases = _collect(args.matrix)
+    if args.filter:
+        cases = [c for c in cases if args.filter in c.name or args.filter == c.group]
+    if not cases:
+        print("No benchmark cases selected.", file=sys.stderr)
+        return 2
+
+    iterations = args.iterations
+    warmup = args.warmup
+    if args.quick:
+        iterations = iterations or _QUICK_ITERATIONS
+        warmup = _QUICK_WARMUP if warmup is None else warmup
+
+    results = []
+    # Runtime components write trace files relative to the cwd;
+    # keep them out of the working tree.
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="bench-") as scratch:
+        os.chdir(scratch)
+        try:
+            for case in cases:
+                r = run_case(case, iterations=iterations, warmup=warmup)
+                results.append(r)
+                print(
+                    f"{r.name:<60} {r.ops_per_s:>10.1f} ops/s  "
+                    f"p50 {r.p50_us:>10.1f}us  p99 {r.p99_us:>10.1f}us"
+                )
+        finally:
+            os.chdir(cwd)
+
+    if args.out:
+        print(f"wrote {save_results(args.out, results)}")
+
+    if args.compare:
+        report = compare_results(
+            load_results(args.compare),
+            {r.name: r for r in results},
+            threshold=args.threshold,
+            metric=args.metric,
+        )
+        print(report.format())
+        return 0 if report.ok else 1
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    report = compare_results(
+        load_results(args.baseline),
+        load_results(args.current),
+        threshold=args.threshold,
+        metric=args.metric,
+    )
+    print(report.format())
+    return 0 if report.ok else 1
+
+
+def _footprint(args: argparse.Namespace) -> int:
+    for f in footprints(count=args.count):
+        layout = "dict" if f.has_dict else "slots"
+        print(f"{f.name:<24} {f.bytes_per_object:>10.1f} B/object  ({layout})")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run benchmark cases")
+    run.add_argument("--matrix", choices=("axes", "full"), default="axes")
+    run.add_argument("--filter", default=None, help="substring of case name, or group name")
+    run.add_argument("--iterations", type=int, default=None)
+    run.add_argument("--warmup", type=int, default=None)
+    run.add_argument("--quick", action="store_true")
+    run.add_argument("--out", type=Path, default=None, help=f"results JSON (e.g. {BASELINE_DIR}/<name>.json)")
+    run.add_argument(
+        "--compare",
+        type=Path,
+        nargs="?",
+        const=REFERENCE_BASELINE,
+        default=None,
+        help=f"baseline JSON to gate against (default: {REFERENCE_BASELINE})",
+    )
+    run.add_argument("--threshold", type=float, default=0.10)
+    run.add_argument("--metric", default="p50_us")
+    run.set_defaults(func=_run)
+
+    cmp_ = sub.add_parser("compare", help="compare two result files")
+    cmp_.add_argument("baseline", type=Path)
+    cmp_.add_argument("current", type=Path)
+    cmp_.add_argument("--threshold", type=float, default=0.10)
+    cmp_.add_argument("--metric", default="p50_us")
+    cmp_.set_defaults(func=_compare)
+
+    fp = sub.add_parser("footprint", help="per-object memory of high-volume records")
+    fp.add_argument("--count", type=int, default=10_000)
+    fp.set_defaults(func=_footprint)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+import os
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from benchmarks.harness import BenchmarkResult
+
+
+FORMAT_VERSION = 1
+
+# Metrics where larger is worse
+_LATENCY_METRICS = ("mean_us", "p50_us", "p90_us", "p99_us", "min_us", "max_us")
+
+
+# --------------------------------------------------
+# Storage
+# --------------------------------------------------
+
+def save_results(path: str | Path, results: Iterable[BenchmarkResult]) -> Path:
+    """
+    Write results as a JSON baseline (atomic replace).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    payload = {
+        "format_version": FORMAT_VERSION,
+        "created_time": time.time(),
+        "python": platform.python_version(),
+        "implementation": sys.implementation.name,
+        "machine": platform.machine(),
+        "results": {r.name: r.to_dict() for r in results},
+    }
+
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def load_results(path: str | Path) -> Dict[str, BenchmarkResult]:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    if payload.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported baseline version: {payload.get('format_version')}")
+    return {
+        name: BenchmarkResult.from_dict(data)
+        for name, data in payload.get("results", {}).items()
+    }
+
+
+# --------------------------------------------------
+# Comparison
+# --------------------------------------------------
+
+@dataclass(frozen=True)
+class BenchmarkComparison:
+    """
+    One case compared against its baseline.
+
+    ratio = current / baseline for the chosen metric, oriented so
+    that ratio > 1 always means slower.
+    """
+
+    name: str
+    metric: str
+    baseline: float
+    current: float
+    ratio: float
+    regressed: bool
+    improved: bool
+
+
+@dataclass(frozen=True)
+class ComparisonReport:
+    metric: str
+    threshold: float
+    comparisons: List[BenchmarkComparison]
+    missing: List[str]
+    added: List[str]
+
+    @property
+    def regressions(self) -> List[BenchmarkComparison]:
+        return [c for c in self.comparisons if c.regressed]
+
+    @property
+    def ok(self) -> bool:
+        return not self.regressions
+
+    def format(self) -> str:
+        lines = [f"metric={self.metric} threshold={self.threshold:.0%}"]
+        for c in self.comparisons:
+            flag = "REGRESSED" if c.regressed else ("improved" if c.improved else "ok")
+            lines.append(
+                f"  {c.name:<60} {c.baseline:>12.2f} -> {c.current:>12.2f}  x{c.ratio:.3f}  {flag}"
+            )
+        for name in self.missing:
+            lines.append(f"  {name:<60} missing from current run")
+        for name in self.added:
+            lines.append(f"  {name:<60} new (no baseline)")
+        lines.append(f"{len(self.regressions)} regression(s)")
+        return "\n".join(lines)
+
+
+def compare_results(
+    baseline: Dict[str, BenchmarkResult],
+    current: Dict[str, BenchmarkResult],
+    *,
+    threshold: float = 0.10,
+    metric: str = "p50_us",
+) -> ComparisonReport:
+    """
+    Flag cases whose metric got worse by more than `threshold`
+    (fractional, e.g. 0.10 = 10%).
+
+    metric: a latency field (p50_us default, robust to outliers)
+    or "ops_per_s".
+    """
+    if threshold < 0:
+        raise ValueError("threshold must be >= 0")
+    if metric not in _LATENCY_METRICS and metric != "ops_per_s":
+        raise ValueError(f"Unknown metric: {metric}")
+
+    comparisons: List[BenchmarkComparison] = []
+    for name in sorted(set(baseline) & set(current)):
+        b = float(getattr(baseline[name], metric))
+        c = float(getattr(current[name], metric))
+
+        if metric == "ops_per_s":
+            ratio = (b / c) if c > 0 else float("inf")
+        else:
+            ratio = (c / b) if b > 0 else (1.0 if c == 0 else float("inf"))
+
+        comparisons.append(BenchmarkComparison(
+            name=name,
+            metric=metric,
+            baseline=b,
+            current=c,
+            ratio=ratio,
+            regressed=ratio > 1.0 + threshold,
+            improved=ratio < 1.0 - threshold,
+        ))
+
+    return ComparisonReport(
+        metric=metric,
+        threshold=threshold,
+        comparisons=comparisons,
+        missing=sorted(set(baseline) - set(current)),
+        added=sorted(set(current) - set(baseline)),
+    )
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+from engine.execution.execution_record import ExecutionRecord
+from engine.execution.execution_target import ExecutionTarget
+from engine.observation.observation_event import ObservationEvent
+from engine.population_model import PopulationModel
+from engine.salience.salience_trace import SalienceTraceEvent
+from memory.episodic.episode_trace import EpisodeTraceRecord
+from persistence.traces import ExponentialTrace
+
+
+@dataclass(frozen=True)
+class Footprint:
+    """
+    Measured per-object memory for one record type.
+
+    bytes_per_object: tracemalloc-attributed bytes per instance,
+    including per-instance attribute storage (dict or slots) and
+    freshly boxed field values, excluding the holding list.
+    """
+
+    name: str
+    count: int
+    bytes_per_object: float
+    has_dict: bool
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "count": self.count,
+            "bytes_per_object": self.bytes_per_object,
+            "has_dict": self.has_dict,
+        }
+
+
+def measure_footprint(name: str, factory: Callable[[int], Any], *, count: int = 10_000) -> Footprint:
+    """
+    Allocate `count` objects from `factory(i)` under tracemalloc.
+    """
+    if count < 1:
+        raise ValueError("count must be >= 1")
+
+    holder: List[Any] = [None] * count
+    gc.collect()
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for i in range(count):
+            holder[i] = factory(i)
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    grown = sum(s.size_diff for s in after.compare_to(before, "filename"))
+    return Footprint(
+        name=name,
+        count=count,
+        bytes_per_object=grown / count,
+        has_dict=hasattr(holder[0], "__dict__"),
+    )
+
+
+# ------------------------------------------------------------
+# Record types
+# ------------------------------------------------------------
+
+_POP_PARAMS = {
+    "tau": 12.0,
+    "threshold": 0.05,
+    "gain": 1.2,
+    "noise_amplitude": 0.01,
+    "role": "projection",
+    "subpopulation": "D1",
+}
+
+
+def _population_model(i: int) -> PopulationModel:
+    p = PopulationModel.from_params(_POP_PARAMS, default_assembly_id=f"striatum:D1_MSN:{i}")
+    # As regions/assembly_differentiation and hypothesis routing do
+    p._structural_gain = 0.9 + (i % 3) * 0.1
+    p._base_subpopulation = p.subpopulation
+    return p
+
+
+FOOTPRINT_CASES: Dict[str, Callable[[int], Any]] = {
+    "PopulationModel": _population_model,
+    "EpisodeTraceRecord": lambda i: EpisodeTraceRecord(
+        event="decision", episode_id=i // 10, step=i, payload={"winner": "D1"},
+    ),
+    "ObservationEvent": lambda i: ObservationEvent(
+        step=i, region="striatum", event_type="mass_rise", payload={"mass": float(i)},
+    ),
+    "ExecutionRecord": lambda i: ExecutionRecord(
+        target=ExecutionTarget.VALUE_BIAS, applied=bool(i & 1), value_snapshot=float(i),
+    ),
+    "SalienceTraceEvent": lambda i: SalienceTraceEvent(
+        step=i, time=i * 0.01, source="sensory", channel_id="D1", delta=0.01 * i,
+    ),
+    "ExponentialTrace": lambda i: ExponentialTrace(decay_tau=30.0),
+}
+
+
+def footprints(*, count: int = 10_000) -> List[Footprint]:
+    return [measure_footprint(name, factory, count=count) for name, factory in FOOTPRINT_CASES.items()]
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import gc
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """
+    One named benchmark.
+
+    `setup` builds the workload outside the timed region and returns
+    the operation to time (called once per iteration).
+    """
+
+    name: str
+    group: str
+    setup: Callable[[], Callable[[], Any]]
+    params: Dict[str, Any] = field(default_factory=dict)
+    iterations: int = 200
+    warmup: int = 20
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """
+    Timing summary of one BenchmarkCase run.
+
+    Latencies are per operation, in microseconds.
+    """
+
+    name: str
+    group: str
+    params: Dict[str, Any]
+    iterations: int
+    total_s: float
+    ops_per_s: float
+    mean_us: float
+    p50_us: float
+    p90_us: float
+    p99_us: float
+    min_us: float
+    max_us: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "group": self.group,
+            "params": dict(self.params),
+            "iterations": self.iterations,
+            "total_s": self.total_s,
+            "ops_per_s": self.ops_per_s,
+            "mean_us": self.mean_us,
+            "p50_us": self.p50_us,
+            "p90_us": self.p90_us,
+            "p99_us": self.p99_us,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "BenchmarkResult":
+        return BenchmarkResult(
+            name=str(data["name"]),
+            group=str(data.get("group", "")),
+            params=dict(data.get("params", {})),
+            iterations=int(data["iterations"]),
+            total_s=float(data["total_s"]),
+            ops_per_s=float(data["ops_per_s"]),
+            mean_us=float(data["mean_us"]),
+            p50_us=float(data["p50_us"]),
+            p90_us=float(data["p90_us"]),
+            p99_us=float(data["p99_us"]),
+            min_us=float(data["min_us"]),
+            max_us=float(data["max_us"]),
+        )
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not ordered:
+        return 0.0
+    k = max(0, min(len(ordered) - 1, int(round(q * (len(ordered) - 1)))))
+    return ordered[k]
+
+
+def summarize(
+    *,
+    name: str,
+    group: str,
+    params: Dict[str, Any],
+    samples_ns: List[int],
+) -> BenchmarkResult:
+    ordered = sorted(s / 1000.0 for s in samples_ns)
+    total_s = sum(samples_ns) / 1e9
+    n = len(ordered)
+
+    return BenchmarkResult(
+        name=name,
+        group=group,
+        params=dict(params),
+        iterations=n,
+        total_s=total_s,
+        ops_per_s=(n / total_s) if total_s > 0 else 0.0,
+        mean_us=(sum(ordered) / n) if n else 0.0,
+        p50_us=_percentile(ordered, 0.50),
+        p90_us=_percentile(ordered, 0.90),
+        p99_us=_percentile(ordered, 0.99),
+        min_us=ordered[0] if ordered else 0.0,
+        max_us=ordered[-1] if ordered else 0.0,
+    )
+
+
+def run_case(
+    case: BenchmarkCase,
+    *,
+    iterations: Optional[int] = None,
+    warmup: Optional[int] = None,
+) -> BenchmarkResult:
+    """
+    Run one case: setup (untimed), warmup, then per-iteration timing.
+
+    GC is disabled inside the timed loop so collection pauses from
+    setup garbage do not land in the latency distribution.
+    """
+    n = case.iterations if iterations is None else int(iterations)
+    w = case.warmup if warmup is None else int(warmup)
+    if n < 1:
+        raise ValueError("iterations must be >= 1")
+
+    op = case.setup()
+    for _ in range(w):
+        op()
+
+    clock = time.perf_counter_ns
+    samples: List[int] = []
+    append = samples.append
+
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(n):
+            t0 = clock()
+            op()
+            append(clock() - t0)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return summarize(name=case.name, group=case.group, params=case.params, samples_ns=samples)
@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+import random
+from typing import Callable, Dict, List
+
+from engine.competition import CompetitionKernel
+from engine.noise import CounterNoise
+from engine.population_model import PopulationModel
+from engine.runtime_context import RuntimeContext
+from engine.replay.execution.replay_executor import ReplayExecutor
+from engine.replay.execution.replay_execution_config import ReplayExecutionConfig
+from engine.replay.requests.replay_request import ReplayRequest
+from engine.replay.scheduling.replay_plan import ReplayPlan
+from engine.cognition.hypothesis.offline.observation_frame import ObservationFrame
+from engine.cognition.hypothesis.offline.support_to_activation import SupportToActivation
+from engine.cognition.hypothesis.offline.hypothesis_runner import HypothesisRunner
+from engine.cognition.hypothesis.hypothesis_array_registry import ArrayHypothesisRegistry
+from engine.cognition.hypothesis.hypothesis_grounding import HypothesisGrounding
+from engine.cognition.hypothesis.hypothesis_competition import HypothesisCompetition
+from engine.cognition.hypothesis.hypothesis_dynamics import HypothesisDynamics
+from engine.cognition.hypothesis.hypothesis_stabilization import HypothesisStabilization
+from engine.cognition.hypothesis.hypothesis_bias import HypothesisBias
+
+from learning.inputs.learning_pipeline_input_adapter import LearningPipelineInputAdapter
+from learning.diffing.learning_bundle_diff import diff_learning_bundles
+from memory.semantic_activation.semantic_activation_record import SemanticActivationRecord
+from memory.proto_structural.pattern_record import PatternRecord
+from memory.proto_structural.episode_signature import EpisodeSignature
+
+from benchmarks.harness import BenchmarkCase
+from benchmarks.runtime_cases import build_runtime, compile_brain
+
+
+# ============================================================
+# Runtime subsystems
+# ============================================================
+
+def competition_kernel_case(*, scale: float = 1.0, iterations: int = 500) -> BenchmarkCase:
+    """
+    CompetitionKernel.apply over the striatal assemblies.
+    """
+    def setup() -> Callable[[], None]:
+        rt = build_runtime(scale=scale)
+        rt.inject_stimulus("striatum", magnitude=0.3)
+        for _ in range(5):
+            rt.step()
+
+        assemblies = [
+            p
+            for plist in rt.region_states["striatum"]["populations"].values()
+            for p in plist
+        ]
+        kernel = CompetitionKernel(inhibition_strength=0.55, persistence_gain=0.15, dominance_tau=0.75)
+        dt = rt.dt
+        return lambda: kernel.apply(assemblies, dt)
+
+    return BenchmarkCase(
+        name=f"competition_kernel.apply[scale={scale}]",
+        group="micro",
+        setup=setup,
+        params={"scale": scale},
+        iterations=iterations,
+        warmup=20,
+    )
+
+
+def runtime_context_case(*, lookups: int = 1000, iterations: int = 200) -> BenchmarkCase:
+    """
+    RuntimeContext.get_gain / get_bias over mixed hit levels
+    (assembly, population, region, global, miss).
+    """
+    def setup() -> Callable[[], None]:
+        ctx = RuntimeContext(decay_tau=5.0)
+        ctx.set("pfc:L23:3", 0.2)
+        ctx.set("striatum:D1_MSN", 0.1)
+        ctx.set("vta", 0.05)
+        rng = random.Random(0)
+        regions = ("pfc", "striatum", "vta", "gpi", "m1")
+        pops = ("L23", "D1_MSN", "DA", "L5")
+        ids = [
+            f"{rng.choice(regions)}:{rng.choice(pops)}:{rng.randrange(50)}"
+            for _ in range(lookups)
+        ]
+
+        def op() -> None:
+            for aid in ids:
+                ctx.get_gain(aid)
+                ctx.get_bias(aid)
+        return op
+
+    return BenchmarkCase(
+        name=f"runtime_context.lookup[n={lookups}]",
+        group="micro",
+        setup=setup,
+        params={"lookups": lookups},
+        iterations=iterations,
+        warmup=10,
+    )
+
+
+def population_step_case(*, assemblies: int = 5000, iterations: int = 100) -> BenchmarkCase:
+    """
+    PopulationModel.step over a runtime-sized assembly set
+    (attribute-read dominated).
+    """
+    def setup() -> Callable[[], None]:
+        pops = [
+            PopulationModel.from_params(
+                {"tau": 10.0 + i % 5, "threshold": 0.02, "gain": 1.1, "subpopulation": "D1"},
+                default_assembly_id=f"bench:D1:{i}",
+            )
+            for i in range(assemblies)
+        ]
+        for i, p in enumerate(pops):
+            p._structural_gain = 0.9 + (i % 3) * 0.1
+            p.input = 0.2
+
+        def op() -> None:
+            for p in pops:
+                p.step(0.01)
+        return op
+
+    return BenchmarkCase(
+        name=f"population_model.step[n={assemblies}]",
+        group="micro",
+        setup=setup,
+        params={"assemblies": assemblies},
+        iterations=iterations,
+        warmup=5,
+    )
+
+
+def population_read_case(*, assemblies: int = 5000, iterations: int = 200) -> BenchmarkCase:
+    """
+    Per-assembly attribute reads as done by the runtime's routing and
+    observation loops (id, channel, hypothesis tag, output).
+    """
+    def setup() -> Callable[[], None]:
+        pops = [PopulationModel(assembly_id=f"bench:{i}", subpopulation="D2") for i in range(assemblies)]
+
+        def op() -> None:
+            total = 0.0
+            for p in pops:
+                if p.hypothesis_id is None and p.subpopulation is not None:
+                    total += p.output()
+        return op
+
+    return BenchmarkCase(
+        name=f"population_model.read_attrs[n={assemblies}]",
+        group="micro",
+        setup=setup,
+        params={"assemblies": assemblies},
+        iterations=iterations,
+        warmup=10,
+    )
+
+
+def noise_vector_case(*, assemblies: int = 8559, iterations: int = 200) -> BenchmarkCase:
+    """
+    One step's per-assembly noise vector from the counter stream.
+    """
+    def setup() -> Callable[[], None]:
+        noise = CounterNoise(seed=0)
+        counter = iter(range(1 << 62))
+        return lambda: noise.standard_normal(next(counter), assemblies)
+
+    return BenchmarkCase(
+        name=f"noise.standard_normal[n={assemblies}]",
+        group="micro",
+        setup=setup,
+        params={"assemblies": assemblies},
+        iterations=iterations,
+        warmup=10,
+    )
+
+
+def loader_case(*, scale: float = 1.0, iterations: int = 30) -> BenchmarkCase:
+    """
+    Full loader pass (neuron bases, regions, profiles, compile).
+    """
+    return BenchmarkCase(
+        name=f"loader.compile[scale={scale}]",
+        group="micro",
+        setup=lambda: (lambda: compile_brain(scale=scale)),
+        params={"scale": scale},
+        iterations=iterations,
+        warmup=3,
+    )
+
+
+# ============================================================
+# Offline pipelines
+# ============================================================
+
+def learning_pipeline_case(*, records: int = 200, terms: int = 500, iterations: int = 50) -> BenchmarkCase:
+    """
+    Learning bundle construction from inspection-surface artifacts,
+    followed by a bundle diff.
+    """
+    def setup() -> Callable[[], None]:
+        rng = random.Random(0)
+        adapter = LearningPipelineInputAdapter()
+
+        def _records(offset: int) -> List[SemanticActivationRecord]:
+            return [
+                SemanticActivationRecord(
+                    activations={f"sem:{rng.randrange(terms)}": rng.random() for _ in range(20)},
+                    snapshot_index=offset + i,
+                )
+                for i in range(records)
+            ]
+
+        patterns = PatternRecord(pattern_counts={
+            EpisodeSignature(
+                length_steps=n,
+                event_count=n % 7,
+                event_types=frozenset({"open", "close"}),
+                region_ids=frozenset({"GPi", "STN"}),
+                transition_counts=(),
+            ): n
+            for n in range(1, 200)
+        })
+        a_records = _records(0)
+        b_records = _records(records)
+
+        def op() -> None:
+            a = adapter.from_inspection_surface(
+                replay_id="bench:a", semantic_activation_records=a_records, pattern_record=patterns,
+            )
+            b = adapter.from_inspection_surface(
+                replay_id="bench:b", semantic_activation_records=b_records, pattern_record=patterns,
+            )
+            diff_learning_bundles(a, b)
+        return op
+
+    return BenchmarkCase(
+        name=f"learning.bundle_build_and_diff[records={records}]",
+        group="offline",
+        setup=setup,
+        params={"records": records, "terms": terms},
+        iterations=iterations,
+        warmup=3,
+    )
+
+
+class _InMemoryEpisodes:
+    def __init__(self, frames_per_episode: Dict[str, int]) -> None:
+        self._frames = frames_per_episode
+
+    def replay_episode(self, episode_id: str):
+        return (ObservationFrame(step=i) for i in range(self._frames[episode_id]))
+
+
+class _SupportDrive:
+    """
+    Per-frame support drive so hypotheses actually move.
+    """
+
+    def __init__(self, runner: HypothesisRunner, registry: ArrayHypothesisRegistry) -> None:
+        self._runner = runner
+        self._support = registry.columns().support
+        self.stabilization_events = runner.stabilization_events
+        self.bias_suggestions = runner.bias_suggestions
+
+    def step(self, frame: ObservationFrame) -> None:
+        support = self._support
+        for i in range(len(support)):
+            support[i] += 0.001 * ((i % 7) + 1)
+        self._runner.step(frame)
+
+    def build_timeline(self):
+        return None
+
+
+def _make_runner(hypotheses: int) -> _SupportDrive:
+    registry = ArrayHypothesisRegistry()
+    for i in range(hypotheses):
+        registry.create(hypothesis_id=f"H{i}", created_step=0)
+
+    runner = HypothesisRunner(
+        registry=registry,
+        grounding=HypothesisGrounding(),
+        competition=HypothesisCompetition(competition_gain=0.02),
+        dynamics=HypothesisDynamics(),
+        stabilization=HypothesisStabilization(activation_threshold=0.5, sustain_steps=3),
+        bias=HypothesisBias(),
+        support_mapper=SupportToActivation(gain=5.0, midpoint=0.4),
+    )
+    return _SupportDrive(runner, registry)
+
+
+def replay_pipeline_case(
+    *,
+    episodes: int = 8,
+    frames: int = 200,
+    hypotheses: int = 64,
+    iterations: int = 20,
+) -> BenchmarkCase:
+    """
+    ReplayExecutor (NREM, per-episode runners) over in-memory episodes.
+    """
+    def setup() -> Callable[[], None]:
+        ids = [f"ep_{i}" for i in range(episodes)]
+        executor = ReplayExecutor(
+            episode_replay=_InMemoryEpisodes({eid: frames for eid in ids}),
+            runner_factory=lambda: _make_runner(hypotheses),
+            execution_config=ReplayExecutionConfig(mode="nrem", stride=1),
+        )
+        plan = ReplayPlan(request=ReplayRequest(reason="benchmark"), selected_episode_ids=ids)
+        return lambda: executor.execute(plan)
+
+    return BenchmarkCase(
+        name=f"replay.execute[episodes={episodes},frames={frames},hypotheses={hypotheses}]",
+        group="offline",
+        setup=setup,
+        params={"episodes": episodes, "frames": frames, "hypotheses": hypotheses},
+        iterations=iterations,
+        warmup=2,
+    )
+
+
+def micro_cases() -> List[BenchmarkCase]:
+    return [
+        competition_kernel_case(),
+        runtime_context_case(),
+        population_step_case(),
+        population_read_case(),
+        noise_vector_case(),
+        loader_case(),
+    ]
+
+
+def offline_cases() -> List[BenchmarkCase]:
+    return [
+        learning_pipeline_case(),
+        replay_pipeline_case(),
+    ]
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import itertools
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import loader.loader as loader_module
+from loader.loader import NeuralFrameworkLoader
+from engine.runtime import BrainRuntime
+from engine.drivers.visual_temporal_driver import VisualTemporalDriver
+from engine.execution.execution_state import ExecutionState
+from engine.execution.execution_gate import ExecutionGate
+
+from benchmarks.harness import BenchmarkCase
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+DEFAULT_SCALE = 1.0
+DEFAULT_TOGGLES = "default"
+DEFAULT_SCRIPT = "poke_sweep"
+
+SCALES: Sequence[float] = (1.0, 0.5, 0.25)
+
+
+# ============================================================
+# Brain construction
+# ============================================================
+
+def compile_brain(*, scale: float = DEFAULT_SCALE, root: Path = REPO_ROOT) -> Dict[str, Any]:
+    """
+    Compile the brain with the loader's ASSEMBLY_DOWNSCALE set to
+    `scale` (restored afterwards). Loader debug output is discarded.
+    """
+    previous = loader_module.ASSEMBLY_DOWNSCALE
+    loader_module.ASSEMBLY_DOWNSCALE = float(scale)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ldr = NeuralFrameworkLoader(root)
+            ldr.load_neuron_bases()
+            ldr.load_regions()
+            ldr.load_profiles()
+            return ldr.compile(
+                expression_profile="human_default",
+                state_profile="awake",
+                compound_profile="experimental",
+            )
+    finally:
+        loader_module.ASSEMBLY_DOWNSCALE = previous
+
+
+class _ScaledBrainRuntime(BrainRuntime):
+    """
+    BrainRuntime with config/assembly_control.json counts scaled.
+    """
+
+    assembly_scale: float = 1.0
+
+    def _load_assembly_control(self) -> Dict[str, int]:
+        base = super()._load_assembly_control()
+        if self.assembly_scale == 1.0:
+            return base
+        return {k: max(1, int(round(n * self.assembly_scale))) for k, n in base.items()}
+
+
+def build_runtime(*, scale: float = DEFAULT_SCALE, dt: float = 0.01) -> BrainRuntime:
+    """
+    Runtime at `scale`: assembly counts (assembly_control.json) and
+    neuron counts (loader ASSEMBLY_DOWNSCALE) are both scaled.
+    """
+    cls = type("ScaledBrainRuntime", (_ScaledBrainRuntime,), {"assembly_scale": float(scale)})
+    return cls(compile_brain(scale=scale), dt=dt)
+
+
+# ============================================================
+# Feature toggles
+# ============================================================
+
+def _set_execution_gate(rt: BrainRuntime, enabled: bool) -> None:
+    rt.execution_state = ExecutionState(enabled=enabled)
+    rt.execution_gate = ExecutionGate(rt.execution_state)
+
+
+def _no_observation(rt: BrainRuntime) -> None:
+    # Observation feeds the episodic boundary hook; both go together
+    rt._observation_hook = None
+
+
+TOGGLES: Dict[str, Callable[[BrainRuntime], None]] = {
+    "default": lambda rt: None,
+    "no_salience": lambda rt: setattr(rt, "enable_salience", False),
+    "no_vta_value": lambda rt: setattr(rt, "enable_vta_value", False),
+    "urgency_on": lambda rt: setattr(rt, "enable_urgency", True),
+    "no_observation": _no_observation,
+    "execution_gate_on": lambda rt: _set_execution_gate(rt, True),
+    "execution_gate_off": lambda rt: _set_execution_gate(rt, False),
+}
+
+
+# ============================================================
+# Stimulus scripts (called once per step, before runtime.step())
+# ============================================================
+
+_SWEEP_REGIONS = ("striatum", "pfc", "vta", "thalamus", "stn")
+
+
+def _poke_sweep() -> Callable[[BrainRuntime, int], None]:
+    def script(rt: BrainRuntime, i: int) -> None:
+        if i % 10 == 0:
+            region = _SWEEP_REGIONS[(i // 10) % len(_SWEEP_REGIONS)]
+            rt.inject_stimulus(region, magnitude=0.1 + 0.05 * ((i // 50) % 4))
+    return script
+
+
+def _competing_inputs() -> Callable[[BrainRuntime, int], None]:
+    def script(rt: BrainRuntime, i: int) -> None:
+        if i % 5 == 0:
+            rt.inject_stimulus("striatum", "D1_MSN", magnitude=0.30)
+            rt.inject_stimulus("striatum", "D2_MSN", magnitude=0.25)
+    return script
+
+
+def _visual_driver() -> Callable[[BrainRuntime, int], None]:
+    driver = VisualTemporalDriver(onset_step=20, offset_step=160, magnitude=0.60)
+
+    def script(rt: BrainRuntime, i: int) -> None:
+        driver.step(rt)
+    return script
+
+
+SCRIPTS: Dict[str, Callable[[], Callable[[BrainRuntime, int], None]]] = {
+    "poke_sweep": _poke_sweep,
+    "competing_inputs": _competing_inputs,
+    "visual_driver": _visual_driver,
+}
+
+
+# ============================================================
+# Cases
+# ============================================================
+
+def runtime_step_case(
+    *,
+    scale: float = DEFAULT_SCALE,
+    toggles: str = DEFAULT_TOGGLES,
+    script: str = DEFAULT_SCRIPT,
+    iterations: int = 200,
+    warmup: int = 20,
+) -> BenchmarkCase:
+    """
+    BrainRuntime.step() (including the stimulus script) for one
+    point of the scale x toggles x script matrix.
+    """
+    if toggles not in TOGGLES:
+        raise KeyError(f"Unknown toggle set: {toggles}")
+    if script not in SCRIPTS:
+        raise KeyError(f"Unknown stimulus script: {script}")
+
+    def setup() -> Callable[[], None]:
+        rt = build_runtime(scale=scale)
+        TOGGLES[toggles](rt)
+        drive = SCRIPTS[script]()
+        counter = itertools.count()
+
+        def op() -> None:
+            drive(rt, next(counter))
+            rt.step()
+        return op
+
+    return BenchmarkCase(
+        name=f"runtime.step[scale={scale},toggles={toggles},script={script}]",
+        group="runtime",
+        setup=setup,
+        params={"scale": scale, "toggles": toggles, "script": script},
+        iterations=iterations,
+        warmup=warmup,
+    )
+
+
+def runtime_cases(
+    *,
+    matrix: str = "axes",
+    scales: Optional[Iterable[float]] = None,
+    toggles: Optional[Iterable[str]] = None,
+    scripts: Optional[Iterable[str]] = None,
+    iterations: int = 200,
+    warmup: int = 20,
+) -> List[BenchmarkCase]:
+    """
+    Runtime step cases.
+
+    matrix:
+    - "axes": vary one axis at a time around the defaults
+    - "full": full scale x toggles x script product
+    """
+    scales = list(SCALES if scales is None else scales)
+    toggles = list(TOGGLES if toggles is None else toggles)
+    scripts = list(SCRIPTS if scripts is None else scripts)
+
+    if matrix == "full":
+        points = list(itertools.product(scales, toggles, scripts))
+    elif matrix == "axes":
+        points = [(s, DEFAULT_TOGGLES, DEFAULT_SCRIPT) for s in scales]
+        points += [(DEFAULT_SCALE, t, DEFAULT_SCRIPT) for t in toggles]
+        points += [(DEFAULT_SCALE, DEFAULT_TOGGLES, sc) for sc in scripts]
+        points = list(dict.fromkeys(points))
+    else:
+        raise ValueError(f"Unknown matrix: {matrix}")
+
+    return [
+        runtime_step_case(scale=s, toggles=t, script=sc, iterations=iterations, warmup=warmup)
+        for s, t, sc in points
+    ]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.baseline import compare_results, load_results, save_results
+from benchmarks.harness import BenchmarkCase, BenchmarkResult, run_case, summarize
+
+
+def _result(name: str, p50_us: float) -> BenchmarkResult:
+    return summarize(name=name, group="fake", params={}, samples_ns=[int(p50_us * 1000)] * 5)
+
+
+def test_run_case_times_every_iteration() -> None:
+    calls = []
+
+    def setup():
+        calls.append("setup")
+        return lambda: calls.append("op")
+
+    r = run_case(BenchmarkCase(name="fake.op", group="fake", setup=setup, iterations=7, warmup=3))
+
+    assert calls.count("setup") == 1
+    assert calls.count("op") == 10
+    assert r.iterations == 7
+    assert r.min_us <= r.p50_us <= r.p99_us <= r.max_us
+    assert r.ops_per_s > 0
+
+
+def test_results_roundtrip_through_baseline_file(tmp_path: Path) -> None:
+    results = [_result("a", 10.0), _result("b", 250.0)]
+    path = save_results(tmp_path / "baselines" / "base.json", results)
+
+    loaded = load_results(path)
+    assert loaded == {r.name: r for r in results}
+
+
+def test_compare_flags_regressions_past_threshold() -> None:
+    baseline = {"a": _result("a", 100.0), "b": _result("b", 100.0), "c": _result("c", 100.0)}
+    current = {"a": _result("a", 105.0), "b": _result("b", 130.0), "c": _result("c", 60.0)}
+
+    report = compare_results(baseline, current, threshold=0.10)
+
+    assert [c.name for c in report.regressions] == ["b"]
+    assert not report.ok
+    assert [c.name for c in report.comparisons if c.improved] == ["c"]
+    assert "REGRESSED" in report.format()
+
+
+def test_throughput_metric_is_oriented_as_slowdown() -> None:
+    baseline = {"a": _result("a", 100.0)}
+    current = {"a": _result("a", 200.0)}
+
+    report = compare_results(baseline, current, metric="ops_per_s", threshold=0.10)
+    assert report.regressions[0].ratio == pytest.approx(2.0)
+
+
+def test_missing_and_new_cases_do_not_gate() -> None:
+    report = compare_results({"old": _result("old", 1.0)}, {"new": _result("new", 1.0)})
+    assert report.ok
+    assert report.missing == ["old"]
+    assert report.added == ["new"]
+
+
+def test_reference_baseline_covers_the_default_matrix() -> None:
+    from benchmarks.__main__ import REFERENCE_BASELINE, _collect
+
+    reference = load_results(REFERENCE_BASELINE)
+    assert set(reference) == {c.name for c in _collect("axes")}
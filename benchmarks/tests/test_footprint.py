@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from benchmarks.footprint import FOOTPRINT_CASES, footprints, measure_footprint
+
+
+def test_footprints_cover_every_record_type() -> None:
+    results = footprints(count=200)
+    assert [f.name for f in results] == list(FOOTPRINT_CASES)
+    assert all(f.bytes_per_object > 0 for f in results)
+
+
+def test_dict_backed_objects_measure_larger() -> None:
+    class Plain:
+        def __init__(self, i: int) -> None:
+            self.a = i
+            self.b = float(i)
+
+    class Slotted:
+        __slots__ = ("a", "b")
+
+        def __init__(self, i: int) -> None:
+            self.a = i
+            self.b = float(i)
+
+    plain = measure_footprint("plain", Plain, count=2000)
+    slotted = measure_footprint("slotted", Slotted, count=2000)
+    assert plain.has_dict and not slotted.has_dict
+    assert slotted.bytes_per_object < plain.bytes_per_object
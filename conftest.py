@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+import pytest
+
+from engine.runtime import BrainRuntime
+from loader.compiled_cache import compiled_brain as _compiled_brain
+
+
+ROOT = Path(__file__).resolve().parent
+
+
+# --------------------------------------------------
+# Shared runtime setup
+# --------------------------------------------------
+#
+# Building a runtime (and warming it up) is done once per session;
+# each test gets its own fork of that template.
+
+@pytest.fixture
+def compiled_brain() -> Dict[str, Any]:
+    # minimal / awake / experimental, as the engine tests use
+    return _compiled_brain(ROOT)
+
+
+@pytest.fixture(scope="session")
+def _runtime_templates() -> Dict[Tuple[int, int], BrainRuntime]:
+    return {}
+
+
+@pytest.fixture
+def fork_runtime(
+    _runtime_templates: Dict[Tuple[int, int], BrainRuntime],
+) -> Callable[..., BrainRuntime]:
+    """
+    fork_runtime(warmup=0, noise_seed=0) -> a fork of a session-wide
+    runtime that has run `warmup` unstimulated steps.
+    """
+
+    def make(*, warmup: int = 0, noise_seed: int = 0) -> BrainRuntime:
+        key = (int(warmup), int(noise_seed))
+        template = _runtime_templates.get(key)
+        if template is None:
+            template = BrainRuntime(_compiled_brain(ROOT), noise_seed=noise_seed)
+            for _ in range(key[0]):
+                template.step()
+            _runtime_templates[key] = template
+        return template.fork()
+
+    return make
+
+
+@pytest.fixture
+def runtime(fork_runtime: Callable[..., BrainRuntime]) -> BrainRuntime:
+    return fork_runtime()
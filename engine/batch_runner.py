@@ -0,0 +1,416 @@
+"""
+Headless, max-speed batch runs driven by a declarative schedule.
+
+    python -m engine.batch_runner SCHEDULE.json [--steps N] [--seed S]
+        [--summary run_summary.json] [--trace regions.jsonl.gz]
+        [--record-every K] [--quiet]
+
+No UI, no TCP, no wall-clock pacing: the brain is loaded once and
+stepped as fast as possible. Scheduled commands use the command
+server's language (poke, poke_pop, salience_set, reset_latch, ...).
+
+Schedule file (JSON):
+
+    {
+      "brain": {"expression_profile": "human_default",
+                "state_profile": "awake",
+                "compound_profile": "experimental"},
+      "dt": 0.01,
+      "steps": 2000,
+      "noise_seed": 0,
+      "kernel_trace": false,
+      "multirate": true,
+      "shards": 0,
+      "record": {"every": 10, "regions": ["striatum", "gpi"]},
+      "commands": [
+        {"at": 0, "command": "sustain 5"},
+        {"at": 100, "command": "poke_pop striatum D1_MSN 0.3"},
+        {"at": 200, "every": 50, "until": 1000, "command": "poke pfc 0.2"}
+      ],
+      "stimuli": [
+        {"region": "visual_input", "population": "VISUAL_SIGNAL",
+         "start": 500, "stop": 800, "magnitude": 0.6},
+        {"region": "striatum", "start": 900, "stop": 1000,
+         "shape": "ramp", "magnitude": 0.0, "end_magnitude": 0.4}
+      ]
+    }
+
+A command scheduled "at" step N is issued when runtime.step_count == N,
+i.e. before the step that advances it to N + 1. "stimuli" are
+StimulusSegment dicts, precompiled into a stimulus timeline; their
+steps are the step_count during the step (command "at" N and stimulus
+step N + 1 land on the same step). "multirate" is true (recommended
+slow-field periods) or a {subsystem: period} map. "shards" > 0 steps
+population physiology in that many worker processes (same results,
+see BrainRuntime.start_shards).
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, IO, List, Optional, Sequence
+
+from engine.command_server import make_command_handler
+from engine.multirate import SLOW_PERIODS
+from engine.runtime import BrainRuntime
+from engine.stimulus_timeline import StimulusTimeline
+from memory.inspection.exporters.streaming import open_export
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+DEFAULT_BRAIN = {
+    "expression_profile": "human_default",
+    "state_profile": "awake",
+    "compound_profile": "experimental",
+}
+
+
+# ============================================================
+# Schedule
+# ============================================================
+
+@dataclass(frozen=True)
+class ScheduledCommand:
+    """
+    One command, issued at step `at` (and every `every` steps after,
+    up to and including `until`, when periodic).
+    """
+
+    at: int
+    command: str
+    every: Optional[int] = None
+    until: Optional[int] = None
+
+    def fires_at(self, step: int) -> bool:
+        if step < self.at:
+            return False
+        if self.every is None:
+            return step == self.at
+        if self.until is not None and step > self.until:
+            return False
+        return (step - self.at) % self.every == 0
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "ScheduledCommand":
+        if "command" not in data or "at" not in data:
+            raise ValueError(f"Scheduled command needs 'at' and 'command': {data}")
+        every = data.get("every")
+        if every is not None and int(every) < 1:
+            raise ValueError("'every' must be >= 1")
+        return ScheduledCommand(
+            at=int(data["at"]),
+            command=str(data["command"]),
+            every=None if every is None else int(every),
+            until=None if data.get("until") is None else int(data["until"]),
+        )
+
+
+@dataclass(frozen=True)
+class RunSchedule:
+    steps: int
+    dt: float = 0.01
+    noise_seed: int = 0
+    brain: Dict[str, str] = field(default_factory=lambda: dict(DEFAULT_BRAIN))
+    commands: List[ScheduledCommand] = field(default_factory=list)
+    record_every: int = 0
+    record_regions: Optional[List[str]] = None
+    kernel_trace: bool = False
+    stimuli: StimulusTimeline = field(default_factory=StimulusTimeline)
+    multirate: Optional[Dict[str, int]] = None
+    shards: int = 0
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "RunSchedule":
+        steps = int(data.get("steps", 0))
+        if steps < 0:
+            raise ValueError("steps must be >= 0")
+
+        record = data.get("record") or {}
+        regions = record.get("regions")
+
+        multirate = data.get("multirate")
+        if multirate is True:
+            multirate = dict(SLOW_PERIODS)
+        elif not multirate:
+            multirate = None
+        else:
+            multirate = {str(k): int(v) for k, v in multirate.items()}
+
+        return RunSchedule(
+            steps=steps,
+            dt=float(data.get("dt", 0.01)),
+            noise_seed=int(data.get("noise_seed", 0)),
+            brain={**DEFAULT_BRAIN, **(data.get("brain") or {})},
+            commands=[ScheduledCommand.from_dict(c) for c in data.get("commands", [])],
+            record_every=int(record.get("every", 0)),
+            record_regions=None if regions is None else [str(r) for r in regions],
+            kernel_trace=bool(data.get("kernel_trace", False)),
+            stimuli=StimulusTimeline.from_dicts(data.get("stimuli", [])),
+            multirate=multirate,
+            shards=int(data.get("shards", 0)),
+        )
+
+    @staticmethod
+    def load(path: str | Path) -> "RunSchedule":
+        return RunSchedule.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+# ============================================================
+# Trace sinks
+# ============================================================
+
+TraceSink = Callable[[BrainRuntime], None]
+
+
+class RegionStatsSink:
+    """
+    JSON Lines trace of per-region stats (mass/mean/std), one line
+    per record. Compression follows the path suffix (.gz/.bz2/.xz).
+    """
+
+    def __init__(self, path: str | Path, *, regions: Optional[Sequence[str]] = None) -> None:
+        self.path = Path(path)
+        self.regions = None if regions is None else list(regions)
+        self.lines = 0
+        self._fh: Optional[IO[str]] = None
+
+    def __call__(self, runtime: BrainRuntime) -> None:
+        if self._fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open_export(self.path, "w")
+
+        regions = self.regions if self.regions is not None else sorted(runtime.region_states)
+        stats = {}
+        for rid in regions:
+            s = runtime.snapshot_region_stats(rid)
+            if s:
+                stats[rid] = {"mass": s["mass"], "mean": s["mean"], "std": s["std"]}
+
+        self._fh.write(json.dumps(
+            {"step": runtime.step_count, "time": runtime.time, "regions": stats},
+            sort_keys=True, separators=(",", ":"),
+        ) + "\n")
+        self.lines += 1
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+# ============================================================
+# Summary
+# ============================================================
+
+@dataclass(frozen=True)
+class RunSummary:
+    steps: int
+    final_step: int
+    sim_time: float
+    wall_s: float
+    steps_per_s: float
+    noise_seed: int
+    commands: List[Dict[str, Any]]
+    errors: int
+    decisions: List[Dict[str, Any]]
+    final_regions: Dict[str, Dict[str, float]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "steps": self.steps,
+            "final_step": self.final_step,
+            "sim_time": self.sim_time,
+            "wall_s": self.wall_s,
+            "steps_per_s": self.steps_per_s,
+            "noise_seed": self.noise_seed,
+            "commands": list(self.commands),
+            "errors": self.errors,
+            "decisions": list(self.decisions),
+            "final_regions": dict(self.final_regions),
+        }
+
+    def write(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2, sort_keys=True, default=str), encoding="utf-8")
+        return path
+
+
+# ============================================================
+# Runner
+# ============================================================
+
+def load_runtime(schedule: RunSchedule, *, root: Path = ROOT, quiet: bool = False) -> BrainRuntime:
+    """
+    Compile the schedule's brain profiles and build a runtime
+    (with the schedule's stimulus timeline attached).
+    """
+    from loader.loader import NeuralFrameworkLoader
+
+    out = io.StringIO() if quiet else sys.stdout
+    with contextlib.redirect_stdout(out):
+        loader = NeuralFrameworkLoader(root)
+        loader.load_neuron_bases()
+        loader.load_regions()
+        loader.load_profiles()
+        brain = loader.compile(**schedule.brain)
+
+    runtime = BrainRuntime(brain, dt=schedule.dt, noise_seed=schedule.noise_seed)
+    if not schedule.kernel_trace:
+        runtime.competition_kernel.TRACE_PATH = None
+    if schedule.stimuli.segments:
+        runtime.add_stimulus_timeline(schedule.stimuli)
+    if schedule.multirate:
+        runtime.configure_multirate(schedule.multirate)
+    if schedule.shards > 0:
+        runtime.start_shards(schedule.shards)
+    return runtime
+
+
+class HeadlessRunner:
+    """
+    Steps a runtime through a schedule with no pacing and no I/O
+    other than the given trace sinks.
+    """
+
+    def __init__(self, runtime: BrainRuntime) -> None:
+        self.runtime = runtime
+        self._handle = make_command_handler(runtime)
+
+    def run(
+        self,
+        schedule: RunSchedule,
+        *,
+        steps: Optional[int] = None,
+        sinks: Sequence[TraceSink] = (),
+        record_every: Optional[int] = None,
+    ) -> RunSummary:
+        rt = self.runtime
+        n = schedule.steps if steps is None else int(steps)
+        every = schedule.record_every if record_every is None else int(record_every)
+
+        start = rt.step_count
+        end = start + n
+
+        # One-shot commands indexed by step; periodic ones checked per step
+        one_shot: Dict[int, List[ScheduledCommand]] = {}
+        periodic: List[ScheduledCommand] = []
+        for c in schedule.commands:
+            if c.every is None:
+                one_shot.setdefault(c.at, []).append(c)
+            else:
+                periodic.append(c)
+
+        log: List[Dict[str, Any]] = []
+        decisions: List[Dict[str, Any]] = []
+        errors = 0
+        handle = self._handle
+        had_decision = rt.get_decision_state() is not None
+
+        t0 = time.perf_counter()
+        while rt.step_count < end:
+            step = rt.step_count
+
+            due = one_shot.get(step, [])
+            if periodic:
+                due = due + [c for c in periodic if c.fires_at(step)]
+            for c in due:
+                try:
+                    resp = handle(c.command)
+                except Exception as e:
+                    resp = f"ERROR: {e}"
+                if resp.startswith("ERROR"):
+                    errors += 1
+                log.append({"at": step, "command": c.command, "response": resp})
+
+            rt.step()
+
+            decision = rt.get_decision_state()
+            if decision is not None and not had_decision:
+                decisions.append({"step": rt.step_count, **decision})
+            had_decision = decision is not None
+
+            if sinks and every > 0 and rt.step_count % every == 0:
+                for sink in sinks:
+                    sink(rt)
+
+        wall = time.perf_counter() - t0
+
+        final_regions = {}
+        for rid in sorted(rt.region_states):
+            s = rt.snapshot_region_stats(rid)
+            if s:
+                final_regions[rid] = {"mass": s["mass"], "mean": s["mean"]}
+
+        return RunSummary(
+            steps=n,
+            final_step=rt.step_count,
+            sim_time=rt.time,
+            wall_s=wall,
+            steps_per_s=(n / wall) if wall > 0 else 0.0,
+            noise_seed=rt.noise.seed,
+            commands=log,
+            errors=errors,
+            decisions=decisions,
+            final_regions=final_regions,
+        )
+
+
+# ============================================================
+# CLI
+# ============================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m engine.batch_runner")
+    parser.add_argument("schedule", type=Path)
+    parser.add_argument("--steps", type=int, default=None, help="override schedule steps")
+    parser.add_argument("--seed", type=int, default=None, help="override noise seed")
+    parser.add_argument("--summary", type=Path, default=None, help="write run summary JSON here")
+    parser.add_argument("--trace", type=Path, default=None, help="region stats JSONL (.gz/.bz2/.xz ok)")
+    parser.add_argument("--record-every", type=int, default=None)
+    parser.add_argument("--quiet", action="store_true", help="suppress loader output")
+    args = parser.parse_args(argv)
+
+    schedule = RunSchedule.load(args.schedule)
+    if args.seed is not None:
+        schedule = replace(schedule, noise_seed=args.seed)
+
+    runtime = load_runtime(schedule, quiet=args.quiet)
+
+    sinks: List[RegionStatsSink] = []
+    if args.trace is not None:
+        sinks.append(RegionStatsSink(args.trace, regions=schedule.record_regions))
+
+    record_every = args.record_every
+    if sinks and record_every is None and schedule.record_every <= 0:
+        record_every = 1
+
+    try:
+        summary = HeadlessRunner(runtime).run(
+            schedule, steps=args.steps, sinks=sinks, record_every=record_every,
+        )
+    finally:
+        for sink in sinks:
+            sink.close()
+        runtime.stop_shards()
+
+    if args.summary is not None:
+        summary.write(args.summary)
+
+    print(
+        f"[RUN] steps={summary.steps} wall={summary.wall_s:.2f}s "
+        f"({summary.steps_per_s:.1f} steps/s) decisions={len(summary.decisions)} "
+        f"command_errors={summary.errors}"
+    )
+    return 1 if summary.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+
+@dataclass
+class HypothesisColumns:
+    """
+    Column-oriented hypothesis state (one slot per hypothesis).
+
+    All columns are index-aligned with `ids` and owned by
+    ArrayHypothesisRegistry. Vectorized phase implementations
+    (step_columns / compute_bias_columns) read and write these
+    in place.
+
+    `layout_version` changes whenever slots are added or removed,
+    so consumers holding slot-aligned caches can re-align.
+    """
+
+    ids: List[str] = field(default_factory=list)
+    created_step: array = field(default_factory=lambda: array("q"))
+    support: array = field(default_factory=lambda: array("d"))
+    activation: array = field(default_factory=lambda: array("d"))
+    age: array = field(default_factory=lambda: array("q"))
+    active: bytearray = field(default_factory=bytearray)
+    stabilized: bytearray = field(default_factory=bytearray)
+    layout_version: int = 0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class HypothesisSlot:
+    """
+    Attribute view of one hypothesis in an ArrayHypothesisRegistry.
+
+    Mirrors the Hypothesis dataclass fields so scalar phase modules
+    and callers keep working unchanged. Reads and writes go straight
+    to the registry columns.
+    """
+
+    __slots__ = ("_registry", "hypothesis_id")
+
+    def __init__(self, registry: "ArrayHypothesisRegistry", hypothesis_id: str) -> None:
+        self._registry = registry
+        self.hypothesis_id = hypothesis_id
+
+    def _i(self) -> int:
+        return self._registry._index[self.hypothesis_id]
+
+    @property
+    def created_step(self) -> int:
+        return self._registry._cols.created_step[self._i()]
+
+    @property
+    def activation(self) -> float:
+        return self._registry._cols.activation[self._i()]
+
+    @activation.setter
+    def activation(self, value: float) -> None:
+        self._registry._cols.activation[self._i()] = value
+
+    @property
+    def support(self) -> float:
+        return self._registry._cols.support[self._i()]
+
+    @support.setter
+    def support(self, value: float) -> None:
+        self._registry._cols.support[self._i()] = value
+
+    @property
+    def age(self) -> int:
+        return self._registry._cols.age[self._i()]
+
+    @age.setter
+    def age(self, value: int) -> None:
+        self._registry._cols.age[self._i()] = value
+
+    @property
+    def active(self) -> bool:
+        return bool(self._registry._cols.active[self._i()])
+
+    @active.setter
+    def active(self, value: bool) -> None:
+        self._registry._cols.active[self._i()] = 1 if value else 0
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Serialize hypothesis to a stable, audit-safe dict
+        (same shape as Hypothesis.to_dict).
+        """
+        return {
+            "hypothesis_id": self.hypothesis_id,
+            "created_step": self.created_step,
+            "activation": self.activation,
+            "support": self.support,
+            "age": self.age,
+            "active": self.active,
+        }
+
+    def __repr__(self) -> str:
+        return f"HypothesisSlot({self.to_dict()!r})"
+
+
+class ArrayHypothesisRegistry:
+    """
+    Array-backed drop-in for HypothesisRegistry.
+
+    Hypothesis state is stored column-wise (HypothesisColumns) rather
+    than as one object per hypothesis. The object API (create/get/all)
+    returns HypothesisSlot views over the columns; HypothesisRunner
+    detects this registry and drives the vectorized phase paths.
+
+    Same guarantees as HypothesisRegistry:
+    - Registry is inert by default
+    - No automatic stepping
+    - No runtime or region coupling
+    - Read-only exposure to outside systems
+    """
+
+    def __init__(self) -> None:
+        self._cols = HypothesisColumns()
+        self._index: Dict[str, int] = {}
+        self._slots: Dict[str, HypothesisSlot] = {}
+
+    # ------------------------------------------------------------
+    # Creation / Removal
+    # ------------------------------------------------------------
+
+    def create(self, *, hypothesis_id: str, created_step: int) -> HypothesisSlot:
+        """
+        Create and register a new hypothesis.
+
+        Raises if the ID already exists.
+        """
+        if hypothesis_id in self._index:
+            raise ValueError(f"Hypothesis '{hypothesis_id}' already exists")
+
+        cols = self._cols
+        self._index[hypothesis_id] = len(cols.ids)
+        cols.ids.append(hypothesis_id)
+        cols.created_step.append(int(created_step))
+        cols.support.append(0.0)
+        cols.activation.append(0.0)
+        cols.age.append(0)
+        cols.active.append(1)
+        cols.stabilized.append(0)
+        cols.layout_version += 1
+
+        slot = HypothesisSlot(self, hypothesis_id)
+        self._slots[hypothesis_id] = slot
+        return slot
+
+    def remove(self, hypothesis_id: str) -> None:
+        """
+        Explicitly remove a hypothesis (order of the rest preserved).
+        """
+        if hypothesis_id not in self._index:
+            raise KeyError(f"Hypothesis '{hypothesis_id}' not found")
+
+        i = self._index.pop(hypothesis_id)
+        del self._slots[hypothesis_id]
+
+        cols = self._cols
+        for column in (
+            cols.ids,
+            cols.created_step,
+            cols.support,
+            cols.activation,
+            cols.age,
+            cols.active,
+            cols.stabilized,
+        ):
+            del column[i]
+        cols.layout_version += 1
+
+        for j in range(i, len(cols.ids)):
+            self._index[cols.ids[j]] = j
+
+    # ------------------------------------------------------------
+    # Access (read-only by convention)
+    # ------------------------------------------------------------
+
+    def get(self, hypothesis_id: str) -> HypothesisSlot | None:
+        """
+        Retrieve a hypothesis by ID.
+        """
+        return self._slots.get(hypothesis_id)
+
+    def all(self) -> Tuple[HypothesisSlot, ...]:
+        """
+        Immutable snapshot of all hypotheses (slot views).
+        """
+        return tuple(self._slots.values())
+
+    def index_of(self, hypothesis_id: str) -> int:
+        """
+        Column slot of a hypothesis (valid until the next create/remove).
+        """
+        return self._index[hypothesis_id]
+
+    def columns(self) -> HypothesisColumns:
+        """
+        Live column state for vectorized phase implementations.
+        """
+        return self._cols
+
+    def __len__(self) -> int:
+        return len(self._cols.ids)
+
+    # ------------------------------------------------------------
+    # Optional bookkeeping (explicit only)
+    # ------------------------------------------------------------
+
+    def tick(self) -> None:
+        """
+        Explicit age advancement for active hypotheses.
+        """
+        cols = self._cols
+        cols.age[:] = array("q", [a + 1 if on else a for a, on in zip(cols.age, cols.active)])
+
+    # ------------------------------------------------------------
+    # Inspection / Audit
+    # ------------------------------------------------------------
+
+    def dump_state(self) -> Dict[str, Dict]:
+        """
+        Stable, audit-safe dump of registry contents.
+        """
+        return {
+            hid: slot.to_dict()
+            for hid, slot in self._slots.items()
+        }
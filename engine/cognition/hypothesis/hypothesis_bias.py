@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Dict, Iterable
 
 from engine.cognition.hypothesis import Hypothesis
+from engine.cognition.hypothesis.hypothesis_array_registry import HypothesisColumns
 
 
 class HypothesisBias:
@@ -65,3 +66,27 @@ class HypothesisBias:
                 bias[h.hypothesis_id] = value
 
         return bias
+
+    def compute_bias_columns(self, columns: HypothesisColumns) -> Dict[str, float]:
+        """
+        Column-wise equivalent of compute_bias() over hypotheses
+        flagged in columns.stabilized.
+        """
+        bias: Dict[str, float] = {}
+        gain = self.bias_gain
+        cap = self.max_bias
+
+        for hid, a, on, stable in zip(
+            columns.ids, columns.activation, columns.active, columns.stabilized
+        ):
+            if not (on and stable):
+                continue
+
+            value = gain * a
+            if value > cap:
+                value = cap
+
+            if value > 0.0:
+                bias[hid] = value
+
+        return bias
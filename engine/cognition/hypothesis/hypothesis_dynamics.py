@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from array import array
 from typing import Iterable
 
 from engine.cognition.hypothesis import Hypothesis
+from engine.cognition.hypothesis.hypothesis_array_registry import HypothesisColumns
 
 
 class HypothesisDynamics:
@@ -53,3 +55,26 @@ class HypothesisDynamics:
             if h.activation < self.min_activation:
                 h.activation = 0.0
                 h.active = False
+
+    def step_columns(self, columns: HypothesisColumns) -> None:
+        """
+        Column-wise equivalent of step() for ArrayHypothesisRegistry.
+        """
+        activation = columns.activation
+        active = columns.active
+        rate = self.decay_rate
+        floor = self.min_activation
+
+        out_act = array("d")
+        out_on = bytearray()
+        for a, on in zip(activation, active):
+            if on:
+                a -= rate * a
+                if a < floor:
+                    a = 0.0
+                    on = 0
+            out_act.append(a)
+            out_on.append(on)
+
+        activation[:] = out_act
+        active[:] = out_on
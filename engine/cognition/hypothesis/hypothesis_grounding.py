@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from array import array
 from typing import Dict, Iterable, Tuple
 
 from engine.cognition.hypothesis import Hypothesis
+from engine.cognition.hypothesis.hypothesis_array_registry import HypothesisColumns
 from engine.population_model import PopulationModel
 
 
@@ -57,3 +59,28 @@ class HypothesisGrounding:
 
             if h.support > self.max_support:
                 h.support = self.max_support
+
+    def step_columns(
+        self,
+        columns: HypothesisColumns,
+        *,
+        total_signal: float = 0.0,
+    ) -> None:
+        """
+        Column-wise equivalent of step() for ArrayHypothesisRegistry.
+
+        total_signal is the summed output of the observed assemblies.
+        """
+        delta = self.support_gain * total_signal
+        cap = self.max_support
+
+        support = columns.support
+        out = array("d")
+        for s, on in zip(support, columns.active):
+            if on:
+                s += delta
+                if s > cap:
+                    s = cap
+            out.append(s)
+        support[:] = out
+
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from array import array
 from typing import Dict, Iterable, List
 
 from engine.cognition.hypothesis import Hypothesis
+from engine.cognition.hypothesis.hypothesis_array_registry import HypothesisColumns
 
 
 class HypothesisStabilization:
@@ -35,6 +37,12 @@ class HypothesisStabilization:
         # internal counters (ephemeral, not persisted)
         self._counters: Dict[str, int] = {}
 
+        # slot-aligned counters for step_columns (synced via _counters
+        # whenever the registry layout changes)
+        self._column_counters = array("q")
+        self._column_ids: List[str] = []
+        self._column_layout = -1
+
     # ------------------------------------------------------------
     # Core logic
     # ------------------------------------------------------------
@@ -67,3 +75,43 @@ class HypothesisStabilization:
                 )
 
         return events
+
+    def step_columns(self, columns: HypothesisColumns) -> List[Dict]:
+        """
+        Column-wise equivalent of step() for ArrayHypothesisRegistry.
+        """
+        if columns.layout_version != self._column_layout:
+            self._realign(columns)
+
+        events: List[Dict] = []
+        threshold = self.activation_threshold
+        sustain = self.sustain_steps
+        counters = self._column_counters
+
+        for i, (a, on) in enumerate(zip(columns.activation, columns.active)):
+            if on and a >= threshold:
+                counters[i] += 1
+            else:
+                counters[i] = 0
+
+            if counters[i] == sustain:
+                events.append(
+                    {
+                        "event": "hypothesis_stabilized",
+                        "hypothesis_id": columns.ids[i],
+                        "activation": a,
+                        "age": columns.age[i],
+                    }
+                )
+
+        return events
+
+    def _realign(self, columns: HypothesisColumns) -> None:
+        for hid, count in zip(self._column_ids, self._column_counters):
+            self._counters[hid] = count
+
+        self._column_ids = list(columns.ids)
+        self._column_counters = array(
+            "q", [self._counters.get(hid, 0) for hid in self._column_ids]
+        )
+        self._column_layout = columns.layout_version
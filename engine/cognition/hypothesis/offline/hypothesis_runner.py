@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from array import array
 from typing import Iterable, List, Dict, Any, Set
 import inspect
 
@@ -7,6 +8,7 @@ from engine.cognition.hypothesis.offline.observation_frame import ObservationFra
 from engine.cognition.hypothesis.offline.support_to_activation import SupportToActivation
 
 from engine.cognition.hypothesis.hypothesis_registry import HypothesisRegistry
+from engine.cognition.hypothesis.hypothesis_array_registry import ArrayHypothesisRegistry
 from engine.cognition.hypothesis.hypothesis_grounding import HypothesisGrounding
 from engine.cognition.hypothesis.hypothesis_competition import HypothesisCompetition
 from engine.cognition.hypothesis.hypothesis_dynamics import HypothesisDynamics
@@ -23,6 +25,11 @@ class HypothesisRunner:
     - No runtime authority
     - No memory writes
     - Deterministic step order
+
+    With an ArrayHypothesisRegistry, each phase runs over the registry
+    columns (step_columns / compute_bias_columns) instead of per-object
+    loops. Phase modules without a column path are driven through the
+    registry's slot views, so mixed setups remain valid.
     """
 
     def __init__(
@@ -55,14 +62,23 @@ class HypothesisRunner:
         self._grounding_params = set(inspect.signature(self.grounding.step).parameters.keys())
         self._stabilization_params = set(inspect.signature(self.stabilization.step).parameters.keys())
 
+        # Resolved once, not per frame
+        self._grounding_uses_assemblies = "observed_assemblies" in self._grounding_params
+        self._stabilization_takes_step = "step" in self._stabilization_params
+        self._columnar = isinstance(self.registry, ArrayHypothesisRegistry)
+
     def step(self, obs: ObservationFrame) -> None:
+        if self._columnar:
+            self._step_columns(obs)
+            return
+
         # 1) Registry tick (ages)
         self.registry.tick()
         hypotheses = self.registry.all()
 
         # 2) Grounding (two supported forms)
         # Preferred canonical: observed_assemblies=Iterable[PopulationModel]
-        if "observed_assemblies" in self._grounding_params:
+        if self._grounding_uses_assemblies:
             # ObservationFrame only has scalars, so default to "no assemblies observed"
             # (Integration test will supply a real list via a wrapper/adapter when ready.)
             self.grounding.step(hypotheses=hypotheses, observed_assemblies=[])
@@ -81,7 +97,7 @@ class HypothesisRunner:
         self.dynamics.step(hypotheses)
 
         # 6) Stabilization (canonical has no step kw)
-        if "step" in self._stabilization_params:
+        if self._stabilization_takes_step:
             events = self.stabilization.step(hypotheses, step=obs.step)  # legacy
         else:
             events = self.stabilization.step(hypotheses)
@@ -100,6 +116,74 @@ class HypothesisRunner:
         if bias_map:
             self.bias_suggestions.append(bias_map)
 
+    def _step_columns(self, obs: ObservationFrame) -> None:
+        """
+        Same phase order as step(), over ArrayHypothesisRegistry columns.
+        """
+        registry: ArrayHypothesisRegistry = self.registry  # type: ignore[assignment]
+
+        # 1) Registry tick (ages)
+        registry.tick()
+        cols = registry.columns()
+
+        # 2) Grounding (no assemblies observed from scalar frames)
+        grounding_columns = getattr(self.grounding, "step_columns", None)
+        if grounding_columns is not None and self._grounding_uses_assemblies:
+            grounding_columns(cols, total_signal=0.0)
+        elif self._grounding_uses_assemblies:
+            self.grounding.step(hypotheses=registry.all(), observed_assemblies=[])
+        else:
+            self.grounding.step(hypotheses=registry.all(), assembly_outputs=obs.assembly_outputs or {})
+
+        # 3) Support -> activation
+        map_many = getattr(self.support_mapper, "map_many", None)
+        if map_many is not None:
+            cols.activation[:] = array("d", map_many(cols.support))
+        else:
+            cols.activation[:] = array("d", [self.support_mapper.map(s) for s in cols.support])
+
+        # 4) Competition
+        competition_columns = getattr(self.competition, "step_columns", None)
+        if competition_columns is not None:
+            competition_columns(cols)
+        else:
+            self.competition.step(registry.all())
+
+        # 5) Dynamics
+        dynamics_columns = getattr(self.dynamics, "step_columns", None)
+        if dynamics_columns is not None:
+            dynamics_columns(cols)
+        else:
+            self.dynamics.step(registry.all())
+
+        # 6) Stabilization
+        stabilization_columns = getattr(self.stabilization, "step_columns", None)
+        if stabilization_columns is not None:
+            events = stabilization_columns(cols)
+        elif self._stabilization_takes_step:
+            events = self.stabilization.step(registry.all(), step=obs.step)  # legacy
+        else:
+            events = self.stabilization.step(registry.all())
+
+        if events:
+            self.stabilization_events.extend(events)
+            for e in events:
+                hid = e.get("hypothesis_id")
+                if isinstance(hid, str):
+                    self._stabilized_ids.add(hid)
+                    cols.stabilized[registry.index_of(hid)] = 1
+
+        # 7) Bias (ONLY from stabilized hypotheses)
+        bias_columns = getattr(self.bias, "compute_bias_columns", None)
+        if bias_columns is not None:
+            bias_map = bias_columns(cols)
+        else:
+            stabilized = [h for h in registry.all() if h.hypothesis_id in self._stabilized_ids]
+            bias_map = self.bias.compute_bias(stabilized_hypotheses=stabilized)
+
+        if bias_map:
+            self.bias_suggestions.append(bias_map)
+
     def run(self, frames: Iterable[ObservationFrame]) -> None:
         for obs in frames:
             self.step(obs)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from typing import Iterable, List
 
 
 class SupportToActivation:
@@ -54,4 +55,38 @@ class SupportToActivation:
         if act > self.max_activation:
             return self.max_activation
         return act
-### passed all tests ###
\ No newline at end of file
+### passed all tests ###
+
+    def map_many(self, supports: Iterable[float]) -> List[float]:
+        """
+        Map a column of support values; identical results to map(),
+        with the per-call attribute lookups hoisted out of the loop.
+        """
+        gain = self.gain
+        midpoint = self.midpoint
+        max_activation = self.max_activation
+        exp = math.exp
+        isfinite = math.isfinite
+
+        out: List[float] = []
+        for support in supports:
+            if not isfinite(support):
+                out.append(0.0)
+                continue
+
+            x = gain * (support - midpoint)
+            if x >= 60.0:
+                out.append(max_activation)
+                continue
+            if x <= -60.0:
+                out.append(0.0)
+                continue
+
+            act = 1.0 / (1.0 + exp(-x))
+            if act < 0.0:
+                act = 0.0
+            elif act > max_activation:
+                act = max_activation
+            out.append(act)
+
+        return out
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from engine.cognition.hypothesis.offline.observation_frame import ObservationFrame
+from engine.cognition.hypothesis.offline.support_to_activation import SupportToActivation
+from engine.cognition.hypothesis.offline.hypothesis_runner import HypothesisRunner
+
+from engine.cognition.hypothesis.hypothesis_registry import HypothesisRegistry
+from engine.cognition.hypothesis.hypothesis_array_registry import ArrayHypothesisRegistry
+from engine.cognition.hypothesis.hypothesis_grounding import HypothesisGrounding
+from engine.cognition.hypothesis.hypothesis_competition import HypothesisCompetition
+from engine.cognition.hypothesis.hypothesis_dynamics import HypothesisDynamics
+from engine.cognition.hypothesis.hypothesis_stabilization import HypothesisStabilization
+from engine.cognition.hypothesis.hypothesis_bias import HypothesisBias
+
+
+def _run(registry):
+    handles = [
+        registry.create(hypothesis_id=f"H{i}", created_step=0)
+        for i in range(6)
+    ]
+
+    runner = HypothesisRunner(
+        registry=registry,
+        grounding=HypothesisGrounding(),
+        competition=HypothesisCompetition(competition_gain=0.02),
+        dynamics=HypothesisDynamics(),
+        stabilization=HypothesisStabilization(activation_threshold=0.5, sustain_steps=3),
+        bias=HypothesisBias(),
+        support_mapper=SupportToActivation(gain=5.0, midpoint=0.4),
+    )
+
+    for step in range(20):
+        for i, h in enumerate(handles):
+            h.support += 0.05 * (i + 1)
+        if step == 10:
+            registry.remove("H2")
+            handles.pop(2)
+        runner.step(ObservationFrame(step=step))
+
+    return runner, registry.dump_state()
+
+
+def test_array_registry_runner_matches_object_registry() -> None:
+    """
+    The columnar runner path must reproduce the per-object path exactly.
+    """
+    obj_runner, obj_state = _run(HypothesisRegistry())
+    arr_runner, arr_state = _run(ArrayHypothesisRegistry())
+
+    assert arr_runner.stabilization_events
+    assert arr_runner.stabilization_events == obj_runner.stabilization_events
+    assert arr_runner.bias_suggestions == obj_runner.bias_suggestions
+    assert arr_state == obj_state
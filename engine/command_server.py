@@ -3,7 +3,10 @@ from __future__ import annotations
 import json
 import socket
 import threading
-from typing import List, Optional, Tuple, Dict, Any
+from typing import Callable, List, Optional, Tuple, Dict, Any
+
+from engine.inspection.memory_accounting import print_report
+from inspection.recruitment.region_dump_columns import BINARY_SUFFIX, write_region_dump
 
 
 # ============================================================
@@ -196,38 +199,59 @@ def _top_assemblies(runtime, region_label: str, n: int) -> str:
         f"{aid} :: {val:.4f}" for aid, val in rows[: max(1, n)]
     )
 
-def _dump_assemblies_json(runtime, region_label: str) -> str:
+def _dump_assemblies(runtime, region_label: str, fmt: str = "bin") -> str:
     """
     Inspection-only.
-    Writes per-assembly activity/output to a JSON file.
+    Writes per-assembly activity/output to a binary columnar dump
+    (default) or, with fmt="json", a JSON file.
     """
     region_id = _resolve_region(runtime, region_label)
     region = runtime.region_states.get(region_id)
     if not region:
         return f"ERROR: unknown region '{region_label}' (resolved='{region_id}')"
 
-    assemblies = []
+    assembly_ids: List[str] = []
+    populations: List[str] = []
+    activity: List[float] = []
+    output: List[float] = []
     for pop_label, plist in region.get("populations", {}).items():
         for pop in plist:
-            assemblies.append({
-                "assembly_id": pop.assembly_id,
-                "population": pop_label,
-                "activity": float(getattr(pop, "activity", 0.0)),
-                "output": float(pop.output()),
-            })
-
-    payload = {
-        "region": region_id,
-        "step": getattr(runtime, "step_count", None),
-        "time": getattr(runtime, "time", None),
-        "assemblies": assemblies,
-    }
-
-    filename = f"assembly_dump_{region_id}_{payload['step']}.json"
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
-
-    return f"OK wrote {len(assemblies)} assemblies to {filename}"
+            assembly_ids.append(pop.assembly_id)
+            populations.append(pop_label)
+            activity.append(float(getattr(pop, "activity", 0.0)))
+            output.append(float(pop.output()))
+
+    step = getattr(runtime, "step_count", None)
+    time = getattr(runtime, "time", None)
+
+    if fmt == "json":
+        payload = {
+            "region": region_id,
+            "step": step,
+            "time": time,
+            "assemblies": [
+                {"assembly_id": aid, "population": p, "activity": act, "output": out}
+                for aid, p, act, out in zip(assembly_ids, populations, activity, output)
+            ],
+        }
+
+        filename = f"assembly_dump_{region_id}_{step}.json"
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+    else:
+        filename = f"assembly_dump_{region_id}_{step}{BINARY_SUFFIX}"
+        write_region_dump(
+            filename,
+            region=region_id,
+            step=step if step is not None else -1,
+            time=time,
+            assembly_ids=assembly_ids,
+            populations=populations,
+            activity=activity,
+            output=output,
+        )
+
+    return f"OK wrote {len(assembly_ids)} assemblies to {filename}"
 
 # ============================================================
 # Context diagnostics
@@ -290,11 +314,11 @@ def _salience_set(runtime, assembly_id: str, value: float) -> str:
     return f"OK salience {assembly_id} = {value}"
 
 def _set_hypothesis(runtime, assembly_id: str, hypothesis_id: str) -> str:
-    reg = getattr(runtime, "hypothesis_registry", None)
-    if not reg:
+    if not hasattr(runtime, "set_assembly_hypothesis"):
         return "ERROR: hypothesis system not enabled"
 
-    reg.assign(assembly_id, hypothesis_id)
+    if not runtime.set_assembly_hypothesis(assembly_id, hypothesis_id):
+        return f"ERROR: unknown assembly {assembly_id}"
     return f"OK hypothesis {assembly_id} -> {hypothesis_id}"
 
 
@@ -477,6 +501,76 @@ def _dump_fx(runtime) -> str:
     return "ERROR: Decision FX not supported by runtime"
 
 
+# ============================================================
+# Memory accounting (read-only)
+# ============================================================
+
+def _dump_memory(runtime, args: List[str]) -> str:
+    if not hasattr(runtime, "memory_accountant"):
+        return "ERROR: memory accounting not supported by runtime"
+
+    acct = runtime.memory_accountant()
+
+    if not args:
+        return acct.sample(runtime.step_count).format()
+
+    sub = args[0].lower()
+
+    if sub == "trace" and len(args) == 2 and args[1].lower() in ("on", "off"):
+        if args[1].lower() == "on":
+            acct.start_tracing()
+        else:
+            acct.stop_tracing()
+        return f"OK mem trace {args[1].lower()}"
+
+    if sub == "reset":
+        acct.reset()
+        return "OK mem reset"
+
+    if sub == "report" and len(args) == 2 and args[1].lower() == "off":
+        runtime.disable_memory_report()
+        return "OK mem report off"
+
+    if sub == "report" and len(args) == 3:
+        # Operator asked for reports: print them on the runtime console
+        runtime.enable_memory_report(
+            sample_every=int(args[1]),
+            report_every=int(args[2]),
+            sink=print_report,
+        )
+        return f"OK mem report every {int(args[2])} (sample every {int(args[1])})"
+
+    return "ERROR: usage mem [trace on|off | reset | report <sample_every> <report_every> | report off]"
+
+
+# ============================================================
+# Live state export (read-only)
+# ============================================================
+
+def _live_export(runtime, args: List[str]) -> str:
+    if not hasattr(runtime, "enable_live_export"):
+        return "ERROR: live export not supported by runtime"
+
+    if not args:
+        live = runtime.live_export
+        if live is None:
+            return "LIVE: off"
+        return f"LIVE: {live.name} every {live.every}"
+
+    sub = args[0].lower()
+
+    if sub == "off" and len(args) == 1:
+        runtime.disable_live_export()
+        return "OK live off"
+
+    if sub == "on" and len(args) <= 2:
+        every = int(args[1]) if len(args) == 2 else 1
+        live = runtime.enable_live_export(every=every)
+        return f"OK live {live.name} every {live.every}"
+
+    return "ERROR: usage live [on [every] | off]"
+
+
 # ============================================================
 # Latch controls
 # ============================================================
@@ -525,10 +619,16 @@ def _reset_latch(runtime) -> str:
 
 
 # ============================================================
-# TCP Server
+# Command dispatch
 # ============================================================
 
-def start_command_server(runtime, host: str = "127.0.0.1", port: int = 5557):
+def make_command_handler(runtime) -> Callable[[str], str]:
+    """
+    Command-line dispatcher bound to `runtime`.
+
+    Shared by the TCP server and headless runs (engine.batch_runner);
+    transport-free, so scheduled commands behave exactly like typed ones.
+    """
 
     def help_text() -> str:
         return (
@@ -564,7 +664,9 @@ def start_command_server(runtime, host: str = "127.0.0.1", port: int = 5557):
             "  hypotheses\n"
             "  working\n"
             "  fx, or decision_fx\n"
-            "  dump_asm <region>\n"
+            "  dump_asm <region> [json]\n"
+            "  mem [trace on|off | reset | report <sample_every> <report_every> | report off]\n"
+            "  live [on [every] | off]\n"
             "  help"
         )
 
@@ -613,7 +715,10 @@ def start_command_server(runtime, host: str = "127.0.0.1", port: int = 5557):
             return "ERROR: usage top <region> <N>"
         
         if op == "dump_asm" and len(parts) == 2:
-            return _dump_assemblies_json(runtime, parts[1])       
+            return _dump_assemblies(runtime, parts[1])
+
+        if op == "dump_asm" and len(parts) == 3 and parts[2].lower() in ("json", "bin"):
+            return _dump_assemblies(runtime, parts[1], parts[2].lower())
 
         if op in ("context", "ctx"):
             return _dump_context(runtime)
@@ -689,6 +794,18 @@ def start_command_server(runtime, host: str = "127.0.0.1", port: int = 5557):
         if op == "urgency_trace":
             return _dump_urgency_trace(runtime)
 
+        # -----------------------------
+        # Memory accounting (read-only)
+        # -----------------------------
+        if op == "mem":
+            return _dump_memory(runtime, parts[1:])
+
+        # -----------------------------
+        # Live state export (read-only)
+        # -----------------------------
+        if op == "live":
+            return _live_export(runtime, parts[1:])
+
         # -----------------------------
         # Pre-decision salience priming
         # -----------------------------
@@ -707,6 +824,24 @@ def start_command_server(runtime, host: str = "127.0.0.1", port: int = 5557):
 
         return "ERROR: unknown command"
 
+    return handle
+
+
+# ============================================================
+# TCP Server
+# ============================================================
+
+def start_command_server(
+    runtime,
+    host: str = "127.0.0.1",
+    port: int = 5557,
+    *,
+    handle: Optional[Callable[[str], str]] = None,
+):
+    # handle: custom dispatcher (e.g. engine.input_journal.JournaledSession.handle)
+    if handle is None:
+        handle = make_command_handler(runtime)
+
     def loop():
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
             s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
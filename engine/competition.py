@@ -91,6 +91,8 @@ class CompetitionKernel:
         dt: float,
         external_gain: Optional[Dict[str, float]] = None,
         external_bias: Optional[Dict[str, float]] = None,
+        channels: Optional[Dict[str, List]] = None,
+        span: int = 1,
     ) -> float:
         """
         Apply channel-level competition.
@@ -106,6 +108,13 @@ class CompetitionKernel:
             aggregated strictly at the CHANNEL level
         external_bias:
             Optional per-channel additive bias (e.g. context / persistence)
+        channels:
+            Optional precomputed channel -> assemblies grouping of
+            `assemblies` (e.g. a cached routing table); read, not modified
+        span:
+            Base steps of length dt this call covers (adaptive
+            stepping); dominance smoothing is the closed form of
+            `span` single steps with the instantaneous map held
 
         Returns
         -------
@@ -122,11 +131,11 @@ class CompetitionKernel:
         # 1. Group assemblies by semantic channel
         # --------------------------------------------------
 
-        channels: Dict[str, List] = {}
-
-        for a in assemblies:
-            ch = getattr(a, self.channel_key, None) or "default"
-            channels.setdefault(ch, []).append(a)
+        if channels is None:
+            channels = {}
+            for a in assemblies:
+                ch = getattr(a, self.channel_key, None) or "default"
+                channels.setdefault(ch, []).append(a)
 
         # Retain dominance state only for live channels
         self._dominance = {ch: self._dominance.get(ch, 0.0) for ch in channels}
@@ -194,6 +203,8 @@ class CompetitionKernel:
         # --------------------------------------------------
 
         alpha = min(dt / self.dominance_tau, 1.0)
+        if span > 1:
+            alpha = 1.0 - (1.0 - alpha) ** span
 
         for ch, d in inst.items():
             prev = self._dominance.get(ch, d)
@@ -259,7 +270,11 @@ class CompetitionKernel:
         """
         Append per-step dominance trace.
         One row per channel, per apply().
+
+        Disabled when TRACE_PATH is None (headless batch runs).
         """
+        if self.TRACE_PATH is None:
+            return
 
         if not self.TRACE_PATH.parent.exists():
             self.TRACE_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Dict, Optional
 
 from engine.execution.execution_target import ExecutionTarget
+from memory.decay import DecayingMap, linear_efolds
 
 
 class DecisionBias:
@@ -33,8 +34,8 @@ class DecisionBias:
         self.max_bias = float(max_bias)
         self.suppress_gain = float(suppress_gain)
 
-        # channel_id -> bias value
-        self._bias: Dict[str, float] = {}
+        # channel_id -> bias value (decays lazily; pruned at |v| <= 1e-6)
+        self._bias: DecayingMap[str] = DecayingMap(epsilon=1e-6)
 
         # Diagnostics
         self.last_winner: Optional[str] = None
@@ -61,16 +62,16 @@ class DecisionBias:
         strength = max(0.0, min(1.0, float(strength)))
 
         win_bias = min(self.max_bias, self.max_bias * strength)
-        self._bias[winner] = win_bias
+        self._bias.set(winner, win_bias)
 
         if channels:
             for ch in channels:
                 if ch == winner:
                     continue
-                self._bias[ch] = max(
+                self._bias.set(ch, max(
                     -self.max_bias,
                     -self.suppress_gain * win_bias,
-                )
+                ))
 
         self.last_winner = winner
         self.last_applied_step = step
@@ -114,26 +115,20 @@ class DecisionBias:
         if self.decay_tau <= 0:
             self._bias.clear()
         else:
-            decay = float(dt) / self.decay_tau
-            for ch in list(self._bias.keys()):
-                v = self._bias[ch] * (1.0 - decay)
-                if abs(v) <= 1e-6:
-                    del self._bias[ch]
-                else:
-                    self._bias[ch] = v
+            self._bias.advance(linear_efolds(dt, self.decay_tau))
 
         # --------------------------------------------------
         # Apply ephemeral external modifiers
         # --------------------------------------------------
         if self._external_modifiers:
-            bias = dict(self._bias)
+            bias = self._bias.dump()
 
             for fn in self._external_modifiers:
                 bias = fn(bias)
 
             self._external_modifiers.clear()
 
-            self._bias = bias
+            self._bias.replace(bias)
 
         # --------------------------------------------------
         # Execution gate (FINAL, per-channel)
@@ -153,11 +148,11 @@ class DecisionBias:
                 if abs(gv) > 1e-6:
                     gated[ch] = max(-self.max_bias, min(self.max_bias, gv))
 
-            self._bias = gated
+            self._bias.replace(gated)
 
     # ------------------------------------------------------------
     # Diagnostics
     # ------------------------------------------------------------
 
     def dump(self) -> Dict[str, float]:
-        return dict(self._bias)
+        return self._bias.dump()
@@ -0,0 +1,392 @@
+"""
+Find the first step (and step phase) where two runtime configurations
+diverge under the same input schedule.
+
+    python -m engine.divergence SCHEDULE.json --a A.json --b B.json
+        [--every 64] [--steps N] [--quiet]
+
+SCHEDULE.json is a batch-runner schedule (engine.batch_runner): its
+commands and stimuli drive both runs. A/B are configurations (a path
+or inline JSON):
+
+    {"label": "baseline",
+     "schedule": {"multirate": true},        # schedule key overrides
+     "attributes": {"gpi_gain": 0.6}}        # runtime attributes to set
+
+Both runs are hashed every `every` steps (per-region activity and
+input, dominance, latch, gate, slow fields) with a checkpoint kept at
+the last matching hash. After the first mismatch, checkpoints bisect
+the interval to the exact step, and that step is re-run with a phase
+probe (engine.runtime.STEP_PHASES) to find the first stage at which
+any field differs.
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import hashlib
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from engine.batch_runner import ROOT, RunSchedule, ScheduledCommand, load_runtime
+from engine.command_server import make_command_handler
+from engine.runtime import BrainRuntime
+
+
+# ============================================================
+# Configuration
+# ============================================================
+
+@dataclass(frozen=True)
+class RunConfig:
+    """
+    One side of a comparison.
+
+    - schedule: overrides merged into the shared schedule dict
+      (brain, dt, noise_seed, multirate, ...; not commands/stimuli)
+    - attributes: runtime attributes set after construction
+    - setup: extra configuration, called on the built runtime
+    """
+
+    label: str
+    schedule: Dict[str, Any] = field(default_factory=dict)
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    setup: Optional[Callable[[BrainRuntime], None]] = None
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any], *, label: str) -> "RunConfig":
+        return RunConfig(
+            label=str(data.get("label", label)),
+            schedule=dict(data.get("schedule") or {}),
+            attributes=dict(data.get("attributes") or {}),
+        )
+
+    def build(self, schedule: Dict[str, Any], *, root: Path, quiet: bool) -> Tuple[BrainRuntime, RunSchedule]:
+        sched = RunSchedule.from_dict({**schedule, **self.schedule})
+        runtime = load_runtime(sched, root=root, quiet=quiet)
+        for name, value in self.attributes.items():
+            if not hasattr(runtime, name):
+                raise ValueError(f"{self.label}: runtime has no attribute {name!r}")
+            setattr(runtime, name, value)
+        if self.setup is not None:
+            self.setup(runtime)
+        return runtime, sched
+
+
+# ============================================================
+# State fields
+# ============================================================
+
+def capture_fields(runtime: BrainRuntime) -> Dict[str, Any]:
+    """
+    Readable state compared between runs, by field name.
+
+    Regions contribute `region:<key>.activity` and `.input` (tuples in
+    population order); the rest are scalars or plain mappings.
+    """
+    runtime.sync_shards()
+
+    fields: Dict[str, Any] = {
+        "clock": (runtime.step_count, runtime.time),
+    }
+    for key, state in runtime.region_states.items():
+        pops = [p for plist in state["populations"].values() for p in plist]
+        if not pops:
+            continue
+        fields[f"region:{key}.activity"] = tuple(p.activity for p in pops)
+        fields[f"region:{key}.input"] = tuple(p.input for p in pops)
+
+    snap = getattr(runtime, "_last_striatum_snapshot", {}) or {}
+    fields["dominance"] = dict(snap.get("dominance", {}))
+    fields["latch"] = {
+        "fired": runtime._decision_fired,
+        "counter": runtime._decision_counter,
+        "state": runtime.get_decision_state(),
+    }
+    fields["gate"] = runtime._last_gate_strength
+    fields["urgency_gain"] = runtime._urgency_gain
+    fields["value"] = runtime.value_signal.get()
+    fields["salience"] = runtime.salience.dump()
+    fields["context"] = runtime.context.dump()
+    fields["decision_bias"] = runtime.get_decision_bias()
+    fields["persistence"] = runtime.bg_persistence.dump()
+    # Slow fields hold their value between updates (see multirate)
+    fields["multirate"] = {
+        name: (int(s["period"]), int(s["pending"]))
+        for name, s in runtime.multirate.stats().items()
+    }
+    return fields
+
+
+def _digest(value: Any) -> bytes:
+    raw = json.dumps(value, sort_keys=True, default=repr) if not isinstance(value, tuple) else repr(value)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).digest()
+
+
+def field_digests(runtime: BrainRuntime) -> Dict[str, bytes]:
+    return {name: _digest(v) for name, v in capture_fields(runtime).items()}
+
+
+def _differing(a: Dict[str, bytes], b: Dict[str, bytes]) -> List[str]:
+    return [k for k in list(a) + [k for k in b if k not in a] if a.get(k) != b.get(k)]
+
+
+# ============================================================
+# Runs
+# ============================================================
+
+class _Run:
+    """
+    A runtime plus its schedule's commands, steppable to any step
+    and clonable as a checkpoint.
+    """
+
+    def __init__(self, runtime: BrainRuntime, commands: List[ScheduledCommand]) -> None:
+        if runtime._shards is not None:
+            raise ValueError("Divergence search needs single-process runtimes")
+        self.runtime = runtime
+        self.commands = commands
+        self._handle = make_command_handler(runtime)
+
+    @property
+    def step(self) -> int:
+        return self.runtime.step_count
+
+    def clone(self) -> "_Run":
+        return _Run(copy.deepcopy(self.runtime), self.commands)
+
+    def issue_commands(self) -> None:
+        step = self.runtime.step_count
+        for c in self.commands:
+            if c.fires_at(step):
+                try:
+                    self._handle(c.command)
+                except Exception:
+                    pass
+
+    def advance_to(self, step: int) -> None:
+        while self.runtime.step_count < step:
+            self.issue_commands()
+            self.runtime.step()
+
+    def digest(self) -> Dict[str, bytes]:
+        return field_digests(self.runtime)
+
+
+# ============================================================
+# Report
+# ============================================================
+
+@dataclass(frozen=True)
+class DivergenceReport:
+    """
+    - step: step_count after the first divergent step (0: the runs
+      differ before stepping)
+    - phase: first STEP_PHASES stage with a differing field ("commands"
+      if issuing that step's commands already differs)
+    - fields: fields differing at that phase
+    - details: short per-field description of the difference
+    - steps_run: total steps simulated across both runs, including
+      bisection re-runs
+    """
+
+    labels: Tuple[str, str]
+    steps: int
+    diverged: bool
+    step: Optional[int] = None
+    phase: Optional[str] = None
+    fields: Tuple[str, ...] = ()
+    details: Dict[str, str] = field(default_factory=dict)
+    steps_run: int = 0
+
+    def format(self, *, limit: int = 8) -> str:
+        a, b = self.labels
+        if not self.diverged:
+            return f"DIVERGENCE {a} vs {b}: none in {self.steps} steps"
+        lines = [
+            f"DIVERGENCE {a} vs {b}: step {self.step} phase {self.phase} "
+            f"({len(self.fields)} field(s); {self.steps_run} steps simulated)"
+        ]
+        for name in self.fields[:limit]:
+            lines.append(f"  {name}: {self.details.get(name, '')}")
+        if len(self.fields) > limit:
+            lines.append(f"  ... {len(self.fields) - limit} more")
+        return "\n".join(lines)
+
+
+def _describe(name: str, a: Any, b: Any, ids: Dict[str, List[str]]) -> str:
+    if isinstance(a, tuple) and isinstance(b, tuple) and name.startswith("region:"):
+        if len(a) != len(b):
+            return f"size {len(a)} vs {len(b)}"
+        diffs = [(abs(x - y), i) for i, (x, y) in enumerate(zip(a, b)) if repr(x) != repr(y)]
+        first = diffs[0][1]
+        region = name[len("region:"):].rsplit(".", 1)[0]
+        aid = ids.get(region, [])[first] if first < len(ids.get(region, [])) else first
+        return f"{len(diffs)}/{len(a)} differ, max |d|={max(diffs)[0]:.3g}, first {aid}: {a[first]!r} vs {b[first]!r}"
+    if isinstance(a, dict) and isinstance(b, dict):
+        keys = [k for k in list(a) + [k for k in b if k not in a] if repr(a.get(k)) != repr(b.get(k))]
+        shown = ", ".join(f"{k}: {a.get(k)!r} vs {b.get(k)!r}" for k in keys[:3])
+        more = f" (+{len(keys) - 3} more)" if len(keys) > 3 else ""
+        return shown + more
+    return f"{a!r} vs {b!r}"
+
+
+# ============================================================
+# Search
+# ============================================================
+
+def find_divergence(
+    schedule: Dict[str, Any],
+    a: RunConfig,
+    b: RunConfig,
+    *,
+    every: int = 64,
+    steps: Optional[int] = None,
+    root: Path = ROOT,
+    quiet: bool = True,
+) -> DivergenceReport:
+    """
+    Run both configurations on `schedule` and locate their first
+    divergent step and phase (see module docstring).
+    """
+    if every < 1:
+        raise ValueError("every must be >= 1")
+
+    rt_a, sched = a.build(schedule, root=root, quiet=quiet)
+    rt_b, _ = b.build(schedule, root=root, quiet=quiet)
+    n = sched.steps if steps is None else int(steps)
+
+    run_a = _Run(rt_a, sched.commands)
+    run_b = _Run(rt_b, sched.commands)
+    labels = (a.label, b.label)
+    steps_run = 0
+
+    if run_a.digest() != run_b.digest():
+        return _phase_report(run_a, run_b, labels, n, steps_run, built=True)
+
+    # Coarse pass: hash every `every` steps, checkpoint the last match
+    good = (run_a.clone(), run_b.clone())
+    bad_step: Optional[int] = None
+    while run_a.step < n:
+        target = min(run_a.step + every, n)
+        steps_run += 2 * (target - run_a.step)
+        run_a.advance_to(target)
+        run_b.advance_to(target)
+        if run_a.digest() != run_b.digest():
+            bad_step = target
+            break
+        good = (run_a.clone(), run_b.clone())
+
+    if bad_step is None:
+        return DivergenceReport(labels=labels, steps=n, diverged=False, steps_run=steps_run)
+
+    # Bisect (good.step, bad_step]: re-run from the latest matching
+    # checkpoint, moving it forward whenever the midpoint still matches
+    lo, hi = good[0].step, bad_step
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        probe_a, probe_b = good[0].clone(), good[1].clone()
+        steps_run += 2 * (mid - lo)
+        probe_a.advance_to(mid)
+        probe_b.advance_to(mid)
+        if probe_a.digest() == probe_b.digest():
+            lo, good = mid, (probe_a, probe_b)
+        else:
+            hi = mid
+
+    return _phase_report(good[0], good[1], labels, n, steps_run + 2)
+
+
+def _phase_report(
+    run_a: _Run,
+    run_b: _Run,
+    labels: Tuple[str, str],
+    steps: int,
+    steps_run: int,
+    *,
+    built: bool = False,
+) -> DivergenceReport:
+    """
+    Re-run one step of two matching checkpoints with a phase probe
+    (or, with built=True, compare the freshly built runtimes).
+    """
+    def recorder(run: _Run, out: List[Tuple[str, Dict[str, Any]]]) -> Callable[[str], None]:
+        return lambda phase: out.append((phase, capture_fields(run.runtime)))
+
+    phases_a: List[Tuple[str, Dict[str, Any]]] = []
+    phases_b: List[Tuple[str, Dict[str, Any]]] = []
+
+    if built:
+        phases_a.append(("build", capture_fields(run_a.runtime)))
+        phases_b.append(("build", capture_fields(run_b.runtime)))
+    else:
+        for run, out in ((run_a, phases_a), (run_b, phases_b)):
+            run.issue_commands()
+            out.append(("commands", capture_fields(run.runtime)))
+            run.runtime._phase_probe = recorder(run, out)
+            try:
+                run.runtime.step()
+            finally:
+                run.runtime._phase_probe = None
+
+    ids = {
+        key: [p.assembly_id for plist in state["populations"].values() for p in plist]
+        for key, state in run_a.runtime.region_states.items()
+    }
+
+    for (phase, fa), (_, fb) in zip(phases_a, phases_b):
+        da = {k: _digest(v) for k, v in fa.items()}
+        db = {k: _digest(v) for k, v in fb.items()}
+        names = _differing(da, db)
+        if names:
+            return DivergenceReport(
+                labels=labels,
+                steps=steps,
+                diverged=True,
+                step=run_a.step,
+                phase=phase,
+                fields=tuple(names),
+                details={k: _describe(k, fa.get(k), fb.get(k), ids) for k in names},
+                steps_run=steps_run,
+            )
+
+    raise RuntimeError("Runs diverged but the divergent step reproduced identically")
+
+
+# ============================================================
+# CLI
+# ============================================================
+
+def _load_json(arg: str) -> Dict[str, Any]:
+    if arg.lstrip().startswith("{"):
+        return json.loads(arg)
+    return json.loads(Path(arg).read_text(encoding="utf-8"))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m engine.divergence")
+    parser.add_argument("schedule", type=Path)
+    parser.add_argument("--a", required=True, help="configuration A (path or inline JSON)")
+    parser.add_argument("--b", required=True, help="configuration B (path or inline JSON)")
+    parser.add_argument("--every", type=int, default=64, help="steps between coarse hashes")
+    parser.add_argument("--steps", type=int, default=None, help="override schedule steps")
+    parser.add_argument("--quiet", action="store_true", help="suppress loader output")
+    args = parser.parse_args(argv)
+
+    report = find_divergence(
+        json.loads(args.schedule.read_text(encoding="utf-8")),
+        RunConfig.from_dict(_load_json(args.a), label="a"),
+        RunConfig.from_dict(_load_json(args.b), label="b"),
+        every=args.every,
+        steps=args.steps,
+        quiet=args.quiet,
+    )
+    print(report.format())
+    return 1 if report.diverged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from engine.stimulus_timeline import StimulusSegment, StimulusTimeline
+
 
 class VisualTemporalDriver:
     """
@@ -15,6 +17,8 @@ class VisualTemporalDriver:
     - Uses delta-based injection because runtime stimulus injection is additive
     - Does NOT modify runtime or population dynamics
     - This is a test driver, not a biological model
+    - timeline() gives the same window as a precompiled, sustained
+      stimulus for runtime.add_stimulus_timeline()
     """
 
     def __init__(
@@ -52,3 +56,18 @@ class VisualTemporalDriver:
 
         # Update state
         self._last_signal = target_signal
+
+    def timeline(self) -> StimulusTimeline:
+        """
+        Sustained VISUAL_SIGNAL drive over [onset_step, offset_step],
+        assuming driver.step() and runtime.step() advance together.
+        """
+        return StimulusTimeline(segments=(
+            StimulusSegment(
+                region="visual_input",
+                population="VISUAL_SIGNAL",
+                start=self.onset_step,
+                stop=self.offset_step + 1,
+                magnitude=self.magnitude,
+            ),
+        ))
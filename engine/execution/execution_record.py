@@ -4,7 +4,7 @@ from typing import Any
 from .execution_target import ExecutionTarget
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionRecord:
     target: ExecutionTarget
     applied: bool
@@ -1,29 +1,10 @@
 from __future__ import annotations
 
-from pathlib import Path
-
-from loader.loader import NeuralFrameworkLoader
 from engine.runtime import BrainRuntime
 
 
-def _build_runtime() -> BrainRuntime:
-    """
-    Build a fresh BrainRuntime using the canonical loader lifecycle.
-    """
-    root = Path(__file__).resolve().parents[3]
-
-    loader = NeuralFrameworkLoader(root)
-    loader.load_neuron_bases()
-    loader.load_regions()
-    loader.load_profiles()
-
-    brain = loader.compile(
-        expression_profile="minimal",
-        state_profile="awake",
-        compound_profile="experimental",
-    )
-
-    return BrainRuntime(brain)
+# Unstimulated warm-up before the measurement window
+WARMUP_STEPS = 300
 
 
 def _snapshot(runtime: BrainRuntime) -> dict:
@@ -42,7 +23,7 @@ def _snapshot(runtime: BrainRuntime) -> dict:
     }
 
 
-def test_execution_off_is_identity_runtime() -> None:
+def test_execution_off_is_identity_runtime(fork_runtime) -> None:
     """
     With execution disabled, runtime behavior must be identical
     to a baseline run with no execution influence.
@@ -51,8 +32,10 @@ def test_execution_off_is_identity_runtime() -> None:
     natural stabilization (warm-up) phase before comparison.
     """
 
-    rt_base = _build_runtime()
-    rt_exec = _build_runtime()
+    # The baseline's warm-up is shared with other tests; rt_exec
+    # warms up with its subsystems enabled
+    rt_base = fork_runtime(warmup=WARMUP_STEPS)
+    rt_exec = fork_runtime()
 
     # NOTE:
     # Execution defaults to OFF and must behave as an identity transform.
@@ -67,8 +50,7 @@ def test_execution_off_is_identity_runtime() -> None:
     # ------------------------------------------------------------
     # Warm-up phase (allow dynamics to stabilize)
     # ------------------------------------------------------------
-    for _ in range(300):
-        rt_base.step()
+    for _ in range(WARMUP_STEPS):
         rt_exec.step()
 
     # ------------------------------------------------------------
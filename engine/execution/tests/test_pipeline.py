@@ -1,6 +1,3 @@
-from pathlib import Path
-
-from loader.loader import NeuralFrameworkLoader
 from engine.runtime import BrainRuntime
 from engine.execution.execution_target import ExecutionTarget
 from memory.influence_arbitration.influence_packet import InfluencePacket
@@ -9,22 +6,7 @@ from memory.influence_arbitration.influence_packet import InfluencePacket
 from engine.execution.execution_state import ExecutionState
 from engine.execution.execution_gate import ExecutionGate
 
-def _build_runtime() -> BrainRuntime:
-    root = Path(__file__).resolve().parents[3]
-
-    loader = NeuralFrameworkLoader(root)
-    loader.load_neuron_bases()
-    loader.load_regions()
-    loader.load_profiles()
-
-    brain = loader.compile(
-        expression_profile="minimal",
-        state_profile="awake",
-        compound_profile="experimental",
-    )
-
-    rt = BrainRuntime(brain)
-
+def _enable_execution(rt: BrainRuntime) -> BrainRuntime:
     # Replace execution state properly (immutable pattern)
     rt.execution_state = ExecutionState(enabled=True)
     rt.execution_gate = ExecutionGate(rt.execution_state)
@@ -32,10 +14,10 @@ def _build_runtime() -> BrainRuntime:
     return rt
 
 
-def test_recall_adapter_direct_probe():
+def test_recall_adapter_direct_probe(runtime: BrainRuntime):
     print("\n================ DIRECT ADAPTER PROBE ==================")
 
-    rt = _build_runtime()
+    rt = _enable_execution(runtime)
 
     # --------------------------------------------------
     # 1. Manually create packet
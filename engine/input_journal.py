@@ -0,0 +1,431 @@
+"""
+Input journal: record an interactive session's mutating commands with
+the step they were applied at, then re-simulate it headlessly.
+
+    python -m engine.input_journal SESSION.njr [--quiet]
+
+Recording (step loop owns the runtime; the TCP server may call
+session.handle from its own thread):
+
+    session = JournaledSession(runtime, "session.njr", brain=profiles)
+    start_command_server(runtime, handle=session.handle)
+    while running:
+        runtime.step()
+        session.after_step()
+    session.close()
+
+Commands from other threads are queued and applied between steps, so
+each lands on a well-defined step. State digests are recorded every
+`digest_every` steps and at close; replay re-runs the commands through
+engine.batch_runner at full speed and compares them.
+
+File format (append-only, little-endian):
+
+    b"NFJRNL01" | u32 meta length | meta JSON
+    records: u8 kind | i64 step | u32 length | payload
+
+Kinds: COMMAND (UTF-8 command text), DIGEST (state digest), END.
+A file cut short by a crash reads back up to its last whole record.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib
+import json
+import struct
+import sys
+import threading
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+
+from engine.batch_runner import (
+    DEFAULT_BRAIN,
+    ROOT,
+    HeadlessRunner,
+    RunSchedule,
+    RunSummary,
+    ScheduledCommand,
+    load_runtime,
+)
+from engine.command_server import make_command_handler
+from engine.runtime import BrainRuntime
+
+
+MAGIC = b"NFJRNL01"
+_META_LEN = struct.Struct("<I")
+_RECORD = struct.Struct("<BqI")
+
+COMMAND = 1
+DIGEST = 2
+END = 3
+
+# Command-server ops that change runtime state (everything else is a read)
+MUTATING_OPS = frozenset({
+    "poke",
+    "poke_pop",
+    "poke_asm",
+    "salience_set",
+    "salience_clear",
+    "sustain",
+    "reset_latch",
+    "force_commit",
+    "value_set",
+    "value_clear",
+    "hypothesis_set",
+    "hypothesis_reset",
+    "psm_prime",
+})
+
+
+def is_mutating(cmd: str) -> bool:
+    parts = cmd.strip().split()
+    return bool(parts) and parts[0].lower() in MUTATING_OPS
+
+
+# ============================================================
+# State digest
+# ============================================================
+
+def state_digest(runtime: BrainRuntime) -> bytes:
+    """
+    Digest of the state a replay must reproduce: step, time, every
+    assembly's activity and firing rate, gate relief, striatal
+    dominance and the decision latch.
+    """
+    runtime.sync_shards()
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(struct.pack("<qd", runtime.step_count, runtime.time))
+    h.update(array("d", [p.activity for p in runtime._all_pops]).tobytes())
+    h.update(array("d", [p.firing_rate for p in runtime._all_pops]).tobytes())
+    h.update(struct.pack("<d", runtime._last_gate_strength))
+
+    snap = getattr(runtime, "_last_striatum_snapshot", {}) or {}
+    h.update(json.dumps(
+        {
+            "dominance": snap.get("dominance", {}),
+            "decision": runtime.get_decision_state(),
+        },
+        sort_keys=True,
+        default=str,
+    ).encode("utf-8"))
+    return h.digest()
+
+
+# ============================================================
+# Journal file
+# ============================================================
+
+@dataclass(frozen=True)
+class JournalRecord:
+    kind: int
+    step: int
+    payload: bytes
+
+    @property
+    def command(self) -> str:
+        return self.payload.decode("utf-8")
+
+
+@dataclass(frozen=True)
+class Journal:
+    """
+    A journal read back from disk.
+
+    - meta: brain profiles, dt, noise_seed, digest_every
+    - records: in file order
+    - complete: the session was closed (END record present)
+    """
+
+    meta: Dict[str, Any]
+    records: List[JournalRecord] = field(default_factory=list)
+    complete: bool = False
+
+    @property
+    def end_step(self) -> int:
+        return max((r.step for r in self.records), default=0)
+
+    def commands(self) -> List[Tuple[int, str]]:
+        return [(r.step, r.command) for r in self.records if r.kind == COMMAND]
+
+    def digests(self) -> Dict[int, bytes]:
+        return {r.step: r.payload for r in self.records if r.kind == DIGEST}
+
+    def to_schedule(self) -> RunSchedule:
+        """
+        Batch-runner schedule that re-issues the journaled commands
+        (one-shot, same steps, same order) up to the last record.
+        """
+        return RunSchedule(
+            steps=self.end_step,
+            dt=float(self.meta.get("dt", 0.01)),
+            noise_seed=int(self.meta.get("noise_seed", 0)),
+            brain={**DEFAULT_BRAIN, **(self.meta.get("brain") or {})},
+            commands=[ScheduledCommand(at=step, command=cmd) for step, cmd in self.commands()],
+        )
+
+
+class JournalWriter:
+    """
+    Append-only journal file; every record is flushed as written.
+    """
+
+    def __init__(self, path: str | Path, meta: Dict[str, Any]) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        raw = json.dumps(meta, sort_keys=True).encode("utf-8")
+
+        self._fh: Optional[BinaryIO] = self.path.open("wb")
+        self._fh.write(MAGIC + _META_LEN.pack(len(raw)) + raw)
+        self._fh.flush()
+
+    def write(self, kind: int, step: int, payload: bytes = b"") -> None:
+        if self._fh is None:
+            raise ValueError("Journal is closed")
+        self._fh.write(_RECORD.pack(kind, step, len(payload)) + payload)
+        self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+def read_journal(path: str | Path) -> Journal:
+    data = Path(path).read_bytes()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"Not an input journal: {path}")
+
+    pos = len(MAGIC)
+    (meta_len,) = _META_LEN.unpack_from(data, pos)
+    pos += _META_LEN.size
+    meta = json.loads(data[pos:pos + meta_len].decode("utf-8"))
+    pos += meta_len
+
+    records: List[JournalRecord] = []
+    complete = False
+    while pos + _RECORD.size <= len(data):
+        kind, step, length = _RECORD.unpack_from(data, pos)
+        end = pos + _RECORD.size + length
+        if end > len(data):
+            break
+        if kind not in (COMMAND, DIGEST, END):
+            raise ValueError(f"Unknown journal record kind {kind} at byte {pos}")
+        records.append(JournalRecord(kind, step, data[pos + _RECORD.size:end]))
+        pos = end
+        if kind == END:
+            complete = True
+            break
+
+    return Journal(meta=meta, records=records, complete=complete)
+
+
+# ============================================================
+# Recording
+# ============================================================
+
+class JournaledSession:
+    """
+    Command handler that journals mutating commands.
+
+    CONTRACT:
+    - The thread that creates the session owns the step loop and
+      calls after_step() after every runtime.step()
+    - handle() from the owner thread applies at once; from any other
+      thread mutating commands are queued and applied by the next
+      after_step(), and handle() returns their response when done
+    - Read-only commands run immediately and are not journaled
+    - Every mutating command is journaled at runtime.step_count when
+      applied (the batch runner's "at" step)
+    - `setup` names the "module:function" that configured the runtime
+      beyond its profiles; replay calls it on the rebuilt runtime
+    """
+
+    def __init__(
+        self,
+        runtime: BrainRuntime,
+        path: str | Path,
+        *,
+        brain: Optional[Dict[str, str]] = None,
+        setup: Optional[str] = None,
+        digest_every: int = 100,
+        timeout: float = 10.0,
+    ) -> None:
+        if digest_every < 1:
+            raise ValueError("digest_every must be >= 1")
+
+        self.runtime = runtime
+        self.digest_every = int(digest_every)
+        self.timeout = float(timeout)
+        self.commands = 0
+
+        self._handle = make_command_handler(runtime)
+        self._owner = threading.get_ident()
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, threading.Event, List[str]]] = []
+
+        self._writer = JournalWriter(path, {
+            "brain": {**DEFAULT_BRAIN, **(brain or {})},
+            "dt": runtime.dt,
+            "noise_seed": runtime.noise.seed,
+            "digest_every": self.digest_every,
+            "start_step": runtime.step_count,
+            "setup": setup,
+        })
+
+    @property
+    def path(self) -> Path:
+        return self._writer.path
+
+    def handle(self, cmd: str) -> str:
+        if not is_mutating(cmd):
+            return self._handle(cmd)
+        if threading.get_ident() == self._owner:
+            return self._apply(cmd)
+
+        done = threading.Event()
+        slot: List[str] = []
+        item = (cmd, done, slot)
+        with self._lock:
+            self._pending.append(item)
+
+        if not done.wait(self.timeout):
+            with self._lock:
+                if item in self._pending:
+                    self._pending.remove(item)
+                    return "ERROR: runtime is not stepping; command not applied"
+            done.wait()
+        return slot[0]
+
+    def after_step(self) -> None:
+        if self.runtime.step_count % self.digest_every == 0:
+            self._writer.write(DIGEST, self.runtime.step_count, state_digest(self.runtime))
+
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for cmd, done, slot in pending:
+            slot.append(self._apply(cmd))
+            done.set()
+
+    def close(self) -> None:
+        step = self.runtime.step_count
+        if step % self.digest_every != 0:
+            self._writer.write(DIGEST, step, state_digest(self.runtime))
+        self._writer.write(END, step)
+        self._writer.close()
+
+    def _apply(self, cmd: str) -> str:
+        self._writer.write(COMMAND, self.runtime.step_count, cmd.strip().encode("utf-8"))
+        self.commands += 1
+        try:
+            return self._handle(cmd)
+        except Exception as e:
+            return f"ERROR: {e}"
+
+
+# ============================================================
+# Replay
+# ============================================================
+
+@dataclass(frozen=True)
+class ReplayResult:
+    summary: RunSummary
+    checked: int
+    mismatches: List[int]
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+
+def resolve_setup(spec: str) -> Callable[[BrainRuntime], Any]:
+    """
+    "package.module:function" -> the function.
+    """
+    module, sep, name = spec.partition(":")
+    if not sep or not module or not name:
+        raise ValueError(f"Setup must be 'module:function': {spec}")
+    return getattr(importlib.import_module(module), name)
+
+
+class _DigestCheck:
+    def __init__(self, expected: Dict[int, bytes]) -> None:
+        self.expected = expected
+        self.checked = 0
+        self.mismatches: List[int] = []
+
+    def __call__(self, runtime: BrainRuntime) -> None:
+        want = self.expected.get(runtime.step_count)
+        if want is None:
+            return
+        self.checked += 1
+        if state_digest(runtime) != want:
+            self.mismatches.append(runtime.step_count)
+
+
+def replay_journal(
+    journal: Journal | str | Path,
+    *,
+    root: Path = ROOT,
+    quiet: bool = True,
+    setup: Optional[Callable[[BrainRuntime], None]] = None,
+) -> ReplayResult:
+    """
+    Re-simulate a journaled session headlessly and compare digests.
+
+    The runtime is rebuilt from the journal's profiles, dt and noise
+    seed, then configured by `setup` (default: the journal's recorded
+    "module:function" setup, if any). Replays start from step 0:
+    journals must be recorded from a freshly built runtime.
+    """
+    if not isinstance(journal, Journal):
+        journal = read_journal(journal)
+    if int(journal.meta.get("start_step", 0)) != 0:
+        raise ValueError("Journal was not recorded from step 0")
+    if setup is None and journal.meta.get("setup"):
+        setup = resolve_setup(journal.meta["setup"])
+
+    schedule = journal.to_schedule()
+    runtime = load_runtime(schedule, root=root, quiet=quiet)
+    if setup is not None:
+        setup(runtime)
+
+    expected = journal.digests()
+    check = _DigestCheck(expected)
+    if 0 in expected:
+        check(runtime)
+
+    summary = HeadlessRunner(runtime).run(schedule, sinks=[check], record_every=1)
+    return ReplayResult(summary=summary, checked=check.checked, mismatches=check.mismatches)
+
+
+# ============================================================
+# CLI
+# ============================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m engine.input_journal")
+    parser.add_argument("journal", type=Path)
+    parser.add_argument("--quiet", action="store_true", help="suppress loader output")
+    args = parser.parse_args(argv)
+
+    journal = read_journal(args.journal)
+    result = replay_journal(journal, quiet=args.quiet)
+    s = result.summary
+
+    print(
+        f"[REPLAY] steps={s.steps} wall={s.wall_s:.2f}s ({s.steps_per_s:.1f} steps/s) "
+        f"commands={len(s.commands)} digests={result.checked} "
+        f"mismatches={len(result.mismatches)}"
+        + ("" if journal.complete else " (journal incomplete)")
+    )
+    if result.mismatches:
+        print(f"[REPLAY] first mismatch at step {result.mismatches[0]}")
+    return 0 if result.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
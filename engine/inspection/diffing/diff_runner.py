@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict
-
 from engine.inspection.diffing.diff_report import DiffReport
 from engine.inspection.diffing.hypothesis_timeline_diff import (
-    HypothesisSummary,
+    HypothesisSummaries,
     HypothesisTimelineDiff,
     diff_hypothesis_timelines,
 )
@@ -27,14 +25,15 @@ class DiffRunner:
     def diff_hypothesis_summaries(
         self,
         *,
-        before: Dict[str, HypothesisSummary],
-        after: Dict[str, HypothesisSummary],
+        before: HypothesisSummaries,
+        after: HypothesisSummaries,
     ) -> DiffReport:
         """
         Diff two hypothesis summary mappings.
 
         Inputs are assumed to be derived from
-        comparable cognition timelines.
+        comparable cognition timelines (plain mappings or
+        summarize_hypothesis_timeline() trees).
         """
 
         hypothesis_diff: HypothesisTimelineDiff = diff_hypothesis_timelines(
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Mapping, Set, Optional, Union
+
+from memory.inspection.diffing.hash_tree import KeyedHashTree
 
 
 # ---------------------------------------------------------------------
@@ -57,13 +59,32 @@ class HypothesisTimelineDiff:
     peak_activation_changes: Dict[str, Dict[str, Optional[float]]]
 
 
+# ---------------------------------------------------------------------
+# Hash-tree summary
+# ---------------------------------------------------------------------
+
+HypothesisSummaries = Union[Mapping[str, HypothesisSummary], KeyedHashTree]
+
+
+def summarize_hypothesis_timeline(
+    summaries: Mapping[str, HypothesisSummary],
+) -> KeyedHashTree:
+    """
+    Content-hash summary of a hypothesis summary mapping.
+
+    Build once per snapshot (e.g. when a timeline is archived); diffs
+    between two summaries only visit hypotheses in changed buckets.
+    """
+    return KeyedHashTree.build(summaries.items())
+
+
 # ---------------------------------------------------------------------
 # Diff function
 # ---------------------------------------------------------------------
 
 def diff_hypothesis_timelines(
-    before: Dict[str, HypothesisSummary],
-    after: Dict[str, HypothesisSummary],
+    before: HypothesisSummaries,
+    after: HypothesisSummaries,
 ) -> HypothesisTimelineDiff:
     """
     Compute a descriptive diff between two hypothesis summary mappings.
@@ -71,7 +92,12 @@ def diff_hypothesis_timelines(
     Inputs are assumed to be:
     - keyed by hypothesis_id
     - derived from comparable timelines
+
+    Either side may be a summarize_hypothesis_timeline() tree; if
+    both are, identical subtrees are skipped.
     """
+    if isinstance(before, KeyedHashTree) or isinstance(after, KeyedHashTree):
+        return _diff_trees(_as_tree(before), _as_tree(after))
 
     before_ids: Set[str] = set(before.keys())
     after_ids: Set[str] = set(after.keys())
@@ -106,3 +132,36 @@ def diff_hypothesis_timelines(
         stabilization_changes=stabilization_changes,
         peak_activation_changes=peak_activation_changes,
     )
+
+
+def _as_tree(summaries: HypothesisSummaries) -> KeyedHashTree:
+    if isinstance(summaries, KeyedHashTree):
+        return summaries
+    return summarize_hypothesis_timeline(summaries)
+
+
+def _diff_trees(before: KeyedHashTree, after: KeyedHashTree) -> HypothesisTimelineDiff:
+    delta = before.diff(after)
+
+    stabilization_changes: Dict[str, Dict[str, Optional[int]]] = {}
+    peak_activation_changes: Dict[str, Dict[str, Optional[float]]] = {}
+
+    for hid, (b, a) in delta.changed.items():
+        if b.stabilization_step != a.stabilization_step:
+            stabilization_changes[hid] = {
+                "before": b.stabilization_step,
+                "after": a.stabilization_step,
+            }
+
+        if b.peak_activation != a.peak_activation:
+            peak_activation_changes[hid] = {
+                "before": b.peak_activation,
+                "after": a.peak_activation,
+            }
+
+    return HypothesisTimelineDiff(
+        appeared=sorted(delta.added),
+        disappeared=sorted(delta.removed),
+        stabilization_changes=stabilization_changes,
+        peak_activation_changes=peak_activation_changes,
+    )
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+"""
+Offline certification test for hash-tree hypothesis diffing.
+
+Verifies:
+- Tree-based diffs equal the mapping-based diff
+- Unchanged hypotheses are skipped via bucket digests
+"""
+
+from engine.inspection.diffing.diff_runner import DiffRunner
+from engine.inspection.diffing.hypothesis_timeline_diff import (
+    HypothesisSummary,
+    diff_hypothesis_timelines,
+    summarize_hypothesis_timeline,
+)
+
+
+def _summaries(n: int, *, bump: int = -1, drop: int = -1, extra: int = 0):
+    out = {}
+    for i in range(n):
+        if i == drop:
+            continue
+        out[f"H{i}"] = HypothesisSummary(
+            hypothesis_id=f"H{i}",
+            stabilized=i % 3 == 0,
+            stabilization_step=i * 10 if i % 3 == 0 else None,
+            peak_activation=0.5 + (0.1 if i == bump else 0.0),
+        )
+    for j in range(extra):
+        out[f"N{j}"] = HypothesisSummary(
+            hypothesis_id=f"N{j}", stabilized=False, stabilization_step=None, peak_activation=None,
+        )
+    return out
+
+
+def test_tree_diff_matches_mapping_diff() -> None:
+    before = _summaries(2000)
+    after = _summaries(2000, bump=17, drop=300, extra=2)
+
+    expected = diff_hypothesis_timelines(before, after)
+
+    t_before = summarize_hypothesis_timeline(before)
+    t_after = summarize_hypothesis_timeline(after)
+
+    assert diff_hypothesis_timelines(t_before, t_after) == expected
+    assert diff_hypothesis_timelines(t_before, after) == expected
+
+    # Only buckets holding H17, H300, N0, N1 differ
+    assert 1 <= len(t_before.changed_buckets(t_after)) <= 4
+
+    report = DiffRunner().diff_hypothesis_summaries(before=t_before, after=t_after)
+    assert report.cognition_changed
+
+
+def test_identical_trees_short_circuit() -> None:
+    t_a = summarize_hypothesis_timeline(_summaries(500))
+    t_b = summarize_hypothesis_timeline(_summaries(500))
+
+    assert t_a.digest == t_b.digest
+    assert t_a.changed_buckets(t_b) == []
+    assert not DiffRunner().diff_hypothesis_summaries(before=t_a, after=t_b).cognition_changed
@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+import weakref
+from array import array
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+# ============================================================
+# Segment layout
+# ============================================================
+#
+#   [0, 64)              header: magic, seq, layout_version, step, time,
+#                        layout_len (little-endian, zero padded)
+#   [64, 64 + reserve)   layout descriptor (UTF-8 JSON)
+#   [data, ...)          float64 arrays; the layout lists each one's
+#                        (offset from data, count)
+#
+# Seqlock: the writer makes `seq` odd before touching the segment and
+# even again afterwards. A reader copies what it needs between two
+# reads of `seq` and retries unless both are the same even value.
+
+MAGIC = b"NFLIVE01"
+_HEADER = struct.Struct("<8sQQqdQ")
+_HEADER_SIZE = 64
+_SEQ_OFFSET = 8
+_SEQ = struct.Struct("<Q")
+_DOUBLE = 8
+
+REGION_FIELDS: Tuple[str, ...] = ("mass", "mean", "std", "n", "active")
+SCALARS: Tuple[str, ...] = ("relief", "value", "urgency_gain", "decision_fired")
+
+# Segments created by writers in this process (see _attach)
+_created: Set[str] = set()
+
+
+def _align(n: int) -> int:
+    return (n + _DOUBLE - 1) // _DOUBLE * _DOUBLE
+
+
+# ============================================================
+# Writer
+# ============================================================
+
+class LiveStateExport:
+    """
+    Publishes runtime state into a shared-memory segment once per
+    `every` steps, for plotters and probes in other processes.
+
+    CONTRACT:
+    - Exported: per-assembly activity and firing rate (_all_pops
+      order), per-region aggregates (REGION_FIELDS), the striatal
+      dominance map and gate/value scalars (SCALARS)
+    - Assemblies and regions are fixed at creation; dominance
+      channels are added as they appear, up to `max_channels` (later
+      ones are not exported). Each change bumps layout_version
+    - Read-only with respect to the runtime; the cost on the step
+      thread is one pass over populations and regions per publish
+    - Readers never block the writer (seqlock)
+    """
+
+    def __init__(
+        self,
+        runtime: Any,
+        *,
+        name: Optional[str] = None,
+        every: int = 1,
+        max_channels: int = 32,
+    ) -> None:
+        if every < 1:
+            raise ValueError("every must be >= 1")
+        if max_channels < 0:
+            raise ValueError("max_channels must be >= 0")
+
+        self.every = int(every)
+        self.max_channels = int(max_channels)
+
+        self._assemblies = [p.assembly_id for p in runtime._all_pops]
+        self._regions = list(runtime.region_states)
+        self._channels: List[str] = []
+        self._layout_version = 0
+
+        n = len(self._assemblies)
+        r = len(self._regions)
+        self._offsets: Dict[str, Tuple[int, int]] = {}
+        size = 0
+        for field, count in (
+            ("activity", n),
+            ("firing_rate", n),
+            ("regions", r * len(REGION_FIELDS)),
+            ("dominance", self.max_channels),
+            ("scalars", len(SCALARS)),
+        ):
+            self._offsets[field] = (size, count)
+            size += count * _DOUBLE
+
+        # Room for the descriptor with every channel slot named
+        self._data = 0
+        self._data = _HEADER_SIZE + _align(
+            len(self._layout_json().encode("utf-8")) + 128 * self.max_channels + 1024
+        )
+
+        self._shm = SharedMemory(name=name, create=True, size=self._data + size)
+        _created.add(self._shm.name)
+        self._buf = self._shm.buf
+        self._doubles = self._buf[self._data:].cast("d")
+        self._seq = 0
+
+        self._begin()
+        self._write_layout()
+        self._write_header(step=int(runtime.step_count), time=float(runtime.time))
+
+        self._finalizer = weakref.finalize(self, _release, self._shm, [self._buf, self._doubles])
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    # --------------------------------------------------
+    # Publishing
+    # --------------------------------------------------
+
+    def step(self, runtime: Any) -> None:
+        if runtime.step_count % self.every == 0:
+            self.publish(runtime)
+
+    def publish(self, runtime: Any) -> None:
+        # Worker-region populations are proxies while sharded
+        runtime.sync_shards()
+
+        pops = runtime._all_pops
+        activity = array("d", [p.activity for p in pops])
+        firing = array("d", [p.firing_rate for p in pops])
+
+        regions = array("d")
+        for key in self._regions:
+            agg = runtime._region_aggregate(key)
+            regions.extend((agg.mass, agg.mean, agg.std, agg.n, agg.active))
+
+        snap = getattr(runtime, "_last_striatum_snapshot", {}) or {}
+        dominance = snap.get("dominance", {}) or {}
+        layout_changed = self._admit_channels(dominance)
+        dom = array("d", [float(dominance.get(ch, 0.0)) for ch in self._channels])
+        dom.extend([0.0] * (self.max_channels - len(dom)))
+
+        scalars = array("d", (
+            float(runtime._last_gate_strength),
+            float(runtime.value_signal.get()),
+            float(runtime._urgency_gain),
+            1.0 if runtime._decision_fired else 0.0,
+        ))
+
+        self._begin()
+        if layout_changed:
+            self._layout_version += 1
+            self._write_layout()
+        for field, values in (
+            ("activity", activity),
+            ("firing_rate", firing),
+            ("regions", regions),
+            ("dominance", dom),
+            ("scalars", scalars),
+        ):
+            start = self._offsets[field][0] // _DOUBLE
+            self._doubles[start:start + len(values)] = values
+        self._write_header(step=int(runtime.step_count), time=float(runtime.time))
+
+    def close(self) -> None:
+        self._finalizer()
+
+    # --------------------------------------------------
+    # Internals
+    # --------------------------------------------------
+
+    def _admit_channels(self, dominance: Dict[str, float]) -> bool:
+        changed = False
+        for ch in dominance:
+            if ch in self._channels or len(self._channels) >= self.max_channels:
+                continue
+            self._channels.append(ch)
+            if len(self._layout_json().encode("utf-8")) > self._data - _HEADER_SIZE:
+                self._channels.pop()
+                continue
+            changed = True
+        return changed
+
+    def _layout_json(self) -> str:
+        return json.dumps({
+            "assemblies": self._assemblies,
+            "regions": self._regions,
+            "region_fields": list(REGION_FIELDS),
+            "channels": self._channels,
+            "scalars": list(SCALARS),
+            "data": self._data,
+            "arrays": {k: list(v) for k, v in self._offsets.items()},
+        })
+
+    def _write_layout(self) -> None:
+        raw = self._layout_json().encode("utf-8")
+        self._buf[_HEADER_SIZE:_HEADER_SIZE + len(raw)] = raw
+        self._layout_len = len(raw)
+
+    def _begin(self) -> None:
+        self._seq += 1
+        _SEQ.pack_into(self._buf, _SEQ_OFFSET, self._seq)
+
+    def _write_header(self, *, step: int, time: float) -> None:
+        # Ends the write (after _begin): seq back to even
+        self._seq += 1
+        _HEADER.pack_into(
+            self._buf, 0,
+            MAGIC, self._seq, self._layout_version, step, time, self._layout_len,
+        )
+
+
+def _release(shm: SharedMemory, views: List[memoryview]) -> None:
+    for v in reversed(views):
+        v.release()
+    _created.discard(shm.name)
+    shm.close()
+    shm.unlink()
+
+
+# ============================================================
+# Reader
+# ============================================================
+
+@dataclass(frozen=True)
+class LiveLayout:
+    assemblies: Tuple[str, ...]
+    regions: Tuple[str, ...]
+    region_fields: Tuple[str, ...]
+    channels: Tuple[str, ...]
+    scalars: Tuple[str, ...]
+    data: int
+    arrays: Dict[str, Tuple[int, int]]
+
+
+@dataclass(frozen=True)
+class LiveSnapshot:
+    """
+    One consistent sample of the exported state.
+
+    Arrays are NumPy float64 arrays when NumPy is installed, else
+    array('d'). `regions` has len(layout.regions) * len(region_fields)
+    values, row-major by region.
+    """
+
+    step: int
+    time: float
+    layout: LiveLayout
+    activity: Any
+    firing_rate: Any
+    regions: Any
+    dominance: Dict[str, float]
+    scalars: Dict[str, float]
+
+    def region(self, key: str) -> Dict[str, float]:
+        i = self.layout.regions.index(key)
+        k = len(self.layout.region_fields)
+        row = self.regions[i * k:(i + 1) * k]
+        return {f: float(v) for f, v in zip(self.layout.region_fields, row)}
+
+
+def _as_array(raw: bytes) -> Any:
+    try:
+        import numpy as np
+    except ImportError:
+        return array("d", raw)
+    return np.frombuffer(raw, dtype=np.float64)
+
+
+def _attach(name: str) -> SharedMemory:
+    shm = SharedMemory(name=name)
+    # A reader must not let its resource tracker unlink the writer's
+    # segment when the reader exits (POSIX only: Windows has no
+    # tracker and frees the segment with its last handle)
+    if os.name == "posix" and name not in _created:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+class LiveStateReader:
+    """
+    Samples a LiveStateExport segment from any process.
+
+    read() copies one consistent snapshot (retrying while the writer
+    is mid-publish); it never takes a lock the writer waits on.
+    """
+
+    def __init__(self, name: str, *, retries: int = 10000) -> None:
+        self._shm = _attach(name)
+        self._buf = self._shm.buf
+        self.retries = int(retries)
+
+        magic = bytes(self._buf[:len(MAGIC)])
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Not a live state segment: {name}")
+
+        self._layout: Optional[LiveLayout] = None
+        self._layout_version = -1
+
+    @property
+    def layout(self) -> LiveLayout:
+        return self.read().layout if self._layout is None else self._layout
+
+    def read(self) -> LiveSnapshot:
+        buf = self._buf
+        for _ in range(self.retries):
+            _, seq, version, step, time, layout_len = _HEADER.unpack_from(buf, 0)
+            if seq % 2:
+                continue
+
+            layout = self._layout
+            if version != self._layout_version or layout is None:
+                # Torn if the writer is rewriting it; the seq check
+                # below rejects anything read during a write
+                try:
+                    layout = _parse_layout(bytes(buf[_HEADER_SIZE:_HEADER_SIZE + layout_len]))
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+            data = layout.data
+            arrays = {
+                field: bytes(buf[data + offset:data + offset + count * _DOUBLE])
+                for field, (offset, count) in layout.arrays.items()
+            }
+
+            if _SEQ.unpack_from(buf, _SEQ_OFFSET)[0] != seq:
+                continue
+
+            self._layout, self._layout_version = layout, version
+            dom = array("d", arrays["dominance"])
+            sca = array("d", arrays["scalars"])
+            return LiveSnapshot(
+                step=step,
+                time=time,
+                layout=layout,
+                activity=_as_array(arrays["activity"]),
+                firing_rate=_as_array(arrays["firing_rate"]),
+                regions=_as_array(arrays["regions"]),
+                dominance=dict(zip(layout.channels, dom)),
+                scalars=dict(zip(layout.scalars, sca)),
+            )
+
+        raise RuntimeError("Live state writer did not settle; retry later")
+
+    def close(self) -> None:
+        self._buf.release()
+        self._shm.close()
+
+
+def _parse_layout(raw: bytes) -> LiveLayout:
+    d = json.loads(raw.decode("utf-8"))
+    return LiveLayout(
+        assemblies=tuple(d["assemblies"]),
+        regions=tuple(d["regions"]),
+        region_fields=tuple(d["region_fields"]),
+        channels=tuple(d["channels"]),
+        scalars=tuple(d["scalars"]),
+        data=int(d["data"]),
+        arrays={k: (int(v[0]), int(v[1])) for k, v in d["arrays"].items()},
+    )
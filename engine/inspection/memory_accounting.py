@@ -0,0 +1,433 @@
+from __future__ import annotations
+
+import logging
+import sys
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# Records
+# ============================================================
+
+@dataclass(frozen=True)
+class ContainerUsage:
+    """
+    Accounting for one registered container at one sample.
+
+    - count: len(container)
+    - est_bytes: container + shallow item sizes (sampled, extrapolated)
+    - traced_bytes: tracemalloc bytes attributed to the container's
+      source files (None when tracing is off)
+    - growth_per_step: least-squares slope of count vs step
+    - linearity: r^2 of that fit (1.0 = perfectly linear growth)
+    """
+
+    name: str
+    subsystem: str
+    count: int
+    est_bytes: int
+    traced_bytes: Optional[int]
+    growth_per_step: float
+    linearity: float
+    alarm: bool
+
+
+@dataclass(frozen=True)
+class MemoryReport:
+    step: int
+    containers: List[ContainerUsage]
+    traced_total: Optional[int]
+
+    @property
+    def alarms(self) -> List[ContainerUsage]:
+        return [c for c in self.containers if c.alarm]
+
+    def format(self) -> str:
+        lines = [f"MEM step={self.step}"]
+        if self.traced_total is not None:
+            lines.append(f"  traced_total={self.traced_total / 1024:.1f}KiB")
+        for c in sorted(self.containers, key=lambda c: c.est_bytes, reverse=True):
+            traced = "-" if c.traced_bytes is None else f"{c.traced_bytes / 1024:.1f}KiB"
+            flag = "  ALARM linear growth" if c.alarm else ""
+            lines.append(
+                f"  {c.name:<32} n={c.count:<8} ~{c.est_bytes / 1024:>9.1f}KiB "
+                f"traced={traced:<10} growth={c.growth_per_step:+.3f}/step "
+                f"r2={c.linearity:.2f}{flag}"
+            )
+        return "\n".join(lines)
+
+
+# ============================================================
+# Size probes
+# ============================================================
+
+# Items sampled per container for byte estimation
+_SAMPLE_ITEMS = 16
+
+
+def _shallow_size(obj: Any) -> int:
+    """
+    Object + one level of contents (dict values, __dict__ or slots,
+    tuple items).
+    """
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(sys.getsizeof(v) for v in obj.values())
+    elif isinstance(obj, tuple):
+        size += sum(sys.getsizeof(v) for v in obj)
+    elif hasattr(obj, "__dict__"):
+        d = obj.__dict__
+        size += sys.getsizeof(d) + sum(sys.getsizeof(v) for v in d.values())
+    else:
+        for name in getattr(type(obj), "__slots__", ()):
+            size += sys.getsizeof(getattr(obj, name, None))
+    return size
+
+
+def estimate_container_bytes(container: Any) -> int:
+    """
+    Retained-size estimate without walking the whole container.
+
+    Samples up to _SAMPLE_ITEMS evenly spaced items and extrapolates,
+    so probing a million-record trace stays cheap.
+    """
+    if container is None:
+        return 0
+    base = sys.getsizeof(container)
+    items = list(container.values()) if isinstance(container, dict) else container
+    try:
+        n = len(items)
+    except TypeError:
+        return base
+    if n == 0:
+        return base
+
+    stride = max(1, n // _SAMPLE_ITEMS)
+    sampled = [items[i] for i in range(0, n, stride)][:_SAMPLE_ITEMS]
+    mean = sum(_shallow_size(x) for x in sampled) / len(sampled)
+    return int(base + mean * n)
+
+
+def _linear_fit(points: Iterable[Tuple[int, int]]) -> Tuple[float, float]:
+    """
+    Least-squares slope and r^2 of count over step.
+    """
+    pts = list(points)
+    n = len(pts)
+    if n < 2:
+        return 0.0, 0.0
+
+    mx = sum(p[0] for p in pts) / n
+    my = sum(p[1] for p in pts) / n
+    sxx = sum((p[0] - mx) ** 2 for p in pts)
+    syy = sum((p[1] - my) ** 2 for p in pts)
+    sxy = sum((p[0] - mx) * (p[1] - my) for p in pts)
+    if sxx == 0:
+        return 0.0, 0.0
+
+    slope = sxy / sxx
+    r2 = (sxy * sxy) / (sxx * syy) if syy > 0 else 0.0
+    return slope, r2
+
+
+@dataclass(frozen=True)
+class _Probe:
+    name: str
+    subsystem: str
+    container: Callable[[], Any]
+    sources: Tuple[str, ...]
+
+
+# ============================================================
+# Accountant
+# ============================================================
+
+class MemoryAccountant:
+    """
+    Retained size and growth rate of registered subsystem containers.
+
+    CONTRACT:
+    - Read-only: probes only call len()/getsizeof on containers
+    - Bounded: keeps at most `window` samples per container
+    - Alarm: a container whose count grows with step count at
+      >= alarm_growth_per_step, with r^2 >= alarm_linearity, over
+      >= alarm_min_samples samples
+
+    tracemalloc is optional. When tracing, each container's
+    traced_bytes is the live allocation total of its `sources`
+    (file-path fragments of the modules that append to it).
+    """
+
+    def __init__(
+        self,
+        *,
+        window: int = 64,
+        alarm_growth_per_step: float = 0.5,
+        alarm_linearity: float = 0.95,
+        alarm_min_samples: int = 8,
+    ) -> None:
+        if window < 2:
+            raise ValueError("window must be >= 2")
+        self.window = int(window)
+        self.alarm_growth_per_step = float(alarm_growth_per_step)
+        self.alarm_linearity = float(alarm_linearity)
+        self.alarm_min_samples = int(alarm_min_samples)
+
+        self._probes: Dict[str, _Probe] = {}
+        self._samples: Dict[str, Deque[Tuple[int, int]]] = {}
+        self._started_tracing = False
+
+    # --------------------------------------------------
+    # Registration
+    # --------------------------------------------------
+
+    def register(
+        self,
+        name: str,
+        container: Callable[[], Any],
+        *,
+        subsystem: str = "",
+        sources: Iterable[str] = (),
+    ) -> None:
+        """
+        Register a container getter (returns the live container, or None).
+        """
+        if name in self._probes:
+            raise KeyError(f"Container already registered: {name}")
+        self._probes[name] = _Probe(
+            name=name,
+            subsystem=subsystem or name.split(".", 1)[0],
+            container=container,
+            sources=tuple(sources),
+        )
+        self._samples[name] = deque(maxlen=self.window)
+
+    def unregister(self, name: str) -> None:
+        self._probes.pop(name, None)
+        self._samples.pop(name, None)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._probes)
+
+    # --------------------------------------------------
+    # tracemalloc
+    # --------------------------------------------------
+
+    def start_tracing(self, frames: int = 1) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            self._started_tracing = True
+
+    def stop_tracing(self) -> None:
+        # Only stop tracing this accountant started
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracing = False
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def _traced_by_source(self) -> Tuple[Optional[int], Dict[str, int]]:
+        if not tracemalloc.is_tracing():
+            return None, {}
+        stats = tracemalloc.take_snapshot().statistics("filename")
+        total = 0
+        by_file: Dict[str, int] = {}
+        for s in stats:
+            total += s.size
+            by_file[s.traceback[0].filename.replace("\\", "/")] = s.size
+        return total, by_file
+
+    # --------------------------------------------------
+    # Sampling
+    # --------------------------------------------------
+
+    def sample(self, step: int) -> MemoryReport:
+        """
+        Probe every registered container at `step` and report.
+        """
+        step = int(step)
+        traced_total, by_file = self._traced_by_source()
+
+        usages: List[ContainerUsage] = []
+        for name, probe in self._probes.items():
+            try:
+                container = probe.container()
+            except Exception:
+                container = None
+            count = len(container) if container is not None else 0
+
+            samples = self._samples[name]
+            if samples and samples[-1][0] == step:
+                samples[-1] = (step, count)
+            else:
+                samples.append((step, count))
+
+            slope, r2 = _linear_fit(samples)
+            alarm = (
+                len(samples) >= self.alarm_min_samples
+                and slope >= self.alarm_growth_per_step
+                and r2 >= self.alarm_linearity
+            )
+
+            traced: Optional[int] = None
+            if traced_total is not None:
+                traced = sum(
+                    size for path, size in by_file.items()
+                    if any(path.endswith(src) for src in probe.sources)
+                )
+
+            usages.append(ContainerUsage(
+                name=name,
+                subsystem=probe.subsystem,
+                count=count,
+                est_bytes=estimate_container_bytes(container),
+                traced_bytes=traced,
+                growth_per_step=slope,
+                linearity=r2,
+                alarm=alarm,
+            ))
+
+        return MemoryReport(step=step, containers=usages, traced_total=traced_total)
+
+    def reset(self) -> None:
+        for samples in self._samples.values():
+            samples.clear()
+
+
+# ============================================================
+# Periodic reporting
+# ============================================================
+
+def log_report(report: MemoryReport) -> None:
+    """
+    Default sink: the module logger, at WARNING when the report has
+    alarms and INFO otherwise (formatted only if that level is enabled).
+    """
+    level = logging.WARNING if report.alarms else logging.INFO
+    if logger.isEnabledFor(level):
+        logger.log(level, "%s", report.format())
+
+
+def print_report(report: MemoryReport) -> None:
+    """
+    Opt-in sink for interactive use: print to stdout.
+    """
+    print("[MEM] " + report.format())
+
+
+class PeriodicMemoryReport:
+    """
+    Step hook: samples every `sample_every` steps and emits a report
+    every `report_every` steps (and whenever a new alarm appears).
+
+    Reports go to `sink` (default: log_report); pass print_report to
+    print them.
+    """
+
+    def __init__(
+        self,
+        accountant: MemoryAccountant,
+        *,
+        sample_every: int = 100,
+        report_every: int = 1000,
+        sink: Optional[Callable[[MemoryReport], None]] = None,
+    ) -> None:
+        if sample_every < 1 or report_every < 1:
+            raise ValueError("sample_every and report_every must be >= 1")
+        self.accountant = accountant
+        self.sample_every = int(sample_every)
+        self.report_every = int(report_every)
+        self.sink = sink or log_report
+        self.last_report: Optional[MemoryReport] = None
+        self._alarmed: set[str] = set()
+
+    def step(self, step: int) -> None:
+        if step % self.sample_every:
+            return
+
+        report = self.accountant.sample(step)
+        self.last_report = report
+
+        new_alarms = {c.name for c in report.alarms} - self._alarmed
+        self._alarmed |= new_alarms
+        if new_alarms or step % self.report_every == 0:
+            self.sink(report)
+
+
+# ============================================================
+# Runtime containers
+# ============================================================
+
+def register_runtime_containers(accountant: MemoryAccountant, runtime: Any) -> None:
+    """
+    Register BrainRuntime's known append-only containers.
+
+    Getters resolve attributes at sample time, so subsystems that
+    are disabled or swapped out report as empty.
+    """
+
+    def attr(*path: str) -> Callable[[], Any]:
+        def get() -> Any:
+            obj = runtime
+            for p in path:
+                obj = getattr(obj, p, None)
+                if obj is None:
+                    return None
+            return obj
+        return get
+
+    accountant.register(
+        "execution_gate.records", attr("execution_gate", "_records"),
+        subsystem="execution", sources=("engine/execution/execution_gate.py",),
+    )
+    accountant.register(
+        "observation.events", attr("_observation_hook", "events"),
+        subsystem="observation", sources=("engine/observation/observation_engine.py",),
+    )
+    accountant.register(
+        "episode_trace.records", attr("_episode_trace", "_records"),
+        subsystem="episodic", sources=("memory/episodic/episode_trace.py",),
+    )
+    accountant.register(
+        "value_trace.records", attr("value_trace", "records"),
+        subsystem="vta_value", sources=("engine/vta_value/value_trace.py",),
+    )
+    accountant.register(
+        "urgency_trace.records", attr("urgency_trace", "_records"),
+        subsystem="urgency", sources=("engine/affective_urgency/urgency_trace.py",),
+    )
+    accountant.register(
+        "decision_trace.events", attr("decision_fx", "_trace", "_events"),
+        subsystem="decision_fx", sources=("engine/decision_fx/decision_trace.py",),
+    )
+
+
+def register_hypothesis_runner(accountant: MemoryAccountant, runner: Any, *, prefix: str = "hypothesis_runner") -> None:
+    """
+    Register a HypothesisRunner's accumulated artifacts.
+    """
+    sources = ("engine/cognition/hypothesis/offline/hypothesis_runner.py",)
+    accountant.register(
+        f"{prefix}.stabilization_events", lambda: runner.stabilization_events,
+        subsystem="hypothesis", sources=sources,
+    )
+    accountant.register(
+        f"{prefix}.bias_suggestions", lambda: runner.bias_suggestions,
+        subsystem="hypothesis", sources=sources,
+    )
+
+
+def register_audit_collector(accountant: MemoryAccountant, collector: Any, *, name: str = "execution_audit.events") -> None:
+    accountant.register(
+        name, lambda: collector._events,
+        subsystem="execution", sources=("engine/execution/audit/execution_audit_collector.py",),
+    )
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import multiprocessing
+
+import pytest
+
+from engine.command_server import make_command_handler
+from engine.inspection import live_state
+from engine.inspection.live_state import LiveStateReader, REGION_FIELDS
+from engine.runtime import BrainRuntime
+
+
+def _sample(name: str, queue) -> None:
+    reader = LiveStateReader(name)
+    snap = reader.read()
+    queue.put((snap.step, list(snap.activity[:4]), snap.region("striatum")))
+    reader.close()
+
+
+def test_reader_sees_published_state(runtime: BrainRuntime) -> None:
+    rt = runtime
+    live = rt.enable_live_export(every=2)
+    reader = LiveStateReader(live.name)
+    try:
+        assert reader.read().step == 0
+
+        rt.inject_stimulus("striatum", "D1_MSN", magnitude=0.4)
+        for _ in range(5):
+            rt.step()
+
+        # Published at step 4, not 5
+        snap = reader.read()
+        assert snap.step == 4
+        assert snap.layout.assemblies == tuple(p.assembly_id for p in rt._all_pops)
+        assert snap.layout.region_fields == REGION_FIELDS
+
+        rt.step()
+        snap = reader.read()
+        assert snap.step == 6
+        assert snap.time == pytest.approx(rt.time)
+        assert list(snap.activity) == [p.activity for p in rt._all_pops]
+        assert list(snap.firing_rate) == [p.firing_rate for p in rt._all_pops]
+
+        stats = rt.snapshot_region_stats("striatum")
+        row = snap.region("striatum")
+        assert row["mass"] == stats["mass"]
+        assert row["n"] == stats["n"]
+
+        dom = rt._last_striatum_snapshot["dominance"]
+        assert dom and snap.dominance == dom
+        assert snap.layout.channels == tuple(dom)
+        assert snap.scalars["relief"] == rt._last_gate_strength
+
+        # Another process maps the same segment
+        queue = multiprocessing.Queue()
+        proc = multiprocessing.Process(target=_sample, args=(live.name, queue))
+        proc.start()
+        step, head, striatum = queue.get(timeout=30)
+        proc.join(timeout=30)
+        assert step == 6
+        assert head == list(snap.activity[:4])
+        assert striatum == row
+    finally:
+        reader.close()
+        rt.disable_live_export()
+
+    assert rt.live_export is None
+
+
+def test_reader_retries_a_torn_layout(runtime: BrainRuntime, monkeypatch) -> None:
+    rt = runtime
+    live = rt.enable_live_export(every=1)
+    reader = LiveStateReader(live.name)
+    calls = []
+
+    def torn(raw: bytes):
+        calls.append(raw)
+        if len(calls) == 1:
+            # The writer publishes while the layout is being read
+            rt.step()
+            return parse(raw[:len(raw) // 2])
+        return parse(raw)
+
+    parse = live_state._parse_layout
+    monkeypatch.setattr(live_state, "_parse_layout", torn)
+    try:
+        snap = reader.read()
+        assert len(calls) == 2
+        assert snap.step == 1
+        assert snap.layout.assemblies == tuple(p.assembly_id for p in rt._all_pops)
+    finally:
+        reader.close()
+        rt.disable_live_export()
+
+
+def test_live_command_toggles_export(runtime: BrainRuntime) -> None:
+    rt = runtime
+    handle = make_command_handler(rt)
+
+    assert handle("live") == "LIVE: off"
+    resp = handle("live on 10")
+    assert resp.startswith("OK live ") and resp.endswith("every 10")
+    assert handle("live").startswith(f"LIVE: {rt.live_export.name}")
+    assert handle("live off") == "OK live off"
+    assert rt.live_export is None
+    assert handle("live sideways").startswith("ERROR")
+
+    with pytest.raises(ValueError):
+        rt.enable_live_export(every=0)
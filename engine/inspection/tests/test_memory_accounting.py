@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import logging
+from typing import List
+
+import pytest
+
+from engine.command_server import _dump_memory
+from engine.inspection.memory_accounting import (
+    MemoryAccountant,
+    PeriodicMemoryReport,
+    estimate_container_bytes,
+)
+from engine.runtime import BrainRuntime
+
+
+def test_linear_growth_raises_alarm_bounded_does_not() -> None:
+    growing: List[int] = []
+    bounded: List[int] = []
+    acct = MemoryAccountant(alarm_growth_per_step=0.5, alarm_min_samples=5)
+    acct.register("sub.growing", lambda: growing)
+    acct.register("sub.bounded", lambda: bounded)
+
+    for step in range(1, 11):
+        growing.extend([step] * 3)
+        bounded[:] = [0] * (step % 3)
+        report = acct.sample(step)
+
+    by_name = {c.name: c for c in report.containers}
+    assert by_name["sub.growing"].count == 30
+    assert by_name["sub.growing"].growth_per_step == pytest.approx(3.0)
+    assert by_name["sub.growing"].alarm
+    assert not by_name["sub.bounded"].alarm
+    assert [c.name for c in report.alarms] == ["sub.growing"]
+
+
+def test_duplicate_registration_rejected() -> None:
+    acct = MemoryAccountant()
+    acct.register("a", lambda: [])
+    with pytest.raises(KeyError):
+        acct.register("a", lambda: [])
+
+
+def test_estimate_scales_with_item_count() -> None:
+    small = [{"step": i, "value": float(i)} for i in range(10)]
+    large = [{"step": i, "value": float(i)} for i in range(1000)]
+    assert estimate_container_bytes(large) > 50 * estimate_container_bytes(small)
+    assert estimate_container_bytes(None) == 0
+
+
+def test_traced_bytes_attributed_when_tracing() -> None:
+    acct = MemoryAccountant()
+    data: List[object] = []
+    acct.register("t.data", lambda: data, sources=("test_memory_accounting.py",))
+
+    acct.start_tracing()
+    try:
+        data.extend({"i": i} for i in range(2000))
+        usage = acct.sample(1).containers[0]
+    finally:
+        acct.stop_tracing()
+
+    assert usage.traced_bytes is not None and usage.traced_bytes > 0
+    assert acct.sample(2).containers[0].traced_bytes is None
+
+
+def test_periodic_report_emits_on_schedule_and_new_alarm() -> None:
+    data: List[int] = []
+    acct = MemoryAccountant(alarm_growth_per_step=0.5, alarm_min_samples=3)
+    acct.register("d", lambda: data)
+    emitted = []
+    hook = PeriodicMemoryReport(acct, sample_every=2, report_every=100, sink=emitted.append)
+
+    for step in range(1, 11):
+        data.append(step)
+        hook.step(step)
+
+    # First alarm at the 3rd sample (step 6), once only
+    assert [r.step for r in emitted] == [6]
+
+
+def test_periodic_report_logs_by_default(caplog, capsys) -> None:
+    data: List[int] = []
+    acct = MemoryAccountant(alarm_growth_per_step=0.5, alarm_min_samples=3)
+    acct.register("d", lambda: data)
+    hook = PeriodicMemoryReport(acct, sample_every=2, report_every=100)
+
+    with caplog.at_level(logging.INFO, logger="engine.inspection.memory_accounting"):
+        for step in range(1, 11):
+            data.append(step)
+            hook.step(step)
+
+    assert [r.levelno for r in caplog.records] == [logging.WARNING]
+    assert "MEM step=6" in caplog.records[0].getMessage()
+    assert capsys.readouterr().out == ""
+
+
+def test_runtime_registers_containers_and_serves_mem(runtime: BrainRuntime) -> None:
+    rt = runtime
+    reports = []
+    rt.enable_memory_report(sample_every=1, report_every=5, sink=reports.append)
+
+    for _ in range(10):
+        rt.step()
+
+    assert [r.step for r in reports if r.step % 5 == 0] == [5, 10]
+    names = {c.name for c in reports[-1].containers}
+    assert {"execution_gate.records", "observation.events", "value_trace.records"} <= names
+
+    gate = {c.name: c for c in reports[-1].containers}["execution_gate.records"]
+    assert gate.count == len(rt.execution_gate.records)
+
+    out = _dump_memory(rt, [])
+    assert out.startswith("MEM step=10")
+    assert "execution_gate.records" in out
+    assert _dump_memory(rt, ["report", "off"]) == "OK mem report off"
+    assert rt.memory_report is None
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+
+# Recommended update periods (physiology steps) for the slow fields.
+# Worst-case held-read error is about (period - 1) * dt / tau of the
+# value (dt = 0.01): value 1.5%, context 1.8%, salience 1.3%,
+# persistence 0.6%.
+SLOW_PERIODS: Dict[str, int] = {
+    "value": 10,
+    "context": 10,
+    "salience": 5,
+    "persistence": 20,
+}
+
+Snapshot = Callable[[Any], Mapping[str, float]]
+
+
+# ============================================================
+# Records
+# ============================================================
+
+@dataclass(frozen=True)
+class RateViolation:
+    """
+    A validation-mode deviation above tolerance.
+
+    - kind: "update" (closed form vs repeated single steps) or
+      "hold" (held value vs the single-rate value at that step)
+    """
+
+    name: str
+    kind: str
+    steps: int
+    deviation: float
+
+
+@dataclass
+class _Entry:
+    name: str
+    target: Any
+    period: int
+    snapshot: Optional[Snapshot]
+    pending: int = 0
+    updates: int = 0
+    max_update_deviation: float = 0.0
+    max_hold_deviation: float = 0.0
+
+
+def _deviation(a: Mapping[str, float], b: Mapping[str, float]) -> float:
+    keys = set(a) | set(b)
+    return max((abs(a.get(k, 0.0) - b.get(k, 0.0)) for k in keys), default=0.0)
+
+
+# ============================================================
+# Scheduler
+# ============================================================
+
+class MultiRateScheduler:
+    """
+    Per-subsystem update periods for slow modulatory fields.
+
+    CONTRACT:
+    - A subsystem registers with step(dt) and advance(dt, steps);
+      advance must be the closed form of `steps` calls to step(dt)
+    - advance(name) is called once per physiology step, where the
+      subsystem used to call step(dt)
+    - period 1: step(dt) every call (exactly single-rate)
+    - period k: advance(dt, k) every k-th call; readers see the
+      value held since the last update
+    - validate: every call compares the subsystem against the
+      single-rate result (deep copies; slow, for testing only)
+    """
+
+    def __init__(self, dt: float, *, validate: bool = False, tolerance: float = 0.02) -> None:
+        self.dt = float(dt)
+        self.validate = bool(validate)
+        self.tolerance = float(tolerance)
+        self.violations: List[RateViolation] = []
+        self._entries: Dict[str, _Entry] = {}
+
+    # --------------------------------------------------
+    # Registration
+    # --------------------------------------------------
+
+    def register(
+        self,
+        name: str,
+        target: Any,
+        *,
+        period: int = 1,
+        snapshot: Optional[Snapshot] = None,
+    ) -> None:
+        if name in self._entries:
+            raise KeyError(f"Subsystem already registered: {name}")
+        if period < 1:
+            raise ValueError("period must be >= 1")
+        self._entries[name] = _Entry(name=name, target=target, period=int(period), snapshot=snapshot)
+
+    def set_period(self, name: str, period: int) -> None:
+        if period < 1:
+            raise ValueError("period must be >= 1")
+        entry = self._entries[name]
+        self._flush(entry)
+        entry.period = int(period)
+
+    def configure(self, periods: Mapping[str, int]) -> None:
+        unknown = set(periods) - set(self._entries)
+        if unknown:
+            raise KeyError(f"Unknown multi-rate subsystems: {sorted(unknown)}")
+        for name, period in periods.items():
+            self.set_period(name, period)
+
+    def periods(self) -> Dict[str, int]:
+        return {name: e.period for name, e in self._entries.items()}
+
+    # --------------------------------------------------
+    # Stepping
+    # --------------------------------------------------
+
+    def advance(self, name: str, steps: int = 1) -> None:
+        """
+        One physiology step for `name` (`steps` base steps when the
+        runtime takes an adaptive step).
+        """
+        entry = self._entries[name]
+
+        if entry.period == 1 and entry.pending == 0:
+            if steps == 1:
+                entry.target.step(self.dt)
+            else:
+                entry.target.advance(self.dt, steps)
+            entry.updates += 1
+            return
+
+        entry.pending += steps
+        if entry.pending >= entry.period:
+            self._flush(entry)
+        elif self.validate:
+            self._check_hold(entry)
+
+    def flush(self) -> None:
+        """
+        Apply every pending update now, e.g. before reading final
+        slow-field values once a run is over.
+
+        Mid-run this restarts each subsystem's period, so the run then
+        differs from an unflushed one. Forks, journal digests and
+        divergence captures therefore do not flush: pending counts are
+        part of the state (copied by fork, captured by
+        divergence.capture_fields).
+        """
+        for entry in self._entries.values():
+            self._flush(entry)
+
+    def _flush(self, entry: _Entry) -> None:
+        n = entry.pending
+        if n == 0:
+            return
+        entry.pending = 0
+        entry.updates += 1
+
+        if self.validate and entry.snapshot is not None:
+            ref = copy.deepcopy(entry.target)
+            for _ in range(n):
+                ref.step(self.dt)
+            entry.target.advance(self.dt, n)
+            dev = _deviation(entry.snapshot(ref), entry.snapshot(entry.target))
+            entry.max_update_deviation = max(entry.max_update_deviation, dev)
+            if dev > self.tolerance:
+                self.violations.append(RateViolation(entry.name, "update", n, dev))
+            return
+
+        entry.target.advance(self.dt, n)
+
+    def _check_hold(self, entry: _Entry) -> None:
+        if entry.snapshot is None:
+            return
+        ref = copy.deepcopy(entry.target)
+        ref.advance(self.dt, entry.pending)
+        dev = _deviation(entry.snapshot(ref), entry.snapshot(entry.target))
+        entry.max_hold_deviation = max(entry.max_hold_deviation, dev)
+        if dev > self.tolerance:
+            self.violations.append(RateViolation(entry.name, "hold", entry.pending, dev))
+
+    # --------------------------------------------------
+    # Diagnostics
+    # --------------------------------------------------
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {
+            name: {
+                "period": e.period,
+                "pending": e.pending,
+                "updates": e.updates,
+                "max_update_deviation": e.max_update_deviation,
+                "max_hold_deviation": e.max_hold_deviation,
+            }
+            for name, e in self._entries.items()
+        }
+
+    def check(self) -> None:
+        """
+        Raise if validation recorded any deviation above tolerance.
+        """
+        if self.violations:
+            worst = max(self.violations, key=lambda v: v.deviation)
+            raise ValueError(
+                f"{len(self.violations)} multi-rate deviations above {self.tolerance}; "
+                f"worst {worst.name} ({worst.kind}, {worst.steps} steps): {worst.deviation:.3g}"
+            )
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Any, Dict
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ObservationEvent:
     """
     Immutable observational fact emitted from runtime inspection.
@@ -54,6 +54,11 @@ class ObservationRuntimeHook:
         """
         Fraction of assemblies with output > 0.
         """
+        # Runtimes that shard regions keep this per-region aggregate
+        fraction = getattr(runtime, "region_fraction_active", None)
+        if fraction is not None:
+            return fraction(region_key)
+
         region = runtime.region_states.get(region_key)
         if not region:
             return 0.0
@@ -1,9 +1,18 @@
 # engine/population_model.py
 from __future__ import annotations
 
+import math
 import random
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, Optional
+
+
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+
+# Leak integrators for PopulationModel.step:
+# - euler: activity += (dt / tau) * (drive - activity)
+# - exponential: exact solution of the linear leak over dt
+INTEGRATORS = ("euler", "exponential")
 
 
 # ------------------------------------------------------------
@@ -35,7 +44,7 @@ def _s(x: Any, default: str = "") -> str:
 # Population Model (GROUND-TRUTH PHYSIOLOGY)
 # ------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class PopulationModel:
     """
     Assembly-level physiological dynamics unit.
@@ -47,6 +56,10 @@ class PopulationModel:
     - No learning, no memory, no cognition
     - Context is NEVER injected here (only via input from runtime)
     - All transient inputs are cleared each step
+
+    LAYOUT:
+    - Slotted (one instance per assembly; no per-instance __dict__)
+    - Attributes assigned after construction are declared below
     """
 
     # -------------------------
@@ -118,6 +131,33 @@ class PopulationModel:
     semantic_tau_bias: float = 1.0
     semantic_inhibition_bias: float = 1.0
 
+    # -------------------------
+    # Runtime-assigned (post-construction)
+    # -------------------------
+
+    # Static differentiation gain (regions/assembly_differentiation)
+    _structural_gain: float = field(default=1.0, init=False, repr=False, compare=False)
+
+    # Biological channel, preserved before hypothesis routing
+    _base_subpopulation: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    # Hypothesis routing tag (see hypothesis_id property)
+    _hypothesis_id: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    # Bumped on every hypothesis_id change, across all models; lets
+    # routing caches detect reassignment without scanning assemblies
+    hypothesis_epoch: ClassVar[int] = 0
+
+    @property
+    def hypothesis_id(self) -> Optional[str]:
+        return self._hypothesis_id
+
+    @hypothesis_id.setter
+    def hypothesis_id(self, value: Optional[str]) -> None:
+        if value != self._hypothesis_id:
+            self._hypothesis_id = value
+            PopulationModel.hypothesis_epoch += 1
+
     # ------------------------------------------------------------
     # Construction
     # ------------------------------------------------------------
@@ -204,6 +244,23 @@ class PopulationModel:
 
         return model
 
+    # ------------------------------------------------------------
+    # Copying
+    # ------------------------------------------------------------
+
+    def clone(self) -> "PopulationModel":
+        """
+        Independent copy (every slot holds an immutable value, so a
+        slot-by-slot copy is a deep copy).
+        """
+        other = object.__new__(PopulationModel)
+        for name in PopulationModel.__slots__:
+            setattr(other, name, getattr(self, name))
+        return other
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "PopulationModel":
+        return self.clone()
+
     # ------------------------------------------------------------
     # Output
     # ------------------------------------------------------------
@@ -215,29 +272,60 @@ class PopulationModel:
     # Noise
     # ------------------------------------------------------------
 
-    def _sample_noise(self) -> float:
+    def _sample_noise(self, unit: Optional[float] = None) -> float:
+        """
+        unit: standard normal draw supplied by the runtime's counter
+        noise stream (engine.noise). Without one (standalone use) the
+        module-level `random` generator is used.
+        """
         if self.noise_amplitude <= 0.0:
             return 0.0
+        if unit is None:
+            if self.noise_distribution == "uniform":
+                return random.uniform(-self.noise_amplitude, self.noise_amplitude)
+            return random.gauss(0.0, self.noise_amplitude)
         if self.noise_distribution == "uniform":
-            return random.uniform(-self.noise_amplitude, self.noise_amplitude)
-        return random.gauss(0.0, self.noise_amplitude)
+            # 2*Phi(z) - 1 ~ U(-1, 1)
+            return self.noise_amplitude * math.erf(unit * _INV_SQRT2)
+        return self.noise_amplitude * unit
 
     # ------------------------------------------------------------
     # Step
     # ------------------------------------------------------------
 
-    def step(self, dt: float) -> None:
+    def step(
+        self,
+        dt: float,
+        noise_unit: Optional[float] = None,
+        *,
+        exact: bool = False,
+        span: int = 1,
+    ) -> None:
         """
         Advance one timestep.
 
+        noise_unit: this assembly's standard normal draw for the step
+        (see _sample_noise).
+
+        exact: integrate the leak with its exact exponential solution
+        (inputs held over dt) instead of forward Euler. The drive's
+        homeostatic and self-inhibition terms are linear in activity,
+        so they are folded into the decay rate.
+
+        span: number of base steps this call stands for (adaptive
+        stepping; dt is then span * base dt). The per-step tonic drift
+        is applied span times and the noise draw is scaled by
+        1/sqrt(span), so its diffusion over the interval matches span
+        single steps.
+
         Pure physiology:
         - No cognition
         - No context
         - No routing
         """
 
-        # Slow tonic stabilization
-        self.tonic += self.tonic_gain * (self.tonic_target - self.activity)
+        # Slow tonic stabilization (per base step)
+        self.tonic += span * self.tonic_gain * (self.tonic_target - self.activity)
 
         # Effective dynamics (neuromodulation acts here)
         mod = max(1e-6, self.modulatory_gain)
@@ -251,19 +339,34 @@ class PopulationModel:
 
         net_drive = self.sign * (self.input - self.lateral_inhibition)
 
+        noise = self._sample_noise(noise_unit)
+        if span != 1:
+            noise /= math.sqrt(span)
+
         drive = (
             self.baseline
             + self.tonic
             + net_drive
             + homeo
             - self_inhib
-            + self._sample_noise()
+            + noise
         )
 
-        if tau > 1e-9:
-            self.activity += (float(dt) / tau) * (drive - self.activity)
-        else:
+        if tau <= 1e-9:
             self.activity = drive
+        elif exact:
+            # d(activity)/dt = (drive - activity) / tau, with
+            # drive = c - leak * activity
+            leak = self.homeostatic_gain + inhibition_gain
+            rate = 1.0 + leak
+            if rate > 1e-9:
+                target = (drive + leak * self.activity) / rate
+                decay = math.exp(-float(dt) * rate / tau)
+                self.activity = target + (self.activity - target) * decay
+            else:
+                self.activity += (float(dt) / tau) * (drive - self.activity)
+        else:
+            self.activity += (float(dt) / tau) * (drive - self.activity)
 
         if self.activity < self.clamp_min:
             self.activity = self.clamp_min
@@ -272,7 +375,7 @@ class PopulationModel:
 
         above = self.activity - self.threshold
         if above > 0.0:
-            struct_gain = getattr(self, "_structural_gain", 1.0)
+            struct_gain = self._structural_gain
 
             if struct_gain < 0.7:
                 struct_gain = 0.7
@@ -24,3 +24,8 @@ class ReplayExecutionConfig:
     # Optional parameters passed to the replay mode
     stride: Optional[int] = None
     seed: Optional[int] = None
+
+    # Worker processes for per-episode replay.
+    # Only used when the executor is given a runner_factory;
+    # 1 replays episodes in-process, in plan order.
+    workers: int = 1
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 
 @dataclass(frozen=True)
@@ -31,6 +31,16 @@ class ReplayExecutionReport:
     # Diagnostics
     observation_frame_count: int
 
+    # --------------------------------------------------
+    # Merged cognition artifacts (plan order, then emission order)
+    # --------------------------------------------------
+
+    # Stabilization events, each tagged with its "episode_id"
+    stabilization_events: List[Dict[str, Any]] = field(default_factory=list)
+
+    # Bias suggestions in the order they were produced
+    bias_suggestions: List[Dict[str, float]] = field(default_factory=list)
+
     # --------------------------------------------------
     # Optional contextual metadata (inspection only)
     # --------------------------------------------------
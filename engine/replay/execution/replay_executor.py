@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import List, Iterable, Protocol
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Iterable, Optional, Protocol
 
 from engine.replay.scheduling.replay_plan import ReplayPlan
 from engine.replay.execution.replay_execution_report import ReplayExecutionReport
@@ -26,6 +28,95 @@ class EpisodeReplaySource(Protocol):
         ...
 
 
+@dataclass(frozen=True)
+class _EpisodeResult:
+    """
+    Per-episode cognition artifacts returned by a replay worker.
+    """
+
+    episode_id: str
+    frame_count: int
+    stabilization_events: List[Dict[str, Any]]
+    bias_suggestions: List[Dict[str, float]]
+    timeline: Any
+
+
+def _build_mode(config: ReplayExecutionConfig) -> ReplayMode:
+    """
+    Instantiate the configured replay mode.
+    """
+
+    if config.mode == "wake":
+        return WakeReplayMode()
+
+    if config.mode == "nrem":
+        return NREMReplayMode(
+            stride=config.stride or 2,
+        )
+
+    if config.mode == "rem":
+        return REMReplayMode(
+            seed=config.seed,
+        )
+
+    raise ValueError(f"Unknown replay mode: {config.mode}")
+
+
+def _replay_isolated(
+    *,
+    episode_id: str,
+    episode_replay: EpisodeReplaySource,
+    runner_factory: Callable[[], HypothesisRunner],
+    mode: ReplayMode,
+) -> _EpisodeResult:
+    """
+    Replay one episode through a fresh runner, streaming frames.
+    """
+
+    runner = runner_factory()
+    frame_count = 0
+
+    for frame in mode.iter_frames(episode_replay.replay_episode(episode_id)):
+        runner.step(frame)
+        frame_count += 1
+
+    build_timeline = getattr(runner, "build_timeline", None)
+
+    return _EpisodeResult(
+        episode_id=episode_id,
+        frame_count=frame_count,
+        stabilization_events=list(getattr(runner, "stabilization_events", [])),
+        bias_suggestions=list(getattr(runner, "bias_suggestions", [])),
+        timeline=build_timeline() if build_timeline is not None else None,
+    )
+
+
+# --------------------------------------------------
+# Worker process state (set once per worker by the pool initializer)
+# --------------------------------------------------
+
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(
+    episode_replay: EpisodeReplaySource,
+    runner_factory: Callable[[], HypothesisRunner],
+    config: ReplayExecutionConfig,
+) -> None:
+    _worker_state["episode_replay"] = episode_replay
+    _worker_state["runner_factory"] = runner_factory
+    _worker_state["mode"] = _build_mode(config)
+
+
+def _replay_in_worker(episode_id: str) -> _EpisodeResult:
+    return _replay_isolated(
+        episode_id=episode_id,
+        episode_replay=_worker_state["episode_replay"],
+        runner_factory=_worker_state["runner_factory"],
+        mode=_worker_state["mode"],
+    )
+
+
 class ReplayExecutor:
     """
     Offline replay execution stub.
@@ -43,40 +134,46 @@ class ReplayExecutor:
     - Modify episodic memory
     - Persist cognition
     - Perform consolidation
+
+    Two execution styles:
+    - Shared runner (hypothesis_runner): episodes are replayed serially
+      through one runner; cognition state carries across episodes.
+    - Per-episode runners (runner_factory): each episode is replayed
+      through its own fresh runner, in-process or across
+      config.workers processes. Results are merged in plan order, so
+      the report is identical for any worker count.
+
+    Frames are streamed in both styles; only counts are kept.
     """
 
     def __init__(
         self,
         *,
         episode_replay: EpisodeReplaySource,
-        hypothesis_runner: HypothesisRunner,
+        hypothesis_runner: Optional[HypothesisRunner] = None,
         execution_config: ReplayExecutionConfig | None = None,
+        runner_factory: Optional[Callable[[], HypothesisRunner]] = None,
     ) -> None:
+        if hypothesis_runner is None and runner_factory is None:
+            raise ValueError(
+                "ReplayExecutor requires hypothesis_runner or runner_factory."
+            )
+
         self._episode_replay = episode_replay
         self._hypothesis_runner = hypothesis_runner
+        self._runner_factory = runner_factory
         self._config = execution_config or ReplayExecutionConfig()
 
+        if self._config.workers < 1:
+            raise ValueError("workers must be >= 1")
+
         self._mode = self._build_mode(self._config)
 
     def _build_mode(self, config: ReplayExecutionConfig) -> ReplayMode:
         """
         Instantiate the configured replay mode.
         """
-
-        if config.mode == "wake":
-            return WakeReplayMode()
-
-        if config.mode == "nrem":
-            return NREMReplayMode(
-                stride=config.stride or 2,
-            )
-
-        if config.mode == "rem":
-            return REMReplayMode(
-                seed=config.seed,
-            )
-
-        raise ValueError(f"Unknown replay mode: {config.mode}")
+        return _build_mode(config)
 
     def execute(self, plan: ReplayPlan) -> ReplayExecutionReport:
         """
@@ -85,30 +182,80 @@ class ReplayExecutor:
         Returns a ReplayExecutionReport describing what occurred.
         """
 
+        if self._runner_factory is not None:
+            return self._execute_isolated(plan)
+
+        runner = self._hypothesis_runner
         executed_episodes: List[str] = []
-        observation_frames: List[ObservationFrame] = []
+        stabilization_events: List[Dict[str, Any]] = []
+        frame_count = 0
 
         # --------------------------------------------------
         # Replay each selected episode (order preserved)
         # --------------------------------------------------
         for episode_id in plan.selected_episode_ids:
             raw_frames = self._episode_replay.replay_episode(episode_id)
+            events_before = len(getattr(runner, "stabilization_events", []))
 
             # Apply replay mode (execution style only)
             for frame in self._mode.iter_frames(raw_frames):
-                self._hypothesis_runner.step(frame)
-                observation_frames.append(frame)
+                runner.step(frame)
+                frame_count += 1
+
+            for event in getattr(runner, "stabilization_events", [])[events_before:]:
+                stabilization_events.append({**event, "episode_id": episode_id})
 
             executed_episodes.append(episode_id)
 
         # --------------------------------------------------
         # Collect cognition outputs (inspection only)
         # --------------------------------------------------
-        cognition_output = self._hypothesis_runner.build_timeline()
+        cognition_output = runner.build_timeline()
 
         return ReplayExecutionReport(
             replay_request_reason=plan.request.reason,
             executed_episode_ids=executed_episodes,
             cognition_output=cognition_output,
-            observation_frame_count=len(observation_frames),
+            observation_frame_count=frame_count,
+            stabilization_events=stabilization_events,
+            bias_suggestions=list(getattr(runner, "bias_suggestions", [])),
+        )
+
+    def _execute_isolated(self, plan: ReplayPlan) -> ReplayExecutionReport:
+        episode_ids = list(plan.selected_episode_ids)
+        workers = min(self._config.workers, len(episode_ids))
+
+        if workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self._episode_replay, self._runner_factory, self._config),
+            ) as pool:
+                # map() yields in submission order -> deterministic merge
+                results = list(pool.map(_replay_in_worker, episode_ids))
+        else:
+            results = [
+                _replay_isolated(
+                    episode_id=episode_id,
+                    episode_replay=self._episode_replay,
+                    runner_factory=self._runner_factory,
+                    mode=self._mode,
+                )
+                for episode_id in episode_ids
+            ]
+
+        stabilization_events: List[Dict[str, Any]] = []
+        bias_suggestions: List[Dict[str, float]] = []
+        for result in results:
+            for event in result.stabilization_events:
+                stabilization_events.append({**event, "episode_id": result.episode_id})
+            bias_suggestions.extend(result.bias_suggestions)
+
+        return ReplayExecutionReport(
+            replay_request_reason=plan.request.reason,
+            executed_episode_ids=[r.episode_id for r in results],
+            cognition_output=[r.timeline for r in results],
+            observation_frame_count=sum(r.frame_count for r in results),
+            stabilization_events=stabilization_events,
+            bias_suggestions=bias_suggestions,
         )
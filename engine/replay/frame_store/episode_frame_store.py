@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import json
+import math
+import mmap
+import os
+import sys
+import weakref
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from engine.cognition.hypothesis.offline.observation_frame import ObservationFrame
+
+
+FORMAT_VERSION = 1
+INDEX_FILE = "index.json"
+
+# column name -> array typecode
+COLUMNS: Dict[str, str] = {
+    "step": "q",
+    "salience": "d",
+    "flags": "B",
+    "outputs_ptr": "q",
+    "outputs_key": "i",
+    "outputs_val": "d",
+    "semantic_ptr": "q",
+    "semantic_key": "i",
+    "semantic_val": "d",
+}
+
+# flags column bits (distinguish None from 0.0 / {})
+HAS_SALIENCE = 1
+HAS_OUTPUTS = 2
+HAS_SEMANTIC = 4
+
+
+def _column_path(root: Path, name: str) -> Path:
+    return root / f"{name}.{COLUMNS[name]}.bin"
+
+
+class EpisodeFrameStoreWriter:
+    """
+    Append-only writer for the on-disk episode frame store.
+
+    Written during wake runs; read back by EpisodeFrameStore during
+    sleep replay without the wake session's objects.
+
+    Layout (one directory):
+    - one flat binary file per column (native byte order)
+    - per-frame columns: step, salience, flags, outputs_ptr, semantic_ptr
+    - sparse dict columns: *_key (dictionary-encoded) + *_val,
+      addressed by the frame's *_ptr offset
+    - index.json: episode -> [first_frame, end_frame), key dictionaries
+
+    CONTRACT:
+    - Offline only
+    - Append-only (episodes are never rewritten)
+    - No interpretation
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self._root = Path(root)
+        self._root.mkdir(parents=True, exist_ok=True)
+
+        index = _load_index(self._root)
+        self._episodes: Dict[str, List[int]] = index["episodes"]
+        self._output_keys: List[str] = index["output_keys"]
+        self._semantic_keys: List[str] = index["semantic_keys"]
+        self._frame_count: int = index["frame_count"]
+        self._outputs_len: int = index["outputs_len"]
+        self._semantic_len: int = index["semantic_len"]
+
+        self._output_ids = {k: i for i, k in enumerate(self._output_keys)}
+        self._semantic_ids = {k: i for i, k in enumerate(self._semantic_keys)}
+
+        self._open_episode: Optional[str] = None
+        self._buffers: Dict[str, array] = {}
+
+        self._truncate_to_index()
+
+    # --------------------------------------------------
+    # Episode lifecycle
+    # --------------------------------------------------
+
+    def begin_episode(self, episode_id: str) -> None:
+        if self._open_episode is not None:
+            raise RuntimeError(f"Episode '{self._open_episode}' is still open.")
+        if str(episode_id) in self._episodes:
+            raise ValueError(f"Episode '{episode_id}' already stored.")
+
+        self._open_episode = str(episode_id)
+        self._episode_start = self._frame_count
+        self._buffers = {name: array(code) for name, code in COLUMNS.items()}
+
+    def append(self, frame: ObservationFrame) -> None:
+        if self._open_episode is None:
+            raise RuntimeError("append() requires an open episode.")
+
+        b = self._buffers
+        flags = 0
+
+        b["step"].append(int(frame.step))
+
+        if frame.salience is not None:
+            flags |= HAS_SALIENCE
+            b["salience"].append(float(frame.salience))
+        else:
+            b["salience"].append(math.nan)
+
+        b["outputs_ptr"].append(self._outputs_len)
+        if frame.assembly_outputs is not None:
+            flags |= HAS_OUTPUTS
+            self._outputs_len += self._append_sparse(
+                frame.assembly_outputs, b["outputs_key"], b["outputs_val"],
+                self._output_ids, self._output_keys,
+            )
+
+        b["semantic_ptr"].append(self._semantic_len)
+        if frame.semantic_activation is not None:
+            flags |= HAS_SEMANTIC
+            self._semantic_len += self._append_sparse(
+                frame.semantic_activation, b["semantic_key"], b["semantic_val"],
+                self._semantic_ids, self._semantic_keys,
+            )
+
+        b["flags"].append(flags)
+        self._frame_count += 1
+
+    def end_episode(self) -> None:
+        if self._open_episode is None:
+            raise RuntimeError("No open episode.")
+
+        for name, buf in self._buffers.items():
+            if buf:
+                with open(_column_path(self._root, name), "ab") as fh:
+                    buf.tofile(fh)
+
+        self._episodes[self._open_episode] = [self._episode_start, self._frame_count]
+        self._open_episode = None
+        self._buffers = {}
+        self._write_index()
+
+    def write_episode(self, episode_id: str, frames) -> None:
+        """
+        Convenience: store a complete episode in one call.
+        """
+        self.begin_episode(episode_id)
+        for frame in frames:
+            self.append(frame)
+        self.end_episode()
+
+    # --------------------------------------------------
+    # Internals
+    # --------------------------------------------------
+
+    @staticmethod
+    def _append_sparse(
+        values: Dict[str, float],
+        keys_out: array,
+        vals_out: array,
+        ids: Dict[str, int],
+        key_table: List[str],
+    ) -> int:
+        for key, value in values.items():
+            kid = ids.get(key)
+            if kid is None:
+                kid = len(key_table)
+                ids[key] = kid
+                key_table.append(key)
+            keys_out.append(kid)
+            vals_out.append(float(value))
+        return len(values)
+
+    def _truncate_to_index(self) -> None:
+        # Drop bytes of an episode whose index update never landed
+        lengths = {
+            "outputs_key": self._outputs_len,
+            "outputs_val": self._outputs_len,
+            "semantic_key": self._semantic_len,
+            "semantic_val": self._semantic_len,
+        }
+        for name, code in COLUMNS.items():
+            path = _column_path(self._root, name)
+            if not path.exists():
+                continue
+            size = lengths.get(name, self._frame_count) * array(code).itemsize
+            if path.stat().st_size > size:
+                with open(path, "r+b") as fh:
+                    fh.truncate(size)
+
+    def _write_index(self) -> None:
+        payload = {
+            "format_version": FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "frame_count": self._frame_count,
+            "outputs_len": self._outputs_len,
+            "semantic_len": self._semantic_len,
+            "episodes": self._episodes,
+            "output_keys": self._output_keys,
+            "semantic_keys": self._semantic_keys,
+        }
+        tmp = self._root / (INDEX_FILE + ".tmp")
+        tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(tmp, self._root / INDEX_FILE)
+
+
+def _load_index(root: Path) -> Dict:
+    path = root / INDEX_FILE
+    if not path.exists():
+        return {
+            "episodes": {},
+            "output_keys": [],
+            "semantic_keys": [],
+            "frame_count": 0,
+            "outputs_len": 0,
+            "semantic_len": 0,
+        }
+
+    index = json.loads(path.read_text(encoding="utf-8"))
+    if index.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported frame store version: {index.get('format_version')}")
+    if index.get("byteorder") != sys.byteorder:
+        raise ValueError("Frame store was written with a different byte order.")
+    return index
+
+
+class EpisodeFrameStore:
+    """
+    Memory-mapped reader for an episode frame store.
+
+    Implements EpisodeReplaySource: replay_episode() streams
+    ObservationFrames lazily from the mapped columns.
+
+    column() exposes zero-copy typed memoryviews for vectorized
+    consumers (optionally restricted to one episode's frames).
+
+    CONTRACT:
+    - Read-only
+    - Offline only
+    - No runtime references
+    - close() releases every view column() handed out
+    - Pickles as its root path (reopened on unpickle), so it can be
+      passed to worker processes
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self._root = Path(root)
+        # Episode slices handed out by column(); released by close()
+        self._slices: List[weakref.ref] = []
+        index = _load_index(self._root)
+        if not (self._root / INDEX_FILE).exists():
+            raise FileNotFoundError(f"No frame store at {self._root}")
+
+        self._episodes: Dict[str, Tuple[int, int]] = {
+            k: (int(v[0]), int(v[1])) for k, v in index["episodes"].items()
+        }
+        self._output_keys: List[str] = index["output_keys"]
+        self._semantic_keys: List[str] = index["semantic_keys"]
+        self._frame_count: int = index["frame_count"]
+
+        self._maps: List[mmap.mmap] = []
+        self._columns: Dict[str, memoryview] = {}
+        lengths = {
+            "outputs_key": index["outputs_len"],
+            "outputs_val": index["outputs_len"],
+            "semantic_key": index["semantic_len"],
+            "semantic_val": index["semantic_len"],
+        }
+        for name, code in COLUMNS.items():
+            self._columns[name] = self._map(name, code, lengths.get(name, self._frame_count))
+
+    def _map(self, name: str, code: str, length: int) -> memoryview:
+        if length == 0:
+            return memoryview(array(code))
+
+        with open(_column_path(self._root, name), "rb") as fh:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mm)
+
+        # Index is authoritative: ignore bytes of a partially written episode
+        view = memoryview(mm).cast(code)
+        return view[:length]
+
+    # --------------------------------------------------
+    # Inspection
+    # --------------------------------------------------
+
+    def episode_ids(self) -> List[str]:
+        return list(self._episodes)
+
+    def frame_range(self, episode_id: str) -> Tuple[int, int]:
+        return self._episodes[str(episode_id)]
+
+    def column(self, name: str, episode_id: Optional[str] = None) -> memoryview:
+        """
+        Zero-copy view of a per-frame column ("step", "salience",
+        "flags", "outputs_ptr", "semantic_ptr") or of a sparse
+        value column ("outputs_key", "outputs_val", ...).
+
+        episode_id restricts per-frame columns to that episode.
+        """
+        view = self._columns[name]
+        if episode_id is None:
+            return view
+        if name not in ("step", "salience", "flags", "outputs_ptr", "semantic_ptr"):
+            raise ValueError(f"Column '{name}' is not per-frame.")
+        start, end = self._episodes[str(episode_id)]
+        sliced = view[start:end]
+        self._slices = [r for r in self._slices if r() is not None]
+        self._slices.append(weakref.ref(sliced))
+        return sliced
+
+    # --------------------------------------------------
+    # EpisodeReplaySource
+    # --------------------------------------------------
+
+    def replay_episode(self, episode_id: str) -> Iterator[ObservationFrame]:
+        start, end = self._episodes[str(episode_id)]
+        c = self._columns
+        steps = c["step"]
+        salience = c["salience"]
+        flags = c["flags"]
+
+        for i in range(start, end):
+            f = flags[i]
+            yield ObservationFrame(
+                step=steps[i],
+                salience=salience[i] if f & HAS_SALIENCE else None,
+                assembly_outputs=(
+                    self._sparse(i, "outputs", self._output_keys)
+                    if f & HAS_OUTPUTS else None
+                ),
+                semantic_activation=(
+                    self._sparse(i, "semantic", self._semantic_keys)
+                    if f & HAS_SEMANTIC else None
+                ),
+            )
+
+    def _sparse(self, i: int, prefix: str, key_table: List[str]) -> Dict[str, float]:
+        c = self._columns
+        ptr = c[f"{prefix}_ptr"]
+        lo = ptr[i]
+        hi = ptr[i + 1] if i + 1 < self._frame_count else len(c[f"{prefix}_key"])
+        keys = c[f"{prefix}_key"]
+        vals = c[f"{prefix}_val"]
+        return {key_table[keys[j]]: vals[j] for j in range(lo, hi)}
+
+    # --------------------------------------------------
+    # Lifecycle
+    # --------------------------------------------------
+
+    def close(self) -> None:
+        # Every view over a map must be released before the map closes
+        for ref in self._slices:
+            view = ref()
+            if view is not None:
+                view.release()
+        self._slices = []
+        for view in self._columns.values():
+            view.release()
+        self._columns = {}
+        for mm in self._maps:
+            mm.close()
+        self._maps = []
+
+    def __enter__(self) -> "EpisodeFrameStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"root": str(self._root)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["root"])
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from engine.cognition.hypothesis.offline.observation_frame import ObservationFrame
+from engine.replay.frame_store.episode_frame_store import (
+    EpisodeFrameStore,
+    EpisodeFrameStoreWriter,
+)
+from engine.replay.execution.replay_executor import ReplayExecutor
+from engine.replay.execution.replay_execution_config import ReplayExecutionConfig
+from engine.replay.scheduling.replay_plan import ReplayPlan
+from engine.replay.requests.replay_request import ReplayRequest
+
+
+def _frames(offset: int, n: int):
+    return [
+        ObservationFrame(
+            step=offset + i,
+            salience=None if i == 0 else 0.1 * i,
+            assembly_outputs={"cortex": float(i), "pfc": -float(i)} if i % 2 else None,
+            semantic_activation={"sem:a": 0.5} if i == 2 else None,
+        )
+        for i in range(n)
+    ]
+
+
+class CountingRunner:
+    def __init__(self) -> None:
+        self.steps = []
+
+    def step(self, frame: ObservationFrame) -> None:
+        self.steps.append(frame.step)
+
+    def build_timeline(self):
+        return list(self.steps)
+
+
+def test_frame_store_roundtrip_and_replay(tmp_path) -> None:
+    ep1 = _frames(0, 5)
+    ep2 = _frames(100, 3)
+
+    writer = EpisodeFrameStoreWriter(tmp_path)
+    writer.write_episode("1", ep1)
+
+    # Reopening appends after existing episodes
+    EpisodeFrameStoreWriter(tmp_path).write_episode("2", ep2)
+
+    with EpisodeFrameStore(tmp_path) as store:
+        assert store.episode_ids() == ["1", "2"]
+        assert list(store.replay_episode("1")) == ep1
+        assert list(store.replay_episode("2")) == ep2
+
+        # Zero-copy column access
+        steps = store.column("step", episode_id="2")
+        assert isinstance(steps, memoryview)
+        assert list(steps) == [100, 101, 102]
+
+        executor = ReplayExecutor(
+            episode_replay=store,
+            hypothesis_runner=CountingRunner(),
+            execution_config=ReplayExecutionConfig(mode="wake"),
+        )
+        report = executor.execute(
+            ReplayPlan(request=ReplayRequest(reason="sleep"), selected_episode_ids=["2", "1"])
+        )
+
+    # close() released the episode slice
+    with pytest.raises(ValueError):
+        steps[0]
+
+    assert report.observation_frame_count == 8
+    assert report.cognition_output == [100, 101, 102, 0, 1, 2, 3, 4]
+
+
+def test_frame_store_pickles_by_root(tmp_path) -> None:
+    EpisodeFrameStoreWriter(tmp_path).write_episode("1", _frames(0, 4))
+
+    with EpisodeFrameStore(tmp_path) as store:
+        clone = pickle.loads(pickle.dumps(store))
+
+    with clone:
+        assert clone.episode_ids() == ["1"]
+        assert list(clone.replay_episode("1")) == _frames(0, 4)
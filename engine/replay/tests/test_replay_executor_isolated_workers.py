@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+"""
+Certification test: per-episode replay workers.
+
+Verifies:
+- In-process and multi-process execution produce identical reports
+- Stabilization events are merged in plan order and tagged by episode
+- Frames are counted, not retained
+"""
+
+from engine.replay.execution.replay_executor import ReplayExecutor
+from engine.replay.execution.replay_execution_config import ReplayExecutionConfig
+from engine.replay.scheduling.replay_plan import ReplayPlan
+from engine.replay.requests.replay_request import ReplayRequest
+from engine.cognition.hypothesis.offline.observation_frame import ObservationFrame
+
+
+class FakeEpisodeReplay:
+    def replay_episode(self, episode_id: str):
+        n = int(episode_id.split("_")[1])
+        return (ObservationFrame(step=i) for i in range(n))
+
+
+class FakeHypothesisRunner:
+    def __init__(self) -> None:
+        self.steps = 0
+        self.stabilization_events = []
+        self.bias_suggestions = []
+
+    def step(self, frame: ObservationFrame) -> None:
+        self.steps += 1
+        if frame.step == 3:
+            self.stabilization_events.append({"hypothesis_id": "H", "step": frame.step})
+            self.bias_suggestions.append({"H": 0.1})
+
+    def build_timeline(self):
+        return {"steps": self.steps}
+
+
+def make_runner() -> FakeHypothesisRunner:
+    return FakeHypothesisRunner()
+
+
+def _execute(workers: int):
+    plan = ReplayPlan(
+        request=ReplayRequest(reason="test"),
+        selected_episode_ids=["ep_6", "ep_2", "ep_8"],
+    )
+    executor = ReplayExecutor(
+        episode_replay=FakeEpisodeReplay(),
+        runner_factory=make_runner,
+        execution_config=ReplayExecutionConfig(mode="nrem", stride=1, workers=workers),
+    )
+    return executor.execute(plan)
+
+
+def test_isolated_replay_is_worker_count_invariant() -> None:
+    inline = _execute(workers=1)
+    pooled = _execute(workers=3)
+
+    assert inline == pooled
+
+    assert pooled.executed_episode_ids == ["ep_6", "ep_2", "ep_8"]
+    assert pooled.observation_frame_count == 16
+    assert pooled.cognition_output == [{"steps": 6}, {"steps": 2}, {"steps": 8}]
+
+    assert [e["episode_id"] for e in pooled.stabilization_events] == ["ep_6", "ep_8"]
+    assert pooled.bias_suggestions == [{"H": 0.1}, {"H": 0.1}]
@@ -9,13 +9,28 @@ class HypothesisRegistry:
 
     This is STRUCTURAL, not dynamic.
     No learning, no adaptation, no decay.
+
+    `version` increases whenever the mapping changes, so routing
+    caches can skip re-resolution while it is unchanged.
     """
 
     def __init__(self):
         self._map: Dict[str, str] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
 
     def register(self, hypothesis_id: str, channel: str) -> None:
-        self._map[hypothesis_id] = channel
+        if self._map.get(hypothesis_id) != channel:
+            self._map[hypothesis_id] = channel
+            self._version += 1
+
+    def clear(self) -> None:
+        if self._map:
+            self._map.clear()
+            self._version += 1
 
     def resolve(self, hypothesis_id: Optional[str]) -> Optional[str]:
         if hypothesis_id is None:
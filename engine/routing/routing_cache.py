@@ -0,0 +1,72 @@
+# engine/routing/routing_cache.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from engine.routing.hypothesis_router import HypothesisRouter
+
+
+# (registry version, PopulationModel.hypothesis_epoch, runtime routing epoch, channel key)
+RoutingKey = Tuple[int, int, int, str]
+
+
+@dataclass(frozen=True)
+class RoutingTable:
+    """
+    Routed striatal channels for one routing state.
+
+    - assemblies: striatal assemblies with a channel, in region order
+    - channels: channel -> assemblies, in first-seen order
+      (the grouping CompetitionKernel.apply builds itself otherwise)
+    - routing: assembly_id -> routed channel (snapshots get a copy
+      made when the table is built)
+    """
+
+    key: RoutingKey
+    assemblies: List[Any]
+    channels: Dict[str, List[Any]]
+    routing: Dict[str, Optional[str]]
+
+
+def build_routing_table(
+    populations: Dict[str, List[Any]],
+    router: HypothesisRouter,
+    *,
+    key: RoutingKey,
+    channel_key: str = "subpopulation",
+) -> RoutingTable:
+    """
+    Route every striatal assembly once and apply the routed channel.
+
+    Assemblies without a subpopulation are not routed. The biological
+    channel is preserved once in _base_subpopulation.
+    """
+    assemblies: List[Any] = []
+    for plist in populations.values():
+        for p in plist:
+            if getattr(p, "subpopulation", None) is None:
+                continue
+
+            if getattr(p, "_base_subpopulation", None) is None:
+                p._base_subpopulation = p.subpopulation
+
+            routed = router.route(
+                hypothesis_id=getattr(p, "hypothesis_id", None),
+                default_channel=p._base_subpopulation,
+            )
+            if routed is not None:
+                p.subpopulation = routed
+
+            assemblies.append(p)
+
+    channels: Dict[str, List[Any]] = {}
+    for p in assemblies:
+        channels.setdefault(getattr(p, channel_key, None) or "default", []).append(p)
+
+    return RoutingTable(
+        key=key,
+        assemblies=assemblies,
+        channels=channels,
+        routing={p.assembly_id: p.subpopulation for p in assemblies},
+    )
@@ -1,6 +1,6 @@
 # engine/routing/routing_influence.py
 from __future__ import annotations
-from typing import Optional
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
 
 from engine.execution.execution_target import ExecutionTarget
 
@@ -32,6 +32,9 @@ class RoutingInfluence:
         # Optional execution gate (identity if None)
         self.execution_gate = execution_gate
 
+        # region -> (cache key, mean gain)
+        self._mean_cache: Dict[str, Tuple[Hashable, float]] = {}
+
     def gain_for(
         self,
         assembly_id: str,
@@ -79,3 +82,72 @@ class RoutingInfluence:
             )
 
         return gain
+
+    # ----------------------------------
+    # Bulk (per-region) gains
+    # ----------------------------------
+
+    def gains_for(self, assemblies: Sequence[Any]) -> List[float]:
+        """
+        gain_for over a region's assemblies in one pass.
+        """
+        gain_for = self.gain_for
+        return [
+            gain_for(
+                assembly_id=p.assembly_id,
+                hypothesis_id=getattr(p, "hypothesis_id", None),
+                target_channel=getattr(p, "subpopulation", None),
+            )
+            for p in assemblies
+        ]
+
+    def _cacheable(self) -> bool:
+        # Gated reads append execution records per call; never skip them
+        if self.execution_gate is not None:
+            return False
+        sal = self.salience_field
+        if sal is None:
+            return True
+        return (
+            sal.execution_gate is None
+            and getattr(sal, "_sparsity_gate", None) is None
+            and hasattr(sal, "version")
+        )
+
+    def mean_gain(
+        self,
+        region: str,
+        assemblies: Sequence[Any],
+        *,
+        key: Optional[Hashable] = None,
+    ) -> float:
+        """
+        Mean outgoing gain of a region's assemblies.
+
+        With a `key` (the caller's routing state: hypothesis ids and
+        channels), the value is reused until the key, the salience
+        field version or the gain parameters change.
+        """
+        if not assemblies:
+            return 1.0
+
+        full_key: Optional[Hashable] = None
+        if key is not None and self._cacheable():
+            sal = self.salience_field
+            full_key = (
+                key,
+                len(assemblies),
+                self.default_gain,
+                self.max_salience_gain,
+                None if sal is None else (id(sal), sal.version),
+            )
+            hit = self._mean_cache.get(region)
+            if hit is not None and hit[0] == full_key:
+                return hit[1]
+
+        gains = self.gains_for(assemblies)
+        mean = sum(gains) / len(gains)
+
+        if full_key is not None:
+            self._mean_cache[region] = (full_key, mean)
+        return mean
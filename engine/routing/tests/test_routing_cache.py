@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from engine.command_server import make_command_handler
+from engine.routing.hypothesis_registry import HypothesisRegistry
+from engine.runtime import BrainRuntime
+
+
+def test_registry_version_bumps_only_on_change() -> None:
+    reg = HypothesisRegistry()
+    assert reg.version == 0
+
+    reg.register("H1", "D1")
+    reg.register("H1", "D1")
+    assert reg.version == 1
+
+    reg.register("H1", "D2")
+    assert reg.version == 2
+
+    reg.clear()
+    reg.clear()
+    assert reg.version == 3
+    assert reg.resolve("H1") is None
+
+
+def test_routing_table_reused_until_routing_state_changes(runtime: BrainRuntime) -> None:
+    rt = runtime
+    rt.step()
+    table = rt._routing_table
+    assert list(table.channels) == ["D1", "D2"]
+
+    rt.step()
+    rt.step()
+    assert rt._routing_table is table
+    routing = rt._last_striatum_snapshot["routing"]
+    assert routing == table.routing
+
+    # Snapshots share one copy per table, never the table's own dict
+    routing.clear()
+    assert table.routing
+    assert list(rt._routing_table.channels) == ["D1", "D2"]
+
+    # Registry change
+    rt.hypothesis_registry.register("H-unused", "D1")
+    rt.step()
+    assert rt._routing_table is not table
+    table = rt._routing_table
+
+    # Direct hypothesis_id write
+    rt.region_states["striatum"]["populations"]["D2_MSN"][0].hypothesis_id = "H-x"
+    rt.step()
+    assert rt._routing_table is not table
+    table = rt._routing_table
+
+    # Reset
+    rt.reset_hypothesis_routing()
+    rt.step()
+    assert rt._routing_table is not table
+
+
+def test_hypothesis_routing_applies_and_resets(runtime: BrainRuntime) -> None:
+    rt = runtime
+    handle = make_command_handler(rt)
+    d1 = rt.region_states["striatum"]["populations"]["D1_MSN"][0]
+
+    rt.hypothesis_registry.register("H1", "D2")
+    assert handle(f"hypothesis_set {d1.assembly_id} H1").startswith("OK")
+    assert handle("hypothesis_set striatum:NOPE:0 H1").startswith("ERROR")
+
+    rt.step()
+    assert d1.subpopulation == "D2"
+    assert d1._base_subpopulation == "D1"
+    assert rt._last_striatum_snapshot["routing"][d1.assembly_id] == "D2"
+    assert d1 in rt._routing_table.channels["D2"]
+
+    assert handle("hypothesis_reset").startswith("OK")
+    assert d1.subpopulation == "D1"
+
+    # Tag still present: the next step routes again
+    rt.step()
+    assert d1.subpopulation == "D2"
+
+    rt.set_assembly_hypothesis(d1.assembly_id, None)
+    rt.step()
+    assert d1.subpopulation == "D1"
+    assert d1 in rt._routing_table.channels["D1"]
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from engine.routing.routing_influence import RoutingInfluence
+from engine.runtime import BrainRuntime
+from engine.salience.salience_field import SalienceField
+
+
+def _asm(aid: str, hid=None, ch=None):
+    return SimpleNamespace(assembly_id=aid, hypothesis_id=hid, subpopulation=ch)
+
+
+def _counting(ri: RoutingInfluence) -> list:
+    calls = []
+    original = ri.gain_for
+
+    def gain_for(**kw):
+        calls.append(kw["assembly_id"])
+        return original(**kw)
+
+    ri.gain_for = gain_for
+    return calls
+
+
+def test_gains_for_matches_per_assembly_gain_for() -> None:
+    sal = SalienceField()
+    sal.inject("a", 0.05)
+    ri = RoutingInfluence(salience_field=sal)
+    asms = [_asm("a", "D1", "D1"), _asm("b", "D1", "D2"), _asm("c")]
+
+    expected = [
+        ri.gain_for(assembly_id=p.assembly_id, hypothesis_id=p.hypothesis_id, target_channel=p.subpopulation)
+        for p in asms
+    ]
+    assert ri.gains_for(asms) == expected
+    assert ri.mean_gain("r", asms) == pytest.approx(sum(expected) / 3)
+
+
+def test_mean_gain_cached_until_key_or_salience_changes() -> None:
+    sal = SalienceField(decay_tau=1.0)
+    ri = RoutingInfluence(salience_field=sal)
+    calls = _counting(ri)
+    asms = [_asm("a"), _asm("b")]
+
+    first = ri.mean_gain("r", asms, key=1)
+    assert ri.mean_gain("r", asms, key=1) == first
+    assert len(calls) == 2
+
+    ri.mean_gain("r", asms, key=2)
+    assert len(calls) == 4
+
+    sal.inject("a", 0.05)
+    boosted = ri.mean_gain("r", asms, key=2)
+    assert boosted > first
+    assert len(calls) == 6
+
+    sal.step(0.1)
+    ri.mean_gain("r", asms, key=2)
+    assert len(calls) == 8
+
+    # No key: always recomputed
+    ri.mean_gain("r", asms)
+    ri.mean_gain("r", asms)
+    assert len(calls) == 12
+
+
+def test_execution_gated_gains_are_never_cached() -> None:
+    gate = SimpleNamespace(records=[])
+    gate.apply = lambda target, value, identity: gate.records.append(target) or value
+    ri = RoutingInfluence(execution_gate=gate)
+    asms = [_asm("a"), _asm("b")]
+
+    ri.mean_gain("r", asms, key=1)
+    ri.mean_gain("r", asms, key=1)
+    assert len(gate.records) == 4
+
+
+def test_runtime_computes_region_gains_once_and_reuses_them(runtime: BrainRuntime) -> None:
+    rt = runtime
+    calls = _counting(rt.routing_influence)
+
+    rt.step()
+    # Once per assembly, however many outputs its region has
+    assert len(calls) == len(set(calls))
+    assert calls
+
+    calls.clear()
+    rt.step()
+    assert calls == []
+
+    d1 = rt.region_states["striatum"]["populations"]["D1_MSN"][0]
+    rt.set_assembly_hypothesis(d1.assembly_id, "D1")
+    rt.step()
+    assert d1.assembly_id in calls
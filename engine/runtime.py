@@ -1,11 +1,30 @@
 
 from __future__ import annotations
 
+import copy
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-from engine.population_model import PopulationModel
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from engine.population_model import INTEGRATORS, PopulationModel
+from engine.noise import CounterNoise
+from engine.sharding import (
+    COORDINATOR_REGIONS,
+    ShardedPhysiology,
+    RegionAggregate,
+    ShardPlan,
+    partition_regions,
+    region_aggregate,
+    region_graph,
+)
+from engine.multirate import SLOW_PERIODS, MultiRateScheduler
+from engine.stimulus_timeline import (
+    CompiledTimeline,
+    StimulusBatch,
+    StimulusTimeline,
+    compile_timeline,
+    scatter_add,
+)
 from engine.competition import CompetitionKernel
 from engine.runtime_context import RuntimeContext
 from engine.context_hooks import PFCContextHook
@@ -28,6 +47,13 @@ from engine.routing.hypothesis_registry import HypothesisRegistry
 from engine.routing.hypothesis_router import HypothesisRouter
 from engine.routing.hypothesis_generator import HypothesisGenerator
 from engine.routing.hypothesis_pressure import HypothesisPressure
+from engine.routing.routing_cache import RoutingTable, build_routing_table
+from engine.inspection.live_state import LiveStateExport
+from engine.inspection.memory_accounting import (
+    MemoryAccountant,
+    PeriodicMemoryReport,
+    register_runtime_containers,
+)
 
 
 
@@ -50,6 +76,43 @@ def _as_int(x: Any, default: int = 0) -> int:
         return int(default)
 
 
+# Stages of step(), in order, as reported to a phase probe
+STEP_PHASES = (
+    "inputs",
+    "physiology",
+    "striatum",
+    "gpi",
+    "urgency",
+    "decision_bias",
+    "latch",
+    "control",
+    "pfc_context",
+    "decay",
+    "decision_fx",
+    "propagation",
+    "time",
+    "hooks",
+)
+
+
+# Multi-rate validation snapshots (readable state of each slow field)
+
+def _value_snapshot(v: ValueSignal) -> Dict[str, float]:
+    return {"value": v.value}
+
+
+def _context_snapshot(c: RuntimeContext) -> Dict[str, float]:
+    return {f"{k}/{d}": g for k, domains in c.dump().items() for d, g in domains.items()}
+
+
+def _salience_snapshot(s: SalienceField) -> Dict[str, float]:
+    return s.dump()
+
+
+def _persistence_snapshot(b: BasalGangliaPersistence) -> Dict[str, float]:
+    return b.dump()
+
+
 # ============================================================
 # BrainRuntime
 # ============================================================
@@ -76,12 +139,35 @@ class BrainRuntime:
     DECISION_RELIEF_THRESHOLD = 0.47
     DECISION_SUSTAIN_STEPS = 5
 
-    def __init__(self, brain: Dict[str, Any], dt: float = 0.01):
+    # Adaptive stepping near the latch thresholds: no span may bring
+    # dominance delta or relief closer than LATCH_SPAN_MARGIN to a
+    # threshold, extrapolating their last rate of change with
+    # LATCH_SPAN_SAFETY headroom (see _latch_stable_span)
+    LATCH_SPAN_MARGIN = 0.01
+    LATCH_SPAN_SAFETY = 2.0
+
+    def __init__(
+        self,
+        brain: Dict[str, Any],
+        dt: float = 0.01,
+        *,
+        noise_seed: int = 0,
+        integrator: str = "euler",
+    ):
         self.brain = brain
         self.dt = float(dt)
         self.time = 0.0
         self.step_count = 0
 
+        # Population leak integrator (see INTEGRATORS) and adaptive
+        # stepping: run() may cover up to max_span base steps per step()
+        self.integrator = "euler"
+        self.max_span = 1
+        self.set_integrator(integrator)
+
+        # Per-assembly physiological noise, keyed by (seed, assembly index, step)
+        self.noise = CounterNoise(seed=noise_seed)
+
         # ------------------------------------------------------------
         # TEST-ONLY: decision coincidence injection
         # ------------------------------------------------------------
@@ -158,6 +244,14 @@ class BrainRuntime:
         )
         self.value_trace = ValueTrace()
 
+        # ---------------- Multi-rate updates (slow fields) ----------------
+        # Single-rate (period 1) unless configure_multirate() is called
+        self.multirate = MultiRateScheduler(dt=self.dt)
+        self.multirate.register("value", self.value_signal, snapshot=_value_snapshot)
+        self.multirate.register("context", self.context, snapshot=_context_snapshot)
+        self.multirate.register("salience", self.salience, snapshot=_salience_snapshot)
+        self.multirate.register("persistence", self.bg_persistence, snapshot=_persistence_snapshot)
+
         # ---------------- Affective Urgency (Phase 3B) ----------------
         self.enable_urgency = False  # OFF by default
 
@@ -194,9 +288,16 @@ class BrainRuntime:
         # ---------------- Runtime state ----------------
         self.region_states: Dict[str, Dict[str, Any]] = {}
         self._all_pops: List[PopulationModel] = []
-        self._stim_queue: List[Tuple[str, Optional[str], Optional[int], float]] = []
+        self._stim_queue: List[StimulusBatch] = []
+        self._stim_targets: Dict[Tuple[str, Optional[str], Optional[int]], Tuple[int, ...]] = {}
+        self._pop_index: Optional[Dict[int, int]] = None
+        self._stim_timelines: List[CompiledTimeline] = []
         self._region_key_by_label: Dict[str, str] = {}
         self._urgency_gain: float = 1.0
+        # Worker-process physiology (start_shards); None = single process
+        self._shards: Optional[ShardedPhysiology] = None
+        # Called with each STEP_PHASES name as step() completes it
+        self._phase_probe: Optional[Callable[[str], None]] = None
 
         # ---------------- Decision latch ----------------
         self._decision_fired = False
@@ -204,12 +305,23 @@ class BrainRuntime:
         self._decision_state: Optional[Dict[str, Any]] = None
         self._control_state: Optional[ControlState] = None
 
+        # Latch inputs (delta, relief) at the last evaluation, their
+        # rates of change per base step, and whether they met the
+        # thresholds; used to bound adaptive spans
+        self._latch_inputs: Optional[Tuple[float, float]] = None
+        self._latch_rates: Tuple[float, float] = (0.0, 0.0)
+        self._latch_condition = False
+
         self._decision_sustain_required = int(self.DECISION_SUSTAIN_STEPS)
         latch_cfg = brain.get("decision_latch", {}) or {}
         if "sustain_steps" in latch_cfg:
             self._decision_sustain_required = max(
                 1, int(latch_cfg["sustain_steps"])
             )
+        elif "sustain_time" in latch_cfg:
+            self._decision_sustain_required = max(
+                1, round(float(latch_cfg["sustain_time"]) / self.dt)
+            )
 
         self._build(brain)
 
@@ -228,6 +340,14 @@ class BrainRuntime:
         # ---------------- Hypothesis routing (STRUCTURAL) ----------------
         self.hypothesis_registry = HypothesisRegistry()
         self.hypothesis_router = HypothesisRouter(self.hypothesis_registry)
+
+        # Striatal routing is recomputed only when its key changes
+        self._routing_epoch = 0
+        self._routing_builds = 0
+        self._routing_table: Optional[RoutingTable] = None
+        # Copy of the table's routing handed to striatum snapshots, so
+        # a consumer editing a snapshot cannot reach the cached table
+        self._routing_snapshot: Dict[str, Optional[str]] = {}
         
         # ---------------- Hypothesis generation (STRUCTURAL) ----------------
         self.hypothesis_generator = HypothesisGenerator()
@@ -312,6 +432,13 @@ class BrainRuntime:
             self._episodic_boundary_adapter = None
             self._episode_runtime_hook = None
 
+        # ---------------- Memory accounting (READ-ONLY, lazy) ----------------
+        self._memory_accountant: Optional[MemoryAccountant] = None
+        self.memory_report: Optional[PeriodicMemoryReport] = None
+
+        # ---------------- Live state export (READ-ONLY, shared memory) ----------------
+        self.live_export: Optional[LiveStateExport] = None
+
     # ============================================================
     # Assembly Control
     # ============================================================
@@ -399,15 +526,89 @@ class BrainRuntime:
         assembly_index: Optional[int] = None,
         magnitude: float = 1.0,
     ) -> None:
+        targets = self._stimulus_targets(region_id, population_id, assembly_index)
+        if targets:
+            self._stim_queue.append((targets, magnitude))
+
+    def _stimulus_targets(
+        self,
+        region_id: str,
+        population_id: Optional[str] = None,
+        assembly_index: Optional[int] = None,
+    ) -> Tuple[int, ...]:
+        """
+        Flat indices into _all_pops for an injection target.
+        Resolved once per distinct target; populations are fixed after build.
+        """
         rk = self._resolve_region_key(region_id) or region_id
-        self._stim_queue.append((rk, population_id, assembly_index, magnitude))
+        key = (rk, population_id, assembly_index)
+        cached = self._stim_targets.get(key)
+        if cached is not None:
+            return cached
+
+        if self._pop_index is None:
+            self._pop_index = {id(p): i for i, p in enumerate(self._all_pops)}
+        index = self._pop_index
+
+        pops = self.region_states.get(rk, {}).get("populations", {})
+        groups = pops.values() if population_id is None else [pops.get(population_id, [])]
+
+        targets = tuple(
+            index[id(p)]
+            for plist in groups
+            for p in (plist if assembly_index is None else plist[assembly_index:assembly_index + 1])
+            if id(p) in index
+        )
+        self._stim_targets[key] = targets
+        return targets
+
+    def add_stimulus_timeline(self, timeline: StimulusTimeline) -> CompiledTimeline:
+        """
+        Compile a timeline against this runtime and apply it every step
+        alongside queued stimuli.
+        """
+        compiled = compile_timeline(timeline, self._stimulus_targets)
+        self._stim_timelines.append(compiled)
+        return compiled
+
+    def clear_stimulus_timelines(self) -> None:
+        self._stim_timelines.clear()
+
+    def _stimulus_gains(self, indices: Iterable[int], urgency: float) -> Dict[int, float]:
+        """
+        Input gain (PSM x context x salience) per target index, once per step.
+        """
+        pops = self._all_pops
+        gains: Dict[int, float] = {}
+        for i in indices:
+            aid = pops[i].assembly_id
+            gain = 1.0
+            if self.enable_pre_decision_adaptation:
+                gain *= self._psm_gain_cache.get(aid, 1.0)
+            if self.enable_context:
+                gain *= self.context.get_gain(aid)
+            if self.enable_salience:
+                sal = self.salience.get(aid)
+                if self.enable_urgency:
+                    sal *= (1.0 + urgency)
+                gain *= (1.0 + sal)
+            gains[i] = gain
+        return gains
 
     # ============================================================
     # STEP
     # ============================================================
 
-    def step(self) -> None:
-        self.step_count += 1
+    def step(self, span: int = 1) -> None:
+        """
+        Advance one step covering `span` base steps of dt.
+
+        span > 1 holds this step's inputs for span * dt: step_count
+        and time advance by span and decays integrate over the whole
+        interval. Only valid while inputs are constant; run() picks
+        spans that are (see configure_adaptive_step).
+        """
+        self.step_count += span
 
         # ============================================================
         # STEP (AUTHORITATIVE ORDER)
@@ -419,33 +620,50 @@ class BrainRuntime:
         urgency = 0.0
         self._urgency_gain = 1.0
 
+        # Phase probe (divergence finder): called after each stage
+        probe = self._phase_probe
+
         # 1. Reset inputs + apply stimuli
-        for p in self._all_pops:
+        shards = self._shards
+        local_pops = self._all_pops if shards is None else shards.local_pops
+        for p in local_pops:
             p.input = 0.0
 
-        for region_key, pop_id, idx, mag in self._stim_queue:
-            pops = self.region_states.get(region_key, {}).get("populations", {})
-            targets = pops.values() if pop_id is None else [pops.get(pop_id, [])]
-
-            for plist in targets:
-                for p in plist if idx is None else plist[idx:idx + 1]:
-                    gain = 1.0
-                    if self.enable_pre_decision_adaptation:
-                        gain *= self._psm_gain_cache.get(p.assembly_id, 1.0)
-                    if self.enable_context:
-                        gain *= self.context.get_gain(p.assembly_id)
-                    if self.enable_salience:
-                        sal = self.salience.get(p.assembly_id)
-                        if self.enable_urgency:
-                            sal *= (1.0 + urgency)
-                        gain *= (1.0 + sal)
-                    p.input += mag * gain
+        # Targets are flat _all_pops indices (resolved at enqueue/compile time)
+        batches = self._stim_queue
+        if self._stim_timelines:
+            step = self.step_count
+            batches = batches + [
+                b for tl in self._stim_timelines for b in tl.contributions(step)
+            ]
+
+        if batches:
+            touched = dict.fromkeys(i for indices, _ in batches for i in indices)
+            gains = self._stimulus_gains(touched, urgency)
+            pops = self._all_pops
+            for i, x in scatter_add(batches, gains).items():
+                if shards is not None and shards.owns(i):
+                    shards.set_input(i, x)
+                else:
+                    pops[i].input = x
 
         self._stim_queue.clear()
 
-        # 2. Physiology update
-        for p in self._all_pops:
-            p.step(self.dt)
+        if probe is not None:
+            probe("inputs")
+
+        # 2. Physiology update (one noise vector per step, indexed like _all_pops)
+        dt = self.dt * span
+        exact = self.integrator == "exponential"
+        if shards is None:
+            units = self.noise.standard_normal(self.step_count, len(self._all_pops))
+            self._step_pops(self._all_pops, units, dt, span, exact)
+        else:
+            # Workers step their regions while the coordinator steps its own
+            shards.begin_step(self.step_count, dt, span, exact)
+            units = self.noise.standard_normal(self.step_count, indices=shards.local_indices)
+            self._step_pops(local_pops, units, dt, span, exact)
+            shards.finish_step()
 
         # 2b. Hypothesis observation (cortical only, read-only) ---
         assoc = self.region_states.get("association_cortex")
@@ -456,14 +674,23 @@ class BrainRuntime:
             self.hypothesis_generator.observe(assemblies)
 
 
+        if probe is not None:
+            probe("physiology")
+
         # 3. Striatum competition + BG persistence
         if self.enable_competition:
-            self._step_striatum()
+            self._step_striatum(span)
+
+        if probe is not None:
+            probe("striatum")
 
         # 4. GPi disinhibition (gate computation)
         relief = self._compute_gpi_relief()
         self._last_gate_strength = relief
 
+        if probe is not None:
+            probe("gpi")
+
         # 4a. Hypothesis pressure (pre-decision, read-only)
         hypothesis_pressure = {}
 
@@ -497,13 +724,16 @@ class BrainRuntime:
             urgency = self.urgency_adapter.compute(
                 time=self.time,
                 step=self.step_count,
-                dt=self.dt,
+                dt=dt,
                 gate_relief=relief,
                 dominance_delta=delta,
             )
 
             self._urgency_gain = 1.0 + urgency
 
+        if probe is not None:
+            probe("urgency")
+
         # 5. Striatum → decision bias (value × urgency tempo)
         if self.enable_vta_value and self.enable_decision_bias:
             urgency_gain = 1.0 + urgency if self.enable_urgency else 1.0
@@ -544,8 +774,14 @@ class BrainRuntime:
                 )
             )
 
+        if probe is not None:
+            probe("decision_bias")
+
         # 6. Decision latch (creates _decision_state)
-        self._evaluate_decision_latch(relief)
+        self._evaluate_decision_latch(relief, span)
+
+        if probe is not None:
+            probe("latch")
 
         # 6a. Episodic observation (READ-ONLY, Phase 5)
         if hasattr(self, "episode_hook"):
@@ -568,22 +804,30 @@ class BrainRuntime:
         self._control_state = ControlHook.compute(self)
 
 
+        if probe is not None:
+            probe("control")
+
         # 7. PFC → Context injection (now sees working state)
         if self.enable_context and self.enable_pfc_context:
             self._apply_pfc_context()
 
+        if probe is not None:
+            probe("pfc_context")
+
         # 8. Decay (context, salience, bias, working state)
+        # Slow fields advance at their multi-rate period; decision bias and
+        # the PFC adapter consume one-shot modifiers and stay per-step
         if self.enable_vta_value:
-            self.value_signal.step(self.dt)
+            self.multirate.advance("value", span)
         if self.enable_context:
-            self.context.step(self.dt)
+            self.multirate.advance("context", span)
         if self.enable_salience:
-            self.salience.step(self.dt)
+            self.multirate.advance("salience", span)
         if self.enable_decision_bias:
-            self.decision_bias.step(self.dt)
+            self.decision_bias.step(dt)
 
         if self.enable_pfc_adapter:
-            self.pfc_adapter.step(self.dt)
+            self.pfc_adapter.step(dt)
 
             if self.enable_vta_value:
                 urgency_gain = 1.0 + urgency if self.enable_urgency else 1.0
@@ -594,6 +838,9 @@ class BrainRuntime:
                     )
                 )
 
+        if probe is not None:
+            probe("decay")
+
         # 9. Decision FX (post-commit, advisory only)
         if self.enable_decision_fx and self._decision_state is not None:
             self.decision_fx.apply(
@@ -601,12 +848,21 @@ class BrainRuntime:
                 dominance=getattr(self, "_last_striatum_snapshot", {}).get("dominance", {}),
             )
 
+        if probe is not None:
+            probe("decision_fx")
+
         # 10. Connectivity propagation + thalamic gating
         self._propagate_connectivity(relief)
 
+        if probe is not None:
+            probe("propagation")
+
         # 12. Advance time
-        self.time += self.dt
+        self.time += dt
         
+        if probe is not None:
+            probe("time")
+
         # ---------------- Observation (READ-ONLY, post-settle) ----------------
         if self._observation_hook is not None:
             self._observation_hook.step(self)
@@ -627,6 +883,110 @@ class BrainRuntime:
                 boundary_events=boundary_events,
             )
 
+        # ---------------- Memory report (READ-ONLY, periodic) ----------------
+        if self.memory_report is not None:
+            self.memory_report.step(self.step_count)
+
+        # ---------------- Live state export (READ-ONLY, periodic) ----------------
+        if self.live_export is not None:
+            self.live_export.step(self)
+
+        if probe is not None:
+            probe("hooks")
+
+    @staticmethod
+    def _step_pops(
+        pops: List[PopulationModel],
+        units: List[float],
+        dt: float,
+        span: int,
+        exact: bool,
+    ) -> None:
+        if exact:
+            for p, z in zip(pops, units):
+                p.step(dt, z, exact=True, span=span)
+        else:
+            for p, z in zip(pops, units):
+                p.step(dt, z)
+
+    def run(self, steps: int) -> int:
+        """
+        Advance `steps` base steps; returns the number of step() calls.
+
+        With max_span > 1, each call covers as many base steps as
+        inputs stay constant (see _adaptive_span).
+        """
+        end = self.step_count + int(steps)
+        calls = 0
+        while self.step_count < end:
+            self.step(self._adaptive_span(end - self.step_count))
+            calls += 1
+        return calls
+
+    def _adaptive_span(self, limit: int) -> int:
+        """
+        Base steps the next step() may cover without changing results
+        that are defined per base step.
+
+        Held to 1 by queued one-step stimuli or a test coincidence
+        window; clipped to the next stimulus-timeline change, to the
+        remaining decision-latch sustain (so the latch fires on the
+        same base step count), to the next memory-report sample, and
+        to 1 while the latch condition could flip (_latch_stable_span),
+        so the latch fires on the same base step as with fixed steps.
+        """
+        span = min(self.max_span, limit)
+        if span <= 1 or self._stim_queue or self._test_coincidence_enabled:
+            return 1
+
+        first = self.step_count + 1
+        for tl in self._stim_timelines:
+            until = tl.constant_until(first)
+            if until is not None:
+                span = min(span, until - first)
+
+        if not self._decision_fired:
+            span = min(span, self._decision_sustain_required - self._decision_counter)
+            span = min(span, self._latch_stable_span())
+
+        if self.memory_report is not None:
+            every = self.memory_report.sample_every
+            span = min(span, every - self.step_count % every)
+
+        return max(1, span)
+
+    def _latch_stable_span(self) -> int:
+        """
+        Base steps over which the latch condition is not expected to
+        flip: each input's distance to its threshold over its last rate
+        of change (with LATCH_SPAN_SAFETY headroom), 1 within
+        LATCH_SPAN_MARGIN of a threshold.
+
+        While the condition holds, any input crossing flips it (min);
+        while it does not, every unmet input has to cross first (max).
+        """
+        if self._latch_inputs is None:
+            return self.max_span
+
+        bounds = []
+        for value, threshold, rate in zip(
+            self._latch_inputs,
+            (self.DECISION_DOMINANCE_THRESHOLD, self.DECISION_RELIEF_THRESHOLD),
+            self._latch_rates,
+        ):
+            gap = abs(value - threshold)
+            if gap < self.LATCH_SPAN_MARGIN:
+                steps = 1
+            elif rate <= 0.0:
+                steps = self.max_span
+            else:
+                steps = max(1, int((gap - self.LATCH_SPAN_MARGIN) / (rate * self.LATCH_SPAN_SAFETY)))
+            bounds.append((value >= threshold, steps))
+
+        if self._latch_condition:
+            return min(steps for _, steps in bounds)
+        return max(steps for met, steps in bounds if not met)
+
     # ============================================================
     # Subsystems
     # ============================================================
@@ -709,35 +1069,13 @@ class BrainRuntime:
             )
 
                    
-    def _step_striatum(self) -> None:
+    def _step_striatum(self, span: int = 1) -> None:
         striatum = self.region_states.get("striatum")
         if not striatum:
             return
 
-        assemblies = []
-        for plist in striatum["populations"].values():
-            for p in plist:
-                if getattr(p, "subpopulation", None) is None:
-                    continue
-
-                # --- Preserve biological channel identity (one-time) ---
-                if not hasattr(p, "_base_subpopulation"):
-                    p._base_subpopulation = p.subpopulation
-
-
-                # Optional hypothesis-based routing
-                hypothesis_id = getattr(p, "hypothesis_id", None)
-
-                routed_channel = self.hypothesis_router.route(
-                    hypothesis_id=hypothesis_id,
-                    default_channel=p._base_subpopulation,
-                )
-
-                # Override channel ONLY if router says so
-                if routed_channel is not None:
-                    p.subpopulation = routed_channel
-
-                assemblies.append(p)
+        table = self._striatum_routing(striatum)
+        assemblies = table.assemblies
 
         if not assemblies:
             return
@@ -761,15 +1099,15 @@ class BrainRuntime:
             self.dt,
             external_gain=external_gain or None,
             external_bias=external_bias or None,
+            channels=table.channels,
+            span=span,
         )
 
         self._last_striatum_snapshot = {
             "winner": self.competition_kernel.last_winner_channel,
             "dominance": dict(self.competition_kernel.last_dominance_map),
             "instant": dict(self.competition_kernel.last_instantaneous_map),
-            "routing": {
-                p.assembly_id: p.subpopulation for p in assemblies
-            },
+            "routing": self._routing_snapshot,
             "time": self.time,
         }
 
@@ -778,8 +1116,38 @@ class BrainRuntime:
             max_out = max(p.output() for p in assemblies)
             for p in assemblies:
                 if p.output() >= max_out * 0.95:
-                    self.bg_persistence.reinforce(p.assembly_id, amount=0.02)
-            self.bg_persistence.step(self.dt)
+                    self.bg_persistence.reinforce(p.assembly_id, amount=0.02 * span)
+            self.multirate.advance("persistence", span)
+
+    def _striatum_routing(self, striatum: Dict[str, Any]) -> RoutingTable:
+        """
+        Cached hypothesis routing for the striatum.
+
+        Rebuilt only when the registry version, any assembly's
+        hypothesis_id, the runtime routing epoch (hypothesis
+        set/reset) or the kernel's channel key changes.
+        """
+        key = (
+            self.hypothesis_registry.version,
+            PopulationModel.hypothesis_epoch,
+            self._routing_epoch,
+            self.competition_kernel.channel_key,
+        )
+        table = self._routing_table
+        if table is None or table.key != key:
+            table = build_routing_table(
+                striatum["populations"],
+                self.hypothesis_router,
+                key=key,
+                channel_key=self.competition_kernel.channel_key,
+            )
+            self._routing_table = table
+            self._routing_snapshot = dict(table.routing)
+            self._routing_builds += 1
+        return table
+
+    def invalidate_routing(self) -> None:
+        self._routing_epoch += 1
 
     def _compute_gpi_relief(self) -> float:
         if not self.enable_gpi_disinhibition:
@@ -825,18 +1193,22 @@ class BrainRuntime:
             
         return InfluencePacket(targets=targets)
 
-    def _evaluate_decision_latch(self, relief: float) -> None:
+    def _evaluate_decision_latch(self, relief: float, span: int = 1) -> None:
         if self._decision_fired:
             return
 
         snap = getattr(self, "_last_striatum_snapshot", None)
         if not snap:
             self._decision_counter = 0
+            self._latch_inputs = None
+            self._latch_condition = False
             return
 
         dom = snap.get("dominance", {})
         if len(dom) < 2:
             self._decision_counter = 0
+            self._latch_inputs = None
+            self._latch_condition = False
             return
 
         vals = sorted(dom.values(), reverse=True)
@@ -858,14 +1230,22 @@ class BrainRuntime:
 # ------------------------------------------------------------
 
 
-        if (
+        met = (
             delta >= self.DECISION_DOMINANCE_THRESHOLD
             and relief >= self.DECISION_RELIEF_THRESHOLD
-        ):
-            self._decision_counter += 1
+        )
+        if met:
+            # An onset inside a multi-step span counts from its last base step
+            self._decision_counter += span if self._latch_condition else 1
         else:
             self._decision_counter = 0
 
+        if self._latch_inputs is not None:
+            last_delta, last_relief = self._latch_inputs
+            self._latch_rates = (abs(delta - last_delta) / span, abs(relief - last_relief) / span)
+        self._latch_inputs = (delta, relief)
+        self._latch_condition = met
+
         if self._decision_counter >= self._decision_sustain_required:
             self._decision_fired = True
             self._decision_state = {
@@ -906,6 +1286,19 @@ class BrainRuntime:
             else 1.0
         )
 
+        routing = getattr(self, "routing_influence", None)
+        routing_key = None
+        if routing is not None:
+            # Source gains depend on hypothesis ids and routed channels
+            routing_key = (
+                self.hypothesis_registry.version,
+                PopulationModel.hypothesis_epoch,
+                self._routing_epoch,
+                self._routing_builds,
+            )
+
+        shards = self._shards
+
         for src_key, state in self.region_states.items():
             outputs = state.get("def", {}).get("outputs", [])
             if not outputs:
@@ -915,7 +1308,14 @@ class BrainRuntime:
             if not src_pops:
                 continue
 
-            src_drive = sum(p.output() for p in src_pops) / len(src_pops)
+            if shards is not None and shards.is_sharded(src_key):
+                src_drive = shards.aggregate(src_key).drive
+            else:
+                src_drive = sum(p.output() for p in src_pops) / len(src_pops)
+
+            # Routing gain depends only on the source assemblies: computed
+            # once per region (at its first live edge), shared by all edges
+            routing_gain: Optional[float] = None
 
             for out in outputs:
                 target_label = (
@@ -934,21 +1334,12 @@ class BrainRuntime:
                 target_pop = out.get("target_population") or out.get("population")
 
                 # ---------------- Routing influence (gain-only, pre-BG) ----------------
-                routing_gain = 1.0
-                if hasattr(self, "routing_influence"):
-                    gains = []
-                    for p in src_pops:
-                        hid = getattr(p, "hypothesis_id", None)
-                        ch = getattr(p, "subpopulation", None)
-                        g = self.routing_influence.gain_for(
-                            assembly_id=p.assembly_id,
-                            hypothesis_id=hid,
-                            target_channel=ch,
-                        )
-                        gains.append(g)
-
-                    if gains:
-                        routing_gain = sum(gains) / len(gains)
+                if routing_gain is None:
+                    routing_gain = (
+                        routing.mean_gain(src_key, src_pops, key=routing_key)
+                        if routing is not None
+                        else 1.0
+                    )
 
                 gain = routing_gain * (self._urgency_gain if self.enable_urgency else 1.0)
 
@@ -978,6 +1369,11 @@ class BrainRuntime:
         if not region:
             return
 
+        # Propagated input is cleared at stage 1 before any population
+        # reads it; worker-owned targets would only dirty their proxies
+        if self._shards is not None and self._shards.is_sharded(region_key):
+            return
+
         pops_map = region.get("populations", {}) or {}
 
         # If no target population specified, broadcast to all assemblies.
@@ -1059,14 +1455,255 @@ class BrainRuntime:
     # Diagnostics
     # ============================================================
 
+    def configure_multirate(
+        self,
+        periods: Optional[Dict[str, int]] = None,
+        *,
+        validate: bool = False,
+        tolerance: float = 0.02,
+    ) -> MultiRateScheduler:
+        """
+        Set slow-field update periods (default SLOW_PERIODS).
+
+        Pass all-1 periods to return to single-rate stepping. With
+        validate=True every step is checked against single-rate
+        stepping; see multirate.stats() / multirate.check().
+        """
+        self.multirate.validate = bool(validate)
+        self.multirate.tolerance = float(tolerance)
+        self.multirate.configure(SLOW_PERIODS if periods is None else periods)
+        return self.multirate
+
+    def set_integrator(self, integrator: str) -> None:
+        """
+        Population leak integrator: "euler" (default) or "exponential".
+        """
+        if integrator not in INTEGRATORS:
+            raise ValueError(f"Unknown integrator: {integrator} (expected one of {INTEGRATORS})")
+        if integrator != "exponential" and self.max_span > 1:
+            raise ValueError("Adaptive stepping requires the exponential integrator")
+        self.integrator = integrator
+
+    def configure_adaptive_step(self, max_span: int = 8) -> None:
+        """
+        Let run() cover up to max_span base steps per step() while
+        inputs are constant (max_span 1 disables it).
+
+        Needs the exponential integrator: Euler's leak error grows
+        with the step. Decision-latch sustain stays counted in base
+        steps, so latch timing is unchanged.
+        """
+        if max_span < 1:
+            raise ValueError("max_span must be >= 1")
+        if max_span > 1 and self.integrator != "exponential":
+            raise ValueError("Adaptive stepping requires the exponential integrator")
+        self.max_span = int(max_span)
+
+    @property
+    def decision_sustain_time(self) -> float:
+        """
+        Decision-latch sustain window in simulated time.
+        """
+        return self._decision_sustain_required * self.dt
+
+    # ============================================================
+    # FORKING
+    # ============================================================
+
+    def fork(self) -> "BrainRuntime":
+        """
+        Independent copy of this runtime, including its dynamical
+        state, for branching a built (and possibly warmed-up) network
+        without rebuilding it.
+
+        - The compiled brain (and the region definitions in it) is
+          shared, not copied: the runtime never writes to it
+        - Populations are copied slot by slot (PopulationModel.clone);
+          all other state is deep-copied
+        - Stepping the fork and the original with the same inputs
+          gives identical results
+        - Not carried over: the live state export and the phase probe
+        - Raises ValueError while shards are running (stop_shards() first)
+        """
+        if self._shards is not None:
+            raise ValueError("Cannot fork while shards are running; call stop_shards() first")
+
+        live_export, self.live_export = self.live_export, None
+        try:
+            other = copy.deepcopy(self, {id(self.brain): self.brain})
+        finally:
+            self.live_export = live_export
+
+        # Keyed by id() of the original populations
+        other._pop_index = None
+        other._phase_probe = None
+        return other
+
+    # ============================================================
+    # SHARDING
+    # ============================================================
+
+    def start_shards(
+        self,
+        n_shards: int,
+        *,
+        pinned: Iterable[str] = COORDINATOR_REGIONS,
+        imbalance: float = 0.1,
+    ) -> ShardPlan:
+        """
+        Step population physiology for most regions in `n_shards`
+        worker processes.
+
+        Regions are partitioned over the connectivity graph (few cut
+        edges, balanced assembly counts). Regions the step loop reads
+        assembly-by-assembly (`pinned`) stay in this process.
+
+        Propagated input is cleared at stage 1, so a population's
+        update only needs its own state, stimuli and noise: workers
+        exchange per-region aggregates (drive, stats) at the step
+        barrier, and results are identical to a single-process run.
+        Worker-region PopulationModel objects here become proxies,
+        refreshed by sync_shards().
+        """
+        if self._shards is not None:
+            raise ValueError("Shards are already running; call stop_shards() first")
+
+        weights = {
+            key: sum(len(plist) for plist in state["populations"].values())
+            for key, state in self.region_states.items()
+        }
+        graph = region_graph(self.region_states, self._resolve_region_key)
+        plan = partition_regions(
+            weights,
+            graph,
+            n_shards,
+            pinned=pinned,
+            imbalance=imbalance,
+        )
+        self._shards = ShardedPhysiology(
+            plan,
+            self.region_states,
+            self._all_pops,
+            noise_seed=self.noise.seed,
+        )
+        return plan
+
+    def stop_shards(self) -> None:
+        """
+        Bring worker state back and resume single-process stepping.
+        """
+        if self._shards is None:
+            return
+        self._shards.sync()
+        self._shards.close()
+        self._shards = None
+
+    def sync_shards(self) -> None:
+        """
+        Refresh worker-region proxies (activity, firing_rate, tonic).
+        """
+        if self._shards is not None:
+            self._shards.sync()
+
+    def push_shards(self) -> None:
+        """
+        Send edited worker-region proxies back to the workers.
+        """
+        if self._shards is not None:
+            self._shards.push()
+
+    def memory_accountant(self) -> MemoryAccountant:
+        """
+        Accountant over the runtime's append-only containers
+        (created on first use).
+        """
+        if self._memory_accountant is None:
+            self._memory_accountant = MemoryAccountant()
+            register_runtime_containers(self._memory_accountant, self)
+        return self._memory_accountant
+
+    def enable_memory_report(
+        self,
+        *,
+        sample_every: int = 100,
+        report_every: int = 1000,
+        sink=None,
+    ) -> PeriodicMemoryReport:
+        """
+        Sample container sizes every `sample_every` steps and emit a
+        report every `report_every` steps or on a new growth alarm
+        (to `sink`; default: logging, see memory_accounting.log_report).
+        """
+        self.memory_report = PeriodicMemoryReport(
+            self.memory_accountant(),
+            sample_every=sample_every,
+            report_every=report_every,
+            sink=sink,
+        )
+        return self.memory_report
+
+    def disable_memory_report(self) -> None:
+        self.memory_report = None
+
+    def enable_live_export(
+        self,
+        *,
+        name: Optional[str] = None,
+        every: int = 1,
+        max_channels: int = 32,
+    ) -> LiveStateExport:
+        """
+        Publish activity, region aggregates, dominance and gate/value
+        scalars to a shared-memory segment every `every` steps
+        (read it with engine.inspection.live_state.LiveStateReader).
+        """
+        self.disable_live_export()
+        self.live_export = LiveStateExport(
+            self,
+            name=name,
+            every=every,
+            max_channels=max_channels,
+        )
+        return self.live_export
+
+    def disable_live_export(self) -> None:
+        if self.live_export is not None:
+            self.live_export.close()
+            self.live_export = None
+
+    def regenerate_noise(self, step: int) -> Dict[str, float]:
+        """
+        Noise term each assembly received (or will receive) at `step`.
+
+        Pure recomputation from the counter stream; runtime state untouched.
+        """
+        units = self.noise.standard_normal(step, len(self._all_pops))
+        return {
+            p.assembly_id: p._sample_noise(z)
+            for p, z in zip(self._all_pops, units)
+        }
+
     def reset_hypothesis_routing(self) -> None:
         """
         Restore all assemblies to their original biological subpopulation
         assignments after hypothesis-based routing.
         """
         for p in self._all_pops:
-            if hasattr(p, "_base_subpopulation"):
+            if getattr(p, "_base_subpopulation", None) is not None:
                 p.subpopulation = p._base_subpopulation
+        self.invalidate_routing()
+
+    def set_assembly_hypothesis(self, assembly_id: str, hypothesis_id: Optional[str]) -> bool:
+        """
+        Tag one assembly with a hypothesis for routing.
+        Returns False if no assembly has that id.
+        """
+        for p in self._all_pops:
+            if p.assembly_id == assembly_id:
+                p.hypothesis_id = hypothesis_id
+                self.invalidate_routing()
+                return True
+        return False
 
 
     def snapshot_region_stats(self, region_key: str) -> Optional[Dict[str, Any]]:
@@ -1076,38 +1713,39 @@ class BrainRuntime:
         Mirrors the TCP `stats <region>` command.
         Safe for tests, probes, and notebooks.
         """
-        rk = self._resolve_region_key(region_key) or region_key
-        region = self.region_states.get(rk)
-        if not region:
+        agg = self._region_aggregate(region_key)
+        if agg is None:
             return None
 
-        acts: List[float] = []
-        outs: List[float] = []
+        return {
+            "region": region_key,
+            "mass": agg.mass,
+            "mean": agg.mean,
+            "std": agg.std,
+            "n": agg.n,
+        }
 
-        for plist in region["populations"].values():
-            for pop in plist:
-                acts.append(float(getattr(pop, "activity", 0.0)))
-                outs.append(float(pop.output()))
+    def region_fraction_active(self, region_key: str) -> float:
+        """
+        Fraction of a region's assemblies with output > 0.
+        """
+        agg = self._region_aggregate(region_key)
+        if agg is None or not agg.n:
+            return 0.0
+        return agg.active / agg.n
 
-        if not acts:
-            return {
-                "region": region_key,
-                "mass": 0.0,
-                "mean": 0.0,
-                "std": 0.0,
-                "n": 0,
-            }
+    def _region_aggregate(self, region_key: str) -> Optional[RegionAggregate]:
+        rk = self._resolve_region_key(region_key) or region_key
+        region = self.region_states.get(rk)
+        if not region:
+            return None
 
-        mean = sum(acts) / len(acts)
-        var = sum((v - mean) ** 2 for v in acts) / len(acts)
+        if self._shards is not None and self._shards.is_sharded(rk):
+            return self._shards.aggregate(rk)
 
-        return {
-            "region": region_key,
-            "mass": sum(outs),
-            "mean": mean,
-            "std": var ** 0.5,
-            "n": len(acts),
-        }
+        return region_aggregate([
+            pop for plist in region["populations"].values() for pop in plist
+        ])
 
 
     def snapshot_gate_state(self) -> Dict[str, Any]:
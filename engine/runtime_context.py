@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import time
 import uuid
 
 from memory.context.context_memory import ContextMemory
+from memory.decay import DecayingMap, linear_efolds
 from memory.context.context_policy import ContextPolicy
 from memory.context.context_trace import ContextTrace
 
@@ -32,13 +33,13 @@ class RuntimeContext:
         self.decay_tau = float(decay_tau)
         self.epsilon = float(epsilon)
 
-        # key -> domain -> gain
+        # (key, domain) -> gain, decaying lazily (pruned at |gain| < epsilon)
         # key may be:
         #   - assembly_id
         #   - region:population
         #   - region
         #   - __global__
-        self._context: Dict[str, Dict[str, float]] = {}
+        self._context: DecayingMap[Tuple[str, str]] = DecayingMap(epsilon=self.epsilon)
 
         self._memory = ContextMemory(decay_tau=decay_tau)
 
@@ -79,10 +80,10 @@ class RuntimeContext:
         assembly_id: str,
         domain: str = "global",
     ) -> float:
+        context = self._context
         for key in self._resolution_chain(assembly_id):
-            domains = self._context.get(key)
-            if domains and domain in domains:
-                return 1.0 + float(domains[domain])
+            if (key, domain) in context:
+                return 1.0 + context.get((key, domain))
         return 1.0
 
     def get_bias(
@@ -90,10 +91,10 @@ class RuntimeContext:
         assembly_id: str,
         domain: str = "global",
     ) -> float:
+        context = self._context
         for key in self._resolution_chain(assembly_id):
-            domains = self._context.get(key)
-            if domains and domain in domains:
-                return float(domains[domain])
+            if (key, domain) in context:
+                return context.get((key, domain))
         return 0.0
 
     # ============================================================
@@ -116,10 +117,9 @@ class RuntimeContext:
         if not ContextPolicy.allow_update(key, domain, delta):
             return
 
-        domains = self._context.setdefault(key, {})
-        current = domains.get(domain, 0.0)
+        current = self._context.get((key, domain), 0.0)
         new_value = ContextPolicy.clamp_gain(current + delta, domain)
-        domains[domain] = new_value
+        self._context.set((key, domain), new_value)
 
         now = time.time()
 
@@ -142,13 +142,24 @@ class RuntimeContext:
         """
         Deterministic overwrite (testing only).
         """
-        self._context.setdefault(key, {})[domain] = float(value)
+        self._context.set((key, domain), float(value))
 
     # ============================================================
     # Dynamics
     # ============================================================
 
     def step(self, dt: float) -> None:
+        self.advance(dt, 1)
+
+    def advance(self, dt: float, steps: int) -> None:
+        """
+        `steps` calls to step(dt) with the gain decay in closed form
+        (multi-rate updates). Trace eligibility is wall-clock based and
+        checked once.
+        """
+        if steps <= 0:
+            return
+
         now = time.time()
 
         # --- Trace eligibility ---
@@ -156,11 +167,11 @@ class RuntimeContext:
             if self._trace_emitted.get(key):
                 continue
 
-            domains = self._context.get(key)
-            if not domains:
+            # No global gain reads as 0.0, which never qualifies
+            if (key, "global") not in self._context:
                 continue
 
-            gain = domains.get("global", 0.0)
+            gain = self._context.get((key, "global"))
             duration = now - start_t
 
             if ContextPolicy.should_create_trace(
@@ -176,32 +187,12 @@ class RuntimeContext:
                 self._memory.add(trace)
                 self._trace_emitted[key] = True
 
-        # --- Ephemeral decay ---
+        # --- Ephemeral decay (lazy; only expiring gains are touched) ---
         tau = max(self.decay_tau, 1e-9)
-        decay = float(dt) / tau
-
-        dead_keys = []
+        self._context.advance(linear_efolds(dt, tau, steps))
 
-        for key, domains in list(self._context.items()):
-            dead_domains = []
-
-            for domain, value in list(domains.items()):
-                new_value = value * (1.0 - decay)
-                if abs(new_value) < self.epsilon:
-                    dead_domains.append(domain)
-                else:
-                    domains[domain] = new_value
-
-            for d in dead_domains:
-                del domains[d]
-
-            if not domains:
-                dead_keys.append(key)
-
-        for key in dead_keys:
-            del self._context[key]
-
-        self._memory.step(dt)
+        for _ in range(int(steps)):
+            self._memory.step(dt)
 
     # ============================================================
     # Maintenance
@@ -213,28 +204,25 @@ class RuntimeContext:
         self._trace_emitted.clear()
 
     def clear_domain(self, domain: str) -> None:
-        dead_keys = []
-        for key, domains in self._context.items():
-            if domain in domains:
-                del domains[domain]
-            if not domains:
-                dead_keys.append(key)
-
-        for key in dead_keys:
-            del self._context[key]
+        for k in [k for k in self._context if k[1] == domain]:
+            self._context.pop(k)
 
     # ============================================================
     # Observability
     # ============================================================
 
     def dump(self) -> Dict[str, Dict[str, float]]:
-        return {k: dict(v) for k, v in self._context.items()}
+        out: Dict[str, Dict[str, float]] = {}
+        for (key, domain), value in self._context.items():
+            out.setdefault(key, {})[domain] = value
+        return out
 
     def stats(self) -> Dict[str, float]:
+        context = self.dump()
         return {
-            "gain_count": len(self._context),
+            "gain_count": len(context),
             "max_gain": max(
-                (max(domains.values()) for domains in self._context.values()),
+                (max(domains.values()) for domains in context.values()),
                 default=0.0,
             ),
             "memory": self._memory.stats(),
@@ -5,6 +5,7 @@ from typing import Dict
 
 from engine.salience.salience_policy import SaliencePolicy
 from engine.execution.execution_target import ExecutionTarget
+from memory.decay import DecayingMap, linear_efolds
 
 
 class SalienceField:
@@ -13,7 +14,7 @@ class SalienceField:
 
     PURPOSE:
     - Store short-lived attentional / novelty / urgency signals
-    - Apply continuous decay
+    - Apply continuous decay (lazily, on read; see DecayingMap)
     - Provide fast read access for runtime gain modulation
 
     DESIGN GUARANTEES:
@@ -34,8 +35,8 @@ class SalienceField:
         self.decay_tau = float(decay_tau)
         self.max_value = float(max_value)
 
-        # assembly_id -> salience value
-        self._values: Dict[str, float] = {}
+        # assembly_id -> salience value (pruned at <= 1e-6)
+        self._values: DecayingMap[str] = DecayingMap(epsilon=1e-6)
 
         # Optional structural sparsity gate (off by default)
         self._sparsity_gate = None
@@ -43,6 +44,13 @@ class SalienceField:
         # Optional execution gate (identity if None)
         self.execution_gate = execution_gate
 
+        # Bumped whenever readable values may have changed
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
     # --------------------------------------------------
     # Injection (single write path)
     # --------------------------------------------------
@@ -60,7 +68,8 @@ class SalienceField:
 
         current = self._values.get(assembly_id, 0.0)
         updated = SaliencePolicy.clamp(current + float(delta))
-        self._values[assembly_id] = min(updated, self.max_value)
+        self._values.set(assembly_id, min(updated, self.max_value))
+        self._version += 1
 
     # --------------------------------------------------
     # Read access (execution-gated)
@@ -130,6 +139,7 @@ class SalienceField:
         - If not attached, salience behaves exactly as before
         """
         self._sparsity_gate = gate
+        self._version += 1
 
     # --------------------------------------------------
     # Dynamics
@@ -139,22 +149,35 @@ class SalienceField:
         """
         Apply continuous exponential decay.
         """
+        if not self._values:
+            return
+
+        self._version += 1
+
         if self.decay_tau <= 0.0:
             self._values.clear()
             return
 
-        decay = float(dt) / self.decay_tau
+        self._values.advance(linear_efolds(dt, self.decay_tau))
+
+    def advance(self, dt: float, steps: int) -> None:
+        """
+        Closed form of `steps` calls to step(dt) (multi-rate updates).
+        """
+        if steps <= 0 or not self._values:
+            return
+
+        self._version += 1
+
+        if self.decay_tau <= 0.0:
+            self._values.clear()
+            return
 
-        for key in list(self._values.keys()):
-            v = self._values[key] * (1.0 - decay)
-            if v <= 1e-6:
-                del self._values[key]
-            else:
-                self._values[key] = v
+        self._values.advance(linear_efolds(dt, self.decay_tau, steps))
 
     # --------------------------------------------------
     # Diagnostics
     # --------------------------------------------------
 
     def dump(self) -> Dict[str, float]:
-        return dict(self._values)
+        return self._values.dump()
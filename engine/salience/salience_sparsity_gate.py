@@ -143,3 +143,24 @@ class SalienceSparsityGate:
             "total": total,
             "ratio": eligible / total if total else 0.0,
         }
+
+
+def attach_sparsity_gate(
+    runtime,
+    *,
+    keep_ratio: float = 0.25,
+    seed: Optional[int] = 42,
+) -> SalienceSparsityGate:
+    """
+    Build a gate over all of the runtime's assemblies and attach it to
+    its salience field (the interactive runner's episode setup; also
+    usable as a journal replay setup).
+    """
+    gate = SalienceSparsityGate(keep_ratio=keep_ratio, seed=seed)
+    gate.initialize(
+        p.assembly_id
+        for p in runtime._all_pops
+        if getattr(p, "assembly_id", None) is not None
+    )
+    runtime.salience.attach_sparsity_gate(gate)
+    return gate
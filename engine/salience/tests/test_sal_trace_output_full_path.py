@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-from pathlib import Path
 from typing import Dict, Any, Iterable
 
-from loader.loader import NeuralFrameworkLoader
 from engine.runtime import BrainRuntime
 
 from engine.salience.salience_engine import SalienceEngine
@@ -14,8 +12,6 @@ from engine.salience.sources.surprise_source import SurpriseSource
 from engine.drivers.visual_temporal_driver import VisualTemporalDriver
 
 
-ROOT = Path(__file__).resolve().parents[3]
-DT = 0.01
 
 # Visual pathway regions we expect to show mass changes
 VISUAL_REGIONS = ("visual_input", "lgn", "v1", "pulvinar")
@@ -53,21 +49,6 @@ class LowEpsSurpriseSource(InspectableSurpriseSource):
     EPSILON = 1e-6
 
 
-def _compile_runtime() -> BrainRuntime:
-    loader = NeuralFrameworkLoader(ROOT)
-    loader.load_neuron_bases()
-    loader.load_regions()
-    loader.load_profiles()
-
-    brain = loader.compile(
-        expression_profile="minimal",
-        state_profile="awake",
-        compound_profile="experimental",
-    )
-
-    return BrainRuntime(brain, dt=DT)
-
-
 def _baseline_mass(runtime: BrainRuntime, steps: int = 40) -> Dict[str, float]:
     """
     Build a stable mass baseline per region.
@@ -82,11 +63,15 @@ def _baseline_mass(runtime: BrainRuntime, steps: int = 40) -> Dict[str, float]:
     return {r: acc[r] / float(steps) for r in VISUAL_REGIONS}
 
 
-def _run_probe(*, surprise_source: SurpriseSource, driver_magnitude: float) -> int:
+def _run_probe(
+    runtime: BrainRuntime,
+    *,
+    surprise_source: SurpriseSource,
+    driver_magnitude: float,
+) -> int:
     """
-    Run a full probe and return trace event count.
+    Run a full probe on a fresh runtime and return trace event count.
     """
-    runtime = _compile_runtime()
 
     # Attach your temporal visual driver
     driver = VisualTemporalDriver(
@@ -152,7 +137,7 @@ def _run_probe(*, surprise_source: SurpriseSource, driver_magnitude: float) -> i
     return total_events
 
 
-def test_visual_mass_spike_emits_surprise_trace() -> None:
+def test_visual_mass_spike_emits_surprise_trace(fork_runtime) -> None:
     """
     End-to-end test:
     VisualTemporalDriver -> mass deltas -> SurpriseSource -> SalienceEngine -> SalienceTrace.
@@ -163,6 +148,7 @@ def test_visual_mass_spike_emits_surprise_trace() -> None:
 
     # Pass 1: default SurpriseSource threshold (EPSILON=1e-3)
     count = _run_probe(
+        fork_runtime(),
         surprise_source=InspectableSurpriseSource(),
         driver_magnitude=0.25,
     )
@@ -174,6 +160,7 @@ def test_visual_mass_spike_emits_surprise_trace() -> None:
     # run a test-only low-EPS source to force at least one trace event.
     print("\n[NOTE] No trace events under default EPSILON. Retrying with test-only EPS override.")
     count2 = _run_probe(
+        fork_runtime(),
         surprise_source=LowEpsSurpriseSource(),
         driver_magnitude=0.25,
     )
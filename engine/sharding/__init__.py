@@ -0,0 +1,25 @@
+from engine.sharding.partition import (
+    COORDINATOR_REGIONS,
+    RegionGraph,
+    ShardPlan,
+    cut_edges,
+    partition_regions,
+    region_graph,
+)
+from engine.sharding.sharded_physiology import (
+    RegionAggregate,
+    ShardedPhysiology,
+    region_aggregate,
+)
+
+__all__ = [
+    "COORDINATOR_REGIONS",
+    "RegionGraph",
+    "ShardPlan",
+    "cut_edges",
+    "partition_regions",
+    "region_graph",
+    "RegionAggregate",
+    "ShardedPhysiology",
+    "region_aggregate",
+]
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+
+# Regions whose populations the coordinator reads every step
+# (competition, GPi relief, PFC context, hypothesis observation)
+COORDINATOR_REGIONS: Tuple[str, ...] = ("striatum", "gpi", "pfc", "association_cortex")
+
+# region -> neighbour -> number of output edges (undirected)
+RegionGraph = Dict[str, Dict[str, int]]
+
+
+# ============================================================
+# Plan
+# ============================================================
+
+@dataclass(frozen=True)
+class ShardPlan:
+    """
+    Assignment of regions to worker shards.
+
+    - coordinator: regions stepped in the coordinating process
+    - shards: worker regions, one tuple per worker
+    - weights: assemblies per worker
+    - cut_edges: output edges between different workers
+    """
+
+    coordinator: Tuple[str, ...]
+    shards: Tuple[Tuple[str, ...], ...]
+    weights: Tuple[int, ...]
+    cut_edges: int
+
+    def shard_of(self, region: str) -> Optional[int]:
+        for i, regions in enumerate(self.shards):
+            if region in regions:
+                return i
+        return None
+
+
+# ============================================================
+# Connectivity graph
+# ============================================================
+
+def region_graph(
+    region_states: Mapping[str, Mapping[str, object]],
+    resolve: Callable[[str], Optional[str]],
+) -> RegionGraph:
+    """
+    Undirected edge counts from each region's `outputs`
+    (targets resolved like _propagate_connectivity does).
+    """
+    graph: RegionGraph = {key: {} for key in region_states}
+    for src, state in region_states.items():
+        outputs = (state.get("def") or {}).get("outputs", []) or []
+        for out in outputs:
+            label = out.get("target") or out.get("region") or out.get("target_region") or ""
+            tgt = resolve(label)
+            if not tgt or tgt == src or tgt not in graph:
+                continue
+            graph[src][tgt] = graph[src].get(tgt, 0) + 1
+            graph[tgt][src] = graph[tgt].get(src, 0) + 1
+    return graph
+
+
+def cut_edges(assignment: Mapping[str, int], graph: RegionGraph) -> int:
+    """
+    Edges between regions assigned to different shards
+    (regions absent from `assignment` are ignored).
+    """
+    cut = 0
+    for a, nbrs in graph.items():
+        sa = assignment.get(a)
+        if sa is None:
+            continue
+        for b, w in nbrs.items():
+            sb = assignment.get(b)
+            if sb is not None and a < b and sa != sb:
+                cut += w
+    return cut
+
+
+# ============================================================
+# Partitioning
+# ============================================================
+
+def partition_regions(
+    weights: Mapping[str, int],
+    graph: RegionGraph,
+    n_shards: int,
+    *,
+    pinned: Iterable[str] = COORDINATOR_REGIONS,
+    imbalance: float = 0.1,
+    max_passes: int = 10,
+) -> ShardPlan:
+    """
+    Split regions across `n_shards` workers, minimizing cut edges
+    under a balance constraint.
+
+    - pinned regions (and empty ones) stay on the coordinator
+    - capacity per shard: ceil(total / n_shards * (1 + imbalance)),
+      except that a region larger than that still gets a shard
+    - greedy growth in BFS order from the heaviest region (placing
+      each region with its most-connected shard that has room), then
+      single-region moves while they reduce the cut
+
+    Deterministic for a given input.
+    """
+    if n_shards < 1:
+        raise ValueError("n_shards must be >= 1")
+
+    pinned_set = set(pinned)
+    coordinator = tuple(r for r in weights if r in pinned_set or weights[r] <= 0)
+    movable = [r for r in weights if r not in coordinator]
+
+    total = sum(weights[r] for r in movable)
+    capacity = math.ceil(total / n_shards * (1.0 + imbalance)) if total else 0
+
+    load = [0] * n_shards
+    assignment: Dict[str, int] = {}
+
+    def links(region: str, shard: int) -> int:
+        return sum(
+            w for nbr, w in graph.get(region, {}).items()
+            if assignment.get(nbr) == shard
+        )
+
+    for region in _bfs_order(movable, weights, graph):
+        w = weights[region]
+        fits = [s for s in range(n_shards) if load[s] + w <= capacity]
+        candidates = fits or [min(range(n_shards), key=lambda s: (load[s], s))]
+        best = max(candidates, key=lambda s: (links(region, s), -load[s], -s))
+        assignment[region] = best
+        load[best] += w
+
+    # Refinement: move single regions while the cut shrinks
+    for _ in range(max_passes):
+        moved = False
+        for region in movable:
+            own = assignment[region]
+            w = weights[region]
+            here = links(region, own)
+            best, best_gain = own, 0
+            for s in range(n_shards):
+                if s == own or load[s] + w > capacity:
+                    continue
+                gain = links(region, s) - here
+                if gain > best_gain:
+                    best, best_gain = s, gain
+            if best != own:
+                assignment[region] = best
+                load[own] -= w
+                load[best] += w
+                moved = True
+        if not moved:
+            break
+
+    shards = tuple(
+        tuple(r for r in movable if assignment[r] == s)
+        for s in range(n_shards)
+    )
+    return ShardPlan(
+        coordinator=coordinator,
+        shards=shards,
+        weights=tuple(load),
+        cut_edges=cut_edges(assignment, graph),
+    )
+
+
+def _bfs_order(
+    regions: Sequence[str],
+    weights: Mapping[str, int],
+    graph: RegionGraph,
+) -> List[str]:
+    """
+    Regions grouped by connected component, each visited breadth-first
+    from its heaviest region (heaviest neighbours first).
+    """
+    remaining = set(regions)
+    order: List[str] = []
+    by_weight = sorted(regions, key=lambda r: (-weights[r], r))
+
+    for seed in by_weight:
+        if seed not in remaining:
+            continue
+        remaining.discard(seed)
+        queue = [seed]
+        while queue:
+            region = queue.pop(0)
+            order.append(region)
+            nbrs = sorted(
+                (n for n in graph.get(region, {}) if n in remaining),
+                key=lambda r: (-weights[r], r),
+            )
+            for n in nbrs:
+                remaining.discard(n)
+                queue.append(n)
+    return order
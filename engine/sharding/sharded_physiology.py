@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+import multiprocessing
+import traceback
+import weakref
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+from engine.noise import CounterNoise
+from engine.population_model import PopulationModel
+from engine.sharding.partition import ShardPlan
+
+
+# Per-population slots: input (coordinator -> worker), then
+# activity, firing_rate, tonic (worker -> coordinator)
+_POP_FIELDS = 4
+# Per-region slots: mass, mean, std, n, active
+_REGION_FIELDS = 5
+_DOUBLE = 8
+
+
+# ============================================================
+# Region aggregates
+# ============================================================
+
+@dataclass(frozen=True)
+class RegionAggregate:
+    """
+    Per-region summary exchanged at the step barrier.
+
+    Same arithmetic as BrainRuntime.snapshot_region_stats, so sharded
+    and single-process runs report identical values.
+    """
+
+    mass: float
+    mean: float
+    std: float
+    n: int
+    active: int
+
+    @property
+    def drive(self) -> float:
+        """
+        Mean output: the source drive used by connectivity propagation.
+        """
+        return self.mass / self.n if self.n else 0.0
+
+
+def region_aggregate(pops: Sequence[PopulationModel]) -> RegionAggregate:
+    acts = [float(p.activity) for p in pops]
+    outs = [float(p.output()) for p in pops]
+    if not acts:
+        return RegionAggregate(mass=0.0, mean=0.0, std=0.0, n=0, active=0)
+
+    mean = sum(acts) / len(acts)
+    var = sum((v - mean) ** 2 for v in acts) / len(acts)
+    return RegionAggregate(
+        mass=sum(outs),
+        mean=mean,
+        std=var ** 0.5,
+        n=len(acts),
+        active=sum(1 for o in outs if o > 0.0),
+    )
+
+
+# ============================================================
+# Worker process
+# ============================================================
+
+def _shard_main(
+    conn: Any,
+    shm_name: str,
+    pops: List[PopulationModel],
+    regions: List[Tuple[int, int]],
+    indices: List[int],
+    noise_seed: int,
+) -> None:
+    """
+    Worker loop: step this shard's populations on request.
+
+    Messages:
+    - ("step", step, dt, span, exact) -> ("ok",) | ("error", tb)
+    - ("load", pops) -> ("ok",)   replace the population objects
+    - ("close",)
+    """
+    shm = SharedMemory(name=shm_name)
+    buf = shm.buf.cast("d")
+    noise = CounterNoise(seed=noise_seed)
+    n = len(pops)
+
+    try:
+        while True:
+            msg = conn.recv()
+            op = msg[0]
+
+            if op == "close":
+                break
+
+            try:
+                if op == "load":
+                    pops = msg[1]
+                elif op == "step":
+                    _, step, dt, span, exact = msg
+                    _step_shard(buf, pops, regions, noise.standard_normal(step, indices=indices), dt, span, exact)
+                else:
+                    raise ValueError(f"Unknown shard message: {op}")
+            except Exception:
+                conn.send(("error", traceback.format_exc()))
+            else:
+                conn.send(("ok",))
+    finally:
+        buf.release()
+        shm.close()
+        conn.close()
+
+
+def _step_shard(
+    buf: memoryview,
+    pops: List[PopulationModel],
+    regions: List[Tuple[int, int]],
+    units: List[float],
+    dt: float,
+    span: int,
+    exact: bool,
+) -> None:
+    n = len(pops)
+
+    # Inputs for this step (stimuli), then clear the slots
+    for j, p in enumerate(pops):
+        p.input = buf[j]
+        buf[j] = 0.0
+
+    if exact:
+        for p, z in zip(pops, units):
+            p.step(dt, z, exact=True, span=span)
+    else:
+        for p, z in zip(pops, units):
+            p.step(dt, z)
+
+    for j, p in enumerate(pops):
+        buf[n + j] = p.activity
+        buf[2 * n + j] = p.firing_rate
+        buf[3 * n + j] = p.tonic
+
+    base = _POP_FIELDS * n
+    for r, (start, stop) in enumerate(regions):
+        agg = region_aggregate(pops[start:stop])
+        o = base + _REGION_FIELDS * r
+        buf[o] = agg.mass
+        buf[o + 1] = agg.mean
+        buf[o + 2] = agg.std
+        buf[o + 3] = agg.n
+        buf[o + 4] = agg.active
+
+
+# ============================================================
+# Coordinator side
+# ============================================================
+
+@dataclass
+class _Shard:
+    regions: Tuple[str, ...]
+    pops: List[PopulationModel]
+    process: Any
+    conn: Any
+    shm: SharedMemory
+    buf: memoryview
+
+
+def _shutdown(shards: List[_Shard]) -> None:
+    for s in shards:
+        try:
+            s.conn.send(("close",))
+        except (OSError, ValueError):
+            pass
+    for s in shards:
+        s.process.join(timeout=5.0)
+        if s.process.is_alive():
+            s.process.terminate()
+        s.conn.close()
+        s.buf.release()
+        s.shm.close()
+        s.shm.unlink()
+
+
+class ShardedPhysiology:
+    """
+    Population physiology for the plan's worker regions, run in
+    worker processes over shared-memory state arrays.
+
+    CONTRACT:
+    - Each worker owns copies of its regions' populations; the
+      coordinator's objects for those regions are proxies, refreshed
+      only by sync()
+    - Per step the coordinator writes stimulus inputs into the shared
+      input slots, starts all workers, steps its own populations, and
+      waits at the barrier (finish_step)
+    - Workers publish per-population activity/firing_rate/tonic and
+      one RegionAggregate per region; the coordinator reads
+      aggregates, not populations
+    - Noise comes from the same counter stream by flat index, so
+      results are identical to a single-process run
+    """
+
+    def __init__(
+        self,
+        plan: ShardPlan,
+        region_states: Mapping[str, Mapping[str, Any]],
+        all_pops: Sequence[PopulationModel],
+        *,
+        noise_seed: int,
+    ) -> None:
+        self.plan = plan
+        index = {id(p): i for i, p in enumerate(all_pops)}
+        ctx = multiprocessing.get_context()
+
+        self._shards: List[_Shard] = []
+        # flat index -> (shard, slot); region -> (shard, region slot)
+        self._slot: Dict[int, Tuple[int, int]] = {}
+        self._region_slot: Dict[str, Tuple[int, int]] = {}
+
+        try:
+            for regions in plan.shards:
+                pops: List[PopulationModel] = []
+                ranges: List[Tuple[int, int]] = []
+                for region in regions:
+                    start = len(pops)
+                    for plist in region_states[region]["populations"].values():
+                        pops.extend(plist)
+                    ranges.append((start, len(pops)))
+                if not pops:
+                    continue
+
+                s = len(self._shards)
+                for r, region in enumerate(regions):
+                    self._region_slot[region] = (s, r)
+                indices = [index[id(p)] for p in pops]
+                for j, i in enumerate(indices):
+                    self._slot[i] = (s, j)
+
+                size = _DOUBLE * (_POP_FIELDS * len(pops) + _REGION_FIELDS * len(regions))
+                # New segments are zero-filled
+                shm = SharedMemory(create=True, size=size)
+                buf = shm.buf.cast("d")
+
+                parent, child = ctx.Pipe()
+                process = ctx.Process(
+                    target=_shard_main,
+                    args=(child, shm.name, pops, ranges, indices, int(noise_seed)),
+                    daemon=True,
+                )
+                process.start()
+                child.close()
+
+                self._shards.append(_Shard(
+                    regions=tuple(regions),
+                    pops=pops,
+                    process=process,
+                    conn=parent,
+                    shm=shm,
+                    buf=buf,
+                ))
+        except BaseException:
+            _shutdown(self._shards)
+            raise
+
+        self.local_indices: Tuple[int, ...] = tuple(
+            i for i in range(len(all_pops)) if i not in self._slot
+        )
+        self.local_pops: List[PopulationModel] = [all_pops[i] for i in self.local_indices]
+
+        self._finalizer = weakref.finalize(self, _shutdown, self._shards)
+
+    # --------------------------------------------------
+    # Lookup
+    # --------------------------------------------------
+
+    @property
+    def workers(self) -> int:
+        return len(self._shards)
+
+    def owns(self, index: int) -> bool:
+        return index in self._slot
+
+    def is_sharded(self, region: str) -> bool:
+        return region in self._region_slot
+
+    # --------------------------------------------------
+    # Step barrier
+    # --------------------------------------------------
+
+    def set_input(self, index: int, value: float) -> None:
+        s, j = self._slot[index]
+        self._shards[s].buf[j] = value
+
+    def begin_step(self, step: int, dt: float, span: int, exact: bool) -> None:
+        msg = ("step", int(step), float(dt), int(span), bool(exact))
+        for s in self._shards:
+            s.conn.send(msg)
+
+    def finish_step(self) -> None:
+        self._collect()
+
+    def aggregate(self, region: str) -> RegionAggregate:
+        s, r = self._region_slot[region]
+        shard = self._shards[s]
+        o = _POP_FIELDS * len(shard.pops) + _REGION_FIELDS * r
+        buf = shard.buf
+        return RegionAggregate(
+            mass=buf[o],
+            mean=buf[o + 1],
+            std=buf[o + 2],
+            n=int(buf[o + 3]),
+            active=int(buf[o + 4]),
+        )
+
+    # --------------------------------------------------
+    # State transfer
+    # --------------------------------------------------
+
+    def sync(self) -> None:
+        """
+        Copy worker activity/firing_rate/tonic into the coordinator's
+        proxy populations.
+        """
+        for shard in self._shards:
+            n = len(shard.pops)
+            buf = shard.buf
+            for j, p in enumerate(shard.pops):
+                p.activity = buf[n + j]
+                p.firing_rate = buf[2 * n + j]
+                p.tonic = buf[3 * n + j]
+
+    def push(self) -> None:
+        """
+        Replace worker populations with the coordinator's proxies
+        (after edits to sharded populations, e.g. a state restore).
+        """
+        for shard in self._shards:
+            shard.conn.send(("load", shard.pops))
+        self._collect()
+
+    def close(self) -> None:
+        self._finalizer()
+
+    def _collect(self) -> None:
+        errors = []
+        for s in self._shards:
+            reply = s.conn.recv()
+            if reply[0] != "ok":
+                errors.append(f"shard {s.regions}: {reply[1]}")
+        if errors:
+            raise RuntimeError("Shard worker failed:\n" + "\n".join(errors))
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from engine.sharding import cut_edges, partition_regions
+
+
+def _clique(names, graph) -> None:
+    for a in names:
+        for b in names:
+            if a != b:
+                graph.setdefault(a, {})[b] = 1
+
+
+def _two_cliques():
+    left = ["a1", "a2", "a3", "a4"]
+    right = ["b1", "b2", "b3", "b4"]
+    graph = {}
+    _clique(left, graph)
+    _clique(right, graph)
+    graph["a1"]["b1"] = 1
+    graph["b1"]["a1"] = 1
+    weights = {r: 10 for r in left + right}
+    return left, right, graph, weights
+
+
+def test_two_cliques_split_along_the_bridge() -> None:
+    left, right, graph, weights = _two_cliques()
+    plan = partition_regions(weights, graph, 2, pinned=())
+
+    assert plan.cut_edges == 1
+    assert plan.weights == (40, 40)
+    assert {frozenset(s) for s in plan.shards} == {frozenset(left), frozenset(right)}
+    assert plan.shard_of("a2") == plan.shard_of("a3")
+    assert plan.shard_of("a1") != plan.shard_of("b1")
+
+    assignment = {r: plan.shard_of(r) for r in weights}
+    assert cut_edges(assignment, graph) == 1
+
+
+def test_pinned_and_empty_regions_stay_on_coordinator() -> None:
+    _, _, graph, weights = _two_cliques()
+    weights["empty"] = 0
+    plan = partition_regions(weights, graph, 2, pinned=("a1",))
+
+    assert set(plan.coordinator) == {"a1", "empty"}
+    assert plan.shard_of("a1") is None
+    assert sum(plan.weights) == 70
+
+    # Deterministic for the same input
+    assert partition_regions(weights, graph, 2, pinned=("a1",)) == plan
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+
+from engine.runtime import BrainRuntime
+from engine.stimulus_timeline import StimulusSegment, StimulusTimeline
+
+
+def _drive(rt: BrainRuntime, steps: int) -> None:
+    rt.add_stimulus_timeline(StimulusTimeline((
+        StimulusSegment("v1", 5, 40, 0.4),
+        StimulusSegment("striatum", 10, 50, 0.3, population="D1_MSN"),
+    )))
+    for step in range(steps):
+        if step == 3:
+            rt.inject_stimulus("a1", magnitude=0.5)
+            rt.inject_stimulus("striatum", "D2_MSN", magnitude=0.2)
+        rt.step()
+
+
+def test_sharded_run_matches_single_process(fork_runtime) -> None:
+    ref = fork_runtime(noise_seed=3)
+    _drive(ref, 60)
+
+    rt = fork_runtime(noise_seed=3)
+    plan = rt.start_shards(2)
+    try:
+        assert plan.shard_of("v1") is not None
+        assert plan.shard_of("striatum") is None
+
+        _drive(rt, 60)
+
+        # Aggregates come from the workers without a sync
+        for region in ("v1", "a1", "md", "striatum"):
+            assert rt.snapshot_region_stats(region) == ref.snapshot_region_stats(region)
+            assert rt.region_fraction_active(region) == ref.region_fraction_active(region)
+        assert rt.get_decision_state() == ref.get_decision_state()
+
+        rt.sync_shards()
+        assert [p.activity for p in rt._all_pops] == [p.activity for p in ref._all_pops]
+
+        with pytest.raises(ValueError):
+            rt.start_shards(2)
+    finally:
+        rt.stop_shards()
+
+    # Back to single-process stepping from the workers' state
+    ref.step()
+    rt.step()
+    assert [p.activity for p in rt._all_pops] == [p.activity for p in ref._all_pops]
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+SHAPES = ("constant", "ramp", "pulse")
+
+# (flat indices into runtime._all_pops, magnitude)
+StimulusBatch = Tuple[Tuple[int, ...], float]
+
+# (region, population, assembly index) -> flat indices
+TargetResolver = Callable[[str, Optional[str], Optional[int]], Tuple[int, ...]]
+
+
+# ============================================================
+# Declarative segments
+# ============================================================
+
+@dataclass(frozen=True)
+class StimulusSegment:
+    """
+    One stimulus over the runtime steps [start, stop).
+
+    Steps are runtime.step_count values during the step being
+    computed (the first step() call is step 1).
+
+    SHAPES:
+    - constant: `magnitude` every step
+    - ramp: linear from `magnitude` (at start) to `end_magnitude`
+      (at stop - 1)
+    - pulse: `magnitude` for the first `width` steps of every
+      `period`, 0 otherwise
+
+    Target follows inject_stimulus: a region, optionally narrowed
+    to a population and then to one assembly index.
+    """
+
+    region: str
+    start: int
+    stop: int
+    magnitude: float
+    population: Optional[str] = None
+    assembly: Optional[int] = None
+    shape: str = "constant"
+    end_magnitude: Optional[float] = None
+    period: int = 1
+    width: int = 1
+
+    def __post_init__(self) -> None:
+        if self.start < 0 or self.stop <= self.start:
+            raise ValueError(f"Invalid segment range [{self.start}, {self.stop})")
+        if self.shape not in SHAPES:
+            raise ValueError(f"Unknown stimulus shape: {self.shape}")
+        if self.shape == "ramp" and self.end_magnitude is None:
+            raise ValueError("ramp segments need end_magnitude")
+        if self.period < 1 or not 1 <= self.width <= self.period:
+            raise ValueError("pulse needs period >= 1 and 1 <= width <= period")
+
+    def table(self) -> array:
+        """
+        Magnitude table; the magnitude at step s is
+        table[(s - start) % len(table)].
+        """
+        if self.shape == "constant":
+            return array("d", [self.magnitude])
+        if self.shape == "pulse":
+            return array("d", [self.magnitude] * self.width + [0.0] * (self.period - self.width))
+
+        n = self.stop - self.start
+        if n == 1:
+            return array("d", [self.magnitude])
+        m0 = self.magnitude
+        span = float(self.end_magnitude) - m0
+        return array("d", (m0 + span * k / (n - 1) for k in range(n)))
+
+    def magnitude_at(self, step: int) -> float:
+        if not self.start <= step < self.stop:
+            return 0.0
+        t = self.table()
+        return t[(step - self.start) % len(t)]
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "StimulusSegment":
+        try:
+            return StimulusSegment(
+                region=str(data["region"]),
+                start=int(data["start"]),
+                stop=int(data["stop"]),
+                magnitude=float(data["magnitude"]),
+                population=data.get("population"),
+                assembly=None if data.get("assembly") is None else int(data["assembly"]),
+                shape=str(data.get("shape", "constant")),
+                end_magnitude=None if data.get("end_magnitude") is None else float(data["end_magnitude"]),
+                period=int(data.get("period", 1)),
+                width=int(data.get("width", 1)),
+            )
+        except KeyError as e:
+            raise ValueError(f"Stimulus segment missing {e}: {data}") from None
+
+
+@dataclass(frozen=True)
+class StimulusTimeline:
+    segments: Tuple[StimulusSegment, ...] = ()
+
+    def add(self, segment: StimulusSegment) -> "StimulusTimeline":
+        return StimulusTimeline(segments=self.segments + (segment,))
+
+    @staticmethod
+    def from_dicts(items: Iterable[Dict[str, Any]]) -> "StimulusTimeline":
+        return StimulusTimeline(segments=tuple(StimulusSegment.from_dict(d) for d in items))
+
+
+# ============================================================
+# Compiled form
+# ============================================================
+
+@dataclass(frozen=True)
+class _CompiledSegment:
+    start: int
+    stop: int
+    indices: Tuple[int, ...]
+    table: array
+
+
+@dataclass
+class CompiledTimeline:
+    """
+    A timeline resolved against one runtime.
+
+    CONTRACT:
+    - Targets are flat indices into the runtime's population list,
+      resolved once at compile time
+    - Magnitudes come from precomputed tables
+    - Active segments per step come from a bisect over the segment
+      boundaries; no per-step scan of inactive segments
+    """
+
+    segments: List[_CompiledSegment]
+    _bounds: List[int] = field(init=False, repr=False)
+    _active: List[Tuple[_CompiledSegment, ...]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        bounds = sorted({s.start for s in self.segments} | {s.stop for s in self.segments})
+        self._bounds = bounds
+        # _active[k] = segments live on [bounds[k], bounds[k + 1])
+        self._active = [
+            tuple(s for s in self.segments if s.start <= b < s.stop)
+            for b in bounds
+        ]
+
+    @property
+    def start(self) -> int:
+        return self._bounds[0] if self._bounds else 0
+
+    @property
+    def stop(self) -> int:
+        return self._bounds[-1] if self._bounds else 0
+
+    def contributions(self, step: int) -> List[StimulusBatch]:
+        """
+        (indices, magnitude) pairs for `step`, zero magnitudes dropped.
+        """
+        k = bisect_right(self._bounds, step) - 1
+        if k < 0:
+            return []
+
+        out: List[StimulusBatch] = []
+        for s in self._active[k]:
+            if not s.indices:
+                continue
+            t = s.table
+            mag = t[(step - s.start) % len(t)]
+            if mag != 0.0:
+                out.append((s.indices, mag))
+        return out
+
+
+    def constant_until(self, step: int) -> Optional[int]:
+        """
+        First step after `step` whose contributions may differ from
+        those at `step` (None: constant from `step` on).
+
+        Only constant segments hold across steps; a live ramp or
+        pulse segment changes every step.
+        """
+        k = bisect_right(self._bounds, step) - 1
+        if k >= 0 and any(len(s.table) > 1 for s in self._active[k] if s.indices):
+            return step + 1
+        if k + 1 < len(self._bounds):
+            return self._bounds[k + 1]
+        return None
+
+
+def compile_timeline(timeline: StimulusTimeline, resolve: TargetResolver) -> CompiledTimeline:
+    return CompiledTimeline(segments=[
+        _CompiledSegment(
+            start=seg.start,
+            stop=seg.stop,
+            indices=resolve(seg.region, seg.population, seg.assembly),
+            table=seg.table(),
+        )
+        for seg in timeline.segments
+    ])
+
+
+# ============================================================
+# Bulk application
+# ============================================================
+
+def scatter_add(
+    batches: Sequence[StimulusBatch],
+    gains: Dict[int, float],
+) -> Dict[int, float]:
+    """
+    Sum magnitude * gain per flat index, in batch order.
+    """
+    acc: Dict[int, float] = {}
+    get = acc.get
+    for indices, mag in batches:
+        for i in indices:
+            acc[i] = get(i, 0.0) + mag * gains[i]
+    return acc
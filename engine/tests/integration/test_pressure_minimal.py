@@ -1,8 +1,5 @@
 from __future__ import annotations
 
-from pathlib import Path
-
-from loader.loader import NeuralFrameworkLoader
 from engine.runtime import BrainRuntime
 
 from memory.episodic.episode_trace import EpisodeTrace
@@ -16,41 +13,22 @@ from memory.proto_structural.pattern_accumulator import PatternAccumulator
 from memory.proto_structural.pattern_statistics import PatternStatisticsBuilder
 
 
-PROJECT_ROOT = Path(__file__).resolve().parents[3]
-
-
-def _build_runtime() -> BrainRuntime:
+def _observe_episodes(runtime: BrainRuntime) -> None:
     """
-    Build a fully compiled runtime with episodic observation enabled.
+    Enable episodic observation on a fresh runtime.
     """
-    loader = NeuralFrameworkLoader(PROJECT_ROOT)
-
-    loader.load_neuron_bases()
-    loader.load_regions()
-    loader.load_profiles()
-
-    brain = loader.compile(
-        expression_profile="minimal",
-        state_profile="awake",
-        compound_profile="experimental",
-    )
-
-    runtime = BrainRuntime(brain)
-
     trace = EpisodeTrace()
     tracker = EpisodeTracker(trace=trace)
     runtime.episode_hook = EpisodeRuntimeHook(tracker=tracker)
 
-    return runtime
-
 
-def test_proto_structural_pressure_exists() -> None:
+def test_proto_structural_pressure_exists(runtime: BrainRuntime) -> None:
     """
     Proves that proto-structural pressure can arise from a real,
     causally valid episode produced by the runtime.
     """
 
-    runtime = _build_runtime()
+    _observe_episodes(runtime)
 
     # --------------------------------------------------
     # Phase 1: build internal dynamics (no decisions)
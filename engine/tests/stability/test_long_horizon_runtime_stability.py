@@ -1,33 +1,9 @@
 from __future__ import annotations
 
-from pathlib import Path
-
-from loader.loader import NeuralFrameworkLoader
 from engine.runtime import BrainRuntime
 
 
-ROOT = Path(__file__).resolve().parents[3]
-
-
-def compile_brain() -> BrainRuntime:
-    """
-    Compile a minimal, deterministic brain with no external stimulation.
-    """
-    loader = NeuralFrameworkLoader(ROOT)
-    loader.load_neuron_bases()
-    loader.load_regions()
-    loader.load_profiles()
-
-    compiled = loader.compile(
-        expression_profile="minimal",
-        state_profile="awake",
-        compound_profile="experimental",
-    )
-
-    return BrainRuntime(compiled)
-
-
-def test_long_horizon_runtime_stability() -> None:
+def test_long_horizon_runtime_stability(runtime: BrainRuntime) -> None:
     """
     Phase 10.1
 
@@ -37,8 +13,6 @@ def test_long_horizon_runtime_stability() -> None:
     - Runtime remains numerically stable
     """
 
-    runtime = compile_brain()
-
     TOTAL_STEPS = 200
     decision_events = 0
 
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from engine.batch_runner import (
+    HeadlessRunner,
+    RegionStatsSink,
+    RunSchedule,
+    ScheduledCommand,
+    load_runtime,
+    main,
+)
+
+
+def _schedule(**overrides) -> RunSchedule:
+    data = {
+        "brain": {"expression_profile": "minimal"},
+        "steps": 20,
+        "noise_seed": 3,
+        "record": {"every": 5, "regions": ["striatum"]},
+        "commands": [
+            {"at": 0, "command": "sustain 2"},
+            {"at": 4, "every": 4, "until": 12, "command": "poke_pop striatum D1_MSN 0.3"},
+            {"at": 10, "command": "no_such_command"},
+        ],
+    }
+    data.update(overrides)
+    return RunSchedule.from_dict(data)
+
+
+def test_scheduled_command_fires_at() -> None:
+    once = ScheduledCommand(at=5, command="poke pfc 0.1")
+    assert [s for s in range(20) if once.fires_at(s)] == [5]
+
+    periodic = ScheduledCommand(at=4, command="poke pfc 0.1", every=4, until=12)
+    assert [s for s in range(20) if periodic.fires_at(s)] == [4, 8, 12]
+
+    unbounded = ScheduledCommand(at=0, command="poke pfc 0.1", every=7)
+    assert [s for s in range(20) if unbounded.fires_at(s)] == [0, 7, 14]
+
+
+def test_schedule_parsing_and_validation() -> None:
+    schedule = _schedule()
+    assert schedule.steps == 20
+    assert schedule.record_every == 5
+    assert schedule.record_regions == ["striatum"]
+    assert schedule.brain["expression_profile"] == "minimal"
+    assert schedule.brain["state_profile"] == "awake"
+    assert schedule.kernel_trace is False
+    assert schedule.multirate is None
+    assert RunSchedule.from_dict({"multirate": True}).multirate["salience"] == 5
+    assert RunSchedule.from_dict({"multirate": {"value": 3}}).multirate == {"value": 3}
+
+    with pytest.raises(ValueError):
+        RunSchedule.from_dict({"steps": -1})
+    with pytest.raises(ValueError):
+        ScheduledCommand.from_dict({"at": 0})
+    with pytest.raises(ValueError):
+        ScheduledCommand.from_dict({"at": 0, "every": 0, "command": "poke pfc 0.1"})
+
+
+def test_headless_run_issues_commands_and_records(tmp_path: Path) -> None:
+    schedule = _schedule()
+    runtime = load_runtime(schedule, quiet=True)
+    assert runtime.competition_kernel.TRACE_PATH is None
+
+    sink = RegionStatsSink(tmp_path / "regions.jsonl.gz", regions=schedule.record_regions)
+    try:
+        summary = HeadlessRunner(runtime).run(schedule, sinks=[sink])
+    finally:
+        sink.close()
+
+    assert summary.final_step == 20
+    assert runtime.step_count == 20
+
+    issued = [(c["at"], c["command"].split()[0]) for c in summary.commands]
+    assert issued == [
+        (0, "sustain"),
+        (4, "poke_pop"),
+        (8, "poke_pop"),
+        (10, "no_such_command"),
+        (12, "poke_pop"),
+    ]
+    assert summary.errors == 1
+
+    with gzip.open(sink.path, "rt", encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert [r["step"] for r in lines] == [5, 10, 15, 20]
+    assert set(lines[0]["regions"]) == {"striatum"}
+
+    out = summary.write(tmp_path / "summary.json")
+    data = json.loads(out.read_text(encoding="utf-8"))
+    assert data["final_step"] == 20
+    assert data["noise_seed"] == 3
+
+
+def test_cli_exit_code_reflects_command_errors(tmp_path: Path) -> None:
+    path = tmp_path / "schedule.json"
+    path.write_text(json.dumps({
+        "brain": {"expression_profile": "minimal"},
+        "steps": 3,
+        "commands": [{"at": 1, "command": "poke striatum 0.1"}],
+    }), encoding="utf-8")
+
+    assert main([str(path), "--quiet", "--summary", str(tmp_path / "s.json")]) == 0
+    assert json.loads((tmp_path / "s.json").read_text(encoding="utf-8"))["final_step"] == 3
+
+    assert main([str(path), "--quiet", "--steps", "2"]) == 0
+
+    bad = tmp_path / "bad.json"
+    bad.write_text(json.dumps({
+        "brain": {"expression_profile": "minimal"},
+        "steps": 2,
+        "commands": [{"at": 0, "command": "bogus"}],
+    }), encoding="utf-8")
+    assert main([str(bad), "--quiet"]) == 1
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from engine.noise import CounterNoise
+from engine.population_model import PopulationModel
+
+
+def test_same_seed_same_vector_different_seed_differs() -> None:
+    assert CounterNoise(7).standard_normal(3, 101) == CounterNoise(7).standard_normal(3, 101)
+    assert CounterNoise(7).standard_normal(3, 101) != CounterNoise(8).standard_normal(3, 101)
+    assert CounterNoise(7).standard_normal(3, 101) != CounterNoise(7).standard_normal(4, 101)
+
+
+def test_draws_do_not_depend_on_count_or_subset() -> None:
+    noise = CounterNoise(1)
+    full = noise.standard_normal(12, 257)
+
+    # Prefix-stable: a larger population does not reshuffle earlier indices
+    assert noise.standard_normal(12, 40) == full[:40]
+
+    # Any shard, in any order, sees the same values
+    shard = [250, 3, 17, 16, 128, 0]
+    assert noise.standard_normal(12, indices=shard) == [full[i] for i in shard]
+
+
+def test_past_steps_regenerate_exactly() -> None:
+    noise = CounterNoise(5)
+    first = noise.standard_normal(0, 64)
+    for step in range(1, 50):
+        noise.standard_normal(step, 64)
+    assert noise.standard_normal(0, 64) == first
+
+
+def test_state_roundtrip_and_rejects_unknown_algorithm() -> None:
+    noise = CounterNoise(99)
+    restored = CounterNoise.from_state(noise.state())
+    assert restored.standard_normal(8, 16) == noise.standard_normal(8, 16)
+
+    with pytest.raises(ValueError):
+        CounterNoise.from_state({"algorithm": "mt19937", "seed": 1})
+
+
+def test_draws_are_standard_normal() -> None:
+    draws = []
+    noise = CounterNoise(0)
+    for step in range(20):
+        draws.extend(noise.standard_normal(step, 1000))
+
+    mean = sum(draws) / len(draws)
+    var = sum((x - mean) ** 2 for x in draws) / len(draws)
+    assert abs(mean) < 0.03
+    assert abs(var - 1.0) < 0.05
+
+
+def test_uniform_assemblies_stay_within_amplitude() -> None:
+    p = PopulationModel(noise_amplitude=0.1, noise_distribution="uniform")
+    for z in CounterNoise(2).standard_normal(0, 500):
+        assert -0.1 < p._sample_noise(z) < 0.1
+
+
+def test_runtime_is_reproducible_and_isolated_from_global_random(fork_runtime) -> None:
+    def run(*, seed: int, disturb: bool):
+        rt = fork_runtime(noise_seed=seed)
+        for i in range(20):
+            if disturb:
+                random.random()
+            if i % 5 == 0:
+                rt.inject_stimulus("striatum", magnitude=0.3)
+            rt.step()
+        return rt, [p.activity for p in rt._all_pops]
+
+    rt, a = run(seed=3, disturb=False)
+    _, b = run(seed=3, disturb=True)
+    _, c = run(seed=4, disturb=False)
+
+    assert a == b
+    assert a != c
+
+    regenerated = rt.regenerate_noise(20)
+    assert len(regenerated) == len(rt._all_pops)
+    assert regenerated == rt.regenerate_noise(20)
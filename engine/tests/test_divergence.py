@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from engine.divergence import RunConfig, _Run, find_divergence
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+SCHEDULE = {
+    "brain": {"expression_profile": "minimal"},
+    "steps": 60,
+    "commands": [{"at": 5, "command": "poke_pop striatum D1_MSN 0.5"}],
+}
+
+LOWER_THRESHOLD = RunConfig("low", attributes={"DECISION_DOMINANCE_THRESHOLD": 0.02})
+
+
+def test_bisects_to_first_divergent_step_and_phase() -> None:
+    report = find_divergence(SCHEDULE, RunConfig("base"), LOWER_THRESHOLD, every=32, root=ROOT)
+
+    assert report.diverged
+    assert report.phase == "latch"
+    assert report.fields == ("latch",)
+    assert "counter" in report.details["latch"]
+    # Coarse pass to 32 (both runs); bisection re-runs at most as much again
+    assert report.steps_run <= 4 * 32
+
+    # Same answer as stepping both runs and comparing every step
+    base, _ = RunConfig("base").build(SCHEDULE, root=ROOT, quiet=True)
+    low, sched = LOWER_THRESHOLD.build(SCHEDULE, root=ROOT, quiet=True)
+    a, b = _Run(base, sched.commands), _Run(low, sched.commands)
+    while a.digest() == b.digest():
+        a.advance_to(a.step + 1)
+        b.advance_to(b.step + 1)
+    assert a.step == report.step
+
+    assert report.format().startswith(f"DIVERGENCE base vs low: step {report.step} phase latch")
+
+
+def test_identical_and_build_time_differences() -> None:
+    same = find_divergence(SCHEDULE, RunConfig("a"), RunConfig("b"), every=16, steps=20, root=ROOT)
+    assert not same.diverged
+    assert same.format() == "DIVERGENCE a vs b: none in 20 steps"
+
+    built = find_divergence(
+        SCHEDULE,
+        RunConfig("a"),
+        RunConfig("b", attributes={"_last_gate_strength": 0.5}),
+        steps=5,
+        root=ROOT,
+    )
+    assert (built.step, built.phase, built.fields) == (0, "build", ("gate",))
+
+    seeded = find_divergence(SCHEDULE, RunConfig("a"), RunConfig("b", schedule={"noise_seed": 9}), every=4, steps=8, root=ROOT)
+    assert (seeded.step, seeded.phase) == (1, "physiology")
+    assert all(f.startswith("region:") for f in seeded.fields)
+    assert "more" in seeded.format(limit=3)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from engine.competition import CompetitionKernel
+from engine.population_model import PopulationModel
+from engine.runtime import BrainRuntime
+from engine.stimulus_timeline import (
+    StimulusSegment,
+    StimulusTimeline,
+    compile_timeline,
+)
+
+
+def _pop(**kw) -> PopulationModel:
+    params = dict(
+        tau=0.05,
+        baseline=0.1,
+        tonic_gain=0.0,
+        homeostatic_gain=0.2,
+        inhibition_gain=0.3,
+        clamp_max=10.0,
+    )
+    params.update(kw)
+    return PopulationModel(**params)
+
+
+def _drive(p: PopulationModel, x: float, dt: float, n: int, **kw) -> float:
+    for _ in range(n):
+        p.input = x
+        p.step(dt, **kw)
+    return p.activity
+
+
+def test_exponential_update_is_exact_for_held_input() -> None:
+    # Fixed point of (drive - a) / tau with drive = b + b*h + x - (h + i) * a
+    b, h, i, x = 0.1, 0.2, 0.3, 1.0
+    fixed = (b + b * h + x) / (1.0 + h + i)
+    rate = (1.0 + h + i) / 0.05
+
+    one = _pop()
+    _drive(one, x, 0.08, 1, exact=True)
+    assert one.activity == pytest.approx(fixed * (1.0 - math.exp(-rate * 0.08)))
+
+    # Exact: one step of 8*dt equals 8 steps of dt
+    many = _pop()
+    _drive(many, x, 0.01, 8, exact=True)
+    assert many.activity == pytest.approx(one.activity, rel=1e-12)
+
+    # Euler converges to it; at dt/tau = 1.6 it overshoots the fixed point
+    fine = _drive(_pop(), x, 0.0001, 800)
+    assert fine == pytest.approx(one.activity, rel=1e-3)
+    assert _drive(_pop(), x, 0.08, 1) > fixed
+
+
+def test_span_scales_tonic_drift_and_noise() -> None:
+    a = _pop(tonic_gain=0.02, tonic_target=0.5)
+    b = _pop(tonic_gain=0.02, tonic_target=0.5)
+    a.step(0.01, exact=True)
+    b.step(0.04, exact=True, span=4)
+    assert b.tonic == pytest.approx(4 * a.tonic)
+
+    # Noise enters the drive scaled by 1/sqrt(span)
+    n1 = _pop(noise_amplitude=0.1, homeostatic_gain=0.0, inhibition_gain=0.0, tau=0.0)
+    n4 = _pop(noise_amplitude=0.1, homeostatic_gain=0.0, inhibition_gain=0.0, tau=0.0)
+    n1.step(0.01, 1.0)
+    n4.step(0.04, 1.0, exact=True, span=4)
+    assert n4.activity - 0.1 == pytest.approx((n1.activity - 0.1) / 2)
+
+
+def test_constant_until_tracks_timeline_changes() -> None:
+    tl = compile_timeline(
+        StimulusTimeline((
+            StimulusSegment("r", 10, 20, 0.3),
+            StimulusSegment("r", 30, 34, 0.0, shape="ramp", end_magnitude=0.4),
+        )),
+        lambda region, pop, idx: (0,),
+    )
+    assert tl.constant_until(1) == 10
+    assert tl.constant_until(12) == 20
+    assert tl.constant_until(20) == 30
+    assert tl.constant_until(31) == 32
+    assert tl.constant_until(40) is None
+
+
+def test_integrator_and_adaptive_configuration(runtime: BrainRuntime, compiled_brain) -> None:
+    rt = runtime
+    assert rt.integrator == "euler"
+    assert rt.decision_sustain_time == pytest.approx(5 * rt.dt)
+
+    with pytest.raises(ValueError):
+        rt.set_integrator("rk4")
+    with pytest.raises(ValueError):
+        rt.configure_adaptive_step(8)
+
+    rt.set_integrator("exponential")
+    rt.configure_adaptive_step(8)
+    with pytest.raises(ValueError):
+        rt.set_integrator("euler")
+
+    compiled_brain["decision_latch"] = {"sustain_time": 0.08}
+    timed = BrainRuntime(compiled_brain)
+    assert timed._decision_sustain_required == 8
+
+
+def test_kernel_span_smoothing_matches_repeated_steps() -> None:
+    def assemblies():
+        return [
+            PopulationModel(assembly_id=f"a{i}", subpopulation=ch, firing_rate=rate)
+            for i, (ch, rate) in enumerate((("D1", 0.6), ("D1", 0.2), ("D2", 0.3)))
+        ]
+
+    single = CompetitionKernel(dominance_tau=0.75)
+    single.TRACE_PATH = None
+    pops = assemblies()
+    for _ in range(6):
+        single.apply(pops, 0.01)
+
+    spanned = CompetitionKernel(dominance_tau=0.75)
+    spanned.TRACE_PATH = None
+    spanned.apply(assemblies(), 0.01)
+    spanned.apply(assemblies(), 0.01, span=5)
+
+    for ch, d in single.last_dominance_map.items():
+        assert spanned.last_dominance_map[ch] == pytest.approx(d, abs=1e-12)
+
+
+def test_adaptive_run_takes_fewer_steps_and_tracks_fixed_step(fork_runtime) -> None:
+    timeline = StimulusTimeline((
+        StimulusSegment("striatum", 20, 120, 0.3, population="D1_MSN"),
+    ))
+
+    ref = fork_runtime(noise_seed=1)
+    ref.set_integrator("exponential")
+    ref.add_stimulus_timeline(timeline)
+    ref.inject_stimulus("striatum", "D2_MSN", magnitude=0.2)
+    assert ref.run(200) == 200
+
+    rt = fork_runtime(noise_seed=1)
+    rt.set_integrator("exponential")
+    rt.add_stimulus_timeline(timeline)
+    rt.configure_adaptive_step(8)
+    rt.inject_stimulus("striatum", "D2_MSN", magnitude=0.2)
+    calls = rt.run(200)
+
+    assert calls < 60
+    assert rt.step_count == 200
+    assert rt.time == pytest.approx(ref.time)
+
+    # Latch sustain is counted in base steps and never overshot, and
+    # the latch fires on the same base step as with fixed steps
+    assert rt._decision_fired
+    assert rt._decision_counter == rt._decision_sustain_required
+    assert rt.get_decision_state()["step"] == ref.get_decision_state()["step"]
+
+    deviation = max(
+        abs(a.activity - b.activity) for a, b in zip(rt._all_pops, ref._all_pops)
+    )
+    assert deviation < 0.02
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from engine.batch_runner import RunSchedule, load_runtime
+from engine.input_journal import (
+    DIGEST,
+    END,
+    JournaledSession,
+    read_journal,
+    replay_journal,
+)
+from engine.salience.salience_sparsity_gate import attach_sparsity_gate
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+BRAIN = {
+    "expression_profile": "minimal",
+    "state_profile": "awake",
+    "compound_profile": "experimental",
+}
+
+
+def _record(path: Path, *, setup=None, setup_spec=None):
+    rt = load_runtime(RunSchedule(steps=0, brain=BRAIN, noise_seed=5), root=ROOT, quiet=True)
+    if setup is not None:
+        setup(rt)
+    session = JournaledSession(rt, path, brain=BRAIN, setup=setup_spec, digest_every=10)
+
+    for step in range(45):
+        if step == 3:
+            assert session.handle("poke_pop striatum D1_MSN 0.4") == "OK"
+        if step == 7:
+            session.handle("stats striatum")  # read-only: not journaled
+            session.handle("sustain 3")
+        if step == 20:
+            # From another thread: queued, applied after the next step
+            replies = []
+            t = threading.Thread(target=lambda: replies.append(session.handle("poke_pop striatum D2_MSN 0.3")))
+            t.start()
+            while not session._pending:
+                pass
+        rt.step()
+        session.after_step()
+        if step == 20:
+            t.join()
+            assert replies == ["OK"]
+
+    session.close()
+    return rt, session
+
+
+def test_record_then_replay_matches(tmp_path: Path) -> None:
+    path = tmp_path / "session.njr"
+    rt, session = _record(
+        path,
+        setup=attach_sparsity_gate,
+        setup_spec="engine.salience.salience_sparsity_gate:attach_sparsity_gate",
+    )
+    assert session.commands == 3
+
+    journal = read_journal(path)
+    assert journal.complete
+    assert journal.meta["brain"] == BRAIN
+    assert journal.commands() == [
+        (3, "poke_pop striatum D1_MSN 0.4"),
+        (7, "sustain 3"),
+        (21, "poke_pop striatum D2_MSN 0.3"),
+    ]
+    assert sorted(journal.digests()) == [10, 20, 30, 40, 45]
+    assert [r.kind for r in journal.records][-1] == END
+
+    result = replay_journal(journal, root=ROOT)
+    assert result.ok
+    assert result.checked == 5
+    assert result.summary.final_step == 45
+    assert [c["at"] for c in result.summary.commands] == [3, 7, 21]
+
+
+def test_replay_detects_divergence_and_reads_truncated_file(tmp_path: Path) -> None:
+    path = tmp_path / "session.njr"
+    _record(path, setup=lambda rt: rt.inject_stimulus("striatum", "D2_MSN", magnitude=0.5))
+
+    # The unjournaled setup injection is missing on replay
+    result = replay_journal(path, root=ROOT)
+    assert not result.ok
+    assert result.mismatches[0] == 10
+
+    # A crash mid-record keeps every whole record before it
+    data = path.read_bytes()
+    path.write_bytes(data[:-3])
+    journal = read_journal(path)
+    assert not journal.complete
+    assert journal.records[-1].kind == DIGEST
+
+    with pytest.raises(ValueError):
+        path.write_bytes(b"nope")
+        read_journal(path)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import pytest
+
+from engine.multirate import SLOW_PERIODS, MultiRateScheduler
+from engine.runtime import BrainRuntime
+from engine.runtime_context import RuntimeContext
+from engine.salience.salience_field import SalienceField
+from engine.vta_value.value_signal import ValueSignal
+from persistence.persistence_core import BasalGangliaPersistence
+
+
+class _Leak:
+    def __init__(self) -> None:
+        self.value = 1.0
+        self.calls = []
+
+    def step(self, dt: float) -> None:
+        self.calls.append(("step", 1))
+        self.value *= 1.0 - dt
+
+    def advance(self, dt: float, steps: int) -> None:
+        self.calls.append(("advance", steps))
+        self.value *= (1.0 - dt) ** steps
+
+
+def test_scheduler_periods_and_flush() -> None:
+    leak = _Leak()
+    sched = MultiRateScheduler(dt=0.1)
+    sched.register("leak", leak)
+
+    sched.advance("leak")
+    assert leak.calls == [("step", 1)]
+
+    sched.set_period("leak", 4)
+    for _ in range(6):
+        sched.advance("leak")
+    assert leak.calls[1:] == [("advance", 4)]
+
+    sched.flush()
+    assert leak.calls[2:] == [("advance", 2)]
+    assert leak.value == pytest.approx(0.9 ** 7)
+
+    with pytest.raises(KeyError):
+        sched.register("leak", leak)
+    with pytest.raises(KeyError):
+        sched.configure({"nope": 2})
+    with pytest.raises(ValueError):
+        sched.set_period("leak", 0)
+
+
+def test_closed_forms_match_repeated_steps() -> None:
+    dt, n = 0.01, 37
+
+    a, b = ValueSignal(decay_tau=6.0), ValueSignal(decay_tau=6.0)
+    a.set(0.8)
+    b.set(0.8)
+    for _ in range(n):
+        a.step(dt)
+    b.advance(dt, n)
+    assert b.get() == pytest.approx(a.get())
+
+    a, b = SalienceField(decay_tau=0.05), SalienceField(decay_tau=0.05)
+    for f in (a, b):
+        f.inject("x", 0.05)
+        f.inject("y", 0.00002)
+    for _ in range(n):
+        a.step(dt)
+    b.advance(dt, n)
+    assert a.dump().keys() == b.dump().keys()
+    assert b.dump()["x"] == pytest.approx(a.dump()["x"])
+
+    a, b = RuntimeContext(decay_tau=5.0), RuntimeContext(decay_tau=5.0)
+    for c in (a, b):
+        c.set("pfc", 0.3)
+    for _ in range(n):
+        a.step(dt)
+    b.advance(dt, n)
+    assert b.get_gain("pfc:L5:0") == pytest.approx(a.get_gain("pfc:L5:0"))
+
+    a, b = BasalGangliaPersistence(), BasalGangliaPersistence()
+    for p in (a, b):
+        p.reinforce("s:D1:0", 0.5)
+    for _ in range(n):
+        a.step(dt)
+    b.advance(dt, n)
+    assert b.traces["s:D1:0"].value == pytest.approx(a.traces["s:D1:0"].value)
+
+
+def test_validation_records_hold_deviation() -> None:
+    leak = _Leak()
+    sched = MultiRateScheduler(dt=0.01, validate=True, tolerance=1e-4)
+    sched.register("leak", leak, period=10, snapshot=lambda x: {"v": x.value})
+
+    for _ in range(10):
+        sched.advance("leak")
+
+    stats = sched.stats()["leak"]
+    assert stats["max_update_deviation"] == pytest.approx(0.0, abs=1e-12)
+    # Held for 9 steps: 1 - 0.99 ** 9
+    assert stats["max_hold_deviation"] == pytest.approx(1 - 0.99 ** 9)
+    assert {v.kind for v in sched.violations} == {"hold"}
+    with pytest.raises(ValueError):
+        sched.check()
+
+
+def test_runtime_multirate_stays_within_tolerance(runtime: BrainRuntime) -> None:
+    rt = runtime
+    assert set(rt.multirate.periods().values()) == {1}
+
+    sched = rt.configure_multirate(validate=True)
+    assert sched.periods() == SLOW_PERIODS
+
+    for i in range(60):
+        if i % 4 == 0:
+            rt.inject_stimulus("striatum", "D1_MSN", magnitude=0.3)
+            rt.salience.inject("striatum:D1_MSN:0", 0.05)
+            rt.context.add_gain("pfc", 0.05)
+        rt.step()
+
+    sched.check()
+    stats = sched.stats()
+    assert stats["salience"]["updates"] == 12
+    assert stats["value"]["updates"] == 6
+
+    rt.configure_multirate({name: 1 for name in SLOW_PERIODS})
+    assert all(s["pending"] == 0 for s in sched.stats().values())
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from engine.divergence import capture_fields
+from engine.runtime import BrainRuntime
+from engine.stimulus_timeline import StimulusSegment, StimulusTimeline
+from loader.compiled_cache import compiled_brain
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _state(rt: BrainRuntime):
+    return (
+        rt.step_count,
+        [(p.activity, p.firing_rate, p.tonic) for p in rt._all_pops],
+        rt._last_gate_strength,
+        rt.value_signal.get(),
+    )
+
+
+def _drive(rt: BrainRuntime, steps: int) -> None:
+    for _ in range(steps):
+        rt.inject_stimulus("association_cortex", magnitude=0.4)
+        rt.inject_stimulus("striatum", "D1_MSN", magnitude=0.2)
+        rt.step()
+
+
+def test_compiled_brain_is_memoized_with_a_private_top_level() -> None:
+    a = compiled_brain(ROOT)
+    b = compiled_brain(ROOT)
+
+    assert a is not b
+    assert a["regions"] is b["regions"]
+
+    a["decision_latch"] = {"sustain_steps": 9}
+    assert "decision_latch" not in compiled_brain(ROOT)
+
+
+def test_fork_continues_exactly_like_the_original() -> None:
+    rt = BrainRuntime(compiled_brain(ROOT), noise_seed=5)
+    rt.add_stimulus_timeline(StimulusTimeline((
+        StimulusSegment("v1", 0, 60, 0.3),
+    )))
+    _drive(rt, 20)
+
+    fork = rt.fork()
+    assert _state(fork) == _state(rt)
+    assert fork.brain is rt.brain
+    assert all(a is not b for a, b in zip(rt._all_pops, fork._all_pops))
+
+    _drive(rt, 30)
+    _drive(fork, 30)
+    assert _state(fork) == _state(rt)
+
+
+def test_fork_mid_period_keeps_held_slow_fields() -> None:
+    rt = BrainRuntime(compiled_brain(ROOT), noise_seed=2)
+    rt.configure_multirate()
+    _drive(rt, 23)
+
+    # Pending updates are state: the fork neither needs nor does a flush
+    fork = rt.fork()
+    assert capture_fields(fork) == capture_fields(rt)
+    assert capture_fields(rt)["multirate"]["persistence"] == (20, 3)
+
+    _drive(rt, 30)
+    _drive(fork, 30)
+    assert capture_fields(fork) == capture_fields(rt)
+
+
+def test_fork_is_independent_of_the_original() -> None:
+    rt = BrainRuntime(compiled_brain(ROOT))
+    _drive(rt, 5)
+    before = _state(rt)
+
+    fork = rt.fork()
+    _drive(fork, 10)
+
+    assert _state(rt) == before
+    assert fork.step_count == rt.step_count + 10
+
+
+def test_fork_drops_live_export_and_refuses_while_sharded() -> None:
+    rt = BrainRuntime(compiled_brain(ROOT))
+    rt.enable_live_export()
+    try:
+        fork = rt.fork()
+        assert fork.live_export is None
+        assert rt.live_export is not None
+    finally:
+        rt.disable_live_export()
+
+    rt.start_shards(1)
+    try:
+        with pytest.raises(ValueError):
+            rt.fork()
+    finally:
+        rt.stop_shards()
+
+
+def test_fixtures_hand_out_private_forks(fork_runtime, runtime) -> None:
+    warm = fork_runtime(warmup=10)
+    again = fork_runtime(warmup=10)
+
+    assert warm.step_count == again.step_count == 10
+    assert warm is not again
+    assert _state(warm) == _state(again)
+
+    _drive(warm, 3)
+    assert _state(again)[0] == 10
+
+    assert runtime.step_count == 0
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from engine.execution.execution_record import ExecutionRecord
+from engine.execution.execution_target import ExecutionTarget
+from engine.observation.observation_event import ObservationEvent
+from engine.population_model import PopulationModel
+from engine.salience.salience_trace import SalienceTraceEvent
+from memory.episodic.episode_trace import EpisodeTraceRecord
+from persistence.traces import ExponentialTrace
+
+
+def test_population_model_has_fixed_layout() -> None:
+    p = PopulationModel.from_params({"subpopulation": "D1"}, default_assembly_id="striatum:D1:0")
+
+    assert not hasattr(p, "__dict__")
+    assert p._structural_gain == 1.0
+    assert p._base_subpopulation is None
+    assert p.hypothesis_id is None
+
+    with pytest.raises(AttributeError):
+        p.not_a_field = 1
+
+
+def test_structural_gain_still_scales_output() -> None:
+    a = PopulationModel(assembly_id="a", threshold=0.0, activity=0.5, tau=1e-12)
+    b = PopulationModel(assembly_id="b", threshold=0.0, activity=0.5, tau=1e-12)
+    b._structural_gain = 1.2
+
+    a.input = b.input = 0.5
+    a.step(0.01)
+    b.step(0.01)
+
+    assert b.output() == pytest.approx(a.output() * 1.2)
+
+
+def test_runtime_assigned_fields_survive_pickle_and_ignore_equality() -> None:
+    p = PopulationModel(assembly_id="x", subpopulation="D2")
+    p._structural_gain = 0.9
+    p._base_subpopulation = "D2"
+    p.hypothesis_id = "H-1"
+
+    q = pickle.loads(pickle.dumps(p))
+    assert (q._structural_gain, q._base_subpopulation, q.hypothesis_id) == (0.9, "D2", "H-1")
+    assert q == PopulationModel(assembly_id="x", subpopulation="D2")
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        EpisodeTraceRecord(event="start", episode_id=1, step=2, payload={}),
+        ObservationEvent(step=1, region="stn", event_type="rise", payload={}),
+        ExecutionRecord(target=ExecutionTarget.VALUE_BIAS, applied=True, value_snapshot=0.1),
+        SalienceTraceEvent(step=1, time=0.01, source="s", channel_id="D1", delta=0.1),
+        ExponentialTrace(decay_tau=5.0),
+    ],
+)
+def test_high_volume_records_are_slotted(record) -> None:
+    assert not hasattr(record, "__dict__")
+    assert pickle.loads(pickle.dumps(record)).__class__ is record.__class__
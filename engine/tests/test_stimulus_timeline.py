@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import pytest
+
+from engine.drivers.visual_temporal_driver import VisualTemporalDriver
+from engine.runtime import BrainRuntime
+from engine.stimulus_timeline import (
+    StimulusSegment,
+    StimulusTimeline,
+    compile_timeline,
+    scatter_add,
+)
+
+
+def test_segment_shapes() -> None:
+    const = StimulusSegment(region="pfc", start=2, stop=5, magnitude=0.3)
+    assert [const.magnitude_at(s) for s in range(7)] == [0.0, 0.0, 0.3, 0.3, 0.3, 0.0, 0.0]
+
+    ramp = StimulusSegment(
+        region="pfc", start=0, stop=5, magnitude=0.0, shape="ramp", end_magnitude=0.4,
+    )
+    assert [ramp.magnitude_at(s) for s in range(5)] == pytest.approx([0.0, 0.1, 0.2, 0.3, 0.4])
+
+    pulse = StimulusSegment(
+        region="pfc", start=10, stop=20, magnitude=1.0, shape="pulse", period=4, width=1,
+    )
+    assert [s for s in range(25) if pulse.magnitude_at(s)] == [10, 14, 18]
+
+
+def test_segment_validation() -> None:
+    with pytest.raises(ValueError):
+        StimulusSegment(region="pfc", start=5, stop=5, magnitude=1.0)
+    with pytest.raises(ValueError):
+        StimulusSegment(region="pfc", start=0, stop=5, magnitude=1.0, shape="square")
+    with pytest.raises(ValueError):
+        StimulusSegment(region="pfc", start=0, stop=5, magnitude=1.0, shape="ramp")
+    with pytest.raises(ValueError):
+        StimulusSegment(region="pfc", start=0, stop=5, magnitude=1.0, shape="pulse", period=2, width=3)
+    with pytest.raises(ValueError):
+        StimulusSegment.from_dict({"region": "pfc", "start": 0, "magnitude": 1.0})
+
+
+def test_compiled_contributions_match_segments() -> None:
+    timeline = StimulusTimeline.from_dicts([
+        {"region": "a", "start": 0, "stop": 10, "magnitude": 1.0},
+        {"region": "b", "start": 5, "stop": 15, "magnitude": 0.5, "shape": "pulse", "period": 2},
+        {"region": "c", "start": 8, "stop": 9, "magnitude": 2.0},
+    ])
+    targets = {"a": (0, 1), "b": (1,), "c": ()}
+    compiled = compile_timeline(timeline, lambda region, pop, asm: targets[region])
+
+    assert (compiled.start, compiled.stop) == (0, 15)
+    for step in range(-2, 20):
+        expected = [
+            (targets[seg.region], seg.magnitude_at(step))
+            for seg in timeline.segments
+            if targets[seg.region] and seg.magnitude_at(step) != 0.0
+        ]
+        assert compiled.contributions(step) == expected
+
+    acc = scatter_add(compiled.contributions(7), {0: 1.0, 1: 2.0})
+    assert acc == {0: 1.0, 1: 1.0 * 2.0 + 0.5 * 2.0}
+
+
+def test_queued_stimuli_resolve_to_indices_at_enqueue(runtime: BrainRuntime) -> None:
+    rt = runtime
+    rt.inject_stimulus("striatum", "D1_MSN", magnitude=0.3)
+    rt.inject_stimulus("striatum", "D1_MSN", 0, magnitude=0.1)
+    rt.inject_stimulus("no_such_region", magnitude=1.0)
+
+    assert len(rt._stim_queue) == 2
+    d1 = rt.region_states["striatum"]["populations"]["D1_MSN"]
+    all_d1, first_d1 = (targets for targets, _ in rt._stim_queue)
+    assert [rt._all_pops[i] for i in all_d1] == d1
+    assert [rt._all_pops[i] for i in first_d1] == d1[:1]
+
+    rt.step()
+    assert not rt._stim_queue
+
+
+def test_timeline_matches_per_step_injection(fork_runtime) -> None:
+    segment = StimulusSegment(
+        region="striatum", population="D1_MSN", start=3, stop=12,
+        magnitude=0.1, shape="ramp", end_magnitude=0.5,
+    )
+
+    injected = fork_runtime(noise_seed=1)
+    for _ in range(15):
+        mag = segment.magnitude_at(injected.step_count + 1)
+        if mag:
+            injected.inject_stimulus("striatum", "D1_MSN", magnitude=mag)
+        injected.step()
+
+    timed = fork_runtime(noise_seed=1)
+    timed.add_stimulus_timeline(StimulusTimeline(segments=(segment,)))
+    for _ in range(15):
+        timed.step()
+
+    assert [p.activity for p in timed._all_pops] == [p.activity for p in injected._all_pops]
+
+
+def test_visual_driver_timeline_window() -> None:
+    driver = VisualTemporalDriver(onset_step=20, offset_step=160, magnitude=0.25)
+    (seg,) = driver.timeline().segments
+    assert (seg.region, seg.population) == ("visual_input", "VISUAL_SIGNAL")
+    assert [s for s in (19, 20, 160, 161) if seg.magnitude_at(s)] == [20, 160]
@@ -85,6 +85,15 @@ class ValueSignal:
         decay_factor = dt / self.decay_tau
         self.value *= max(0.0, 1.0 - decay_factor)
 
+    def advance(self, dt: float, steps: int) -> None:
+        """
+        Closed form of `steps` calls to step(dt) (multi-rate updates).
+        """
+        if not self.enabled or self.decay_tau <= 0.0 or steps <= 0:
+            return
+
+        self.value *= max(0.0, 1.0 - dt / self.decay_tau) ** int(steps)
+
     # ============================================================
     # Internals
     # ============================================================
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import struct
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from inspection.recruitment.region_dump_columns import BINARY_SUFFIX, read_region_dump_meta
+
+MANIFEST_FILENAME = "holding_bin_manifest.jsonl"
+DUMP_SUFFIXES = (".json", BINARY_SUFFIX)
+
+_EP_RE = re.compile(r"^ep(?P<ep>\d+)__")
+_ROLE_RE = re.compile(r"__(?P<role>baseline|post|poke)__", flags=re.IGNORECASE)
+_TAG_RE = re.compile(r"__tag(?P<tag>.+)\.(?:json|rdump)$")
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """
+    Index metadata for one dump in the holding bin.
+
+    Fields mirror what RegionDumpIndexBuilder needs, so index builds
+    never open dump files:
+    - name_episode_id: from the "ep<N>__" filename prefix (if any)
+    - payload_episode_id / region / step: from the dump payload
+    - role / tag: from the filename
+    - size / mtime_ns: revalidation keys
+    - content_hash: blake2b of the file bytes
+    """
+
+    filename: str
+    name_episode_id: Optional[int]
+    payload_episode_id: Optional[int]
+    region: Optional[str]
+    step: int
+    role: Optional[str]
+    tag: Optional[str]
+    size: int
+    mtime_ns: int
+    content_hash: str
+
+    @property
+    def readable(self) -> bool:
+        return self.region is not None
+
+    def matches_episode(self, episode_id: int) -> bool:
+        return self.name_episode_id == int(episode_id) or self.payload_episode_id == int(episode_id)
+
+
+def _entry_from_bytes(path: Path, data: bytes, stat: os.stat_result) -> ManifestEntry:
+    name = path.name
+
+    ep_m = _EP_RE.match(name)
+    role_m = _ROLE_RE.search(name)
+    tag_m = _TAG_RE.search(name)
+
+    payload: Dict[str, Any] = {}
+    region: Optional[str] = None
+    payload_ep: Optional[int] = None
+    try:
+        if name.endswith(BINARY_SUFFIX):
+            payload = read_region_dump_meta(data)
+        else:
+            payload = json.loads(data.decode("utf-8"))
+        region = str(payload.get("region", "")).lower()
+        if "episode_id" in payload:
+            payload_ep = int(payload["episode_id"])
+    except (ValueError, TypeError, AttributeError, struct.error):
+        payload = {}
+
+    try:
+        step = int(payload.get("step", -1))
+    except (ValueError, TypeError):
+        step = -1
+
+    return ManifestEntry(
+        filename=name,
+        name_episode_id=int(ep_m.group("ep")) if ep_m else None,
+        payload_episode_id=payload_ep,
+        region=region,
+        step=step,
+        role=role_m.group("role").lower() if role_m else None,
+        tag=tag_m.group("tag") if tag_m else None,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        content_hash=hashlib.blake2b(data, digest_size=16).hexdigest(),
+    )
+
+
+class HoldingBinManifest:
+    """
+    Sidecar manifest for the recruitment holding bin.
+
+    Stored as JSON Lines next to the dumps; later lines supersede
+    earlier ones for the same filename, and a line with
+    {"filename": ..., "removed": true} drops an entry. The file is
+    compacted whenever refresh() finds changes.
+
+    - record(): incremental update, called by HoldingBinWriter
+    - refresh(): revalidate against the directory by (size, mtime_ns);
+      only new or changed dumps are opened
+
+    Offline-only. Never mutates dumps.
+    """
+
+    def __init__(self, holding_bin_dir: Path) -> None:
+        self._dir = Path(holding_bin_dir)
+        self._path = self._dir / MANIFEST_FILENAME
+        self._entries: Dict[str, ManifestEntry] = self._load()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def entries(self) -> List[ManifestEntry]:
+        return [self._entries[k] for k in sorted(self._entries)]
+
+    # --------------------------------------------------
+    # Persistence
+    # --------------------------------------------------
+
+    def _load(self) -> Dict[str, ManifestEntry]:
+        entries: Dict[str, ManifestEntry] = {}
+        if not self._path.exists():
+            return entries
+
+        with self._path.open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                    if row.get("removed"):
+                        entries.pop(row["filename"], None)
+                    else:
+                        entries[row["filename"]] = ManifestEntry(**row)
+                except (ValueError, TypeError, KeyError):
+                    # Torn/foreign line: refresh() will re-derive the entry
+                    continue
+        return entries
+
+    def _append(self, rows: List[Dict[str, Any]]) -> None:
+        self._dir.mkdir(parents=True, exist_ok=True)
+        with self._path.open("a", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, sort_keys=True) + "\n")
+
+    def _rewrite(self) -> None:
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            for entry in self.entries():
+                f.write(json.dumps(asdict(entry), sort_keys=True) + "\n")
+        os.replace(tmp, self._path)
+
+    # --------------------------------------------------
+    # Updates
+    # --------------------------------------------------
+
+    def record(self, path: Path, data: bytes) -> ManifestEntry:
+        """
+        Record a dump that was just written with the given bytes.
+        """
+        path = Path(path)
+        entry = _entry_from_bytes(path, data, path.stat())
+        self._entries[entry.filename] = entry
+        self._append([asdict(entry)])
+        return entry
+
+    def refresh(self) -> List[ManifestEntry]:
+        """
+        Revalidate against the holding bin and return current entries.
+        """
+        changed = False
+        seen = set()
+
+        with os.scandir(self._dir) as it:
+            for de in it:
+                if not de.name.endswith(DUMP_SUFFIXES) or not de.is_file():
+                    continue
+                seen.add(de.name)
+
+                st = de.stat()
+                known = self._entries.get(de.name)
+                if known is not None and known.size == st.st_size and known.mtime_ns == st.st_mtime_ns:
+                    continue
+
+                path = Path(de.path)
+                self._entries[de.name] = _entry_from_bytes(path, path.read_bytes(), st)
+                changed = True
+
+        for name in [n for n in self._entries if n not in seen]:
+            del self._entries[name]
+            changed = True
+
+        if changed:
+            self._rewrite()
+
+        return self.entries()
@@ -3,7 +3,10 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
+
+from inspection.recruitment.holding_bin_manifest import HoldingBinManifest
+from inspection.recruitment.region_dump_columns import BINARY_SUFFIX, encode_region_dump
 
 
 @dataclass(frozen=True)
@@ -27,16 +30,21 @@ class HoldingBinLayout:
 
 class HoldingBinWriter:
     """
-    Writes region dump JSON payloads into the holding bin using a deterministic name.
+    Writes region dumps (JSON payloads or binary columnar) into the holding bin
+    using a deterministic name.
 
     This is a *dumb file sink*:
     - offline-only
     - no runtime access
-    - no mutation of payload (except JSON serialization)
+    - no mutation of payload (except serialization)
+
+    Each write also appends the dump's entry to the holding bin
+    manifest, so index builds never have to reopen it.
     """
 
     def __init__(self, holding_bin_dir: Path) -> None:
         self._dir = Path(holding_bin_dir)
+        self._manifest: Optional[HoldingBinManifest] = None
 
     def write_dump(
         self,
@@ -47,6 +55,53 @@ class HoldingBinWriter:
         step: int,
         payload: Dict[str, Any],
         tag: Optional[str] = None,
+    ) -> Path:
+        path = self._path_for(episode_id=episode_id, region=region, role=role, step=step, tag=tag, suffix=".json")
+
+        # Stable serialization (sorted keys)
+        return self._write(path, json.dumps(payload, sort_keys=True, indent=2).encode("utf-8"))
+
+    def write_region_dump(
+        self,
+        *,
+        episode_id: int,
+        region: str,
+        role: str,
+        step: int,
+        assembly_ids: Iterable[str],
+        activity: Iterable[float],
+        output: Iterable[float],
+        populations: Optional[Iterable[str]] = None,
+        time: Optional[float] = None,
+        tag: Optional[str] = None,
+        typecode: str = "d",
+    ) -> Path:
+        """
+        Binary columnar variant of write_dump (see region_dump_columns).
+        """
+        path = self._path_for(episode_id=episode_id, region=region, role=role, step=step, tag=tag, suffix=BINARY_SUFFIX)
+        data = encode_region_dump(
+            region=region,
+            step=step,
+            assembly_ids=assembly_ids,
+            activity=activity,
+            output=output,
+            populations=populations,
+            time=time,
+            episode_id=episode_id,
+            typecode=typecode,
+        )
+        return self._write(path, data)
+
+    def _path_for(
+        self,
+        *,
+        episode_id: int,
+        region: str,
+        role: str,
+        step: int,
+        tag: Optional[str],
+        suffix: str,
     ) -> Path:
         self._dir.mkdir(parents=True, exist_ok=True)
 
@@ -54,9 +109,13 @@ class HoldingBinWriter:
         safe_region = region.strip().lower().replace(" ", "_")
 
         tag_part = f"__tag{tag}" if tag else ""
-        filename = f"ep{episode_id}__{safe_region}__{safe_role}__step{int(step)}{tag_part}.json"
-        path = self._dir / filename
+        filename = f"ep{episode_id}__{safe_region}__{safe_role}__step{int(step)}{tag_part}{suffix}"
+        return self._dir / filename
 
-        # Stable serialization (sorted keys)
-        path.write_text(json.dumps(payload, sort_keys=True, indent=2), encoding="utf-8")
+    def _write(self, path: Path, data: bytes) -> Path:
+        path.write_bytes(data)
+
+        if self._manifest is None:
+            self._manifest = HoldingBinManifest(self._dir)
+        self._manifest.record(path, data)
         return path
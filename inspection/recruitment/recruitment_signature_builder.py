@@ -5,12 +5,12 @@ from pathlib import Path
 from typing import Dict, Optional
 
 from inspection.recruitment.recruitment_signature import RecruitmentSignature
+from inspection.recruitment.region_dump_columns import load_region_dump
 from inspection.recruitment.recruitment_stats_from_dump import (
-    load_dump,
-    total_mass,
-    fraction_active,
-    top_k_assemblies,
-    tier_counts,
+    total_mass_columns,
+    fraction_active_columns,
+    top_k_columns,
+    tier_counts_columns,
     overlap_fraction,
     DEFAULT_ACTIVE_THRESHOLD,
 )
@@ -45,20 +45,19 @@ class RecruitmentSignatureBuilder:
         decision_summary: Optional[Dict],
     ) -> RecruitmentSignature:
 
-        base = load_dump(baseline_dump)
-        post = load_dump(post_dump)
+        # Binary (.rdump, memory-mapped) or JSON dumps
+        with load_region_dump(baseline_dump) as base, load_region_dump(post_dump) as post:
+            base_mass = total_mass_columns(base.output)
+            post_mass = total_mass_columns(post.output)
 
-        base_asm = list(base.get("assemblies", []))
-        post_asm = list(post.get("assemblies", []))
+            base_frac = fraction_active_columns(base.output, threshold=self._active_threshold)
+            post_frac = fraction_active_columns(post.output, threshold=self._active_threshold)
 
-        base_mass = total_mass(base_asm)
-        post_mass = total_mass(post_asm)
+            base_top = top_k_columns(base.assembly_ids, base.output, self._top_k)
+            post_top = top_k_columns(post.assembly_ids, post.output, self._top_k)
 
-        base_frac = fraction_active(base_asm, threshold=self._active_threshold)
-        post_frac = fraction_active(post_asm, threshold=self._active_threshold)
-
-        base_top = top_k_assemblies(base_asm, self._top_k)
-        post_top = top_k_assemblies(post_asm, self._top_k)
+            base_tiers = tier_counts_columns(base.output)
+            post_tiers = tier_counts_columns(post.output)
 
         overlap = overlap_fraction(base_top, post_top)
 
@@ -107,8 +106,8 @@ class RecruitmentSignatureBuilder:
             has_decision=bool(has_decision),
             winner=str(winner) if winner is not None else None,
 
-            baseline_step=int(base.get("step", -1)),
-            post_step=int(post.get("step", -1)),
+            baseline_step=int(base.step),
+            post_step=int(post.step),
 
             baseline_mass=float(base_mass),
             post_mass=float(post_mass),
@@ -118,8 +117,8 @@ class RecruitmentSignatureBuilder:
             post_fraction_active=float(post_frac),
             delta_fraction_active=float(post_frac - base_frac),
 
-            baseline_tiers=tier_counts(base_asm),
-            post_tiers=tier_counts(post_asm),
+            baseline_tiers=base_tiers,
+            post_tiers=post_tiers,
 
             top_k_overlap=float(overlap),
 
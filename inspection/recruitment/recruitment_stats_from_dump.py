@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import heapq
 import json
+from bisect import bisect_right
+from itertools import compress
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
 
 # ------------------------------------------------------------
@@ -76,6 +79,47 @@ def overlap_fraction(
     return len(ids_a & ids_b) / len(ids_a)
 
 
+# ------------------------------------------------------------
+# Column variants (RegionDumpColumns.output / any float sequence)
+#
+# Same results as the row helpers above; loops run in C builtins
+# (map/compress/sorted/bisect) instead of per-dict Python code.
+# ------------------------------------------------------------
+
+def fraction_active_columns(output: Sequence[float], *, threshold: float = DEFAULT_ACTIVE_THRESHOLD) -> float:
+    if not len(output):
+        return 0.0
+    return sum(map(float(threshold).__lt__, output)) / len(output)
+
+
+def total_mass_columns(output: Sequence[float]) -> float:
+    return float(sum(output))
+
+
+def top_k_columns(
+    assembly_ids: Sequence[str],
+    output: Sequence[float],
+    k: int,
+) -> List[Tuple[str, float]]:
+    positive = compress(range(len(output)), map((0.0).__lt__, output))
+    # nlargest is stable on ties, matching the row variant's sort
+    top = heapq.nlargest(k, positive, key=output.__getitem__)
+    return [(assembly_ids[i], float(output[i])) for i in top]
+
+
+def tier_counts_columns(output: Sequence[float]) -> Dict[str, int]:
+    ordered = sorted(output)
+    zero = bisect_right(ordered, 0.0)
+    low = bisect_right(ordered, 0.05)
+    mid = bisect_right(ordered, 0.2)
+    return {
+        "high": len(ordered) - mid,
+        "mid": mid - low,
+        "low": low - zero,
+        "zero": zero,
+    }
+
+
 # ------------------------------------------------------------
 # Convenience CLI for ad-hoc inspection
 # ------------------------------------------------------------
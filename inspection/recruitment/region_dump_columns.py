@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+
+BINARY_SUFFIX = ".rdump"
+FORMAT_VERSION = 1
+
+_MAGIC = b"RDMP"
+
+# magic, version, value typecode, byteorder (l/b), meta length, assembly count
+_HEADER = struct.Struct("<4sHccII")
+_ALIGN = 8
+
+
+@dataclass(frozen=True)
+class RegionDumpColumns:
+    """
+    Column view of one per-assembly region dump.
+
+    - assembly_ids: dictionary of assembly ids (slot order)
+    - population: per-slot index into `populations`
+    - activity / output: per-slot values (typed arrays or memoryviews)
+
+    Loaded from a binary dump, activity/output are zero-copy views
+    into the mapped file: close() (or a with block) unmaps it.
+    Inspection-only; never mutated.
+    """
+
+    region: str
+    step: int
+    time: Optional[float]
+    episode_id: Optional[int]
+    assembly_ids: List[str]
+    populations: List[str]
+    population: Any
+    activity: Any
+    output: Any
+
+    # File mapping behind the columns (binary dumps loaded from disk)
+    _mapping: Optional[mmap.mmap] = field(default=None, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.assembly_ids)
+
+    def assemblies(self) -> List[Dict[str, Any]]:
+        """
+        Row form (same shape as the JSON dump entries).
+        """
+        pops = self.populations
+        return [
+            {
+                "assembly_id": aid,
+                "population": pops[p] if pops else None,
+                "activity": float(act),
+                "output": float(out),
+            }
+            for aid, p, act, out in zip(self.assembly_ids, self.population, self.activity, self.output)
+        ]
+
+    def to_payload(self) -> Dict[str, Any]:
+        """
+        JSON-export payload (same shape as dump_asm JSON output).
+        """
+        payload: Dict[str, Any] = {
+            "region": self.region,
+            "step": self.step,
+            "time": self.time,
+            "assemblies": self.assemblies(),
+        }
+        if self.episode_id is not None:
+            payload["episode_id"] = self.episode_id
+        return payload
+
+    def close(self) -> None:
+        """
+        Unmap the dump file; the column views are unusable afterwards.
+        No-op for in-memory columns.
+        """
+        if self._mapping is None:
+            return
+        for column in (self.population, self.activity, self.output):
+            if isinstance(column, memoryview):
+                column.release()
+        self._mapping.close()
+
+    def __enter__(self) -> "RegionDumpColumns":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ------------------------------------------------------------
+# Encoding
+# ------------------------------------------------------------
+
+def encode_region_dump(
+    *,
+    region: str,
+    step: int,
+    assembly_ids: Iterable[str],
+    activity: Iterable[float],
+    output: Iterable[float],
+    populations: Optional[Iterable[str]] = None,
+    time: Optional[float] = None,
+    episode_id: Optional[int] = None,
+    typecode: str = "d",
+) -> bytes:
+    """
+    Encode a region dump into the binary columnar format.
+
+    Layout:
+    - fixed header (magic, version, value typecode, byteorder,
+      meta length, assembly count)
+    - JSON meta: region/step/time/episode_id, assembly id dictionary,
+      population label table
+    - padding to 8 bytes
+    - population index column (uint16)
+    - activity column, output column (float32 "f" or float64 "d")
+    """
+    if typecode not in ("f", "d"):
+        raise ValueError("typecode must be 'f' (float32) or 'd' (float64)")
+
+    ids = [str(a) for a in assembly_ids]
+    act = array(typecode, activity)
+    out = array(typecode, output)
+    if not (len(ids) == len(act) == len(out)):
+        raise ValueError("assembly_ids, activity and output must have equal length")
+
+    labels: List[str] = []
+    label_ids: Dict[str, int] = {}
+    pop = array("H")
+    if populations is not None:
+        for label in populations:
+            label = str(label)
+            pid = label_ids.get(label)
+            if pid is None:
+                pid = label_ids[label] = len(labels)
+                labels.append(label)
+            pop.append(pid)
+        if len(pop) != len(ids):
+            raise ValueError("populations must match assembly_ids length")
+    else:
+        pop = array("H", bytes(2 * len(ids)))
+
+    meta = json.dumps({
+        "region": str(region),
+        "step": int(step),
+        "time": time,
+        "episode_id": episode_id,
+        "assembly_ids": ids,
+        "populations": labels,
+    }, separators=(",", ":")).encode("utf-8")
+
+    head = _HEADER.pack(
+        _MAGIC, FORMAT_VERSION, typecode.encode("ascii"),
+        b"l" if sys.byteorder == "little" else b"b",
+        len(meta), len(ids),
+    )
+    used = len(head) + len(meta)
+    pad = b"\0" * (-used % _ALIGN)
+
+    # Pad after the uint16 column so value columns stay 8-byte aligned
+    pop_bytes = pop.tobytes()
+    pop_pad = b"\0" * (-len(pop_bytes) % _ALIGN)
+
+    return b"".join((head, meta, pad, pop_bytes, pop_pad, act.tobytes(), out.tobytes()))
+
+
+def write_region_dump(path: Path, **fields: Any) -> Path:
+    """
+    Write a binary region dump (see encode_region_dump for fields).
+    """
+    path = Path(path)
+    path.write_bytes(encode_region_dump(**fields))
+    return path
+
+
+# ------------------------------------------------------------
+# Decoding
+# ------------------------------------------------------------
+
+def decode_region_dump(buf: Any) -> RegionDumpColumns:
+    """
+    Decode a binary dump from any buffer (bytes, mmap, memoryview).
+
+    Value columns are zero-copy memoryviews into `buf`.
+    """
+    view = memoryview(buf)
+    if len(view) < _HEADER.size:
+        raise ValueError("Truncated region dump header")
+
+    magic, version, code, order, meta_len, n = _HEADER.unpack_from(view, 0)
+    if magic != _MAGIC:
+        raise ValueError("Not a binary region dump")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported region dump version: {version}")
+    if order != (b"l" if sys.byteorder == "little" else b"b"):
+        raise ValueError("Region dump was written with a different byte order.")
+
+    typecode = code.decode("ascii")
+    itemsize = array(typecode).itemsize
+
+    off = _HEADER.size
+    meta = json.loads(bytes(view[off:off + meta_len]).decode("utf-8"))
+    off += meta_len
+    off += -off % _ALIGN
+
+    pop_len = 2 * n
+    population = view[off:off + pop_len].cast("H")
+    off += pop_len + (-pop_len % _ALIGN)
+
+    activity = view[off:off + n * itemsize].cast(typecode)
+    off += n * itemsize
+    output = view[off:off + n * itemsize].cast(typecode)
+    if len(output) != n:
+        raise ValueError("Truncated region dump columns")
+
+    return RegionDumpColumns(
+        region=str(meta.get("region", "")),
+        step=int(meta.get("step", -1)),
+        time=meta.get("time"),
+        episode_id=meta.get("episode_id"),
+        assembly_ids=list(meta.get("assembly_ids", [])),
+        populations=list(meta.get("populations", [])),
+        population=population,
+        activity=activity,
+        output=output,
+    )
+
+
+def read_region_dump_meta(buf: Any) -> Dict[str, Any]:
+    """
+    Header + meta only (region/step/episode_id); value columns untouched.
+    """
+    view = memoryview(buf)
+    magic, version, _, _, meta_len, n = _HEADER.unpack_from(view, 0)
+    if magic != _MAGIC or version != FORMAT_VERSION:
+        raise ValueError("Not a supported binary region dump")
+    meta = json.loads(bytes(view[_HEADER.size:_HEADER.size + meta_len]).decode("utf-8"))
+    meta["assembly_count"] = n
+    return meta
+
+
+def load_region_dump(path: Path) -> RegionDumpColumns:
+    """
+    Memory-map a binary dump, or convert a JSON dump, to columns.
+
+    Close the result (or use it in a with block) to release the file.
+    """
+    path = Path(path)
+
+    if path.suffix != BINARY_SUFFIX:
+        return columns_from_payload(json.loads(path.read_text(encoding="utf-8")))
+
+    with path.open("rb") as fh:
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return replace(decode_region_dump(mm), _mapping=mm)
+    except BaseException:
+        mm.close()
+        raise
+
+
+def columns_from_payload(payload: Dict[str, Any]) -> RegionDumpColumns:
+    """
+    Columns from a JSON dump payload (legacy / export format).
+    """
+    rows = list(payload.get("assemblies", []))
+
+    labels: List[str] = []
+    label_ids: Dict[str, int] = {}
+    pop = array("H")
+    for a in rows:
+        label = a.get("population")
+        label = "" if label is None else str(label)
+        pid = label_ids.get(label)
+        if pid is None:
+            pid = label_ids[label] = len(labels)
+            labels.append(label)
+        pop.append(pid)
+
+    step = payload.get("step", -1)
+    episode_id = payload.get("episode_id")
+
+    return RegionDumpColumns(
+        region=str(payload.get("region", "")),
+        step=int(step) if step is not None else -1,
+        time=payload.get("time"),
+        episode_id=int(episode_id) if episode_id is not None else None,
+        assembly_ids=[str(a.get("assembly_id")) for a in rows],
+        populations=labels,
+        population=pop,
+        activity=array("d", (float(a.get("activity", 0.0)) for a in rows)),
+        output=array("d", (float(a.get("output", 0.0)) for a in rows)),
+    )
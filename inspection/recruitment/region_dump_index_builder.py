@@ -1,19 +1,13 @@
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional
 
-from inspection.recruitment.recruitment_stats_from_dump import load_dump
+from inspection.recruitment.holding_bin_manifest import HoldingBinManifest, ManifestEntry
 from inspection.recruitment.region_dump_index import DumpPair, RegionDumpIndex
 
 
-_EP_RE = re.compile(r"^ep(?P<ep>\d+)__")
-_ROLE_RE = re.compile(r"__(?P<role>baseline|post|poke)__", flags=re.IGNORECASE)
-_STEP_RE = re.compile(r"__step(?P<step>\d+)", flags=re.IGNORECASE)
-
-
 @dataclass(frozen=True)
 class RegionDumpIndexBuilder:
     """
@@ -23,6 +17,9 @@ class RegionDumpIndexBuilder:
     - prefer explicit role-tagged files ("baseline" vs "post"/"poke")
     - otherwise choose min-step as baseline and max-step as post
     - constrain to episode_bounds if provided
+
+    Selection runs against the holding bin manifest; dumps are only
+    opened when they are new or changed since the last build.
     """
 
     holding_bin_dir: Path
@@ -39,48 +36,40 @@ class RegionDumpIndexBuilder:
         if not root.exists():
             raise FileNotFoundError(f"Holding bin directory not found: {root}")
 
-        candidates = [p for p in root.glob("*.json") if p.is_file()]
+        # Manifest query (only new/changed dumps are opened)
+        candidates = HoldingBinManifest(root).refresh()
         if not candidates:
             raise ValueError(f"No JSON dumps found in holding bin: {root}")
 
         # Filter by episode id (prefer name, fallback to payload)
-        filtered: List[Path] = []
-        for p in candidates:
-            m = _EP_RE.match(p.name)
-            if m and int(m.group("ep")) == int(episode_id):
-                filtered.append(p)
-                continue
-            # Fallback: allow files without ep prefix but with payload match
-            try:
-                payload = load_dump(p)
-            except Exception:
-                continue
-            if int(payload.get("episode_id", -1)) == int(episode_id):
-                filtered.append(p)
+        filtered: List[ManifestEntry] = []
+        for e in candidates:
+            if e.name_episode_id == int(episode_id):
+                if not e.readable:
+                    raise ValueError(f"Unreadable dump in holding bin: {e.filename}")
+                filtered.append(e)
+            elif e.readable and e.payload_episode_id == int(episode_id):
+                filtered.append(e)
 
         if not filtered:
             raise ValueError(f"No dumps matched episode_id={episode_id} in {root}")
 
         # Optional tag filter (filename tag only; deterministic and cheap)
         if tag:
-            filtered = [p for p in filtered if f"__tag{tag}" in p.name]
+            filtered = [e for e in filtered if f"__tag{tag}" in e.filename]
             if not filtered:
                 raise ValueError(f"No dumps matched episode_id={episode_id} and tag={tag} in {root}")
 
         # Group by region
-        by_region: Dict[str, List[Tuple[Path, Dict]]] = {}
-        for p in filtered:
-            payload = load_dump(p)
-            region = str(payload.get("region", "")).lower()
-            step = int(payload.get("step", -1))
-
+        by_region: Dict[str, List[ManifestEntry]] = {}
+        for e in filtered:
             if episode_bounds is not None:
                 start = int(episode_bounds["start_step"])
                 end = int(episode_bounds["end_step"])
-                if step < start or step > end:
+                if e.step < start or e.step > end:
                     continue
 
-            by_region.setdefault(region, []).append((p, payload))
+            by_region.setdefault(e.region, []).append(e)
 
         if not by_region:
             raise ValueError("All dumps were filtered out by episode_bounds (or missing region/step).")
@@ -89,52 +78,32 @@ class RegionDumpIndexBuilder:
 
         for region, items in sorted(by_region.items(), key=lambda kv: kv[0]):
             # Identify explicit roles from filenames if possible
-            baseline_items: List[Tuple[Path, Dict]] = []
-            post_items: List[Tuple[Path, Dict]] = []
-            other_items: List[Tuple[Path, Dict]] = []
-
-            for p, payload in items:
-                role_m = _ROLE_RE.search(p.name)
-                if role_m:
-                    role = role_m.group("role").lower()
-                    if role == "baseline":
-                        baseline_items.append((p, payload))
-                    else:
-                        post_items.append((p, payload))
-                else:
-                    other_items.append((p, payload))
-
-            def _best_by_step(it: List[Tuple[Path, Dict]], *, pick_max: bool) -> Tuple[Path, Dict]:
+            baseline_items = [e for e in items if e.role == "baseline"]
+            post_items = [e for e in items if e.role in ("post", "poke")]
+
+            def _best_by_step(it: List[ManifestEntry], *, pick_max: bool) -> ManifestEntry:
                 # deterministic tiebreaker: step then filename
-                sorted_it = sorted(
-                    it,
-                    key=lambda t: (int(t[1].get("step", -1)), t[0].name),
-                    reverse=pick_max,
-                )
-                return sorted_it[0]
+                return sorted(it, key=lambda e: (e.step, e.filename), reverse=pick_max)[0]
 
             if baseline_items and post_items:
-                b_path, b_payload = _best_by_step(baseline_items, pick_max=False)
-                p_path, p_payload = _best_by_step(post_items, pick_max=True)
+                b = _best_by_step(baseline_items, pick_max=False)
+                p = _best_by_step(post_items, pick_max=True)
             else:
                 # Step-based fallback across all items
                 if len(items) < 2:
                     raise ValueError(f"Region '{region}' has <2 dumps; cannot form baseline/post pair.")
-                b_path, b_payload = _best_by_step(items, pick_max=False)
-                p_path, p_payload = _best_by_step(items, pick_max=True)
-
-            b_step = int(b_payload.get("step", -1))
-            p_step = int(p_payload.get("step", -1))
+                b = _best_by_step(items, pick_max=False)
+                p = _best_by_step(items, pick_max=True)
 
-            if b_step == p_step and b_path == p_path:
-                raise ValueError(f"Region '{region}' baseline and post resolved to the same dump: {b_path.name}")
+            if b.step == p.step and b.filename == p.filename:
+                raise ValueError(f"Region '{region}' baseline and post resolved to the same dump: {b.filename}")
 
             pairs[region] = DumpPair(
                 region=region,
-                baseline=b_path,
-                post=p_path,
-                baseline_step=b_step,
-                post_step=p_step,
+                baseline=root / b.filename,
+                post=root / p.filename,
+                baseline_step=b.step,
+                post_step=p.step,
             )
 
         return RegionDumpIndex(episode_id=int(episode_id), pairs=pairs)
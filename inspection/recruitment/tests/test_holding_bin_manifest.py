@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Dict
+
+from inspection.recruitment.holding_bin_manifest import HoldingBinManifest
+from inspection.recruitment.holding_bin_writer import HoldingBinWriter
+from inspection.recruitment.region_dump_index_builder import RegionDumpIndexBuilder
+
+
+def _payload(region: str, step: int) -> Dict:
+    return {
+        "region": region,
+        "step": step,
+        "assemblies": [{"assembly_id": f"{region}:0", "output": 0.01}],
+    }
+
+
+def test_writer_records_manifest_entries(holding_bin_dir: Path, episode_id: int) -> None:
+    writer = HoldingBinWriter(holding_bin_dir)
+    writer.write_dump(episode_id=episode_id, region="STN", role="baseline", step=950, payload=_payload("STN", 950))
+    writer.write_dump(episode_id=episode_id, region="stn", role="post", step=1050, payload=_payload("stn", 1050), tag="a")
+
+    entries = {e.filename: e for e in HoldingBinManifest(holding_bin_dir).entries()}
+
+    post = entries[f"ep{episode_id}__stn__post__step1050__taga.json"]
+    assert post.name_episode_id == episode_id
+    assert post.region == "stn"
+    assert post.step == 1050
+    assert post.role == "post"
+    assert post.tag == "a"
+
+    baseline = entries[f"ep{episode_id}__stn__baseline__step950.json"]
+    assert baseline.region == "stn"
+    assert baseline.role == "baseline"
+
+
+def test_refresh_reopens_only_changed_dumps(
+    holding_bin_dir: Path,
+    episode_id: int,
+    fake_episode_bounds: Dict[str, int],
+) -> None:
+    writer = HoldingBinWriter(holding_bin_dir)
+    writer.write_dump(episode_id=episode_id, region="stn", role="baseline", step=950, payload=_payload("stn", 950))
+    post = writer.write_dump(episode_id=episode_id, region="stn", role="post", step=1050, payload=_payload("stn", 1050))
+
+    # Foreign dump (no ep prefix) discovered by revalidation
+    (holding_bin_dir / "gpi_a.json").write_text(
+        json.dumps({**_payload("gpi", 960), "episode_id": episode_id}), encoding="utf-8"
+    )
+    (holding_bin_dir / "gpi_b.json").write_text(
+        json.dumps({**_payload("gpi", 1040), "episode_id": episode_id}), encoding="utf-8"
+    )
+
+    builder = RegionDumpIndexBuilder(holding_bin_dir)
+    index = builder.build(episode_id=episode_id, episode_bounds=fake_episode_bounds)
+    assert sorted(index.pairs) == ["gpi", "stn"]
+    assert index.get("gpi").baseline.name == "gpi_a.json"
+
+    # Rewrite post dump in place: manifest must pick up the new step
+    post.write_text(json.dumps(_payload("stn", 1070)), encoding="utf-8")
+    st = post.stat()
+    os.utime(post, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    before = {e.filename: e for e in HoldingBinManifest(holding_bin_dir).entries()}
+    index = builder.build(episode_id=episode_id, episode_bounds=fake_episode_bounds)
+    after = {e.filename: e for e in HoldingBinManifest(holding_bin_dir).entries()}
+
+    assert index.get("stn").post_step == 1070
+    assert after[post.name].content_hash != before[post.name].content_hash
+    assert after["gpi_a.json"] == before["gpi_a.json"]
+
+    # Deleted dumps drop out of the manifest
+    (holding_bin_dir / "gpi_b.json").unlink()
+    HoldingBinManifest(holding_bin_dir).refresh()
+    names = {e.filename for e in HoldingBinManifest(holding_bin_dir).entries()}
+    assert "gpi_b.json" not in names
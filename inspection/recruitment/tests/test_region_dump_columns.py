@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from inspection.recruitment.holding_bin_writer import HoldingBinWriter
+from inspection.recruitment.recruitment_signature_builder import RecruitmentSignatureBuilder
+from inspection.recruitment.recruitment_stats_from_dump import (
+    fraction_active,
+    fraction_active_columns,
+    tier_counts,
+    tier_counts_columns,
+    top_k_assemblies,
+    top_k_columns,
+    total_mass,
+    total_mass_columns,
+)
+from inspection.recruitment.region_dump_columns import columns_from_payload, load_region_dump
+from inspection.recruitment.region_dump_index_builder import RegionDumpIndexBuilder
+
+
+def _rows(region: str, scale: float):
+    outputs = [0.0, 0.3 * scale, 0.01, 0.06, 0.3 * scale, 0.2, 0.0]
+    return [
+        {
+            "assembly_id": f"{region}:{i}",
+            "population": "L5" if i % 2 else "L23",
+            "activity": out * 2.0,
+            "output": out,
+        }
+        for i, out in enumerate(outputs)
+    ]
+
+
+def _write_binary(writer: HoldingBinWriter, *, episode_id: int, region: str, role: str, step: int, scale: float) -> Path:
+    rows = _rows(region, scale)
+    return writer.write_region_dump(
+        episode_id=episode_id,
+        region=region,
+        role=role,
+        step=step,
+        assembly_ids=[r["assembly_id"] for r in rows],
+        populations=[r["population"] for r in rows],
+        activity=[r["activity"] for r in rows],
+        output=[r["output"] for r in rows],
+    )
+
+
+def test_column_stats_match_row_stats() -> None:
+    rows = _rows("stn", 1.0)
+    cols = columns_from_payload({"region": "stn", "step": 1, "assemblies": rows})
+
+    assert fraction_active_columns(cols.output) == fraction_active(rows)
+    assert total_mass_columns(cols.output) == total_mass(rows)
+    assert tier_counts_columns(cols.output) == tier_counts(rows)
+    assert top_k_columns(cols.assembly_ids, cols.output, 3) == top_k_assemblies(rows, 3)
+
+
+def test_binary_dump_roundtrips_and_exports_json(holding_bin_dir: Path, episode_id: int) -> None:
+    writer = HoldingBinWriter(holding_bin_dir)
+    path = _write_binary(writer, episode_id=episode_id, region="stn", role="baseline", step=950, scale=1.0)
+
+    with load_region_dump(path) as cols:
+        assert cols.region == "stn"
+        assert cols.step == 950
+        assert cols.episode_id == episode_id
+        assert cols.to_payload()["assemblies"] == _rows("stn", 1.0)
+
+        # JSON export reloads to the same columns
+        exported = holding_bin_dir / "export.json"
+        exported.write_text(json.dumps(cols.to_payload()), encoding="utf-8")
+        again = load_region_dump(exported)
+        assert list(again.output) == list(cols.output)
+        assert again.assembly_ids == cols.assembly_ids
+
+    # Unmapped on exit; in-memory columns are unaffected by close()
+    with pytest.raises(ValueError):
+        cols.output[0]
+    again.close()
+    assert again.output[1] == 0.3
+
+
+def test_binary_and_json_dumps_give_identical_signatures(
+    tmp_path: Path,
+    episode_id: int,
+    fake_episode_bounds: Dict[str, int],
+) -> None:
+    bin_dir = tmp_path / "bin"
+    json_dir = tmp_path / "json"
+    bin_writer = HoldingBinWriter(bin_dir)
+    json_writer = HoldingBinWriter(json_dir)
+
+    for role, step, scale in (("baseline", 950, 0.5), ("post", 1050, 1.0)):
+        _write_binary(bin_writer, episode_id=episode_id, region="stn", role=role, step=step, scale=scale)
+        json_writer.write_dump(
+            episode_id=episode_id,
+            region="stn",
+            role=role,
+            step=step,
+            payload={"region": "stn", "step": step, "assemblies": _rows("stn", scale)},
+        )
+
+    signatures = []
+    for root in (bin_dir, json_dir):
+        pair = RegionDumpIndexBuilder(root).build(episode_id=episode_id, episode_bounds=fake_episode_bounds).get("stn")
+        signatures.append(RecruitmentSignatureBuilder(top_k=3).build(
+            episode_id=episode_id,
+            region="stn",
+            baseline_dump=pair.baseline,
+            post_dump=pair.post,
+            episode_bounds=fake_episode_bounds,
+            salience_summary={},
+            urgency_summary={},
+            value_summary={},
+            decision_summary=None,
+        ))
+
+    assert signatures[0] == signatures[1]
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import dataclasses
 from collections import defaultdict
 from typing import Iterable
 
+from learning.inputs.bundle_hash_tree import bundle_hash_tree
+from learning.inputs.learning_input_bundle import LearningInputBundle
+from learning.diffing.learning_bundle_diff_builder import build_learning_bundle_diff
 from learning.diffing.learning_bundle_diff_types import LearningBundleDiff
 from learning.diffing.learning_bundle_diff_aggregate import LearningBundleDiffAggregate
 
@@ -43,3 +47,22 @@ def aggregate_learning_bundle_diffs(
         structural_signature_add_counts=dict(structural_add),
         structural_signature_remove_counts=dict(structural_remove),
     )
+
+
+def aggregate_against_baseline(
+    baseline: LearningInputBundle,
+    bundles: Iterable[LearningInputBundle],
+) -> LearningBundleDiffAggregate:
+    """
+    Aggregate diffs of many bundles against one shared baseline.
+
+    The baseline's hash tree is resolved once; each diff then only
+    visits buckets that differ from it.
+    """
+    tree = bundle_hash_tree(baseline)
+    if baseline.hash_tree is None:
+        baseline = dataclasses.replace(baseline, hash_tree=tree)
+
+    return aggregate_learning_bundle_diffs(
+        build_learning_bundle_diff(baseline, bundle) for bundle in bundles
+    )
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
 
 from learning.diffing.learning_bundle_diff import LearningBundleDiff
 from learning.diffing.learning_bundle_diff_types import SemanticDiff, StructuralPatternDiff
+from memory.inspection.exporters.streaming import write_jsonl
 
 
 def serialize_diff(diff: LearningBundleDiff) -> Dict[str, Any]:
@@ -35,3 +37,51 @@ def serialize_diff(diff: LearningBundleDiff) -> Dict[str, Any]:
             }
 
     return out
+
+
+def iter_diff_records(diff: LearningBundleDiff) -> Iterator[Dict[str, Any]]:
+    """
+    Flat, per-item records for a diff (JSON Lines friendly).
+
+    First record is a header; then one record per term / signature,
+    in the same order serialize_diff uses. Nothing is materialized.
+    """
+    sem: Optional[SemanticDiff] = diff.summary.get("semantic") if diff.summary else None
+    struct: Optional[StructuralPatternDiff] = diff.summary.get("structural") if diff.summary else None
+
+    yield {
+        "kind": "header",
+        "has_difference": diff.has_difference,
+        "semantic": sem is not None,
+        "structural": struct is not None,
+    }
+
+    if sem:
+        for term in sem.added_terms:
+            yield {"kind": "semantic_added", "term": term}
+        for term in sem.removed_terms:
+            yield {"kind": "semantic_removed", "term": term}
+        for term, (before, after) in sem.changed_activations.items():
+            yield {"kind": "semantic_changed", "term": term, "before": before, "after": after}
+
+    if struct:
+        for sig in struct.added_signatures:
+            yield {"kind": "structural_added", "signature": sig}
+        for sig in struct.removed_signatures:
+            yield {"kind": "structural_removed", "signature": sig}
+        for sig, delta in struct.count_deltas.items():
+            yield {"kind": "structural_count_delta", "signature": sig, "delta": delta}
+
+
+def write_diff_jsonl(
+    diff: LearningBundleDiff,
+    path: str | Path,
+    *,
+    compression: Optional[str] = "auto",
+) -> int:
+    """
+    Stream a diff to a (possibly compressed) JSON Lines file.
+
+    Returns the number of records written.
+    """
+    return write_jsonl(iter_diff_records(diff), path, compression=compression)
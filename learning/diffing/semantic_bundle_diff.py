@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Dict, Tuple
 
+from learning.inputs.bundle_hash_tree import bundle_hash_tree
 from learning.inputs.learning_input_bundle import LearningInputBundle
 from learning.diffing.learning_bundle_diff_types import SemanticDiff
 
@@ -10,29 +11,35 @@ def diff_semantics(
     a: LearningInputBundle,
     b: LearningInputBundle,
 ) -> SemanticDiff:
-    a_terms = a.semantic_ids
-    b_terms = b.semantic_ids
+    """
+    Semantic diff via the bundles' hash trees.
 
-    added = tuple(sorted(set(b_terms) - set(a_terms)))
-    removed = tuple(sorted(set(a_terms) - set(b_terms)))
+    Only terms in buckets whose digests differ are compared.
+    """
+    delta = bundle_hash_tree(a).semantic.diff(bundle_hash_tree(b).semantic)
 
-    a_latest: Dict[str, float] = {}
-    for _, items in a.semantic_activation_snapshots:
-        for term, val in items:
-            a_latest[term] = val
+    added = []
+    removed = []
+    changed: Dict[str, Tuple[float, float]] = {}
 
-    b_latest: Dict[str, float] = {}
-    for _, items in b.semantic_activation_snapshots:
-        for term, val in items:
-            b_latest[term] = val
+    for term, (observed, _) in delta.added.items():
+        if observed:
+            added.append(term)
 
-    changed: Dict[str, Tuple[float, float]] = {}
-    for term in set(a_latest.keys()) & set(b_latest.keys()):
-        if a_latest[term] != b_latest[term]:
-            changed[term] = (a_latest[term], b_latest[term])
+    for term, (observed, _) in delta.removed.items():
+        if observed:
+            removed.append(term)
+
+    for term, ((a_observed, a_latest), (b_observed, b_latest)) in delta.changed.items():
+        if b_observed and not a_observed:
+            added.append(term)
+        elif a_observed and not b_observed:
+            removed.append(term)
+        if a_latest is not None and b_latest is not None and a_latest != b_latest:
+            changed[term] = (a_latest, b_latest)
 
     return SemanticDiff(
-        added_terms=added,
-        removed_terms=removed,
+        added_terms=tuple(sorted(added)),
+        removed_terms=tuple(sorted(removed)),
         changed_activations=changed,
     )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Dict, Tuple
 
+from learning.inputs.bundle_hash_tree import bundle_hash_tree
 from learning.inputs.learning_input_bundle import LearningInputBundle
 from learning.diffing.learning_bundle_diff_types import StructuralPatternDiff
 
@@ -10,20 +11,20 @@ def diff_structural_patterns(
     a: LearningInputBundle,
     b: LearningInputBundle,
 ) -> StructuralPatternDiff:
-    a_patterns = dict(a.pattern_counts)
-    b_patterns = dict(b.pattern_counts)
+    """
+    Structural diff via the bundles' hash trees.
 
-    a_keys = set(a_patterns.keys())
-    b_keys = set(b_patterns.keys())
+    Only signatures in buckets whose digests differ are compared.
+    """
+    delta = bundle_hash_tree(a).patterns.diff(bundle_hash_tree(b).patterns)
 
-    added = tuple(sorted(b_keys - a_keys))
-    removed = tuple(sorted(a_keys - b_keys))
+    added = tuple(sorted(delta.added))
+    removed = tuple(sorted(delta.removed))
 
     deltas: Dict[Tuple, int] = {}
-    for key in a_keys & b_keys:
-        delta = b_patterns[key] - a_patterns[key]
-        if delta != 0:
-            deltas[key] = delta
+    for key, (before, after) in delta.changed.items():
+        if after - before != 0:
+            deltas[key] = after - before
 
     return StructuralPatternDiff(
         added_signatures=added,
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import random
+
+from learning.inputs.learning_pipeline_input_adapter import LearningPipelineInputAdapter
+from learning.inputs.bundle_hash_tree import build_bundle_hash_tree
+from learning.diffing.learning_bundle_diff import diff_learning_bundles
+from learning.diffing.learning_bundle_diff_aggregator import (
+    aggregate_against_baseline,
+    aggregate_learning_bundle_diffs,
+)
+
+from memory.semantic_activation.semantic_activation_record import SemanticActivationRecord
+from memory.proto_structural.pattern_record import PatternRecord
+from memory.proto_structural.episode_signature import EpisodeSignature
+
+
+def _bundle(rng: random.Random, replay_id: str):
+    adapter = LearningPipelineInputAdapter()
+    records = [
+        SemanticActivationRecord(
+            activations={f"sem:{rng.randrange(400)}": round(rng.random(), 2) for _ in range(50)},
+            snapshot_index=i,
+        )
+        for i in range(4)
+    ]
+    counts = {
+        EpisodeSignature(
+            length_steps=rng.randrange(6),
+            event_count=rng.randrange(3),
+            event_types=frozenset({"open", "close"}),
+            region_ids=frozenset({"GPi"}),
+            transition_counts=(),
+        ): rng.randrange(1, 4)
+        for _ in range(20)
+    }
+    return adapter.from_inspection_surface(
+        replay_id=replay_id,
+        semantic_activation_records=records,
+        pattern_record=PatternRecord(pattern_counts=counts),
+    )
+
+
+def _brute_force(a, b):
+    a_latest = {t: v for _, items in a.semantic_activation_snapshots for t, v in items}
+    b_latest = {t: v for _, items in b.semantic_activation_snapshots for t, v in items}
+    a_counts = dict(a.pattern_counts)
+    b_counts = dict(b.pattern_counts)
+    return {
+        "added_terms": tuple(sorted(set(b.semantic_ids) - set(a.semantic_ids))),
+        "removed_terms": tuple(sorted(set(a.semantic_ids) - set(b.semantic_ids))),
+        "changed": {
+            t: (a_latest[t], b_latest[t])
+            for t in set(a_latest) & set(b_latest)
+            if a_latest[t] != b_latest[t]
+        },
+        "added_sigs": tuple(sorted(set(b_counts) - set(a_counts))),
+        "removed_sigs": tuple(sorted(set(a_counts) - set(b_counts))),
+        "deltas": {
+            k: b_counts[k] - a_counts[k]
+            for k in set(a_counts) & set(b_counts)
+            if b_counts[k] != a_counts[k]
+        },
+    }
+
+
+def test_hash_tree_diff_matches_full_walk():
+    rng = random.Random(7)
+    for trial in range(20):
+        a = _bundle(rng, "replay:a")
+        b = _bundle(rng, "replay:b")
+
+        diff = diff_learning_bundles(a, b)
+        sem = diff.summary["semantic"]
+        struct = diff.summary["structural"]
+        expected = _brute_force(a, b)
+
+        assert sem.added_terms == expected["added_terms"]
+        assert sem.removed_terms == expected["removed_terms"]
+        assert sem.changed_activations == expected["changed"]
+        assert struct.added_signatures == expected["added_sigs"]
+        assert struct.removed_signatures == expected["removed_sigs"]
+        assert struct.count_deltas == expected["deltas"]
+
+
+def test_hash_tree_is_built_with_bundle_and_content_addressed():
+    a = _bundle(random.Random(1), "replay:x")
+    b = _bundle(random.Random(1), "replay:x")
+
+    assert a.hash_tree is not None
+    assert a.hash_tree.root == b.hash_tree.root
+    assert a.hash_tree.semantic.changed_buckets(b.hash_tree.semantic) == []
+    assert build_bundle_hash_tree(a).root == a.hash_tree.root
+    assert not diff_learning_bundles(a, b).has_difference
+
+
+def test_aggregate_against_baseline_matches_pairwise_aggregate():
+    rng = random.Random(3)
+    baseline = _bundle(rng, "replay:base")
+    bundles = [_bundle(rng, f"replay:{i}") for i in range(10)]
+
+    expected = aggregate_learning_bundle_diffs(
+        diff_learning_bundles(baseline, b) for b in bundles
+    )
+    assert aggregate_against_baseline(baseline, bundles) == expected
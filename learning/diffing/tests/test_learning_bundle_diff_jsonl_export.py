@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from learning.inputs.learning_pipeline_input_adapter import LearningPipelineInputAdapter
+from learning.diffing.learning_bundle_diff import diff_learning_bundles
+from learning.diffing.learning_bundle_diff_serializer import (
+    iter_diff_records,
+    serialize_diff,
+    write_diff_jsonl,
+)
+from memory.inspection.exporters.streaming import read_jsonl
+
+from memory.semantic_activation.semantic_activation_record import SemanticActivationRecord
+from memory.proto_structural.pattern_record import PatternRecord
+from memory.proto_structural.episode_signature import EpisodeSignature
+
+
+def test_learning_bundle_diff_jsonl_export_matches_serializer(tmp_path):
+    adapter = LearningPipelineInputAdapter()
+
+    sig = EpisodeSignature(
+        length_steps=3,
+        event_count=1,
+        event_types=frozenset({"close"}),
+        region_ids=frozenset({"GPi"}),
+        transition_counts=(),
+    )
+
+    bundle_a = adapter.from_inspection_surface(
+        replay_id="replay:jsonl",
+        semantic_activation_records=[
+            SemanticActivationRecord(activations={"sem:a": 0.1, "sem:b": 0.3}, snapshot_index=1),
+        ],
+        pattern_record=PatternRecord(pattern_counts={sig: 1}),
+    )
+    bundle_b = adapter.from_inspection_surface(
+        replay_id="replay:jsonl",
+        semantic_activation_records=[
+            SemanticActivationRecord(activations={"sem:a": 0.2, "sem:c": 0.4}, snapshot_index=2),
+        ],
+        pattern_record=PatternRecord(pattern_counts={sig: 3}),
+    )
+
+    diff = diff_learning_bundles(bundle_a, bundle_b)
+    path = tmp_path / "diff.jsonl.gz"
+
+    count = write_diff_jsonl(diff, path)
+    rows = list(read_jsonl(path))
+
+    assert count == len(rows) == len(list(iter_diff_records(diff)))
+    assert rows[0]["kind"] == "header"
+    assert rows[0]["has_difference"] is True
+
+    ser = serialize_diff(diff)
+    assert [r["term"] for r in rows if r["kind"] == "semantic_added"] == ser["semantic"]["added_terms"]
+    assert [r["term"] for r in rows if r["kind"] == "semantic_removed"] == ser["semantic"]["removed_terms"]
+    assert {
+        r["term"]: {"before": r["before"], "after": r["after"]}
+        for r in rows if r["kind"] == "semantic_changed"
+    } == ser["semantic"]["changed_activations"]
+    assert [r["delta"] for r in rows if r["kind"] == "structural_count_delta"] == list(
+        ser["structural"]["count_deltas"].values()
+    )
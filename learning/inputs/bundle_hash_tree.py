@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional
+
+from memory.inspection.diffing.hash_tree import KeyedHashTree, digest_of
+
+if TYPE_CHECKING:
+    from learning.inputs.learning_input_bundle import LearningInputBundle
+
+
+@dataclass(frozen=True)
+class BundleHashTree:
+    """
+    Content-hash summary of a LearningInputBundle.
+
+    Sections:
+    - semantic: term -> (observed in semantic_ids, latest activation)
+    - patterns: signature tuple -> count
+    - meta: digest of the remaining fields (identity, episodes, tags)
+
+    Built once with the bundle; diffs compare sections bucket-wise
+    and only open buckets whose digests differ.
+
+    CONTRACT:
+    - Derived from the bundle only
+    - Deterministic across processes
+    - No authority
+    """
+
+    root: bytes
+    semantic: KeyedHashTree
+    patterns: KeyedHashTree
+    meta: bytes
+
+
+def build_bundle_hash_tree(bundle: "LearningInputBundle") -> BundleHashTree:
+    observed = set(bundle.semantic_ids)
+
+    # Latest activation per term (later snapshots win; snapshots are sorted)
+    latest: Dict[str, float] = {}
+    for _, items in bundle.semantic_activation_snapshots:
+        for term, val in items:
+            latest[term] = val
+
+    terms = sorted(observed | set(latest))
+    semantic = KeyedHashTree.build(
+        (term, (term in observed, latest.get(term))) for term in terms
+    )
+    patterns = KeyedHashTree.build(bundle.pattern_counts)
+
+    meta = digest_of((
+        bundle.replay_id,
+        bundle.episode_ids,
+        bundle.semantic_ids,
+        bundle.semantic_episode_pairs,
+        bundle.tags,
+    ))
+
+    return BundleHashTree(
+        root=digest_of((semantic.digest, patterns.digest, meta)),
+        semantic=semantic,
+        patterns=patterns,
+        meta=meta,
+    )
+
+
+def bundle_hash_tree(bundle: "LearningInputBundle") -> BundleHashTree:
+    """
+    The bundle's hash tree (built by LearningInputBuilder), or a
+    freshly computed one for bundles constructed directly.
+    """
+    tree: Optional[BundleHashTree] = bundle.hash_tree
+    return tree if tree is not None else build_bundle_hash_tree(bundle)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import dataclasses
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
@@ -9,6 +10,7 @@ from memory.semantic_activation.semantic_activation_record import SemanticActiva
 from memory.proto_structural.pattern_record import PatternRecord
 from memory.proto_structural.episode_signature import EpisodeSignature
 
+from learning.inputs.bundle_hash_tree import build_bundle_hash_tree
 from learning.inputs.learning_input_bundle import LearningInputBundle
 
 
@@ -105,7 +107,7 @@ class LearningInputBuilder:
                 self._validate_tag_value(value)
             safe_tags = tuple(sorted(tags.items()))
 
-        return LearningInputBundle(
+        bundle = LearningInputBundle(
             replay_id=str(replay_id),
             episode_ids=episode_ids,
             semantic_ids=semantic_ids,
@@ -115,6 +117,11 @@ class LearningInputBuilder:
             tags=safe_tags,
         )
 
+        # --------------------------------------------------
+        # Content-hash summary (diffs skip identical subtrees)
+        # --------------------------------------------------
+        return dataclasses.replace(bundle, hash_tree=build_bundle_hash_tree(bundle))
+
     @staticmethod
     def _validate_tag_value(value: Any) -> None:
         """
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Tuple, Any
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+if TYPE_CHECKING:
+    from learning.inputs.bundle_hash_tree import BundleHashTree
 
 
 @dataclass(frozen=True)
@@ -46,3 +49,7 @@ class LearningInputBundle:
 
     # Optional free-form tags (immutable, hash-safe)
     tags: Tuple[Tuple[str, Any], ...] = field(default_factory=tuple)
+
+    # Derived content-hash summary (set by LearningInputBuilder; not
+    # part of bundle identity)
+    hash_tree: Optional["BundleHashTree"] = field(default=None, compare=False, repr=False)
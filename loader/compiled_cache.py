@@ -0,0 +1,64 @@
+# loader/compiled_cache.py
+from __future__ import annotations
+
+import contextlib
+import io
+import threading
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from loader.loader import NeuralFrameworkLoader
+
+
+# (resolved root, expression, state, compound) -> compiled brain
+_CacheKey = Tuple[str, str, str, str]
+
+_cache: Dict[_CacheKey, Dict[str, Any]] = {}
+_lock = threading.Lock()
+
+
+def compiled_brain(
+    root: str | Path,
+    *,
+    expression_profile: str = "minimal",
+    state_profile: str = "awake",
+    compound_profile: str = "experimental",
+) -> Dict[str, Any]:
+    """
+    Compiled brain for `root` and the given profiles, loaded once per
+    process.
+
+    CONTRACT:
+    - The first call loads and compiles (compile's debug output is
+      suppressed); later calls reuse that result
+    - Each call returns a new top-level dict, so callers may add or
+      replace keys (e.g. "decision_latch"); nested definitions are
+      shared and must be treated as read-only
+    - Files changed on disk are not seen until clear_compiled_cache()
+    """
+    key = (
+        str(Path(root).resolve()),
+        expression_profile,
+        state_profile,
+        compound_profile,
+    )
+    with _lock:
+        brain = _cache.get(key)
+        if brain is None:
+            loader = NeuralFrameworkLoader(key[0])
+            with contextlib.redirect_stdout(io.StringIO()):
+                loader.load_neuron_bases()
+                loader.load_regions()
+                loader.load_profiles()
+                brain = loader.compile(
+                    expression_profile=expression_profile,
+                    state_profile=state_profile,
+                    compound_profile=compound_profile,
+                )
+            _cache[key] = brain
+    return dict(brain)
+
+
+def clear_compiled_cache() -> None:
+    with _lock:
+        _cache.clear()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import List, Iterable
+import heapq
+import math
+from typing import Dict, List, Iterable, Optional, Tuple
 
 from memory.attention.attention_item import AttentionItem
 from memory.attention.attention_policy import AttentionPolicy
@@ -16,6 +18,14 @@ class AttentionField:
     - Normalizes gains
     - Accepts read-only ingestion
     - No interpretation
+
+    LAZY DECAY:
+    - Items are stored with their original gain and created_step
+    - Decay is applied from that base on read (policy.decay)
+    - Suppression is scheduled in a min-heap keyed on the step at
+      which the item first crosses the policy threshold
+    - step() cost depends on the number of items suppressed,
+      not on the number of items held
     """
 
     def __init__(
@@ -24,13 +34,25 @@ class AttentionField:
         policy: AttentionPolicy,
     ) -> None:
         self._policy = policy
-        self._items: List[AttentionItem] = []
+
+        # seq -> base item (insertion order preserved)
+        self._live: Dict[int, AttentionItem] = {}
+        # (suppression step, seq)
+        self._expiry: List[Tuple[float, int]] = []
+        # Items added since the last step (raw until stepped)
+        self._pending: List[AttentionItem] = []
+
+        self._seq = 0
+        self._now: Optional[int] = None
+        self._view: Optional[List[AttentionItem]] = None
 
     def items(self) -> List[AttentionItem]:
-        return list(self._items)
+        if self._view is None:
+            self._view = self._materialize()
+        return self._view + self._pending
 
     def add(self, item: AttentionItem) -> None:
-        self._items.append(item)
+        self._pending.append(item)
 
     def ingest(self, items: Iterable[AttentionItem]) -> None:
         """
@@ -42,27 +64,41 @@ class AttentionField:
         - No suppression
         - No normalization
         """
-        for item in items:
-            self._items.append(item)
+        self._pending.extend(items)
 
     def step(self, *, current_step: int) -> None:
         # --------------------------------------------------
-        # 1. decay
+        # 1. admit pending items (schedule suppression)
         # --------------------------------------------------
-        decayed = [
-            self._policy.decay(item, current_step=current_step)
-            for item in self._items
-        ]
+        for item in self._pending:
+            seq = self._seq
+            self._seq += 1
+            self._live[seq] = item
+            expires = item.created_step + self._policy.suppression_age(item)
+            if expires != math.inf:
+                heapq.heappush(self._expiry, (expires, seq))
+        self._pending = []
 
         # --------------------------------------------------
-        # 2. suppress
+        # 2. suppress items whose threshold crossing has come due
         # --------------------------------------------------
-        kept = [
-            item for item in decayed
-            if not self._policy.should_suppress(item)
-        ]
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= current_step:
+            _, seq = heapq.heappop(expiry)
+            del self._live[seq]
 
         # --------------------------------------------------
-        # 3. normalize
+        # 3. decay + normalize are applied lazily on read
         # --------------------------------------------------
-        self._items = self._policy.normalize(kept)
+        self._now = current_step
+        self._view = None
+
+    def _materialize(self) -> List[AttentionItem]:
+        if self._now is None:
+            return list(self._live.values())
+
+        decayed = [
+            self._policy.decay(item, current_step=self._now)
+            for item in self._live.values()
+        ]
+        return self._policy.normalize(decayed)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from typing import List
 
 from memory.attention.attention_item import AttentionItem
@@ -26,6 +27,10 @@ class AttentionPolicy:
         self._min_gain = min_gain
         self._max_gain = max_gain
 
+    @property
+    def min_gain(self) -> float:
+        return self._min_gain
+
     def decay(
         self,
         item: AttentionItem,
@@ -46,6 +51,36 @@ class AttentionPolicy:
     def should_suppress(self, item: AttentionItem) -> bool:
         return item.gain <= self._min_gain
 
+    def suppression_age(self, item: AttentionItem) -> float:
+        """
+        First age (steps after item.created_step) at which the item,
+        decayed from its original gain, is suppressed.
+
+        Returns math.inf if the item is never suppressed.
+        Lets AttentionField schedule suppression instead of polling.
+        """
+
+        def suppressed(age: int) -> bool:
+            decayed = self.decay(item, current_step=item.created_step + age)
+            return self.should_suppress(decayed)
+
+        if suppressed(0):
+            return 0
+
+        rate = self._decay_rate
+        if rate >= 1.0:
+            return math.inf
+        if rate <= 0.0 or self._min_gain <= 0.0:
+            return 1 if suppressed(1) else math.inf
+
+        # Closed form, then settle against decay() for float edges
+        age = max(1, math.ceil(math.log(self._min_gain / item.gain) / math.log(rate)))
+        while age > 1 and suppressed(age - 1):
+            age -= 1
+        while not suppressed(age):
+            age += 1
+        return age
+
     def normalize(self, items: List[AttentionItem]) -> List[AttentionItem]:
         if not items:
             return []
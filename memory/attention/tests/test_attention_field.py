@@ -35,3 +35,27 @@ def test_attention_field_suppresses_weak_items() -> None:
     field.step(current_step=1)
 
     assert len(field.items()) == 0
+
+
+def test_attention_field_decays_lazily_from_base() -> None:
+    policy = AttentionPolicy(
+        decay_rate=0.5,
+        min_gain=0.1,
+        max_gain=1.0,
+    )
+
+    field = AttentionField(policy=policy)
+    field.add(AttentionItem("old", 1.0, 0))
+    field.add(AttentionItem("new", 1.0, 2))
+
+    for step in range(1, 4):
+        field.step(current_step=step)
+
+    # Decay is measured from the stored base, not compounded per step
+    gains = {i.key: i.gain for i in field.items()}
+    assert abs(gains["old"] - 0.125 / 0.625) < 1e-12
+    assert abs(gains["new"] - 0.5 / 0.625) < 1e-12
+
+    # 1.0 * 0.5**4 <= 0.1 -> "old" suppressed at step 4
+    field.step(current_step=4)
+    assert [i.key for i in field.items()] == ["new"]
@@ -0,0 +1,6 @@
+from memory.decay.decaying_map import DecayingMap, linear_efolds
+
+__all__ = [
+    "DecayingMap",
+    "linear_efolds",
+]
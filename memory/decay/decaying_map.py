@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Dict, Generic, Hashable, Iterator, List, Tuple, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+
+# Clock value (in e-folds) past which stamps are rebased toward 0
+_REBASE_AT = 1024.0
+
+
+def linear_efolds(dt: float, tau: float, steps: int = 1) -> float:
+    """
+    E-folds of `steps` per-step factors (1 - dt/tau) (inf once the
+    factor reaches 0: everything is gone).
+    """
+    d = float(dt) / float(tau)
+    if d >= 1.0:
+        return math.inf
+    return -math.log1p(-d) * int(steps)
+
+
+class DecayingMap(Generic[K]):
+    """
+    Keyed values that decay exponentially on a shared clock.
+
+    CONTRACT:
+    - The clock counts e-folds; a value written at clock c0 reads
+      value * exp(-(clock - c0)). Callers convert their decay law
+      (exp(-dt/tau), or per-step (1 - dt/tau); see linear_efolds)
+      into e-folds when they advance the clock
+    - Writes stamp the value with the current clock
+    - An entry expires once |value| falls below epsilon; the crossing
+      is projected at write time and kept in a min-heap, so advance()
+      costs O(expired keys), not O(live keys)
+    - Values written below epsilon stay readable until the next
+      advance(), as with per-step decay-then-prune
+    - Iteration and dump() follow insertion order
+    """
+
+    def __init__(self, *, epsilon: float = 1e-6) -> None:
+        if epsilon <= 0.0:
+            raise ValueError("epsilon must be > 0")
+        self.epsilon = float(epsilon)
+
+        self._clock = 0.0
+        # key -> (value at stamp, stamp, seq)
+        self._entries: Dict[K, Tuple[float, float, int]] = {}
+        # (death clock, seq, key) — stale entries skipped on pop
+        self._expiry: List[Tuple[float, int, K]] = []
+        self._seq = 0
+
+    # --------------------------------------------------
+    # Read access
+    # --------------------------------------------------
+
+    @property
+    def clock(self) -> float:
+        return self._clock
+
+    def get(self, key: K, default: float = 0.0) -> float:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        value, stamp, _ = entry
+        if stamp == self._clock:
+            return value
+        return value * math.exp(stamp - self._clock)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._entries)
+
+    def keys(self) -> List[K]:
+        return list(self._entries)
+
+    def items(self) -> List[Tuple[K, float]]:
+        return [(k, self.get(k)) for k in self._entries]
+
+    def dump(self) -> Dict[K, float]:
+        return {k: self.get(k) for k in self._entries}
+
+    # --------------------------------------------------
+    # Write access
+    # --------------------------------------------------
+
+    def set(self, key: K, value: float) -> None:
+        value = float(value)
+        seq = self._seq
+        self._seq += 1
+
+        # Re-stamping an existing key keeps its insertion position
+        self._entries[key] = (value, self._clock, seq)
+
+        magnitude = abs(value)
+        if magnitude > 0.0:
+            death = self._clock + math.log(magnitude / self.epsilon)
+        else:
+            death = -math.inf
+        heapq.heappush(self._expiry, (death, seq, key))
+
+        # Rewrites leave stale heap entries behind; compact when they dominate
+        if len(self._expiry) > 2 * len(self._entries) + 64:
+            self._compact()
+
+    def pop(self, key: K, default: float = 0.0) -> float:
+        if key not in self._entries:
+            return default
+        value = self.get(key)
+        del self._entries[key]
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._expiry.clear()
+
+    def replace(self, values: Dict[K, float]) -> None:
+        """
+        Replace the whole map (e.g. after an external map rewrite).
+        """
+        self.clear()
+        for k, v in values.items():
+            self.set(k, v)
+
+    # --------------------------------------------------
+    # Clock
+    # --------------------------------------------------
+
+    def advance(self, efolds: float) -> List[K]:
+        """
+        Move the clock and drop entries that fell below epsilon.
+        Returns the expired keys.
+        """
+        if efolds < 0.0:
+            raise ValueError("efolds must be >= 0")
+        if efolds == math.inf:
+            expired = list(self._entries)
+            self.clear()
+            return expired
+
+        self._clock += efolds
+
+        expired: List[K] = []
+        heap = self._expiry
+        entries = self._entries
+        while heap and heap[0][0] <= self._clock:
+            _, seq, key = heapq.heappop(heap)
+            entry = entries.get(key)
+            if entry is not None and entry[2] == seq:
+                del entries[key]
+                expired.append(key)
+
+        if self._clock > _REBASE_AT:
+            self._rebase()
+
+        return expired
+
+    # --------------------------------------------------
+    # Maintenance
+    # --------------------------------------------------
+
+    def _compact(self) -> None:
+        entries = self._entries
+        self._expiry = [
+            item for item in self._expiry
+            if (entry := entries.get(item[2])) is not None and entry[2] == item[1]
+        ]
+        heapq.heapify(self._expiry)
+
+    def _rebase(self) -> None:
+        # Live entries are at most log(max|value| / epsilon) e-folds old;
+        # shifting every stamp keeps exp(stamp - clock) well conditioned.
+        shift = self._clock
+        self._clock = 0.0
+        self._entries = {
+            k: (value, stamp - shift, seq)
+            for k, (value, stamp, seq) in self._entries.items()
+        }
+        self._expiry = [(death - shift, seq, k) for death, seq, k in self._expiry]
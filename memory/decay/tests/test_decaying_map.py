@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from memory.decay import DecayingMap, linear_efolds
+
+
+def test_matches_per_step_decay_and_prune() -> None:
+    rng = random.Random(7)
+    dt, tau, eps = 0.01, 0.2, 1e-4
+
+    lazy: DecayingMap[str] = DecayingMap(epsilon=eps)
+    eager = {}
+
+    for step in range(600):
+        if step < 250 and step % 3 == 0:
+            key = f"k{rng.randrange(12)}"
+            value = rng.uniform(-0.5, 0.5)
+            lazy.set(key, lazy.get(key) + value)
+            eager[key] = eager.get(key, 0.0) + value
+
+        lazy.advance(linear_efolds(dt, tau))
+        for key in list(eager):
+            v = eager[key] * (1.0 - dt / tau)
+            if abs(v) < eps:
+                del eager[key]
+            else:
+                eager[key] = v
+
+        assert lazy.keys() == list(eager)
+        for key, value in eager.items():
+            assert lazy.get(key) == pytest.approx(value, rel=1e-9)
+
+    assert not lazy
+
+
+def test_advance_returns_only_expired_keys() -> None:
+    m: DecayingMap[str] = DecayingMap(epsilon=0.01)
+    m.set("short", 0.02)
+    m.set("long", 1.0)
+    m.set("zero", 0.0)
+
+    # Written values stay readable until the clock moves
+    assert m.get("zero") == 0.0
+    assert m.advance(0.0) == ["zero"]
+
+    assert m.advance(0.5) == []
+    assert m.get("short") == pytest.approx(0.02 * math.exp(-0.5))
+    assert m.advance(0.5) == ["short"]
+    assert m.advance(math.log(100.0)) == ["long"]
+
+    m.set("a", 1.0)
+    assert m.advance(math.inf) == ["a"]
+    with pytest.raises(ValueError):
+        m.advance(-1.0)
+    with pytest.raises(ValueError):
+        DecayingMap(epsilon=0.0)
+
+
+def test_rewrites_keep_heap_bounded_and_rebase_keeps_values() -> None:
+    m: DecayingMap[str] = DecayingMap(epsilon=1e-9)
+    for _ in range(5000):
+        m.set("hot", 1.0)
+        m.advance(0.3)
+    assert len(m._expiry) <= 2 * len(m) + 64
+    assert m.clock < 1024.0
+    assert m.get("hot") == pytest.approx(math.exp(-0.3))
+
+    m.set("cold", 0.5)
+    assert m.pop("cold") == 0.5
+    assert m.dump() == {"hot": pytest.approx(math.exp(-0.3))}
+
+
+def test_linear_efolds() -> None:
+    assert math.exp(-linear_efolds(0.01, 0.5, 10)) == pytest.approx((1 - 0.02) ** 10)
+    assert linear_efolds(1.0, 0.5) == math.inf
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EpisodeTraceRecord:
     """
     Immutable trace record for episodic events.
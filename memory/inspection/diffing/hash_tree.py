@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+
+# Buckets per tree (fixed so any two trees are comparable bucket-wise)
+FANOUT = 256
+
+_DIGEST_SIZE = 16
+
+
+# ---------------------------------------------------------------------
+# Canonical encoding (process-stable; independent of hash seeds)
+# ---------------------------------------------------------------------
+
+def canonical(obj: Any) -> str:
+    """
+    Deterministic text encoding used for all tree digests.
+
+    Sets are sorted, dicts are sorted by key, dataclasses are encoded
+    field by field, so digests are stable across processes and runs.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str, bytes)):
+        return f"{type(obj).__name__}:{obj!r}"
+    if isinstance(obj, (tuple, list)):
+        return "(" + ",".join(canonical(v) for v in obj) + ")"
+    if isinstance(obj, (set, frozenset)):
+        return "{" + ",".join(sorted(canonical(v) for v in obj)) + "}"
+    if isinstance(obj, Mapping):
+        return "{" + ",".join(sorted(f"{canonical(k)}:{canonical(v)}" for k, v in obj.items())) + "}"
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return type(obj).__name__ + canonical(
+            tuple((f.name, getattr(obj, f.name)) for f in dataclasses.fields(obj))
+        )
+    return f"{type(obj).__name__}:{obj!r}"
+
+
+def digest_of(obj: Any) -> bytes:
+    return hashlib.blake2b(canonical(obj).encode("utf-8"), digest_size=_DIGEST_SIZE).digest()
+
+
+def _bucket_of(key_digest: bytes) -> int:
+    return key_digest[0] % FANOUT
+
+
+# ---------------------------------------------------------------------
+# Tree
+# ---------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class KeyedTreeDiff:
+    """
+    Keyed difference between two KeyedHashTrees (before -> after).
+
+    Keys are sorted where comparable.
+    """
+
+    added: Dict[Any, Any]
+    removed: Dict[Any, Any]
+    changed: Dict[Any, Tuple[Any, Any]]
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+
+@dataclass(frozen=True)
+class KeyedHashTree:
+    """
+    Two-level Merkle summary of a key -> value mapping.
+
+    - leaves are hashed from (key, value)
+    - leaves are grouped into FANOUT buckets by key hash
+    - bucket digests hash their sorted leaf digests
+    - the root hashes the bucket digests
+
+    diff() skips identical trees via the root and identical buckets
+    via their digests, so its cost scales with what changed, not
+    with the size of either side.
+
+    CONTRACT:
+    - Immutable once built
+    - Deterministic across processes
+    - Descriptive only
+    """
+
+    digest: bytes
+    bucket_digests: Mapping[int, bytes] = field(repr=False)
+    buckets: Mapping[int, Mapping[Any, Any]] = field(repr=False)
+    size: int = 0
+
+    @staticmethod
+    def build(items: Iterable[Tuple[Any, Any]]) -> "KeyedHashTree":
+        buckets: Dict[int, Dict[Any, Any]] = {}
+        leaves: Dict[int, List[bytes]] = {}
+        size = 0
+
+        for key, value in items:
+            b = _bucket_of(digest_of(key))
+            bucket = buckets.setdefault(b, {})
+            if key not in bucket:
+                size += 1
+            bucket[key] = value
+
+        for b, bucket in buckets.items():
+            leaves[b] = sorted(digest_of((k, v)) for k, v in bucket.items())
+
+        bucket_digests = {
+            b: hashlib.blake2b(b"".join(leaves[b]), digest_size=_DIGEST_SIZE).digest()
+            for b in sorted(buckets)
+        }
+
+        root = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+        for b, d in bucket_digests.items():
+            root.update(b.to_bytes(2, "big"))
+            root.update(d)
+
+        return KeyedHashTree(
+            digest=root.digest(),
+            bucket_digests=bucket_digests,
+            buckets=buckets,
+            size=size,
+        )
+
+    def __len__(self) -> int:
+        return self.size
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self.buckets.get(_bucket_of(digest_of(key)), {}).get(key, default)
+
+    def changed_buckets(self, other: "KeyedHashTree") -> List[int]:
+        """
+        Bucket indices whose contents differ between the two trees.
+        """
+        if self.digest == other.digest:
+            return []
+        mine = self.bucket_digests
+        theirs = other.bucket_digests
+        return sorted(
+            b for b in set(mine) | set(theirs)
+            if mine.get(b) != theirs.get(b)
+        )
+
+    def diff(self, other: "KeyedHashTree") -> KeyedTreeDiff:
+        """
+        Keyed diff from self (before) to other (after).
+        """
+        added: Dict[Any, Any] = {}
+        removed: Dict[Any, Any] = {}
+        changed: Dict[Any, Tuple[Any, Any]] = {}
+
+        for b in self.changed_buckets(other):
+            before = self.buckets.get(b, {})
+            after = other.buckets.get(b, {})
+
+            for key, value in after.items():
+                if key not in before:
+                    added[key] = value
+                elif before[key] != value:
+                    changed[key] = (before[key], value)
+            for key, value in before.items():
+                if key not in after:
+                    removed[key] = value
+
+        return KeyedTreeDiff(
+            added=_sorted_dict(added),
+            removed=_sorted_dict(removed),
+            changed=_sorted_dict(changed),
+        )
+
+
+def _sorted_dict(d: Dict[Any, Any]) -> Dict[Any, Any]:
+    try:
+        return {k: d[k] for k in sorted(d)}
+    except TypeError:
+        return {k: d[k] for k in sorted(d, key=canonical)}
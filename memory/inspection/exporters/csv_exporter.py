@@ -1,10 +1,22 @@
 from __future__ import annotations
 
 import csv
-import io
+from pathlib import Path
+from typing import Iterator, Optional
+
+from memory.inspection.exporters.streaming import write_chunks
 from memory.inspection.inspection_report import InspectionReport
 
 
+class _LineSink:
+    """
+    File-like target returning each formatted CSV row from write().
+    """
+
+    def write(self, line: str) -> str:
+        return line
+
+
 class CSVInspectionExporter:
     """
     Flattens inspection counts and summaries only.
@@ -15,21 +27,34 @@ class CSVInspectionExporter:
     """
 
     def export(self, report: InspectionReport) -> str:
-        buf = io.StringIO()
-        writer = csv.writer(buf)
+        return "".join(self.iter_export(report))
 
-        writer.writerow(["field", "value"])
+    def iter_export(self, report: InspectionReport) -> Iterator[str]:
+        """
+        Yield formatted CSV rows one at a time.
+        """
+        # csv.writer.writerow returns the sink's write() result
+        writer = csv.writer(_LineSink())
+
+        yield writer.writerow(["field", "value"])
 
         # --- Core counts ---
-        writer.writerow(["episode_count", report.episode_count])
-        writer.writerow(["semantic_record_count", report.semantic_record_count])
-        writer.writerow(["drift_record_count", report.drift_record_count])
-        writer.writerow(
+        yield writer.writerow(["episode_count", report.episode_count])
+        yield writer.writerow(["semantic_record_count", report.semantic_record_count])
+        yield writer.writerow(["drift_record_count", report.drift_record_count])
+        yield writer.writerow(
             ["promotion_candidate_count", report.promotion_candidate_count]
         )
 
         # --- Summaries (descriptive only) ---
         for key, value in report.summaries.items():
-            writer.writerow([f"summary:{key}", value])
-
-        return buf.getvalue()
+            yield writer.writerow([f"summary:{key}", value])
+
+    def export_to(
+        self,
+        report: InspectionReport,
+        path: str | Path,
+        *,
+        compression: Optional[str] = "auto",
+    ) -> Path:
+        return write_chunks(self.iter_export(report), path, compression=compression)
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from memory.inspection.exporters.streaming import lower_default, write_chunks
 from memory.inspection.inspection_report import InspectionReport
 
 
@@ -14,7 +18,30 @@ class JSONInspectionExporter:
     """
 
     def export(self, report: InspectionReport) -> str:
-        payload = {
+        return "".join(self.iter_export(report))
+
+    def iter_export(self, report: InspectionReport) -> Iterator[str]:
+        """
+        Stream the JSON document in encoder-sized chunks.
+        """
+        encoder = json.JSONEncoder(indent=2, sort_keys=True, default=lower_default)
+        return encoder.iterencode(self._payload(report))
+
+    def export_to(
+        self,
+        report: InspectionReport,
+        path: str | Path,
+        *,
+        compression: Optional[str] = "auto",
+    ) -> Path:
+        return write_chunks(self.iter_export(report), path, compression=compression)
+
+    # --------------------------------------------------
+    # Internal helpers
+    # --------------------------------------------------
+
+    def _payload(self, report: InspectionReport) -> Dict[str, Any]:
+        return {
             # --- Provenance ---
             "report_id": report.report_id,
             "generated_step": report.generated_step,
@@ -27,32 +54,9 @@ class JSONInspectionExporter:
             "drift_record_count": report.drift_record_count,
             "promotion_candidate_count": report.promotion_candidate_count,
 
-            # --- Descriptive summaries ---
-            "summaries": self._lower(report.summaries),
+            # --- Descriptive summaries (lowered lazily by the encoder) ---
+            "summaries": report.summaries,
 
             # --- Warnings only (human-facing) ---
             "warnings": list(report.warnings),
         }
-
-        return json.dumps(payload, indent=2, sort_keys=True)
-
-    # --------------------------------------------------
-    # Internal helpers
-    # --------------------------------------------------
-
-    def _lower(self, obj):
-        """
-        Lower inspection-only objects to JSON-safe primitives.
-        """
-        if isinstance(obj, dict):
-            return {k: self._lower(v) for k, v in obj.items()}
-        if isinstance(obj, (list, tuple, set)):
-            return [self._lower(v) for v in obj]
-        if hasattr(obj, "__dict__"):
-            # Inspection views only: structural, no behavior
-            return {
-                k: self._lower(v)
-                for k, v in obj.__dict__.items()
-                if not k.startswith("_")
-            }
-        return obj
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import bz2
+import gzip
+import io
+import json
+import lzma
+from pathlib import Path
+from typing import Any, IO, Iterable, Iterator, Optional
+
+
+# suffix -> compression name
+_SUFFIXES = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "lzma",
+    ".zst": "zstd",
+}
+
+
+def _resolve_compression(path: Path, compression: Optional[str]) -> Optional[str]:
+    if compression == "auto":
+        return _SUFFIXES.get(path.suffix.lower())
+    if compression not in (None, "gzip", "bz2", "lzma", "zstd"):
+        raise ValueError(f"Unknown compression: {compression}")
+    return compression
+
+
+def open_export(path: str | Path, mode: str = "w", *, compression: Optional[str] = "auto") -> IO[str]:
+    """
+    Open a text stream for export (mode "w") or reading back ("r").
+
+    compression:
+    - "auto" (default): inferred from suffix (.gz/.bz2/.xz/.zst)
+    - None, "gzip", "bz2", "lzma", "zstd"
+
+    zstd uses the standard library module where available
+    (compression.zstd, Python 3.14+).
+    """
+    if mode not in ("w", "r"):
+        raise ValueError("mode must be 'w' or 'r'")
+
+    path = Path(path)
+    kind = _resolve_compression(path, compression)
+    text_mode = mode + "t"
+
+    if kind is None:
+        return path.open(mode, encoding="utf-8", newline="")
+    if kind == "gzip":
+        # mtime=0 keeps compressed exports byte-stable
+        raw = gzip.GzipFile(path, mode + "b", mtime=0) if mode == "w" else gzip.GzipFile(path, "rb")
+        return io.TextIOWrapper(raw, encoding="utf-8", newline="")
+    if kind == "bz2":
+        return bz2.open(path, text_mode, encoding="utf-8", newline="")
+    if kind == "lzma":
+        return lzma.open(path, text_mode, encoding="utf-8", newline="")
+
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+    except ImportError as exc:
+        raise ValueError("zstd compression requires Python 3.14+ (compression.zstd)") from exc
+    return zstd.open(path, text_mode, encoding="utf-8", newline="")
+
+
+def write_chunks(chunks: Iterable[str], path: str | Path, *, compression: Optional[str] = "auto") -> Path:
+    """
+    Stream text chunks to `path` as they are produced.
+    """
+    path = Path(path)
+    with open_export(path, "w", compression=compression) as f:
+        for chunk in chunks:
+            f.write(chunk)
+    return path
+
+
+# --------------------------------------------------
+# JSON lowering (shared by JSON / JSON Lines exporters)
+# --------------------------------------------------
+
+def lower_default(obj: Any) -> Any:
+    """
+    json `default` hook lowering inspection-only objects lazily.
+
+    Sets become (sorted where possible) lists; objects become dicts of their public
+    attributes. Applied by the encoder as it walks, so no lowered
+    copy of the report is built.
+    """
+    if isinstance(obj, (set, frozenset)):
+        try:
+            return sorted(obj)
+        except TypeError:
+            return list(obj)
+    if hasattr(obj, "__dict__"):
+        # Inspection views only: structural, no behavior
+        return {k: v for k, v in obj.__dict__.items() if not k.startswith("_")}
+    if hasattr(obj, "__dataclass_fields__"):
+        # Slotted dataclasses
+        return {
+            k: getattr(obj, k)
+            for k in obj.__dataclass_fields__
+            if not k.startswith("_")
+        }
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def iter_jsonl(records: Iterable[Any]) -> Iterator[str]:
+    """
+    One compact, key-sorted JSON document per record.
+    """
+    encoder = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=lower_default)
+    for record in records:
+        yield encoder.encode(record) + "\n"
+
+
+def write_jsonl(records: Iterable[Any], path: str | Path, *, compression: Optional[str] = "auto") -> int:
+    """
+    Write records as JSON Lines while they are produced.
+
+    Returns the number of records written.
+    """
+    count = 0
+    with open_export(path, "w", compression=compression) as f:
+        for line in iter_jsonl(records):
+            f.write(line)
+            count += 1
+    return count
+
+
+def read_jsonl(path: str | Path, *, compression: Optional[str] = "auto") -> Iterator[Any]:
+    """
+    Stream records back from a (possibly compressed) JSON Lines file.
+    """
+    with open_export(path, "r", compression=compression) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
@@ -1,4 +1,9 @@
 from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator, Optional
+
+from memory.inspection.exporters.streaming import write_chunks
 from memory.inspection.inspection_report import InspectionReport
 
 
@@ -11,37 +16,54 @@ class TextInspectionExporter:
     """
 
     def export(self, report: InspectionReport) -> str:
-        lines: list[str] = []
+        return "\n".join(self.iter_lines(report))
 
-        lines.append("INSPECTION REPORT")
-        lines.append("=" * 20)
+    def iter_lines(self, report: InspectionReport) -> Iterator[str]:
+        """
+        Yield report lines (without line terminators).
+        """
+        yield "INSPECTION REPORT"
+        yield "=" * 20
 
         # --- Provenance ---
-        lines.append(f"Report ID: {report.report_id}")
-        lines.append(f"Generated step: {report.generated_step}")
-        lines.append(f"Generated time: {report.generated_time}")
-        lines.append(f"Inspected components: {', '.join(report.inspected_components)}")
+        yield f"Report ID: {report.report_id}"
+        yield f"Generated step: {report.generated_step}"
+        yield f"Generated time: {report.generated_time}"
+        yield f"Inspected components: {', '.join(report.inspected_components)}"
 
-        lines.append("")
+        yield ""
 
         # --- Core counts ---
-        lines.append(f"Episode count: {report.episode_count}")
-        lines.append(f"Semantic record count: {report.semantic_record_count}")
-        lines.append(f"Drift record count: {report.drift_record_count}")
-        lines.append(f"Promotion candidate count: {report.promotion_candidate_count}")
+        yield f"Episode count: {report.episode_count}"
+        yield f"Semantic record count: {report.semantic_record_count}"
+        yield f"Drift record count: {report.drift_record_count}"
+        yield f"Promotion candidate count: {report.promotion_candidate_count}"
 
         # --- Summaries ---
         if report.summaries:
-            lines.append("")
-            lines.append("Summaries:")
+            yield ""
+            yield "Summaries:"
             for key, value in report.summaries.items():
-                lines.append(f"  - {key}: {value}")
+                yield f"  - {key}: {value}"
 
         # --- Warnings ---
         if report.warnings:
-            lines.append("")
-            lines.append("Warnings:")
+            yield ""
+            yield "Warnings:"
             for warning in report.warnings:
-                lines.append(f"  * {warning}")
+                yield f"  * {warning}"
+
+    def iter_export(self, report: InspectionReport) -> Iterator[str]:
+        """
+        Stream the report as newline-terminated lines.
+        """
+        return (line + "\n" for line in self.iter_lines(report))
 
-        return "\n".join(lines)
+    def export_to(
+        self,
+        report: InspectionReport,
+        path: str | Path,
+        *,
+        compression: Optional[str] = "auto",
+    ) -> Path:
+        return write_chunks(self.iter_export(report), path, compression=compression)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from memory.inspection.exporters.csv_exporter import CSVInspectionExporter
+from memory.inspection.exporters.json_exporter import JSONInspectionExporter
+from memory.inspection.exporters.streaming import open_export, read_jsonl, write_jsonl
+from memory.inspection.exporters.text_exporter import TextInspectionExporter
+from memory.inspection.inspection_report import InspectionReport
+from memory.inspection.semantic_activation_report import SemanticActivationReport
+
+
+@dataclass(frozen=True)
+class _View:
+    name: str
+    regions: frozenset
+
+
+def _report() -> InspectionReport:
+    return InspectionReport(
+        report_id="r1",
+        generated_step=10,
+        generated_time=1.5,
+        inspected_components=["episodic", "semantic"],
+        episode_count=3,
+        semantic_record_count=2,
+        drift_record_count=0,
+        promotion_candidate_count=1,
+        summaries={"views": [_View("a", frozenset({"pfc", "gpi"}))], "counts": (1, 2)},
+        warnings=["w1"],
+    )
+
+
+@pytest.mark.parametrize(
+    "exporter",
+    [JSONInspectionExporter(), CSVInspectionExporter(), TextInspectionExporter()],
+)
+@pytest.mark.parametrize("suffix", [".out", ".out.gz", ".out.bz2", ".out.xz"])
+def test_streamed_file_matches_in_memory_export(tmp_path: Path, exporter, suffix: str) -> None:
+    report = _report()
+    path = exporter.export_to(report, tmp_path / f"report{suffix}")
+
+    with open_export(path, "r") as f:
+        streamed = f.read()
+
+    assert streamed == "".join(exporter.iter_export(report))
+    assert streamed.rstrip("\n") == exporter.export(report).rstrip("\n")
+
+
+def test_json_export_lowers_views_lazily() -> None:
+    payload = json.loads(JSONInspectionExporter().export(_report()))
+    assert payload["summaries"]["views"] == [{"name": "a", "regions": ["gpi", "pfc"]}]
+    assert payload["summaries"]["counts"] == [1, 2]
+
+
+def test_jsonl_roundtrips_large_collections(tmp_path: Path) -> None:
+    reports = (
+        SemanticActivationReport(
+            snapshot_index=i,
+            scales_present=["short"],
+            term_counts_by_scale={"short": i},
+            value_ranges_by_scale={"short": {"min": 0.0, "max": float(i)}},
+        )
+        for i in range(1000)
+    )
+
+    path = tmp_path / "activation.jsonl.gz"
+    assert write_jsonl(reports, path) == 1000
+
+    rows = list(read_jsonl(path))
+    assert len(rows) == 1000
+    assert rows[7] == {
+        "snapshot_index": 7,
+        "scales_present": ["short"],
+        "term_counts_by_scale": {"short": 7},
+        "value_ranges_by_scale": {"short": {"min": 0.0, "max": 7.0}},
+    }
+
+
+def test_unknown_compression_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        write_jsonl([], tmp_path / "x.jsonl", compression="snappy")
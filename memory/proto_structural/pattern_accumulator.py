@@ -1,16 +1,26 @@
 from __future__ import annotations
 
-from collections import Counter
-from typing import Iterable
+from array import array
+from typing import Iterable, Optional
 
 from memory.proto_structural.episode_signature import EpisodeSignature
-from memory.proto_structural.pattern_record import PatternRecord
+from memory.proto_structural.pattern_record import PatternCountsView, PatternRecord
+from memory.proto_structural.pattern_sketch import PatternSketch
+from memory.proto_structural.signature_builder import EpisodeSignatureBuilder
 
 
 class PatternAccumulator:
     """
     Offline accumulator of recurring EpisodeSignatures.
 
+    Signatures are interned to integer ids through an
+    EpisodeSignatureBuilder; counts live in a compact int64 array
+    indexed by id. Accumulators sharing a builder merge by array
+    addition (e.g. shards from parallel replay workers).
+
+    Optional sketch mode keeps a bounded PatternSketch instead of
+    exact counts; snapshots then expose only the heavy hitters.
+
     CONTRACT:
     - Counts only
     - No decay
@@ -18,12 +28,100 @@ class PatternAccumulator:
     - No authority
     """
 
-    def __init__(self) -> None:
-        self._counter: Counter[EpisodeSignature] = Counter()
+    def __init__(
+        self,
+        *,
+        builder: Optional[EpisodeSignatureBuilder] = None,
+        sketch: Optional[PatternSketch] = None,
+    ) -> None:
+        self._builder = builder if builder is not None else EpisodeSignatureBuilder()
+        self._sketch = sketch
+
+        self._counts = array("q")
+        self._distinct = 0
+
+        # True while a snapshot view shares self._counts
+        self._shared = False
+
+    @property
+    def builder(self) -> EpisodeSignatureBuilder:
+        return self._builder
+
+    @property
+    def sketch(self) -> Optional[PatternSketch]:
+        return self._sketch
+
+    # --------------------------------------------------
+    # Ingestion
+    # --------------------------------------------------
+
+    def _writable_counts(self) -> array:
+        if self._shared:
+            self._counts = array("q", self._counts)
+            self._shared = False
+        return self._counts
+
+    def _add(self, counts: array, sid: int, n: int) -> None:
+        if sid >= len(counts):
+            counts.extend([0] * (sid + 1 - len(counts)))
+        if counts[sid] == 0:
+            self._distinct += 1
+        counts[sid] += n
 
     def ingest(self, signatures: Iterable[EpisodeSignature]) -> None:
+        if self._sketch is not None:
+            for sig in signatures:
+                self._sketch.add(sig)
+            return
+
+        counts = self._writable_counts()
+        intern = self._builder.intern
         for sig in signatures:
-            self._counter[sig] += 1
+            self._add(counts, intern(sig), 1)
+
+    def merge(self, other: "PatternAccumulator") -> None:
+        """
+        Fold another accumulator's counts into this one.
+
+        Exact counts merge into exact or sketch accumulators;
+        a sketch can only merge into another sketch.
+        """
+        if other._sketch is not None:
+            if self._sketch is None:
+                raise ValueError("Cannot merge a sketch accumulator into an exact accumulator.")
+            self._sketch.merge(other._sketch)
+            return
+
+        other_counts = other._counts
+        other_builder = other._builder
+
+        if self._sketch is not None:
+            for sid, n in enumerate(other_counts):
+                if n:
+                    self._sketch.add(other_builder.signature_for(sid), n)
+            return
+
+        counts = self._writable_counts()
+        same_ids = other_builder is self._builder
+        intern = self._builder.intern
+        for sid, n in enumerate(other_counts):
+            if n:
+                target = sid if same_ids else intern(other_builder.signature_for(sid))
+                self._add(counts, target, n)
+
+    # --------------------------------------------------
+    # Snapshot
+    # --------------------------------------------------
 
     def snapshot(self) -> PatternRecord:
-        return PatternRecord(pattern_counts=dict(self._counter))
+        if self._sketch is not None:
+            return PatternRecord(pattern_counts=self._sketch.heavy_hitters())
+
+        self._shared = True
+        return PatternRecord(
+            pattern_counts=PatternCountsView(
+                builder=self._builder,
+                counts=self._counts,
+                distinct=self._distinct,
+            )
+        )
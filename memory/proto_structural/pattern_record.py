@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
-from typing import Dict
+from typing import TYPE_CHECKING, Iterator, Mapping
 
 from memory.proto_structural.episode_signature import EpisodeSignature
 
+if TYPE_CHECKING:
+    from memory.proto_structural.signature_builder import EpisodeSignatureBuilder
+
 
 @dataclass(frozen=True)
 class PatternRecord:
@@ -17,4 +21,51 @@ class PatternRecord:
     - Discardable
     """
 
-    pattern_counts: Dict[EpisodeSignature, int]
+    pattern_counts: Mapping[EpisodeSignature, int]
+
+
+class PatternCountsView(Mapping[EpisodeSignature, int]):
+    """
+    Read-only mapping over an accumulator's interned count array.
+
+    The view shares the count array with the accumulator that produced
+    it. The accumulator copies the array before its next mutation
+    (copy-on-write), so a view never observes later ingestion.
+
+    CONTRACT:
+    - Read-only
+    - Zero counts are not exposed
+    - Behaves like Dict[EpisodeSignature, int] for readers
+    """
+
+    __slots__ = ("_builder", "_counts", "_size", "_distinct")
+
+    def __init__(
+        self,
+        *,
+        builder: "EpisodeSignatureBuilder",
+        counts: array,
+        distinct: int,
+    ) -> None:
+        self._builder = builder
+        self._counts = counts
+        self._size = len(counts)
+        self._distinct = distinct
+
+    def __getitem__(self, signature: EpisodeSignature) -> int:
+        sid = self._builder.id_for(signature)
+        if sid is None or sid >= self._size or self._counts[sid] == 0:
+            raise KeyError(signature)
+        return self._counts[sid]
+
+    def __iter__(self) -> Iterator[EpisodeSignature]:
+        counts = self._counts
+        for sid in range(self._size):
+            if counts[sid]:
+                yield self._builder.signature_for(sid)
+
+    def __len__(self) -> int:
+        return self._distinct
+
+    def __repr__(self) -> str:
+        return f"PatternCountsView({dict(self.items())!r})"
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import hashlib
+from array import array
+from typing import Dict, List, Tuple
+
+from memory.proto_structural.episode_signature import EpisodeSignature
+
+
+def _signature_hashes(signature: EpisodeSignature) -> Tuple[int, int]:
+    """
+    Process-independent hash pair for a signature.
+
+    Built-in hash() of frozensets of strings is salted per process,
+    which would make sketches from different replay workers
+    unmergeable. The canonical tuple is sorted, so its repr is stable.
+    """
+    digest = hashlib.blake2b(
+        repr(signature.as_canonical_tuple()).encode("utf-8"),
+        digest_size=16,
+    ).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return h1, h2
+
+
+class PatternSketch:
+    """
+    Bounded-memory approximate counter for EpisodeSignatures.
+
+    Count-min sketch (width x depth) plus a heavy-hitter table of the
+    top_k signatures by estimated count.
+
+    CONTRACT:
+    - Estimates never undercount
+    - Memory independent of distinct signature count
+    - Deterministic across processes (mergeable)
+    - No thresholds
+    - No authority
+    """
+
+    def __init__(self, *, width: int = 2048, depth: int = 4, top_k: int = 64) -> None:
+        if width <= 0 or depth <= 0 or top_k <= 0:
+            raise ValueError("PatternSketch width, depth and top_k must be positive.")
+
+        self.width = int(width)
+        self.depth = int(depth)
+        self.top_k = int(top_k)
+
+        self._rows: List[array] = [array("q", bytes(8 * self.width)) for _ in range(self.depth)]
+        self._heavy: Dict[EpisodeSignature, int] = {}
+        self._floor = 0
+        self.total = 0
+
+    # --------------------------------------------------
+    # Counting
+    # --------------------------------------------------
+
+    def _indices(self, signature: EpisodeSignature) -> List[int]:
+        h1, h2 = _signature_hashes(signature)
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def add(self, signature: EpisodeSignature, count: int = 1) -> None:
+        estimate = None
+        for row, idx in zip(self._rows, self._indices(signature)):
+            row[idx] += count
+            value = row[idx]
+            if estimate is None or value < estimate:
+                estimate = value
+
+        self.total += count
+        self._offer(signature, int(estimate))
+
+    def estimate(self, signature: EpisodeSignature) -> int:
+        return min(row[idx] for row, idx in zip(self._rows, self._indices(signature)))
+
+    def _offer(self, signature: EpisodeSignature, estimate: int) -> None:
+        heavy = self._heavy
+        if signature in heavy:
+            heavy[signature] = estimate
+            return
+
+        if len(heavy) < self.top_k:
+            heavy[signature] = estimate
+            self._floor = min(heavy.values())
+            return
+
+        if estimate <= self._floor:
+            return
+
+        victim = min(heavy, key=heavy.__getitem__)
+        del heavy[victim]
+        heavy[signature] = estimate
+        self._floor = min(heavy.values())
+
+    # --------------------------------------------------
+    # Merging / views
+    # --------------------------------------------------
+
+    def merge(self, other: "PatternSketch") -> None:
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Cannot merge PatternSketch instances with different shapes.")
+
+        for mine, theirs in zip(self._rows, other._rows):
+            for i in range(self.width):
+                mine[i] += theirs[i]
+        self.total += other.total
+
+        candidates = set(self._heavy) | set(other._heavy)
+        self._heavy = {}
+        self._floor = 0
+        for sig in sorted(candidates, key=lambda s: s.as_canonical_tuple()):
+            self._offer(sig, self.estimate(sig))
+
+    def heavy_hitters(self) -> Dict[EpisodeSignature, int]:
+        # Re-estimate: counts of tracked signatures may have grown since admission.
+        return {sig: self.estimate(sig) for sig in self._heavy}
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import Counter
-from typing import Iterable, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from memory.proto_structural.episode_signature import EpisodeSignature
 
@@ -14,8 +14,17 @@ class EpisodeSignatureBuilder:
     - Structural extraction only
     - No interpretation
     - No scoring
+
+    INTERNING:
+    - intern() assigns each distinct signature a dense integer id
+    - ids are stable for the lifetime of the builder (append-only)
+    - accumulators sharing one builder share one id space
     """
 
+    def __init__(self) -> None:
+        self._ids: Dict[EpisodeSignature, int] = {}
+        self._signatures: List[EpisodeSignature] = []
+
     def build(
         self,
         *,
@@ -40,3 +49,25 @@ class EpisodeSignatureBuilder:
             region_ids=region_set,
             transition_counts=transition_counts,
         )
+
+    # --------------------------------------------------
+    # Interning
+    # --------------------------------------------------
+
+    def intern(self, signature: EpisodeSignature) -> int:
+        sid = self._ids.get(signature)
+        if sid is None:
+            sid = len(self._signatures)
+            self._ids[signature] = sid
+            self._signatures.append(signature)
+        return sid
+
+    def id_for(self, signature: EpisodeSignature) -> Optional[int]:
+        return self._ids.get(signature)
+
+    def signature_for(self, signature_id: int) -> EpisodeSignature:
+        return self._signatures[signature_id]
+
+    @property
+    def interned_count(self) -> int:
+        return len(self._signatures)
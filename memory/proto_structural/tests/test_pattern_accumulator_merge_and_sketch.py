@@ -0,0 +1,72 @@
+# memory/proto_structural/tests/test_pattern_accumulator_merge_and_sketch.py
+
+from memory.proto_structural.pattern_accumulator import PatternAccumulator
+from memory.proto_structural.pattern_sketch import PatternSketch
+from memory.proto_structural.signature_builder import EpisodeSignatureBuilder
+from memory.proto_structural.episode_signature import EpisodeSignature
+
+
+def _sig(n: int) -> EpisodeSignature:
+    return EpisodeSignature(
+        length_steps=n,
+        event_count=1,
+        event_types=frozenset({"A"}),
+        region_ids=frozenset({"R"}),
+        transition_counts=(),
+    )
+
+
+def test_builder_interns_signatures_to_dense_ids():
+    builder = EpisodeSignatureBuilder()
+
+    assert builder.intern(_sig(1)) == 0
+    assert builder.intern(_sig(2)) == 1
+    assert builder.intern(_sig(1)) == 0
+    assert builder.signature_for(1) == _sig(2)
+    assert builder.interned_count == 2
+
+
+def test_snapshot_is_not_affected_by_later_ingest():
+    acc = PatternAccumulator()
+    acc.ingest([_sig(1), _sig(1)])
+
+    record = acc.snapshot()
+    acc.ingest([_sig(1), _sig(2)])
+
+    assert dict(record.pattern_counts) == {_sig(1): 2}
+    assert dict(acc.snapshot().pattern_counts) == {_sig(1): 3, _sig(2): 1}
+
+
+def test_merge_shared_and_foreign_builders():
+    builder = EpisodeSignatureBuilder()
+    a = PatternAccumulator(builder=builder)
+    b = PatternAccumulator(builder=builder)
+    c = PatternAccumulator()
+
+    a.ingest([_sig(1)])
+    b.ingest([_sig(2), _sig(1)])
+    c.ingest([_sig(3), _sig(2)])
+
+    a.merge(b)
+    a.merge(c)
+
+    assert dict(a.snapshot().pattern_counts) == {
+        _sig(1): 2,
+        _sig(2): 2,
+        _sig(3): 1,
+    }
+
+
+def test_sketch_mode_tracks_heavy_hitters_and_merges():
+    a = PatternAccumulator(sketch=PatternSketch(width=64, depth=3, top_k=2))
+    b = PatternAccumulator(sketch=PatternSketch(width=64, depth=3, top_k=2))
+
+    a.ingest([_sig(1)] * 5 + [_sig(2)] * 3 + [_sig(3)])
+    b.ingest([_sig(2)] * 4 + [_sig(4)])
+
+    a.merge(b)
+    counts = a.snapshot().pattern_counts
+
+    assert set(counts) == {_sig(1), _sig(2)}
+    assert counts[_sig(1)] >= 5
+    assert counts[_sig(2)] >= 7
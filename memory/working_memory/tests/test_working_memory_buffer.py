@@ -25,3 +25,23 @@ def test_buffer_decay_and_eviction() -> None:
     buffer.step(current_step=3)
 
     assert len(buffer.items()) == 0
+
+
+def test_buffer_decays_lazily_and_reschedules_on_bias() -> None:
+    policy = WorkingMemoryPolicy(decay_rate=0.5, min_strength=0.1)
+    buffer = WorkingMemoryBuffer(capacity=5, policy=policy)
+
+    buffer.insert(WorkingItem("x", None, 1.0, 0))
+    buffer.insert(WorkingItem("y", None, 1.0, 2))
+
+    buffer.step(current_step=1)
+    buffer.step(current_step=2)
+
+    strengths = {i.key: i.strength for i in buffer.items()}
+    assert strengths == {"x": 0.25, "y": 1.0}
+
+    # Faster decay from here on: x (1.0 * 0.25**3) falls below threshold
+    policy.set_decay_bias(bias=0.5)
+    buffer.step(current_step=3)
+
+    assert [i.key for i in buffer.items()] == ["y"]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import List
+import heapq
+import math
+from typing import Dict, List, Optional, Tuple
 
 from memory.working_memory.working_item import WorkingItem
 from memory.working_memory.working_memory_policy import WorkingMemoryPolicy
@@ -15,6 +17,15 @@ class WorkingMemoryBuffer:
     - Enforces capacity
     - Applies decay BEFORE eviction
     - No interpretation
+
+    LAZY DECAY:
+    - Items are stored with their original strength and created_step
+    - Decay is applied from that base on read (policy.decay)
+    - Threshold eviction is scheduled in a min-heap keyed on the step
+      at which the item first falls below threshold
+    - Capacity eviction pops the weakest item from a rank heap
+      (policy.strength_rank), which is time-invariant
+    - Heaps are rebuilt only when the policy's decay rate changes
     """
 
     def __init__(
@@ -25,43 +36,108 @@ class WorkingMemoryBuffer:
     ) -> None:
         self._capacity = capacity
         self._policy = policy
-        self._items: List[WorkingItem] = []
+
+        # seq -> base item (insertion order preserved)
+        self._live: Dict[int, WorkingItem] = {}
+        # (eviction step, seq) — lazy deletion
+        self._expiry: List[Tuple[float, int]] = []
+        # (rank, -seq) — weakest first; ties evict the newest
+        self._ranks: List[Tuple[float, int]] = []
+
+        self._seq = 0
+        self._now: Optional[int] = None
+        self._rate = policy.effective_decay_rate
 
     def items(self) -> List[WorkingItem]:
-        return list(self._items)
+        return [self._decayed(item) for item in self._live.values()]
 
     def insert(self, item: WorkingItem) -> None:
-        self._items.append(item)
+        self._sync_rate()
+
+        seq = self._seq
+        self._seq += 1
+        self._live[seq] = item
+        self._schedule(seq, item)
+
         self._evict_if_needed()
 
     def step(self, *, current_step: int) -> None:
-        # --------------------------------------------------
-        # 1. Apply decay to all items (forensic, monotonic)
-        # --------------------------------------------------
-        decayed: List[WorkingItem] = [
-            self._policy.decay(item, current_step=current_step)
-            for item in self._items
-        ]
+        self._sync_rate()
+        self._now = current_step
 
         # --------------------------------------------------
-        # 2. Evict items that fall below threshold
+        # 1-2. Evict items whose threshold crossing has come due
+        #      (decay itself is applied lazily on read)
         # --------------------------------------------------
-        self._items = [
-            item
-            for item in decayed
-            if not self._policy.should_evict(item, current_step=current_step)
-        ]
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= current_step:
+            _, seq = heapq.heappop(expiry)
+            self._live.pop(seq, None)
 
         # --------------------------------------------------
         # 3. Enforce capacity (strength-based)
         # --------------------------------------------------
         self._evict_if_needed()
+        self._compact()
+
+    # --------------------------------------------------
+    # Internals
+    # --------------------------------------------------
+    def _decayed(self, item: WorkingItem) -> WorkingItem:
+        if self._now is None or self._now <= item.created_step:
+            return item
+        return self._policy.decay(item, current_step=self._now)
+
+    def _schedule(self, seq: int, item: WorkingItem) -> None:
+        expires = item.created_step + self._policy.eviction_age(item)
+        if expires != math.inf:
+            heapq.heappush(self._expiry, (expires, seq))
+
+        rank = self._policy.strength_rank(item)
+        if rank is not None:
+            heapq.heappush(self._ranks, (rank, -seq))
+
+    def _sync_rate(self) -> None:
+        # Decay bias changes alter every eviction step and rank
+        rate = self._policy.effective_decay_rate
+        if rate == self._rate:
+            return
+        self._rate = rate
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._expiry = []
+        self._ranks = []
+        for seq, item in self._live.items():
+            self._schedule(seq, item)
+
+    def _compact(self) -> None:
+        # Drop stale heap entries once they dominate
+        if len(self._ranks) > 2 * len(self._live) + 16:
+            self._rebuild()
 
     def _evict_if_needed(self) -> None:
-        if len(self._items) <= self._capacity:
+        if len(self._live) <= self._capacity:
+            return
+
+        if self._policy.strength_rank(next(iter(self._live.values()))) is None:
+            # No time-invariant order: defer to the policy
+            decayed = {seq: self._decayed(i) for seq, i in self._live.items()}
+            survivors = {
+                id(i)
+                for i in self._policy.select_evictions(
+                    items=list(decayed.values()),
+                    max_items=self._capacity,
+                )
+            }
+            self._live = {
+                seq: self._live[seq]
+                for seq, i in decayed.items()
+                if id(i) in survivors
+            }
             return
 
-        self._items = self._policy.select_evictions(
-            items=self._items,
-            max_items=self._capacity,
-        )
+        ranks = self._ranks
+        while len(self._live) > self._capacity:
+            _, neg_seq = heapq.heappop(ranks)
+            self._live.pop(-neg_seq, None)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from typing import List, Optional
 
 from memory.working_memory.working_item import WorkingItem
@@ -48,6 +49,13 @@ class WorkingMemoryPolicy:
         """
         self._decay_bias = 1.0
 
+    @property
+    def effective_decay_rate(self) -> float:
+        """
+        Per-step decay factor including external bias.
+        """
+        return self._decay_rate * self._decay_bias
+
     # --------------------------------------------------
     # Core policy
     # --------------------------------------------------
@@ -91,3 +99,52 @@ class WorkingMemoryPolicy:
             reverse=True,
         )
         return items_sorted[:max_items]
+
+    # --------------------------------------------------
+    # Scheduling helpers (lazy buffers)
+    # --------------------------------------------------
+    def eviction_age(self, item: WorkingItem) -> float:
+        """
+        First age (steps after item.created_step) at which the item,
+        decayed from its original strength, falls below threshold.
+
+        Returns math.inf if the item is never evicted by decay.
+        Valid until the decay bias changes.
+        """
+
+        def evicted(age: int) -> bool:
+            step = item.created_step + age
+            decayed = self.decay(item, current_step=step)
+            return self.should_evict(decayed, current_step=step)
+
+        if evicted(0):
+            return 0
+
+        rate = self.effective_decay_rate
+        if rate >= 1.0:
+            return math.inf
+        if rate <= 0.0 or self._min_strength <= 0.0:
+            return 1 if evicted(1) else math.inf
+
+        # Closed form, then settle against decay() for float edges
+        age = max(1, math.ceil(math.log(self._min_strength / item.strength) / math.log(rate)))
+        while age > 1 and evicted(age - 1):
+            age -= 1
+        while not evicted(age):
+            age += 1
+        return age
+
+    def strength_rank(self, item: WorkingItem) -> Optional[float]:
+        """
+        Time-invariant ordering key: items compare by rank exactly as
+        they compare by decayed strength at any common step.
+
+        Returns None when no such key exists (non-positive decay rate).
+        Valid until the decay bias changes.
+        """
+        rate = self.effective_decay_rate
+        if rate <= 0.0:
+            return None
+        if item.strength <= 0.0:
+            return -math.inf
+        return math.log(item.strength) - item.created_step * math.log(rate)
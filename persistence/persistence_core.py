@@ -3,9 +3,15 @@ from __future__ import annotations
 
 from typing import Dict
 
+from memory.decay import DecayingMap
 from persistence.traces import ExponentialTrace
 
 
+# Trace bounds (ExponentialTrace defaults)
+_TRACE_MIN = 0.0
+_TRACE_MAX = 1.0
+
+
 class BasalGangliaPersistence:
     """
     Short-lived persistence of recent striatal dominance.
@@ -20,6 +26,11 @@ class BasalGangliaPersistence:
     - No plasticity
     - No parameter writes
     - Fully bounded, exponentially decaying
+
+    STORAGE:
+    - Trace values live in one DecayingMap (bounded to [0, 1] like
+      ExponentialTrace); decay is applied on read and step() only
+      touches traces that fall below epsilon
     """
 
     def __init__(
@@ -29,13 +40,13 @@ class BasalGangliaPersistence:
         epsilon: float = 1e-9,
         enable_diagnostics: bool = False,
     ):
-        # Per-assembly traces
-        self.traces: Dict[str, ExponentialTrace] = {}
-
         self.decay_tau = float(decay_tau)
         self.bias_gain = float(bias_gain)
         self.epsilon = float(epsilon)
 
+        # Per-assembly trace values
+        self._traces: DecayingMap[str] = DecayingMap(epsilon=self.epsilon)
+
         # Optional observability
         self.enable_diagnostics = bool(enable_diagnostics)
         self.last_total_bias: float = 0.0
@@ -45,10 +56,25 @@ class BasalGangliaPersistence:
     # Trace management
     # ------------------------------------------------------------
 
+    @property
+    def traces(self) -> Dict[str, ExponentialTrace]:
+        """
+        Per-assembly traces at their current values.
+
+        Read-only snapshot (built on access); writes go through
+        reinforce().
+        """
+        out: Dict[str, ExponentialTrace] = {}
+        for aid, value in self._traces.items():
+            trace = ExponentialTrace(decay_tau=self.decay_tau)
+            trace.value = value
+            out[aid] = trace
+        return out
+
     def ensure_trace(self, assembly_id: str) -> None:
         aid = str(assembly_id)
-        if aid not in self.traces:
-            self.traces[aid] = ExponentialTrace(decay_tau=self.decay_tau)
+        if aid not in self._traces:
+            self._traces.set(aid, 0.0)
 
     # ------------------------------------------------------------
     # Dynamics
@@ -58,17 +84,24 @@ class BasalGangliaPersistence:
         """
         Advance all traces and remove near-zero entries.
         """
-        if not self.traces:
+        if not self._traces:
+            return
+
+        dt = float(dt)
+        if self.decay_tau <= 1e-9 and dt > 0.0:
+            # Effectively instant decay
+            self._traces.clear()
             return
 
-        dead = []
-        for aid, trace in self.traces.items():
-            trace.step(dt)
-            if abs(getattr(trace, "value", 0.0)) < self.epsilon:
-                dead.append(aid)
+        self._traces.advance(max(dt, 0.0) / self.decay_tau)
 
-        for aid in dead:
-            del self.traces[aid]
+    def advance(self, dt: float, steps: int) -> None:
+        """
+        `steps` calls to step(dt) at once (multi-rate updates).
+        Trace decay is exp(-dt/tau), so one step of steps * dt is exact.
+        """
+        if steps > 0:
+            self.step(float(dt) * int(steps))
 
     # ------------------------------------------------------------
     # Reinforcement
@@ -85,8 +118,9 @@ class BasalGangliaPersistence:
         if amount == 0.0:
             return
 
-        self.ensure_trace(assembly_id)
-        self.traces[str(assembly_id)].reinforce(float(amount))
+        aid = str(assembly_id)
+        value = self._traces.get(aid) + float(amount)
+        self._traces.set(aid, min(_TRACE_MAX, max(_TRACE_MIN, value)))
 
     # ------------------------------------------------------------
     # Readout
@@ -98,11 +132,11 @@ class BasalGangliaPersistence:
 
         Intended to be aggregated at the CHANNEL level by caller.
         """
-        trace = self.traces.get(str(assembly_id))
-        if not trace:
+        aid = str(assembly_id)
+        if aid not in self._traces:
             return 0.0
 
-        return float(getattr(trace, "value", 0.0)) * self.bias_gain
+        return self._traces.get(aid) * self.bias_gain
 
     def get_all_biases(self) -> Dict[str, float]:
         """
@@ -112,8 +146,8 @@ class BasalGangliaPersistence:
         out = {}
         total = 0.0
 
-        for aid, trace in self.traces.items():
-            val = float(getattr(trace, "value", 0.0)) * self.bias_gain
+        for aid, value in self._traces.items():
+            val = value * self.bias_gain
             if abs(val) > 0.0:
                 out[aid] = val
                 total += abs(val)
@@ -129,12 +163,12 @@ class BasalGangliaPersistence:
         Raw trace values (pre gain).
         Debug-only.
         """
-        return {aid: float(getattr(t, "value", 0.0)) for aid, t in self.traces.items()}
+        return self._traces.dump()
 
     def clear(self) -> None:
         """
         Hard reset (used only for test isolation).
         """
-        self.traces.clear()
+        self._traces.clear()
         self.last_total_bias = 0.0
         self.last_active_traces = 0
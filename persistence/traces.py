@@ -15,6 +15,9 @@ class ExponentialTrace:
     - No learning; this is just a leaky accumulator
     """
 
+    # One per tracked assembly; fixed layout, no per-instance __dict__
+    __slots__ = ("value", "decay_tau", "max_value", "min_value")
+
     def __init__(
         self,
         decay_tau: float = 30.0,  # seconds
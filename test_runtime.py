@@ -173,6 +173,14 @@ HELP_TEXT = (
 )
 
 
+def _poke(runtime: BrainRuntime, region: str, mag: float) -> None:
+    # Through the journal when recording, so the session can be replayed
+    if journal is not None:
+        journal.handle(f"poke {region} {mag!r}")
+    else:
+        runtime.inject_stimulus(region, magnitude=mag)
+
+
 def apply_command(runtime: BrainRuntime, cmd: str) -> str:
     global VIEW_MODE, SHOW_ZERO
 
@@ -205,10 +213,10 @@ def apply_command(runtime: BrainRuntime, cmd: str) -> str:
 
         if target == "all":
             for r in runtime.region_states.keys():
-                runtime.inject_stimulus(r, magnitude=mag)
+                _poke(runtime, r, mag)
             return f"POKE all += {mag}"
 
-        runtime.inject_stimulus(parts[1], magnitude=mag)
+        _poke(runtime, parts[1], mag)
         return f"POKE {parts[1]} += {mag}"
 
     # ----------------------------
@@ -316,26 +324,10 @@ runtime = BrainRuntime(brain, dt=0.01)
 # STRUCTURAL SALIENCE SPARSITY (EPISODE-LEVEL)
 # ============================================================
 
-from engine.salience.salience_sparsity_gate import SalienceSparsityGate
-
-# Collect all assembly IDs known to the runtime
-assembly_ids = [
-    p.assembly_id
-    for p in runtime._all_pops
-    if getattr(p, "assembly_id", None) is not None
-]
-
-# Create deterministic sparsity gate
-sparsity_gate = SalienceSparsityGate(
-    keep_ratio=0.25,   # 25% of assemblies eligible
-    seed=42,           # deterministic per episode
-)
+from engine.salience.salience_sparsity_gate import attach_sparsity_gate
 
-# Initialize eligibility
-sparsity_gate.initialize(assembly_ids)
-
-# Attach gate to salience field
-runtime.salience.attach_sparsity_gate(sparsity_gate)
+# Deterministic gate over all assemblies: 25% eligible, seed 42
+sparsity_gate = attach_sparsity_gate(runtime)
 
 print(
     "[INIT] Salience sparsity gate attached:",
@@ -359,11 +351,32 @@ except Exception:
     # command server must still run.
     pass
 
+# ------------------------------------------------------------------
+# INPUT JOURNAL (optional)
+# ------------------------------------------------------------------
+# NF_JOURNAL=session.njr records every mutating command with its step;
+# replay headlessly with: python -m engine.input_journal session.njr
+journal = None
+if os.environ.get("NF_JOURNAL"):
+    from engine.input_journal import JournaledSession
+
+    journal = JournaledSession(
+        runtime,
+        os.environ["NF_JOURNAL"],
+        brain={
+            "expression_profile": "human_default",
+            "state_profile": "awake",
+            "compound_profile": "experimental",
+        },
+        setup="engine.salience.salience_sparsity_gate:attach_sparsity_gate",
+    )
+    print(f"[INIT] Journaling commands to {journal.path}")
+
 # Attach local command handler (keyboard UI)
 runtime.apply_command = lambda c: apply_command(runtime, c)  # type: ignore[attr-defined]
 
 # Start TCP server (external scripts)
-start_command_server(runtime)
+start_command_server(runtime, handle=journal.handle if journal else None)
 
 print("\nLIVE RUNTIME | TCP + Keyboard")
 print("Port 5557 | Ctrl+C to quit")
@@ -384,6 +397,8 @@ last_msg = "Ready."
 try:
     while True:
         runtime.step()
+        if journal is not None:
+            journal.after_step()
 
         # Keyboard input (non-blocking)
         while key_available():
@@ -456,5 +471,7 @@ except KeyboardInterrupt:
     print("\nStopped.")
 
 finally:
+    if journal is not None:
+        journal.close()
     if not IS_WINDOWS:
         termios.tcsetattr(fd, termios.TCSADRAIN, old_term_settings)